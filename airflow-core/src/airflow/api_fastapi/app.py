@@ -143,7 +143,11 @@ def create_app(apps: str = "all") -> FastAPI:
         app.mount("/execution", task_exec_api_app)
 
     if "all" in apps_list or "core" in apps_list:
+        # Imported here: the grid services import the core API security, which imports this module
+        from airflow.api_fastapi.core_api.services.ui.grid import create_grid_summary_cache
+
         app.state.dag_bag = dag_bag
+        app.state.grid_summary_cache = create_grid_summary_cache()
         init_plugins(app)
         init_auth_manager(app)
         init_flask_plugins(app)
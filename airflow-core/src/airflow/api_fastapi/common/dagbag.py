@@ -25,6 +25,7 @@ from sqlalchemy.orm import Session
 from airflow.configuration import conf
 from airflow.models.dagbag import DBDagBag
 from airflow.models.serialized_dag import SerializedDagModel
+from airflow.serialization.shared_dag_cache import SharedSerializedDagCache
 
 if TYPE_CHECKING:
     from airflow.models.dagrun import DagRun
@@ -33,6 +34,18 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _create_shared_dag_cache() -> SharedSerializedDagCache | None:
+    path = conf.get("api", "dag_cache_shared_dir", fallback="")
+    if not path:
+        return None
+    max_size_mb = conf.getint("api", "dag_cache_shared_max_size_mb", fallback=512)
+    try:
+        return SharedSerializedDagCache(path, max_size=max(max_size_mb, 0) * 1024 * 1024)
+    except OSError as e:
+        log.warning("Not sharing serialized Dags between API server workers through %s: %s", path, e)
+        return None
+
+
 def create_dag_bag() -> DBDagBag:
     """Create DagBag with configurable LRU+TTL caching for API server usage."""
     cache_size = conf.getint("api", "dag_cache_size", fallback=64)
@@ -47,12 +60,12 @@ def create_dag_bag() -> DBDagBag:
 
     # Use unbounded dict (no eviction) if cache_size is 0
     if cache_size <= 0:
-        return DBDagBag(cache_size=0)
+        return DBDagBag(cache_size=0, shared_cache=_create_shared_dag_cache())
 
     # Disable TTL if cache_ttl is 0
     cache_ttl: int | None = cache_ttl_config if cache_ttl_config > 0 else None
 
-    return DBDagBag(cache_size=cache_size, cache_ttl=cache_ttl)
+    return DBDagBag(cache_size=cache_size, cache_ttl=cache_ttl, shared_cache=_create_shared_dag_cache())
 
 
 def dag_bag_from_app(request: Request) -> DBDagBag:
@@ -0,0 +1,59 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from airflow.api_fastapi.core_api.base import BaseModel
+from airflow.utils.state import DagRunState, TaskInstanceState
+
+
+class DagRunChange(BaseModel):
+    """A Dag run that changed, as sent by the change feed."""
+
+    run_id: str
+    state: DagRunState
+    start_date: datetime | None
+    end_date: datetime | None
+
+
+class TaskInstanceChange(BaseModel):
+    """A task instance that changed, as sent by the change feed."""
+
+    run_id: str
+    task_id: str
+    map_index: int
+    state: TaskInstanceState | None
+    try_number: int
+    start_date: datetime | None
+    end_date: datetime | None
+
+
+class DagChanges(BaseModel):
+    """
+    One batch of changes to the runs and task instances of a Dag.
+
+    ``cursor`` can be passed back as ``since`` to resume the feed. When ``reset`` is set, too much
+    changed to be sent as a delta and the client should reload its views instead.
+    """
+
+    dag_id: str
+    cursor: datetime
+    reset: bool = False
+    dag_runs: list[DagRunChange]
+    task_instances: list[TaskInstanceChange]
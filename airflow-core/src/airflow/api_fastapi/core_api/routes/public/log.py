@@ -20,6 +20,7 @@ from __future__ import annotations
 import contextlib
 import textwrap
 from collections.abc import Generator, Iterable
+from datetime import datetime
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
@@ -101,8 +102,17 @@ def get_log(
     full_content: bool = False,
     map_index: int = -1,
     token: str | None = None,
+    tail_lines: PositiveInt | None = None,
+    since: datetime | None = None,
 ):
-    """Get logs for a specific task instance."""
+    """
+    Get logs for a specific task instance.
+
+    ``tail_lines`` returns only the last lines of the log, and ``since`` only the lines logged from
+    that time on. When the log is read from local files, both seek through an index of the files
+    instead of reading them from the start, and the continuation token resumes where the previous
+    read stopped.
+    """
     if not token:
         metadata = {}
     else:
@@ -117,6 +127,10 @@ def get_log(
         full_content = True
 
     metadata["download_logs"] = full_content
+    if tail_lines is not None:
+        metadata["tail_lines"] = tail_lines
+    if since is not None:
+        metadata["since"] = since.isoformat()
 
     task_log_reader = TaskLogReader()
 
@@ -23,6 +23,7 @@ from airflow.api_fastapi.core_api.routes.ui.assets import assets_router
 from airflow.api_fastapi.core_api.routes.ui.auth import auth_router
 from airflow.api_fastapi.core_api.routes.ui.backfills import backfills_router
 from airflow.api_fastapi.core_api.routes.ui.calendar import calendar_router
+from airflow.api_fastapi.core_api.routes.ui.changes import changes_router
 from airflow.api_fastapi.core_api.routes.ui.config import config_router
 from airflow.api_fastapi.core_api.routes.ui.connections import connections_router
 from airflow.api_fastapi.core_api.routes.ui.dag_runs import dag_runs_router
@@ -56,4 +57,5 @@ ui_router.include_router(backfills_router)
 ui_router.include_router(grid_router)
 ui_router.include_router(gantt_router)
 ui_router.include_router(calendar_router)
+ui_router.include_router(changes_router)
 ui_router.include_router(teams_router)
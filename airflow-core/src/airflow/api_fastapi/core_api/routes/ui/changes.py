@@ -0,0 +1,89 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
+from airflow.api_fastapi.common.db.common import SessionDep
+from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.core_api.datamodels.ui.changes import DagChanges
+from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
+from airflow.api_fastapi.core_api.security import requires_access_dag
+from airflow.api_fastapi.core_api.services.ui.change_feed import DagChangeFeed
+from airflow.models.dag import DagModel
+
+changes_router = AirflowRouter(prefix="/changes", tags=["Changes"])
+
+
+@changes_router.get(
+    "/{dag_id}",
+    response_class=StreamingResponse,
+    response_model=DagChanges,
+    responses={
+        **create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
+        200: {
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+            "description": "NDJSON stream — one ``DagChanges`` JSON object per line",
+        },
+    },
+    dependencies=[
+        Depends(
+            requires_access_dag(
+                method="GET",
+                access_entity=DagAccessEntity.TASK_INSTANCE,
+            )
+        ),
+        Depends(
+            requires_access_dag(
+                method="GET",
+                access_entity=DagAccessEntity.RUN,
+            )
+        ),
+    ],
+)
+def get_dag_changes(
+    dag_id: str,
+    session: SessionDep,
+    since: Annotated[
+        datetime | None,
+        Query(description="Cursor of a previous ``DagChanges`` line to resume from. Defaults to now."),
+    ] = None,
+    interval: Annotated[float, Query(gt=0.0, description="Seconds to wait between checks for changes")] = 2.0,
+    timeout: Annotated[
+        float, Query(gt=0.0, le=600.0, description="Seconds after which the stream ends")
+    ] = 60.0,
+) -> StreamingResponse:
+    """
+    Stream the changes to the runs and task instances of a Dag as NDJSON.
+
+    The first line is sent right away and carries the cursor to resume from. After that a line is
+    sent whenever runs or task instances changed, holding only those rows. The stream ends after
+    ``timeout`` seconds; clients then reconnect with the ``cursor`` of the last line as ``since``.
+    """
+    if not session.scalar(select(DagModel.dag_id).where(DagModel.dag_id == dag_id)):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, f"Dag with id {dag_id} was not found")
+    # Release the request session; the feed polls with its own async sessions.
+    session.close()
+    feed = DagChangeFeed(dag_id=dag_id, since=since, interval=interval, timeout=timeout)
+    return StreamingResponse(feed.stream(), media_type="application/x-ndjson")
@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
 import structlog
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy import exists, select
 from sqlalchemy.orm import Session, joinedload, load_only
@@ -60,9 +60,13 @@ from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_
 from airflow.api_fastapi.core_api.security import requires_access_dag
 from airflow.api_fastapi.core_api.services.ui.grid import (
     GridNodeAgg,
+    GridSummaryCache,
     _find_aggregates,
     _get_aggs_for_node,
     _merge_node_dicts,
+    etag_matches,
+    get_run_fingerprints,
+    make_grid_etag,
 )
 from airflow.api_fastapi.core_api.services.ui.task_group import (
     get_task_group_children_getter,
@@ -84,6 +88,13 @@ log = structlog.get_logger(logger_name=__name__)
 grid_router = AirflowRouter(prefix="/grid", tags=["Grid"])
 
 
+def _grid_summary_cache_from_app(request: Request) -> GridSummaryCache:
+    return request.app.state.grid_summary_cache
+
+
+GridSummaryCacheDep = Annotated[GridSummaryCache, Depends(_grid_summary_cache_from_app)]
+
+
 def _get_latest_serdag(dag_id, session):
     serdag = session.scalar(SerializedDagModel.latest_item_select_object(dag_id))
     if not serdag:
@@ -498,8 +509,10 @@ def _build_ti_summaries(
 def get_grid_ti_summaries_stream(
     dag_id: str,
     dag_bag: DagBagDep,
+    summary_cache: GridSummaryCacheDep,
+    request: Request,
     run_ids: Annotated[list[str] | None, Query()] = None,
-) -> StreamingResponse:
+) -> Response:
     """
     Stream TI summaries for multiple Dag runs as NDJSON (one JSON line per run).
 
@@ -510,7 +523,18 @@ def get_grid_ti_summaries_stream(
     The serialized Dag structure is served from the app-wide ``DBDagBag`` cache
     (keyed by ``dag_version_id``), which avoids repeated deserialization across
     runs of the same version *and* across requests.
+
+    The task instances of all requested runs are first fingerprinted with a single
+    aggregate query. Runs whose fingerprint is unchanged are served from the
+    in-process grid summary cache, and the response carries an ``ETag`` so that a
+    request whose ``If-None-Match`` still matches gets an empty 304 response.
     """
+    run_ids = run_ids or []
+    with create_session(scoped=False) as session:
+        fingerprints = get_run_fingerprints(dag_id, run_ids, session)
+    etag = make_grid_etag(dag_id, run_ids, fingerprints)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
     def _generate() -> Generator[str, None, None]:
         # Each iteration opens and closes its own DB session so the connection is
@@ -525,7 +549,14 @@ def get_grid_ti_summaries_stream(
             .label("has_note")
         )
 
-        for run_id in run_ids or []:
+        for run_id in run_ids:
+            fingerprint = fingerprints.get(run_id)
+            if fingerprint is None:
+                # No task instances when fingerprinted, so there is nothing to summarize.
+                continue
+            if (line := summary_cache.get(dag_id, run_id, fingerprint)) is not None:
+                yield line
+                continue
             with create_session(scoped=False) as session:
                 tis = session.execute(
                     select(
@@ -552,6 +583,8 @@ def get_grid_ti_summaries_stream(
                 )
             if summary is None:
                 continue
-            yield GridTISummaries.model_validate(summary).model_dump_json() + "\n"
+            line = GridTISummaries.model_validate(summary).model_dump_json() + "\n"
+            summary_cache.put(dag_id, run_id, fingerprint, line)
+            yield line
 
-    return StreamingResponse(content=_generate(), media_type="application/x-ndjson")
+    return StreamingResponse(content=_generate(), media_type="application/x-ndjson", headers={"ETag": etag})
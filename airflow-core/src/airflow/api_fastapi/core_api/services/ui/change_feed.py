@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Change feed of the runs and task instances of a Dag, for the UI to follow without polling."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Hashable
+from datetime import datetime, timedelta
+from typing import Any
+
+import attrs
+from sqlalchemy import select
+
+from airflow._shared.timezones import timezone
+from airflow.api_fastapi.core_api.datamodels.ui.changes import (
+    DagChanges,
+    DagRunChange,
+    TaskInstanceChange,
+)
+from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
+from airflow.utils.session import create_session_async
+
+# ``updated_at`` and ``state_changed_at`` are set when a row is written, not when its transaction
+# commits, so a slow transaction can commit a row older than changes already sent. Every poll
+# looks back this far behind the cursor to pick such rows up; rows already sent unchanged are not
+# sent again.
+COMMIT_LAG = timedelta(seconds=5)
+
+# Beyond this many changed rows in one poll the feed asks the client to reload instead.
+MAX_CHANGES = 5000
+
+
+@attrs.define
+class DagChangeFeed:
+    """
+    Stream the changes to the runs and task instances of a Dag as NDJSON.
+
+    The feed polls the ``(dag_id, updated_at)`` index of ``dag_run`` and the
+    ``(dag_id, state_changed_at)`` index of ``task_instance`` every ``interval`` seconds and emits
+    one :class:`DagChanges` line per poll that found changes. Task instances are followed through
+    ``state_changed_at`` rather than ``updated_at``, which every heartbeat bumps. Only rows whose
+    visible fields changed since they were last sent are emitted. The first line is sent right
+    away, even when empty, so the client always has a cursor to resume from.
+
+    Delivery is at-least-once: after resuming from a cursor, changes from just before it may be
+    sent again. Clients should apply changes as idempotent snapshots of the rows.
+    """
+
+    dag_id: str
+    since: datetime | None
+    interval: float
+    timeout: float
+    _sent: dict[Hashable, tuple[Any, ...]] = attrs.field(factory=dict, init=False)
+
+    async def _fetch(self, after: datetime) -> tuple[list[Any], list[Any]]:
+        async with create_session_async() as session:
+            dag_runs = (
+                await session.execute(
+                    select(
+                        DagRun.run_id,
+                        DagRun.state,
+                        DagRun.start_date,
+                        DagRun.end_date,
+                        DagRun.updated_at,
+                    )
+                    .where(DagRun.dag_id == self.dag_id, DagRun.updated_at > after)
+                    .limit(MAX_CHANGES + 1)
+                )
+            ).all()
+            task_instances = (
+                await session.execute(
+                    select(
+                        TaskInstance.run_id,
+                        TaskInstance.task_id,
+                        TaskInstance.map_index,
+                        TaskInstance.state,
+                        TaskInstance.try_number,
+                        TaskInstance.start_date,
+                        TaskInstance.end_date,
+                        TaskInstance.state_changed_at,
+                    )
+                    .where(TaskInstance.dag_id == self.dag_id, TaskInstance.state_changed_at > after)
+                    .limit(MAX_CHANGES + 1)
+                )
+            ).all()
+        return dag_runs, task_instances
+
+    def _is_new(self, key: Hashable, values: tuple[Any, ...]) -> bool:
+        if self._sent.get(key) == values:
+            return False
+        self._sent[key] = values
+        return True
+
+    async def _poll(self, cursor: datetime) -> DagChanges:
+        dag_runs, task_instances = await self._fetch(cursor - COMMIT_LAG)
+        if len(dag_runs) > MAX_CHANGES or len(task_instances) > MAX_CHANGES:
+            # Everything sent so far is superseded by the reload.
+            self._sent.clear()
+            return DagChanges(
+                dag_id=self.dag_id, cursor=timezone.utcnow(), reset=True, dag_runs=[], task_instances=[]
+            )
+        latest = max(
+            (*(row.updated_at for row in dag_runs), *(row.state_changed_at for row in task_instances)),
+            default=cursor,
+        )
+        return DagChanges(
+            dag_id=self.dag_id,
+            cursor=max(cursor, latest),
+            dag_runs=[
+                DagRunChange(run_id=run_id, state=state, start_date=start_date, end_date=end_date)
+                for run_id, state, start_date, end_date, _ in dag_runs
+                if self._is_new(("dag_run", run_id), (state, start_date, end_date))
+            ],
+            task_instances=[
+                TaskInstanceChange(
+                    run_id=run_id,
+                    task_id=task_id,
+                    map_index=map_index,
+                    state=state,
+                    try_number=try_number,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                for run_id, task_id, map_index, state, try_number, start_date, end_date, _ in task_instances
+                if self._is_new(
+                    ("task_instance", run_id, task_id, map_index), (state, try_number, start_date, end_date)
+                )
+            ],
+        )
+
+    async def stream(self) -> AsyncGenerator[str, None]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        if self.since is None:
+            changes = DagChanges(dag_id=self.dag_id, cursor=timezone.utcnow(), dag_runs=[], task_instances=[])
+        else:
+            changes = await self._poll(self.since)
+        yield changes.model_dump_json() + "\n"
+        cursor = changes.cursor
+        while loop.time() + self.interval < deadline:
+            await asyncio.sleep(self.interval)
+            changes = await self._poll(cursor)
+            cursor = changes.cursor
+            if changes.reset or changes.dag_runs or changes.task_instances:
+                yield changes.model_dump_json() + "\n"
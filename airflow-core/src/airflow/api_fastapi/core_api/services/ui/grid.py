@@ -18,22 +18,33 @@
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from threading import Lock
+from typing import TYPE_CHECKING, Any
 
 import structlog
+from cachetools import LRUCache
+from sqlalchemy import func, select
 
 from airflow.api_fastapi.common.parameters import state_priority
 from airflow.api_fastapi.core_api.services.ui.task_group import get_task_group_children_getter
+from airflow.configuration import conf
+from airflow.models.taskinstance import TaskInstance, TaskInstanceNote
 from airflow.models.taskmap import TaskMap
 from airflow.serialization.definitions.baseoperator import SerializedBaseOperator
 from airflow.serialization.definitions.mappedoperator import SerializedMappedOperator
 from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
+from airflow.utils.hashlib_wrapper import md5
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
 
 log = structlog.get_logger(logger_name=__name__)
 
+RunFingerprint = tuple[tuple[Any, ...], ...]
+
 
 @dataclass
 class GridNodeAgg:
@@ -206,3 +217,108 @@ def _find_aggregates(
             summary,
         )
         return
+
+
+def get_run_fingerprints(dag_id: str, run_ids: Sequence[str], session: Session) -> dict[str, RunFingerprint]:
+    """
+    Return a cheap fingerprint of the task instances of each of the given Dag runs.
+
+    The fingerprint of a run is made of, per task instance state, the number of task instances,
+    their latest ``updated_at`` and the number and latest update of their notes. It changes whenever
+    a task instance of the run is added, removed, updated or gets its note changed, so it can stand
+    in for the full grid summary of the run. Runs without task instances are left out.
+
+    All runs are fingerprinted by one aggregate query over the ``(dag_id, run_id)`` index.
+    """
+    if not run_ids:
+        return {}
+    rows = session.execute(
+        select(
+            TaskInstance.run_id,
+            TaskInstance.state,
+            func.count(TaskInstance.id),
+            func.max(TaskInstance.updated_at),
+            func.count(TaskInstanceNote.content),
+            func.max(TaskInstanceNote.updated_at),
+        )
+        .outerjoin(TaskInstanceNote, TaskInstanceNote.ti_id == TaskInstance.id)
+        .where(TaskInstance.dag_id == dag_id, TaskInstance.run_id.in_(run_ids))
+        .group_by(TaskInstance.run_id, TaskInstance.state)
+    )
+    by_run: dict[str, list[tuple[Any, ...]]] = {}
+    for run_id, *fields in rows:
+        by_run.setdefault(run_id, []).append(tuple(fields))
+    # ``state`` is None for task instances without a state, so sort on its string form.
+    return {run_id: tuple(sorted(parts, key=str)) for run_id, parts in by_run.items()}
+
+
+def make_grid_etag(dag_id: str, run_ids: Sequence[str], fingerprints: Mapping[str, RunFingerprint]) -> str:
+    """Build a weak ETag for the grid summaries of ``run_ids`` from their fingerprints."""
+    key = (dag_id, [(run_id, fingerprints.get(run_id)) for run_id in run_ids])
+    return f'W/"{md5(repr(key).encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Tell whether an ``If-None-Match`` header value matches ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    wanted = etag.removeprefix("W/")
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == wanted
+        for candidate in (value.strip() for value in if_none_match.split(","))
+    )
+
+
+class GridSummaryCache:
+    """
+    In-process LRU of rendered grid TI summaries, one entry per Dag run.
+
+    An entry holds the NDJSON line of a run together with the fingerprint of the run's task
+    instances it was built from (see :func:`get_run_fingerprints`). It is only served while the
+    fingerprint is unchanged, so a run whose task instances changed is rebuilt on the next request
+    and unchanged runs, the bulk of a grid view, are served without loading their task instances or
+    walking their task groups again.
+
+    :param maxsize: Maximum number of Dag runs kept; 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: LRUCache[tuple[str, str], tuple[RunFingerprint, str]] | None = (
+            LRUCache(maxsize=maxsize) if maxsize > 0 else None
+        )
+        # cachetools caches are not thread-safe and sync endpoints run in a thread pool.
+        self._lock = Lock()
+
+    def get(self, dag_id: str, run_id: str, fingerprint: RunFingerprint) -> str | None:
+        """Return the cached summary line of the run if it was built from ``fingerprint``."""
+        if self._entries is None:
+            return None
+        with self._lock:
+            entry = self._entries.get((dag_id, run_id))
+        if entry is None or entry[0] != fingerprint:
+            return None
+        return entry[1]
+
+    def put(self, dag_id: str, run_id: str, fingerprint: RunFingerprint, line: str) -> None:
+        """Store the summary line of the run built from ``fingerprint``."""
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries[(dag_id, run_id)] = (fingerprint, line)
+
+    def clear(self) -> None:
+        """Drop all cached summaries."""
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries.clear()
+
+
+def create_grid_summary_cache() -> GridSummaryCache:
+    """Create the grid summary cache of the API server, sized by ``[api] grid_summary_cache_size``."""
+    maxsize = conf.getint("api", "grid_summary_cache_size", fallback=1024)
+    if maxsize < 0:
+        log.warning("grid_summary_cache_size must be >= 0, disabling the grid summary cache")
+        maxsize = 0
+    return GridSummaryCache(maxsize=maxsize)
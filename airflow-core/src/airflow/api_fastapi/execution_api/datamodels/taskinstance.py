@@ -24,6 +24,7 @@ from typing import Annotated, Any, Literal
 
 from pydantic import (
     AwareDatetime,
+    Discriminator,
     Field,
     JsonValue,
     Tag,
@@ -139,6 +140,13 @@ class TIDeferredStatePayload(StrictBaseModel):
     """
 
     trigger_timeout: timedelta | None = None
+    trigger_fire_at: UtcDateTime | None = None
+    """
+    The moment the trigger fires, set when it does nothing but wait for it.
+
+    The trigger must then fire a single event with this moment as its payload, so the scheduler can
+    resume the task at that moment without running the trigger.
+    """
     queue: str | None = None
     next_method: str
     """The name of the method on the operator to call in the worker after the trigger has fired."""
@@ -253,16 +261,17 @@ def ti_state_discriminator(v: dict[str, str] | StrictBaseModel) -> str:
 
 # It is called "_terminal_" to avoid future conflicts if we added an actual state named "terminal"
 # and "_other_" is a catch-all for all other states that are not covered by the other schemas.
-TIStateUpdate = Annotated[
+_TIStatePayloads = (
     Annotated[TITerminalStatePayload, Tag("_terminal_")]
     | Annotated[TISuccessStatePayload, Tag("success")]
     | Annotated[TITargetStatePayload, Tag("_other_")]
     | Annotated[TIDeferredStatePayload, Tag("deferred")]
     | Annotated[TIRescheduleStatePayload, Tag("up_for_reschedule")]
     | Annotated[TIAwaitingInputStatePayload, Tag("awaiting_input")]
-    | Annotated[TIRetryStatePayload, Tag("up_for_retry")],
-    Field(discriminator=ti_state_discriminator),
-]
+    | Annotated[TIRetryStatePayload, Tag("up_for_retry")]
+)
+
+TIStateUpdate = Annotated[_TIStatePayloads, Field(discriminator=ti_state_discriminator)]
 
 
 class TIHeartbeatInfo(StrictBaseModel):
@@ -272,6 +281,47 @@ class TIHeartbeatInfo(StrictBaseModel):
     pid: int
 
 
+class TIBatchItem(StrictBaseModel):
+    """Schema for one heartbeat or state update of a TaskInstance in a batch request."""
+
+    task_instance_id: uuid.UUID
+    token: str
+    """Execution API token of the TaskInstance, as sent to the endpoints of a single TaskInstance."""
+
+    heartbeat: TIHeartbeatInfo | None = None
+    state: Annotated[_TIStatePayloads, Discriminator(ti_state_discriminator)] | None = None
+
+    @model_validator(mode="after")
+    def check_one_operation(self) -> TIBatchItem:
+        if (self.heartbeat is None) == (self.state is None):
+            raise ValueError("Exactly one of 'heartbeat' or 'state' must be set")
+        return self
+
+
+class TIBatchRequest(StrictBaseModel):
+    """Schema for heartbeating and updating the state of several TaskInstances in one request."""
+
+    items: Annotated[list[TIBatchItem], Field(max_length=1000)]
+
+
+class TIBatchItemResult(BaseModel):
+    """Result of one item of a batch request."""
+
+    task_instance_id: uuid.UUID
+    status_code: int
+    """Status code the endpoint of a single TaskInstance would have returned for the item."""
+
+    detail: JsonValue = None
+    refreshed_token: str | None = None
+    """New token for the TaskInstance, set when its token is about to expire."""
+
+
+class TIBatchResponse(BaseModel):
+    """Response schema for a batch request, with one result per item in the order of the items."""
+
+    results: list[TIBatchItemResult]
+
+
 # This model is not used in the API, but it is included in generated OpenAPI schema
 # for use in the client SDKs.
 class TaskInstance(BaseModel):
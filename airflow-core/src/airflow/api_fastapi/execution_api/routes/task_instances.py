@@ -27,6 +27,7 @@ from uuid import UUID
 
 import attrs
 import structlog
+from anyio import to_thread
 from cadwyn import VersionedAPIRouter
 from fastapi import Body, HTTPException, Query, Response, Security, status
 from opentelemetry import trace
@@ -43,7 +44,7 @@ from structlog.contextvars import bind_contextvars
 from airflow._shared.observability.traces import override_ids
 from airflow._shared.state import TaskScope
 from airflow._shared.timezones import timezone
-from airflow.api_fastapi.auth.tokens import JWTGenerator
+from airflow.api_fastapi.auth.tokens import JWTGenerator, JWTValidator
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.db.dags import eager_load_teams
@@ -58,6 +59,10 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TaskBreadcrumbsResponse,
     TaskStatesResponse,
     TIAwaitingInputStatePayload,
+    TIBatchItem,
+    TIBatchItemResult,
+    TIBatchRequest,
+    TIBatchResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -76,7 +81,9 @@ from airflow.api_fastapi.execution_api.security import (
     ExecutionAPIRoute,
     get_team_name_for_ti,
     require_auth,
+    token_needs_reissue,
 )
+from airflow.api_fastapi.execution_api.services.heartbeats import get_heartbeat_coalescer, record_heartbeats
 from airflow.api_fastapi.execution_api.services.task_instances import (
     client_supports_arg_bindings,
     get_arg_bindings,
@@ -256,6 +263,7 @@ def ti_run(
         unixname=ti_run_payload.unixname,
         pid=ti_run_payload.pid,
         state=TaskInstanceState.RUNNING,
+        state_changed_at=timezone.utcnow(),
         last_heartbeat_at=timezone.utcnow(),
         retry_delay_override=None,
         retry_reason=None,
@@ -503,6 +511,7 @@ def ti_update_state(
         query = query.values(state=(updated_state := TaskInstanceState.FAILED))
         if ti is not None:
             _handle_fail_fast_for_dag(ti=ti, dag_id=dag_id, session=session, dag_bag=dag_bag)
+    query = query.values(state_changed_at=timezone.utcnow())
 
     # TODO: Replace this with FastAPI's Custom Exception handling:
     # https://fastapi.tiangolo.com/tutorial/handling-errors/#install-custom-exception-handlers
@@ -720,6 +729,7 @@ def _create_ti_state_update_query_and_update_state(
             kwargs={},
             queue=ti_patch_payload.queue,
             team_name=get_team_name_for_ti(task_instance_id, session),
+            fire_at=ti_patch_payload.trigger_fire_at,
         )
         trigger_row.encrypted_kwargs = trigger_kwargs
         session.add(trigger_row)
@@ -884,7 +894,7 @@ def ti_skip_downstream(
             tuple_(TI.task_id, TI.map_index).in_(task_ids),
             skippable_state_clause,
         )
-        .values(state=TaskInstanceState.SKIPPED, start_date=now, end_date=now)
+        .values(state=TaskInstanceState.SKIPPED, state_changed_at=now, start_date=now, end_date=now)
         .execution_options(synchronize_session=False)
     )
 
@@ -933,7 +943,7 @@ def _raise_ti_not_in_live_table(task_instance_id: UUID, session: SessionDep) ->
         ]
     ),
 )
-def ti_heartbeat(
+async def ti_heartbeat(
     task_instance_id: UUID,
     ti_payload: TIHeartbeatInfo,
     session: SessionDep,
@@ -942,6 +952,17 @@ def ti_heartbeat(
     bind_contextvars(ti_id=str(task_instance_id))
     log.debug("Processing heartbeat", hostname=ti_payload.hostname, pid=ti_payload.pid)
 
+    # Async so that heartbeats waiting to be written together hold no thread; the database is only
+    # used from worker threads.
+    coalescer = get_heartbeat_coalescer()
+    if coalescer is not None and await coalescer.heartbeat(task_instance_id, ti_payload):
+        log.debug("Heartbeat updated with other coalesced heartbeats")
+        return
+    await to_thread.run_sync(_update_heartbeat, task_instance_id, ti_payload, session)
+
+
+def _update_heartbeat(task_instance_id: UUID, ti_payload: TIHeartbeatInfo, session: SessionDep) -> None:
+    """Update the heartbeat of a TaskInstance, or raise why it should not be running anymore."""
     # Hot path: in the common case the TI is still running on the same host and pid,
     # so we can update last_heartbeat_at directly without first taking a row lock.
     fast_path_result = cast(
@@ -1011,6 +1032,97 @@ def ti_heartbeat(
     log.debug("Heartbeat updated", state=previous_state)
 
 
+@router.post("/batch", status_code=status.HTTP_200_OK)
+def ti_batch(
+    batch: TIBatchRequest,
+    session: SessionDep,
+    dag_bag: DagBagDep,
+    services=DepContainer,
+) -> TIBatchResponse:
+    """
+    Heartbeat and update the state of several TaskInstances in one request.
+
+    Each item carries the token of its TaskInstance, and is processed and committed as a request to
+    the heartbeat or state endpoint of that TaskInstance would be. The result of each item holds the
+    status code and error detail that endpoint would have returned, and a refreshed token when the
+    token of the item is about to expire. The heartbeats of the batch are written with one UPDATE.
+    """
+    validator: JWTValidator = services.get(JWTValidator)
+    claims: dict[int, dict[str, Any]] = {}
+    errors: dict[int, HTTPException] = {}
+    for index, item in enumerate(batch.items):
+        try:
+            claims[index] = _validate_batch_item_token(item, validator)
+        except HTTPException as e:
+            errors[index] = e
+
+    # The heartbeats are written together; only those that were not written are checked one by one.
+    heartbeated = record_heartbeats(
+        {
+            item.task_instance_id: item.heartbeat
+            for index, item in enumerate(batch.items)
+            if index in claims and item.heartbeat is not None
+        },
+        session=session,
+    )
+    session.commit()
+
+    results = []
+    for index, item in enumerate(batch.items):
+        if (error := errors.get(index)) is None:
+            try:
+                if item.heartbeat is not None:
+                    if item.task_instance_id not in heartbeated:
+                        _update_heartbeat(item.task_instance_id, item.heartbeat, session)
+                    status_code = status.HTTP_204_NO_CONTENT
+                else:
+                    response = ti_update_state(item.task_instance_id, item.state, session, dag_bag)  # type: ignore[arg-type]
+                    status_code = response.status_code if response is not None else status.HTTP_204_NO_CONTENT
+                session.commit()
+            except HTTPException as e:
+                session.rollback()
+                error = e
+        if error is not None:
+            results.append(
+                TIBatchItemResult(
+                    task_instance_id=item.task_instance_id, status_code=error.status_code, detail=error.detail
+                )
+            )
+            continue
+        refreshed_token = None
+        if token_needs_reissue(claims[index]):
+            generator: JWTGenerator = services.get(JWTGenerator)
+            refreshed_token = generator.generate(claims[index])
+        results.append(
+            TIBatchItemResult(
+                task_instance_id=item.task_instance_id,
+                status_code=status_code,
+                refreshed_token=refreshed_token,
+            )
+        )
+    return TIBatchResponse(results=results)
+
+
+def _validate_batch_item_token(item: TIBatchItem, validator: JWTValidator) -> dict[str, Any]:
+    """Validate the token of a batch item like ``require_auth`` validates the token of a request."""
+    try:
+        claims = validator.validated_claims(item.token, {})
+    except Exception:
+        log.warning("Failed to validate JWT of batch item", ti_id=str(item.task_instance_id), exc_info=True)
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid auth token")
+    if claims.get("scope", "execution") != "execution":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Token type '{claims.get('scope')}' not allowed for this endpoint. Allowed types: execution",
+        )
+    if claims.get("sub") != str(item.task_instance_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Token subject does not match task instance ID",
+        )
+    return claims
+
+
 @ti_id_router.put(
     "/{task_instance_id}/rtif",
     status_code=status.HTTP_201_CREATED,
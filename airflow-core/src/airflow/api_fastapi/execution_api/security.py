@@ -67,6 +67,7 @@ Why ``ExecutionAPIRoute`` is needed:
 # Disable future annotations in this file to work around https://github.com/fastapi/fastapi/issues/13056
 # ruff: noqa: I002
 
+import time
 from typing import Any, get_args
 
 import structlog
@@ -143,6 +144,21 @@ class JWTBearer(HTTPBearer):
 _jwt_bearer = JWTBearer()
 
 
+def token_needs_reissue(claims: dict[str, Any]) -> bool:
+    """
+    Whether the token the given claims were validated from should be replaced by a new one.
+
+    A token is reissued once less than 20% of its lifetime, or less than 30 seconds, is left.
+    Workload tokens are long-lived and meant to survive queue wait times, so they are never reissued.
+    """
+    if claims.get("scope") == "workload":
+        return False
+    token_lifetime = int(claims.get("exp", 0)) - int(claims.get("iat", 0))
+    refresh_when_less_than = max(int(token_lifetime * 0.20), 30)
+    valid_left = int(claims.get("exp", 0)) - int(time.time())
+    return valid_left <= refresh_when_less_than
+
+
 async def require_auth(
     security_scopes: SecurityScopes,
     request: Request,
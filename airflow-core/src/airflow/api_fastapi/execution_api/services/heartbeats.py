@@ -0,0 +1,150 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Writing the heartbeats of several task instances with one UPDATE."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from functools import cache
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import structlog
+from anyio import to_thread
+from sqlalchemy import select, tuple_, update
+
+from airflow._shared.timezones import timezone
+from airflow.configuration import conf
+from airflow.models.taskinstance import TaskInstance as TI
+from airflow.utils.session import create_session
+from airflow.utils.sqlalchemy import get_dialect_name
+from airflow.utils.state import TaskInstanceState
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from airflow.api_fastapi.execution_api.datamodels.taskinstance import TIHeartbeatInfo
+
+log = structlog.get_logger(__name__)
+
+
+def record_heartbeats(heartbeats: Mapping[UUID, TIHeartbeatInfo], *, session: Session) -> set[UUID]:
+    """
+    Update the heartbeat of the running task instances still on the host and pid of their heartbeat.
+
+    All the heartbeats are written with one UPDATE. The ids of the task instances whose heartbeat was
+    written are returned; the others need the diagnostic checks of the heartbeat endpoint, which tell
+    why the task should stop.
+    """
+    if not heartbeats:
+        return set()
+    matching = (
+        TI.state == TaskInstanceState.RUNNING,
+        tuple_(TI.id, TI.hostname, TI.pid).in_(
+            [(ti_id, info.hostname, info.pid) for ti_id, info in heartbeats.items()]
+        ),
+    )
+    heartbeat_update = (
+        update(TI)
+        .where(*matching)
+        .values(last_heartbeat_at=timezone.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    # Use RETURNING where supported (PostgreSQL); elsewhere select the rows again. The rows updated
+    # are locked until the transaction ends, so they still match.
+    if get_dialect_name(session) == "postgresql":
+        return set(session.scalars(heartbeat_update.returning(TI.id)))
+    session.execute(heartbeat_update)
+    return set(session.scalars(select(TI.id).where(*matching)))
+
+
+def _write_heartbeats(heartbeats: Mapping[UUID, TIHeartbeatInfo]) -> set[UUID]:
+    with create_session(scoped=False) as session:
+        return record_heartbeats(heartbeats, session=session)
+
+
+class HeartbeatCoalescer:
+    """
+    Write the heartbeats received at about the same time by an API server process together.
+
+    The first heartbeat starts a window of ``window`` seconds. The heartbeats received until it ends,
+    or until ``max_size`` of them have arrived, are then written with one UPDATE in a worker thread.
+    Requests wait for the write on the event loop, so no thread is held while a window is open. A
+    heartbeat that was not written, including when the write failed, is left to the caller to write
+    and validate on its own.
+
+    Must be used from the event loop of the API server process only.
+
+    :param window: Seconds to wait for other heartbeats before writing.
+    :param max_size: Number of heartbeats written at most with one UPDATE.
+    """
+
+    def __init__(self, window: float, max_size: int = 500) -> None:
+        self.window = window
+        self.max_size = max_size
+        self._pending: dict[UUID, TIHeartbeatInfo] = {}
+        self._written: asyncio.Future[set[UUID]] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        # Keep a reference to the running writes, which the event loop only references weakly
+        self._writes: set[asyncio.Task[None]] = set()
+
+    async def heartbeat(self, ti_id: UUID, info: TIHeartbeatInfo) -> bool:
+        """Write the heartbeat of a task instance with the others received meanwhile; return whether it was."""
+        if self._written is None:
+            loop = asyncio.get_running_loop()
+            self._written = loop.create_future()
+            self._timer = loop.call_later(self.window, self._flush)
+        written = self._written
+        self._pending[ti_id] = info
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        # A request going away must not cancel the write the other requests wait for
+        return ti_id in await asyncio.shield(written)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        heartbeats, written = self._pending, self._written
+        self._pending, self._written, self._timer = {}, None, None
+        if written is None:
+            return
+        task = asyncio.ensure_future(self._write(heartbeats, written))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    @staticmethod
+    async def _write(heartbeats: dict[UUID, TIHeartbeatInfo], written: asyncio.Future[set[UUID]]) -> None:
+        try:
+            updated = await to_thread.run_sync(_write_heartbeats, heartbeats)
+        except Exception:
+            log.warning("Failed to write coalesced heartbeats", count=len(heartbeats), exc_info=True)
+            updated = set()
+        log.debug("Coalesced heartbeats written", count=len(heartbeats), written=len(updated))
+        if not written.done():
+            written.set_result(updated)
+
+
+@cache
+def get_heartbeat_coalescer() -> HeartbeatCoalescer | None:
+    """Return the heartbeat coalescer of this process, or None when heartbeats are not coalesced."""
+    window = conf.getfloat("execution_api", "heartbeat_coalesce_window", fallback=0)
+    if window <= 0:
+        return None
+    return HeartbeatCoalescer(
+        window=window, max_size=conf.getint("execution_api", "heartbeat_coalesce_max_size", fallback=500)
+    )
@@ -51,11 +51,20 @@ from airflow.api_fastapi.execution_api.versions.v2026_06_30 import (
     AddTeamNameField,
     AddVariableKeysEndpoint,
 )
-from airflow.api_fastapi.execution_api.versions.v2026_10_30 import AddArgBindingsToTIRunContext
+from airflow.api_fastapi.execution_api.versions.v2026_10_30 import (
+    AddArgBindingsToTIRunContext,
+    AddTaskInstanceBatchEndpoint,
+    AddTriggerFireAtField,
+)
 
 bundle = VersionBundle(
     HeadVersion(),
-    Version("2026-10-30", AddArgBindingsToTIRunContext),
+    Version(
+        "2026-10-30",
+        AddArgBindingsToTIRunContext,
+        AddTriggerFireAtField,
+        AddTaskInstanceBatchEndpoint,
+    ),
     Version(
         "2026-06-30",
         AddVariableKeysEndpoint,
@@ -19,12 +19,14 @@ from __future__ import annotations
 
 from cadwyn import (
     ResponseInfo,
+    VersionChange,
     VersionChangeWithSideEffects,
     convert_response_to_previous_version_for,
+    endpoint,
     schema,
 )
 
-from airflow.api_fastapi.execution_api.datamodels.taskinstance import TIRunContext
+from airflow.api_fastapi.execution_api.datamodels.taskinstance import TIDeferredStatePayload, TIRunContext
 
 
 class AddArgBindingsToTIRunContext(VersionChangeWithSideEffects):
@@ -40,3 +42,21 @@ class AddArgBindingsToTIRunContext(VersionChangeWithSideEffects):
     def remove_arg_bindings_field(response: ResponseInfo) -> None:  # type: ignore[misc]
         """Strip ``arg_bindings`` from the run context for older clients."""
         response.body.pop("arg_bindings", None)
+
+
+class AddTriggerFireAtField(VersionChange):
+    """Add the ``trigger_fire_at`` field to TIDeferredStatePayload for deferrals that only wait for a time."""
+
+    description = __doc__
+
+    instructions_to_migrate_to_previous_version = (
+        schema(TIDeferredStatePayload).field("trigger_fire_at").didnt_exist,
+    )
+
+
+class AddTaskInstanceBatchEndpoint(VersionChange):
+    """Add POST /task-instances/batch endpoint to heartbeat and update the state of several TaskInstances."""
+
+    description = __doc__
+
+    instructions_to_migrate_to_previous_version = (endpoint("/task-instances/batch", ["POST"]).didnt_exist,)
@@ -55,7 +55,12 @@ from airflow.dag_processing.bundles.base import (
 )
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.parse_cache import DagFileParseCache
+from airflow.dag_processing.processor import (
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    pre_import_modules,
+)
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DagPriorityParsingRequest
@@ -170,6 +175,11 @@ def _config_get_factory(section: str, key: str):
     return functools.partial(conf.get, section, key)
 
 
+def _make_parse_cache() -> DagFileParseCache | None:
+    ttl = conf.getfloat("dag_processor", "parse_cache_ttl", fallback=0)
+    return DagFileParseCache(ttl=ttl) if ttl > 0 else None
+
+
 def _resolve_path(instance: Any, attribute: attrs.Attribute, val: str | os.PathLike[str] | None):
     if val is not None:
         val = Path(val).resolve()
@@ -270,6 +280,9 @@ class DagFileProcessorManager(LoggingMixin):
 
     _processors: dict[DagFileInfo, DagFileProcessorProcess] = attrs.field(factory=dict, init=False)
 
+    _parse_cache: DagFileParseCache | None = attrs.field(factory=_make_parse_cache, init=False)
+    """Parsing results reused while a file and its imported modules are unchanged, if enabled."""
+
     _parsing_start_time: float | None = attrs.field(default=None, init=False)
     _num_run: int = attrs.field(default=0, init=False)
 
@@ -298,6 +311,13 @@ class DagFileProcessorManager(LoggingMixin):
         factory=_config_get_factory("dag_processor", "file_parsing_sort_mode")
     )
 
+    parsing_pre_import_module_list: list[str] = attrs.field(
+        factory=functools.partial(
+            conf.getlist, "dag_processor", "parsing_pre_import_module_list", fallback=[]
+        )
+    )
+    """Modules imported once before the parsing loop starts, inherited by every parsing process."""
+
     dag_discovery_safe_mode: bool = attrs.field(
         factory=_config_bool_factory("core", "dag_discovery_safe_mode")
     )
@@ -374,7 +394,13 @@ class DagFileProcessorManager(LoggingMixin):
         self.log.info("Process each file at most once every %s seconds", self._file_process_interval)
         self.prepare_bundles()
         self._symlink_latest_log_directory()
-        # To prevent COW in forked process parsing dag file
+        # Parsing processes are forked from this one, so they start with these already imported. There
+        # is no pool of long-lived parsing workers: each parsing process handles one file with its own
+        # log and comms socket, and forking from this warmed-up process already shares the imports.
+        pre_import_modules(self.parsing_pre_import_module_list, self.log)
+        # To prevent COW in forked process parsing dag file. Freeze only once, after warming up and
+        # collecting: objects frozen later would never be collected, even once they are garbage.
+        gc.collect()
         gc.freeze()
 
     def after_run(self) -> None:
@@ -638,6 +664,9 @@ class DagFileProcessorManager(LoggingMixin):
     def _queue_requested_files_for_parsing(self) -> None:
         """Queue any files requested for parsing as requested by users via UI/API."""
         files = self.claim_priority_files()
+        if self._parse_cache is not None:
+            # A requested reparse must actually parse the file.
+            self._parse_cache.invalidate(files)
         self._add_files_to_queue(files, mode="frontprio")
         self.request_bundle_refresh(file.bundle_name for file in files)
         if self._force_refresh_bundles:
@@ -1200,6 +1229,8 @@ class DagFileProcessorManager(LoggingMixin):
         self.purge_removed_files_from_queue(present=files_set)
         self.terminate_orphan_processes(present=files_set)
         self.remove_orphaned_file_stats(present=files_set)
+        if self._parse_cache is not None:
+            self._parse_cache.retain(present=files_set)
 
     def purge_removed_files_from_queue(self, present: set[DagFileInfo]):
         """Remove from queue any files no longer observed locally."""
@@ -1315,8 +1346,66 @@ class DagFileProcessorManager(LoggingMixin):
                 )
                 return
 
+            if self._parse_cache is not None and not proc.accessed_external_state:
+                self._parse_cache.put(
+                    file,
+                    proc.parsing_result,
+                    parse_duration=run_duration,
+                    parse_started_at=proc.parse_started_at,
+                )
+
         self._file_stats[file] = next_stat
 
+    def _reuse_cached_parsing_result(self, file: DagFileInfo) -> bool:
+        """
+        Persist the cached parsing result of ``file`` again instead of starting a processor for it.
+
+        This refreshes the parse time of its DAGs, so they are not deactivated as stale. Files with
+        pending callbacks are always parsed, since callbacks run in the processor.
+
+        :return: Whether a cached result was used.
+        """
+        if self._parse_cache is None or self._callback_to_execute.get(file):
+            return False
+        if (entry := self._parse_cache.get(file)) is None:
+            return False
+
+        try:
+            with create_session() as session:
+                self.persist_parsing_result(
+                    bundle_name=file.bundle_name,
+                    bundle_version=self._bundle_versions[file.bundle_name],
+                    version_data=self._bundle_version_data.get(file.bundle_name),
+                    parsing_result=entry.parsing_result,
+                    run_duration=entry.parse_duration,
+                    relative_fileloc=str(file.rel_path),
+                    session=session,
+                )
+        except Exception:
+            self.log.exception(
+                "Failed to persist cached parsing result for %s in bundle %s; parsing it again.",
+                str(file.rel_path),
+                file.bundle_name,
+            )
+            self._parse_cache.invalidate([file])
+            return False
+
+        team_name = self._get_team_name(file.bundle_name)
+        self._file_stats[file] = process_parse_results(
+            run_duration=entry.parse_duration,
+            finish_time=timezone.utcnow(),
+            run_count=self._file_stats[file].run_count,
+            bundle_name=file.bundle_name,
+            parsing_result=entry.parsing_result,
+            relative_fileloc=str(file.rel_path),
+            team_name=team_name,
+        )
+        stats.incr(
+            "dag_processing.parse_cache_hits",
+            tags=prune_dict({"bundle_name": file.bundle_name, "team_name": team_name}),
+        )
+        return True
+
     def persist_parsing_result(
         self,
         *,
@@ -1458,6 +1547,9 @@ class DagFileProcessorManager(LoggingMixin):
             if file in self._processors:
                 continue
 
+            if self._reuse_cached_parsing_result(file):
+                continue
+
             processor = self._create_process(file)
             stats.incr(
                 "dag_processing.processes",
@@ -0,0 +1,150 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Cache of DAG file parsing results, keyed by the content of the file and the modules it imports."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import attrs
+
+from airflow.utils.hashlib_wrapper import md5
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from airflow.dag_processing.manager import DagFileInfo
+    from airflow.dag_processing.processor import DagFileParsingResult
+
+
+def fingerprint_files(
+    paths: Sequence[str | os.PathLike[str]], *, unchanged_since: float | None = None
+) -> str | None:
+    """
+    Hash the content of the given files.
+
+    :param paths: Files to hash, in a stable order.
+    :param unchanged_since: If given, a file modified at or after this (wall clock) time makes the
+        fingerprint unreliable, and ``None`` is returned.
+    :return: The hex digest, or ``None`` if a file is missing or was modified too recently.
+    """
+    digest = md5()
+    for path in paths:
+        try:
+            if unchanged_since is not None and os.stat(path).st_mtime >= unchanged_since:
+                return None
+            with open(path, "rb") as f:
+                digest.update(os.fsencode(path))
+                digest.update(f.read())
+        except OSError:
+            return None
+    return digest.hexdigest()
+
+
+@attrs.define
+class ParseCacheEntry:
+    """A parsing result that can be reused while the files it was parsed from are unchanged."""
+
+    fingerprint: str
+    paths: tuple[str, ...]
+    parsing_result: DagFileParsingResult
+    parse_duration: float
+    cached_at: float = attrs.field(factory=time.monotonic)
+
+
+@attrs.define
+class DagFileParseCache:
+    """
+    Parsing results of DAG files, reused instead of parsing a file again when nothing it depends on changed.
+
+    An entry is keyed by the DAG file and fingerprinted by the content of the file and of the
+    modules from its bundle that parsing imported. It is dropped once either changes, when it is
+    older than ``ttl`` seconds, or when :meth:`invalidate` is called for the file (e.g. when a
+    reparse is requested through the API).
+
+    :param ttl: Maximum age of an entry in seconds. This bounds how long the DAGs of a file whose
+        structure depends on anything else (current time, Variables read through a secrets backend,
+        other external state) may be out of date.
+    """
+
+    ttl: float
+    _entries: dict[DagFileInfo, ParseCacheEntry] = attrs.field(factory=dict, init=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, file: DagFileInfo) -> ParseCacheEntry | None:
+        """Return the entry of ``file`` if it is still valid."""
+        if (entry := self._entries.get(file)) is None:
+            return None
+        if (
+            time.monotonic() - entry.cached_at > self.ttl
+            or fingerprint_files(entry.paths) != entry.fingerprint
+        ):
+            del self._entries[file]
+            return None
+        return entry
+
+    def put(
+        self,
+        file: DagFileInfo,
+        parsing_result: DagFileParsingResult,
+        *,
+        parse_duration: float,
+        parse_started_at: float,
+    ) -> bool:
+        """
+        Cache the result of parsing ``file``.
+
+        :param parsing_result: The parsing result. Results with import errors are not cached.
+        :param parse_duration: How long parsing took, reported again when the entry is reused.
+        :param parse_started_at: Wall clock time the parsing started. A result is not cached when one
+            of its files was modified since, as it may have been parsed from the old content.
+        :return: Whether the result was cached.
+        """
+        self._entries.pop(file, None)
+        if parsing_result.import_errors:
+            return False
+        paths = (os.fspath(file.absolute_path), *sorted(set(parsing_result.imported_module_files or ())))
+        fingerprint = fingerprint_files(paths, unchanged_since=parse_started_at)
+        if fingerprint is None:
+            return False
+        self._entries[file] = ParseCacheEntry(
+            fingerprint=fingerprint,
+            paths=paths,
+            parsing_result=parsing_result,
+            parse_duration=parse_duration,
+        )
+        return True
+
+    def invalidate(self, files: Iterable[DagFileInfo] | None = None) -> None:
+        """Drop the entries of ``files``, matched regardless of bundle version, or all entries if ``None``."""
+        if files is None:
+            self._entries.clear()
+            return
+        keys = {file.presence_key for file in files}
+        for file in [f for f in self._entries if f.presence_key in keys]:
+            del self._entries[file]
+
+    def retain(self, present: Iterable[DagFileInfo]) -> None:
+        """Drop the entries of files that are no longer present."""
+        keys = {file.presence_key for file in present}
+        for file in [f for f in self._entries if f.presence_key not in keys]:
+            del self._entries[file]
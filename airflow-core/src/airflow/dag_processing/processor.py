@@ -20,8 +20,10 @@ import contextlib
 import importlib
 import logging
 import os
+import sys
+import time
 import traceback
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, BinaryIO, ClassVar, Literal
 
@@ -142,6 +144,8 @@ class DagFileParsingResult(BaseModel):
     serialized_dags: list[LazyDeserializedDAG]
     warnings: list | None = None
     import_errors: dict[str, str] | None = None
+    imported_module_files: list[str] | None = None
+    """Files of the modules from the bundle that were imported while parsing, other than the DAG file."""
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
@@ -205,6 +209,23 @@ def _pre_import_airflow_modules(file_path: str, log: FilteringBoundLogger) -> No
             log.warning("Error when trying to pre-import module '%s' found in %s: %s", module, file_path, e)
 
 
+def pre_import_modules(modules: Iterable[str], log: FilteringBoundLogger) -> None:
+    """
+    Import the given modules into the current process.
+
+    The parsing processes are forked from the processor manager, so modules imported there up front
+    are already loaded in every parsing process instead of being imported again for each file.
+
+    :param modules: Names of the modules to import
+    :param log: Logger instance to use for warnings
+    """
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            log.warning("Error when trying to pre-import module '%s': %s", module, e)
+
+
 def _parse_file_entrypoint():
     # Mark as client-side (runs user DAG code)
     # Prevents inheriting server context from parent DagProcessorManager
@@ -245,6 +266,7 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
             import_errors=stability_check_error_dict,
         )
 
+    modules_before = set(sys.modules)
     bag = BundleDagBag(
         dag_folder=msg.file,
         bundle_path=msg.bundle_path,
@@ -264,10 +286,31 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
         serialized_dags=serialized_dags,
         import_errors=bag.import_errors,
         warnings=stability_check_result.get_formatted_warnings(bag.dag_ids),
+        imported_module_files=_get_imported_bundle_files(
+            modules_before, bundle_path=msg.bundle_path, dag_file=msg.file
+        ),
     )
     return result
 
 
+def _get_imported_bundle_files(modules_before: set[str], *, bundle_path: Path, dag_file: str) -> list[str]:
+    """Return the files of the modules from the bundle imported since ``modules_before`` was taken."""
+    bundle_dir = os.fspath(bundle_path.resolve())
+    dag_file = os.path.realpath(dag_file)
+    files = set()
+    for name in set(sys.modules) - modules_before:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if not module_file:
+            continue
+        module_file = os.path.realpath(module_file)
+        # Modules loaded from a zipped DAG file are not files on disk; they are covered by the DAG file.
+        if module_file == dag_file or not os.path.isfile(module_file):
+            continue
+        if os.path.commonpath([bundle_dir, module_file]) == bundle_dir:
+            files.add(module_file)
+    return sorted(files)
+
+
 def _serialize_dags(
     bag: DagBag,
     log: FilteringBoundLogger,
@@ -585,6 +628,10 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
     parsing_result: DagFileParsingResult | None = None
     decoder: ClassVar[TypeAdapter[ToManager]] = TypeAdapter[ToManager](ToManager)
     had_callbacks: bool = False  # Track if this process was started with callbacks to prevent stale DAG detection false positives
+    parse_started_at: float = 0.0
+    """Wall clock time the process was started at."""
+    accessed_external_state: bool = False
+    """Whether parsing requested Connections, Variables, XComs or task states through the supervisor."""
 
     client: Client
     """The HTTP client to use for communication with the API server."""
@@ -619,6 +666,7 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
         if not use_exec:
             _pre_import_airflow_modules(os.fspath(path), logger)
 
+        parse_started_at = time.time()
         proc: Self = super().start(
             target=target,
             client=client,
@@ -628,6 +676,7 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
             **kwargs,
         )
         proc.had_callbacks = bool(callbacks)  # Track if this process had callbacks
+        proc.parse_started_at = parse_started_at
         proc._on_child_started(callbacks, path, bundle_path, bundle_name)
         return proc
 
@@ -677,6 +726,8 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
 
         resp: BaseModel | None = None
         dump_opts: dict[str, bool] = {}
+        if not isinstance(msg, (DagFileParsingResult, MaskSecret)):
+            self.accessed_external_state = True
         if isinstance(msg, DagFileParsingResult):
             self.parsing_result = msg
         elif isinstance(msg, GetConnection):
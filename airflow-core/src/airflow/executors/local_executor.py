@@ -76,6 +76,25 @@ def _run_worker(
     log = structlog.get_logger(logger_name)
     log.info("Worker starting up pid=%d", os.getpid())
 
+    try:
+        _run_workloads(log, input, output, unread_messages, team_conf)
+    finally:
+        # Worker processes leave with os._exit, which skips atexit handlers and does not wait for
+        # non-daemon threads
+        from airflow.sdk.execution_time.supervisor import wait_for_task_log_archives
+        from airflow.sdk.execution_time.task_runner_pool import close_task_runner_pool
+
+        close_task_runner_pool()
+        wait_for_task_log_archives()
+
+
+def _run_workloads(
+    log,
+    input: SimpleQueue[ExecutorWorkload | None],
+    output: Queue[WorkloadResultType],
+    unread_messages: multiprocessing.sharedctypes.Synchronized[int],
+    team_conf,
+) -> None:
     while True:
         setproctitle(f"{_get_executor_process_title_prefix(team_conf.team_name)} <idle>", log)
         try:
@@ -27,7 +27,7 @@ import sys
 import time
 from collections import Counter, defaultdict, deque
 from collections.abc import Callable, Collection, Iterable, Iterator
-from contextlib import ExitStack
+from contextlib import AbstractContextManager, ExitStack, nullcontext
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import groupby
@@ -109,6 +109,7 @@ from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.models.team import Team
 from airflow.models.trigger import TRIGGER_FAIL_REPR, Trigger, TriggerFailureReason, handle_event_submit
+from airflow.observability.loop_profiler import LoopProfiler
 from airflow.observability.metrics import stats_utils
 from airflow.partition_mappers.base import is_rollup
 from airflow.serialization.definitions.assets import SerializedAssetUniqueKey
@@ -277,6 +278,132 @@ class ConcurrencyMap:
             if state not in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT):
                 self.dag_run_active_tasks_map[dag_id, run_id] += count
 
+    def record_queued(self, ti: TI) -> None:
+        """Account for a task instance the scheduler is about to move to QUEUED."""
+        self.dag_run_active_tasks_map[ti.dag_id, ti.run_id] += 1
+        self.task_concurrency_map[(ti.dag_id, ti.task_id)] += 1
+        self.task_dagrun_concurrency_map[(ti.dag_id, ti.run_id, ti.task_id)] += 1
+
+
+def _decrement(counter: Counter, key: Any, amount: int = 1) -> None:
+    """Decrement a counter, dropping the key once it reaches zero so the ledger doesn't grow unbounded."""
+    counter[key] -= amount
+    if counter[key] <= 0:
+        del counter[key]
+
+
+class ConcurrencyLedger(ConcurrencyMap):
+    """
+    Incrementally maintained variant of :class:`ConcurrencyMap` that also tracks pool slot usage.
+
+    Instead of re-aggregating ``task_instance`` on every critical section pass, the ledger keeps one
+    entry per active task instance. Entries are added when the scheduler queues a task instance and
+    removed when the executor reports that it finished, so concurrency and pool checks become
+    dictionary lookups.
+
+    Transitions the scheduler does not observe (for example a task deferring, or a task instance
+    queued by another scheduler) are picked up by :meth:`load`, which is re-run once the ledger is
+    older than ``reconcile_interval`` seconds. Missed *removals* only make the ledger more conservative;
+    missed *additions* (another scheduler in an HA setup queueing tasks) can let limits be exceeded
+    until the next reconciliation.
+
+    Scheduled task instances are tracked for the pool stats only. Those scheduled since the last
+    reconciliation are not counted until the next one.
+
+    Task instances recorded as queued are only known to be queued once the critical section commits:
+    :meth:`commit` accepts them, while :meth:`rollback` makes the ledger stale so it is reloaded.
+
+    :param reconcile_interval: Maximum age (in seconds) of the ledger before it is reloaded from the DB.
+    """
+
+    def __init__(self, reconcile_interval: float):
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        # (pool, state) -> sum of pool_slots, mirroring the aggregate in Pool.slots_stats.
+        self.pool_slots_map: Counter[tuple[str, TaskInstanceState]] = Counter()
+        # (dag_id, run_id, task_id, map_index) -> (pool, pool_slots, state)
+        self._active_tis: dict[tuple[str, str, str, int], tuple[str, int, TaskInstanceState]] = {}
+        self._loaded_at: float | None = None
+        self._has_uncommitted = False
+
+    @property
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.reconcile_interval
+
+    def load(self, session: Session) -> None:
+        self.dag_run_active_tasks_map.clear()
+        self.task_concurrency_map.clear()
+        self.task_dagrun_concurrency_map.clear()
+        self.pool_slots_map.clear()
+        self._active_tis.clear()
+        query = session.execute(
+            select(TI.dag_id, TI.run_id, TI.task_id, TI.map_index, TI.state, TI.pool, TI.pool_slots).where(
+                TI.state.in_(ACTIVE_STATES | {TaskInstanceState.SCHEDULED})
+            )
+        )
+        for dag_id, run_id, task_id, map_index, state, pool, pool_slots in query:
+            self._add((dag_id, run_id, task_id, map_index), pool, pool_slots, state)
+        self._loaded_at = time.monotonic()
+        stats.incr("scheduler.concurrency_ledger.reconciled")
+
+    def _add(
+        self, key: tuple[str, str, str, int], pool: str, pool_slots: int, state: TaskInstanceState
+    ) -> None:
+        if key in self._active_tis:
+            self._remove(key)
+        dag_id, run_id, task_id, _ = key
+        self._active_tis[key] = (pool, pool_slots, state)
+        self.pool_slots_map[pool, state] += pool_slots
+        if state == TaskInstanceState.SCHEDULED:
+            # Scheduled task instances only count towards the pool stats, not towards concurrency limits.
+            return
+        self.task_concurrency_map[(dag_id, task_id)] += 1
+        self.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += 1
+        if state not in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT):
+            self.dag_run_active_tasks_map[dag_id, run_id] += 1
+
+    def _remove(self, key: tuple[str, str, str, int]) -> None:
+        entry = self._active_tis.pop(key, None)
+        if entry is None:
+            return
+        pool, pool_slots, state = entry
+        dag_id, run_id, task_id, _ = key
+        _decrement(self.pool_slots_map, (pool, state), pool_slots)
+        if state == TaskInstanceState.SCHEDULED:
+            return
+        _decrement(self.task_concurrency_map, (dag_id, task_id))
+        _decrement(self.task_dagrun_concurrency_map, (dag_id, run_id, task_id))
+        if state not in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT):
+            _decrement(self.dag_run_active_tasks_map, (dag_id, run_id))
+
+    def record_queued(self, ti: TI) -> None:
+        key = (ti.dag_id, ti.run_id, ti.task_id, ti.map_index)
+        self._add(key, ti.pool, ti.pool_slots, TaskInstanceState.QUEUED)
+        self._has_uncommitted = True
+
+    def commit(self) -> None:
+        """Accept the task instances recorded as queued, once the transaction queueing them committed."""
+        self._has_uncommitted = False
+
+    def rollback(self) -> None:
+        """Forget the task instances recorded as queued in a rolled back transaction, by reloading."""
+        if self._has_uncommitted:
+            self._loaded_at = None
+            self._has_uncommitted = False
+
+    def record_finished(self, ti: TI) -> None:
+        """Drop a task instance that is no longer active from the ledger."""
+        self._remove((ti.dag_id, ti.run_id, ti.task_id, ti.map_index))
+
+    def pool_slot_counts(self) -> Iterator[tuple[str, TaskInstanceState, int]]:
+        """Return ``(pool, state, slots)`` rows in the shape expected by ``Pool.slots_stats``."""
+        return (
+            (pool, state, slots)
+            for (pool, state), slots in self.pool_slots_map.items()
+            # AWAITING_INPUT never holds a pool slot.
+            if slots and state != TaskInstanceState.AWAITING_INPUT
+        )
+
 
 def _is_parent_process() -> bool:
     """
@@ -357,6 +484,26 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self._multi_team = conf.getboolean("core", "multi_team")
         self._dag_tags_in_metrics = conf.getboolean("metrics", "dag_tags_in_metrics", fallback=False)
         self._max_partition_dag_runs_per_loop = MAX_PARTITION_DAG_RUNS_PER_LOOP
+        self._batch_dag_run_scheduling = conf.getboolean(
+            "scheduler", "batch_dag_run_scheduling", fallback=False
+        )
+        # Ids of the dag runs whose TIs were moved to a new Dag version while scheduling the current batch;
+        # their pre-loaded task instances are stale and must be queried again.
+        self._dag_runs_with_new_dag_version: set[int] = set()
+        concurrency_ledger_reconcile_interval = conf.getfloat(
+            "scheduler", "concurrency_ledger_reconcile_interval", fallback=0.0
+        )
+        self._concurrency_ledger: ConcurrencyLedger | None = (
+            ConcurrencyLedger(reconcile_interval=concurrency_ledger_reconcile_interval)
+            if concurrency_ledger_reconcile_interval > 0
+            else None
+        )
+        loop_trace_history_size = conf.getint("scheduler", "loop_trace_history_size", fallback=0)
+        self._loop_profiler: LoopProfiler | None = (
+            LoopProfiler(metric_prefix="scheduler", history_size=loop_trace_history_size)
+            if loop_trace_history_size > 0
+            else None
+        )
         self._dag_id_to_team_name: dict[str, str | None] = {}
 
         self.executors: list[BaseExecutor] = executors if executors else ExecutorLoader.init_executors()
@@ -562,6 +709,16 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.info("\n\t".join(map(repr, callstack)))
             self.log.info("-" * 80)
 
+        if self._loop_profiler is not None:
+            self._loop_profiler.dump()
+            self.log.info("-" * 80)
+
+    def _profile_phase(self, name: str) -> AbstractContextManager[None]:
+        """Profile a phase of the scheduler loop, when ``[scheduler] loop_trace_history_size`` is set."""
+        if self._loop_profiler is None:
+            return nullcontext()
+        return self._loop_profiler.phase(name)
+
     def _task_concurrency_allows_execution(
         self,
         *,
@@ -592,7 +749,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             session.execute(
                 update(TI)
                 .where(TI.dag_id == dag_id, TI.state == TaskInstanceState.SCHEDULED)
-                .values(state=TaskInstanceState.FAILED)
+                .values(state=TaskInstanceState.FAILED, state_changed_at=timezone.utcnow())
                 .execution_options(synchronize_session="fetch")
             )
 
@@ -673,9 +830,19 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     "Failed to acquire advisory lock", params=None, orig=RuntimeError("55P03")
                 )
 
+        # When the in-memory ledger is enabled and fresh, pool usage and concurrency counts come from it
+        # rather than from aggregates over task_instance. A stale ledger is reloaded below, once the
+        # pool rows are locked.
+        concurrency_ledger = self._concurrency_ledger
+        use_ledger_counts = concurrency_ledger is not None and not concurrency_ledger.is_stale
+
         # Get the pool settings. We get a lock on the pool rows, treating this as a "critical section"
         # Throws an exception if lock cannot be obtained, rather than blocking
-        pools = Pool.slots_stats(lock_rows=True, session=session)
+        pools = Pool.slots_stats(
+            lock_rows=True,
+            slot_counts=concurrency_ledger.pool_slot_counts() if use_ledger_counts else None,
+            session=session,
+        )
 
         # If the pools are full, there is no point doing anything!
         # If _somehow_ the pool is overfull, don't let the limit go negative - it breaks SQL
@@ -694,8 +861,16 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             pool_to_team_name = Pool.get_name_to_team_name_mapping(list(pools.keys()), session=session)
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
-        concurrency_map.load(session=session)
+        concurrency_map: ConcurrencyMap
+        saturated_dag_runs: set[tuple[str, str]] = set()
+        if concurrency_ledger is None:
+            concurrency_map = ConcurrencyMap()
+            concurrency_map.load(session=session)
+        else:
+            if not use_ledger_counts:
+                concurrency_ledger.load(session=session)
+            concurrency_map = concurrency_ledger
+            saturated_dag_runs = self._get_saturated_dag_runs(concurrency_ledger, session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -713,13 +888,6 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             num_starved_tasks = len(starved_tasks)
             num_starved_tasks_task_dagrun_concurrency = len(starved_tasks_task_dagrun_concurrency)
 
-            # This behaves the same as 'concurrency_map.load()' with the difference that
-            # 'load()' executes immediately while '_get_current_dr_task_concurrency' creates a
-            # subquery object that is then executed along with main query.
-            # The results of 'load()' aren't used again here because by the time the main query
-            # executes, there could be a change that will be ignored.
-            dr_task_concurrency_subquery = _get_current_dr_task_concurrency(states=EXECUTION_STATES)
-
             query = (
                 select(TI)
                 .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
@@ -729,19 +897,28 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 .where(~DM.is_paused)
                 .where(TI.state == TaskInstanceState.SCHEDULED)
                 .where(DM.bundle_name.is_not(None))
-                .join(
+                .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
+            )
+
+            if concurrency_ledger is None:
+                # This behaves the same as 'concurrency_map.load()' with the difference that
+                # 'load()' executes immediately while '_get_current_dr_task_concurrency' creates a
+                # subquery object that is then executed along with main query.
+                # The results of 'load()' aren't used again here because by the time the main query
+                # executes, there could be a change that will be ignored.
+                dr_task_concurrency_subquery = _get_current_dr_task_concurrency(states=EXECUTION_STATES)
+                query = query.join(
                     dr_task_concurrency_subquery,
                     and_(
                         TI.dag_id == dr_task_concurrency_subquery.c.dag_id,
                         TI.run_id == dr_task_concurrency_subquery.c.run_id,
                     ),
                     isouter=True,
-                )
-                .where(
+                ).where(
                     func.coalesce(dr_task_concurrency_subquery.c.task_per_dr_count, 0) < DM.max_active_tasks
                 )
-                .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
-            )
+            elif saturated_dag_runs:
+                query = query.where(tuple_(TI.dag_id, TI.run_id).not_in(saturated_dag_runs))
 
             # Starvation filters should be applied before computing the row_num based on the
             # max_active_tasks limit. That way, starved dags and tasks that shouldn't run,
@@ -1003,11 +1180,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_run_active_tasks_map[dag_run_key] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.record_queued(task_instance)
 
                 pool_stats["open"] = open_slots
 
@@ -1060,6 +1233,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
             queued_values: dict[str, Any] = {
                 "state": TaskInstanceState.QUEUED,
+                "state_changed_at": timezone.utcnow(),
                 "queued_dttm": timezone.utcnow(),
                 "queued_by_job_id": self.job.id,
             }
@@ -1124,6 +1298,23 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             make_transient(ti)
         return executable_tis
 
+    @staticmethod
+    def _get_saturated_dag_runs(
+        concurrency_ledger: ConcurrencyLedger, session: Session
+    ) -> set[tuple[str, str]]:
+        """Return the ``(dag_id, run_id)`` pairs that already hold their DAG's ``max_active_tasks``."""
+        active_dag_ids = {dag_id for dag_id, _ in concurrency_ledger.dag_run_active_tasks_map}
+        if not active_dag_ids:
+            return set()
+        max_active_tasks = dict(
+            session.execute(select(DM.dag_id, DM.max_active_tasks).where(DM.dag_id.in_(active_dag_ids))).all()
+        )
+        return {
+            (dag_id, run_id)
+            for (dag_id, run_id), count in concurrency_ledger.dag_run_active_tasks_map.items()
+            if dag_id in max_active_tasks and count >= max_active_tasks[dag_id]
+        }
+
     def _enqueue_task_instances_with_queued_state(
         self, task_instances: list[TI], executor: BaseExecutor, session: Session
     ) -> None:
@@ -1302,7 +1493,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
     @staticmethod
     def _process_task_event_logs(log_records: deque[Log], session: Session):
-        objects = (log_records.popleft() for _ in range(len(log_records)))
+        objects = [log_records.popleft() for _ in range(len(log_records))]
         session.bulk_save_objects(objects=objects, preserve_order=False)
 
     @staticmethod
@@ -1327,15 +1518,18 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 scheduler_dag_bag=self.scheduler_dag_bag,
                 session=session,
                 eagerly_load_dag_tags=self._dag_tags_in_metrics,
+                concurrency_ledger=self._concurrency_ledger,
             )
         except Exception as exc:
             stats.incr("scheduler.executor_events.failed", tags={"exception_class": type(exc).__name__})
             raise
 
     @staticmethod
-    def _emit_executor_events_batch_metrics(num_events: int) -> None:
+    def _emit_executor_events_batch_metrics(num_events: int, started_at: float) -> None:
         stats.gauge("scheduler.executor_events.batch_size", num_events)
         stats.incr("scheduler.executor_events.processed", num_events)
+        if num_events and (elapsed := time.monotonic() - started_at) > 0:
+            stats.gauge("scheduler.executor_events.per_second", num_events / elapsed)
 
     @classmethod
     def process_executor_events(
@@ -1345,6 +1539,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         scheduler_dag_bag: DBDagBag,
         session: Session,
         eagerly_load_dag_tags: bool = False,
+        concurrency_ledger: ConcurrencyLedger | None = None,
     ) -> int:
         """
         Process task completion events from the executor and update task instance states.
@@ -1370,6 +1565,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :param eagerly_load_dag_tags: When True, eager-load dag_model.tags so the per-finished-task
             metrics carry Dag tags without a per-TI lazy load. The scheduler passes its cached flag so
             the hot path never reads conf; other callers (e.g. ``dag.test()``) leave it at the default.
+        :param concurrency_ledger: The scheduler's concurrency ledger, if enabled. Task instances that
+            are no longer active once their executor event is handled are removed from it.
 
         :return: Number of events processed from the executor event buffer
 
@@ -1379,6 +1576,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         `dag.test` execute DAGs with no scheduler, therefore it needs to handle the events pushed by the
         executors as well.
         """
+        started_at = time.monotonic()
         ti_primary_key_to_try_number_map: dict[tuple[str, str, str, int], int] = {}
         event_buffer = executor.get_event_buffer()
         num_events = len(event_buffer)
@@ -1417,10 +1615,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             else:
                 cls.logger().error("Unknown workload key type in event buffer: %r", key)
 
-        # Handle callback state events
+        # Handle callback state events, loading all their callbacks at once
+        callbacks_by_id: dict[UUID, Callback] = {}
+        if callback_keys_with_events:
+            callback_ids = [UUID(str(callback_id)) for callback_id in callback_keys_with_events]
+            callbacks_by_id = {
+                callback.id: callback
+                for callback in session.scalars(select(Callback).where(Callback.id.in_(callback_ids)))
+            }
         for callback_id in callback_keys_with_events:
             state, info = event_buffer.pop(callback_id)
-            callback = session.get(Callback, UUID(str(callback_id)))
+            callback = callbacks_by_id.get(UUID(str(callback_id)))
             if not callback:
                 # This should not normally happen - we just received an event for this callback.
                 # Only possible if callback was deleted mid-execution (e.g., cascade delete from DagRun deletion).
@@ -1443,34 +1648,23 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         # Return if no finished tasks
         if not tis_with_right_state:
-            cls._emit_executor_events_batch_metrics(num_events)
+            cls._emit_executor_events_batch_metrics(num_events, started_at)
             return len(event_buffer)
 
         # Check state of finished tasks
         filter_for_tis = TI.filter_for_tis(tis_with_right_state)
         if filter_for_tis is None:
-            cls._emit_executor_events_batch_metrics(num_events)
+            cls._emit_executor_events_batch_metrics(num_events, started_at)
             return len(event_buffer)
-        asset_loader, alias_loader = _eager_load_dag_run_for_validation()
-        query = (
-            select(TI)
-            .where(filter_for_tis)
-            .options(selectinload(TI.dag_model))
-            .options(asset_loader)
-            .options(alias_loader)
-            .options(joinedload(TI.dag_run).selectinload(DagRun.created_dag_version))
-            .options(joinedload(TI.dag_version))
-        )
-        # When emitting Dag tags as metric tags, eager-load dag_model.tags so the per-finished-task
-        # ti_failures / operator_failures / task.*_duration metrics carry them without a per-TI lazy load.
-        # TI already joins DagModel by dag_id, so warm tags off that relationship directly rather than
-        # via the dag_run hop; the DagModel is shared in the identity map, so dag_run.dag_model.tags is free.
-        if eagerly_load_dag_tags:
-            query = query.options(selectinload(TI.dag_model).selectinload(DagModel.tags))
+        # The task instances are loaded without their relationships: these are only needed to handle
+        # state mismatches, and are loaded below for just those task instances.
         # row lock this entire set of taskinstances to make sure the scheduler doesn't fail when we have
         # multi-schedulers
-        locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
+        locked_query = with_row_locks(
+            select(TI).where(filter_for_tis), of=TI, session=session, skip_locked=True
+        )
         tis: Iterator[TI] = session.scalars(locked_query)
+        state_mismatches: list[tuple[TI, TaskInstanceState, Any]] = []
         for ti in tis:
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
@@ -1492,6 +1686,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 cls.logger().info("Setting external_executor_id for %s to %s", ti, info)
                 continue
 
+            if concurrency_ledger is not None and ti.state not in ACTIVE_STATES:
+                concurrency_ledger.record_finished(ti)
+
             msg = (
                 "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, ti_id=%s, "
                 "run_start_date=%s, run_end_date=%s, "
@@ -1557,133 +1754,165 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             )
 
             if ti_queued and not ti_requeued:
-                team_name = (
-                    DagModel.get_team_name(ti.dag_id, session=session)
-                    if conf.getboolean("core", "multi_team")
-                    else None
-                )
-                stats.incr(
-                    "scheduler.tasks.killed_externally",
-                    tags=prune_dict({"dag_id": ti.dag_id, "task_id": ti.task_id, "team_name": team_name}),
-                )
-                msg = (
-                    "Executor %s reported that the task instance %s finished with state %s, but the task instance's state attribute is %s. "  # noqa: RUF100, UP031, flynt
-                    "Learn more: https://airflow.apache.org/docs/apache-airflow/stable/troubleshooting.html#task-state-changed-externally"
-                    % (executor, ti, state, ti.state)
-                )
-                if info is not None:
-                    msg += " Extra info: %s" % info  # noqa: RUF100, UP031, flynt
-                session.add(Log(event="state mismatch", extra=msg, task_instance=ti.key))
+                state_mismatches.append((ti, state, info))
 
-                # Get task from the Serialized DAG
-                try:
-                    dag = scheduler_dag_bag.get_dag_for_run(dag_run=ti.dag_run, session=session)
-                    if not dag:
-                        cls.logger().error(
-                            "DAG '%s' for task instance %s not found in serialized_dag table",
-                            ti.dag_id,
-                            ti,
-                        )
-                        raise DagNotFound(f"DAG '{ti.dag_id}' not found in serialized_dag table")
+        if not state_mismatches:
+            cls._emit_executor_events_batch_metrics(num_events, started_at)
+            return len(event_buffer)
 
-                    task = dag.get_task(ti.task_id)
-                except Exception:
-                    cls.logger().exception("Marking task instance %s as %s", ti, state)
-                    ti.set_state(state)
-                    continue
-                ti.task = task
-                if task.has_on_retry_callback or task.has_on_failure_callback:
-                    # Only log the error/extra info here, since the `ti.handle_failure()` path will log it
-                    # too, which would lead to double logging
-                    cls.logger().error(msg)
-                    # Safely extract bundle info: prefer dag_version when available,
-                    # fall back to dag_model/dag_run for legacy tasks migrated from
-                    # Airflow 2 where dag_version may be None (AIP-66).
-                    _bundle_name = ti.dag_version.bundle_name if ti.dag_version else ti.dag_model.bundle_name
-                    # Mirror dag_run pinning: if the run wasn't pinned (e.g. dag.disable_bundle_versioning=True),
-                    # leave the callback unpinned so it runs against the same code as the task.
-                    _bundle_version = (
-                        ti.dag_version.bundle_version
-                        if ti.dag_version and ti.dag_run.bundle_version is not None
-                        else ti.dag_run.bundle_version
-                    )
-                    _version_data = _resolve_version_data(ti.dag_version, ti.dag_run.bundle_version)
-                    # Backfill dag_version_id for legacy tasks (Pydantic requires uuid.UUID).
-                    if not _ensure_ti_has_dag_version_id(ti, session, cls.logger()):
-                        continue
-                    request = TaskCallbackRequest(
-                        filepath=ti.dag_model.relative_fileloc or "",
-                        bundle_name=_bundle_name,
-                        bundle_version=_bundle_version,
-                        version_data=_version_data,
-                        ti=ti,
-                        msg=msg,
-                        task_callback_type=(
-                            TaskInstanceState.UP_FOR_RETRY
-                            if ti.is_eligible_to_retry()
-                            else TaskInstanceState.FAILED
-                        ),
-                        context_from_server=TIRunContext(
-                            dag_run=DRDataModel.model_validate(ti.dag_run, from_attributes=True),
-                            max_tries=ti.max_tries,
-                            variables=[],
-                            connections=[],
-                            xcom_keys_to_clear=[],
-                        ),
-                    )
-                    executor.send_callback(request)
+        asset_loader, alias_loader = _eager_load_dag_run_for_validation()
+        query = (
+            select(TI)
+            .where(TI.id.in_([ti.id for ti, _, _ in state_mismatches]))
+            .options(selectinload(TI.dag_model))
+            .options(asset_loader)
+            .options(alias_loader)
+            .options(joinedload(TI.dag_run).selectinload(DagRun.created_dag_version))
+            .options(joinedload(TI.dag_version))
+        )
+        # When emitting Dag tags as metric tags, eager-load dag_model.tags so the per-finished-task
+        # ti_failures / operator_failures / task.*_duration metrics carry them without a per-TI lazy load.
+        # TI already joins DagModel by dag_id, so warm tags off that relationship directly rather than
+        # via the dag_run hop; the DagModel is shared in the identity map, so dag_run.dag_model.tags is free.
+        if eagerly_load_dag_tags:
+            query = query.options(selectinload(TI.dag_model).selectinload(DagModel.tags))
+        # The task instances are already in the session. Eager loads fill in their unloaded
+        # relationships without overwriting attributes that may have unflushed changes.
+        session.scalars(query).all()
+
+        multi_team = conf.getboolean("core", "multi_team")
+        state_mismatch_logs: deque[Log] = deque()
+        for ti, state, info in state_mismatches:
+            team_name = DagModel.get_team_name(ti.dag_id, session=session) if multi_team else None
+            stats.incr(
+                "scheduler.tasks.killed_externally",
+                tags=prune_dict({"dag_id": ti.dag_id, "task_id": ti.task_id, "team_name": team_name}),
+            )
+            msg = (
+                "Executor %s reported that the task instance %s finished with state %s, but the task instance's state attribute is %s. "  # noqa: RUF100, UP031, flynt
+                "Learn more: https://airflow.apache.org/docs/apache-airflow/stable/troubleshooting.html#task-state-changed-externally"
+                % (executor, ti, state, ti.state)
+            )
+            if info is not None:
+                msg += " Extra info: %s" % info  # noqa: RUF100, UP031, flynt
+            state_mismatch_logs.append(Log(event="state mismatch", extra=msg, task_instance=ti.key))
 
-                # Handle cleared tasks that were successfully terminated by executor
-                if ti.state == TaskInstanceState.RESTARTING and state == TaskInstanceState.SUCCESS:
-                    cls.logger().info(
-                        "Task %s was cleared and successfully terminated. Setting to scheduled for retry.",
+            # Get task from the Serialized DAG
+            try:
+                dag = scheduler_dag_bag.get_dag_for_run(dag_run=ti.dag_run, session=session)
+                if not dag:
+                    cls.logger().error(
+                        "DAG '%s' for task instance %s not found in serialized_dag table",
+                        ti.dag_id,
                         ti,
                     )
-                    # Adjust max_tries to allow retry beyond normal limits (like clearing does)
-                    ti.max_tries = ti.try_number + ti.task.retries
-                    ti.set_state(None)
+                    raise DagNotFound(f"DAG '{ti.dag_id}' not found in serialized_dag table")
+
+                task = dag.get_task(ti.task_id)
+            except Exception:
+                cls.logger().exception("Marking task instance %s as %s", ti, state)
+                ti.set_state(state)
+                if concurrency_ledger is not None:
+                    concurrency_ledger.record_finished(ti)
+                continue
+            ti.task = task
+            if task.has_on_retry_callback or task.has_on_failure_callback:
+                # Only log the error/extra info here, since the `ti.handle_failure()` path will log it
+                # too, which would lead to double logging
+                cls.logger().error(msg)
+                # Safely extract bundle info: prefer dag_version when available,
+                # fall back to dag_model/dag_run for legacy tasks migrated from
+                # Airflow 2 where dag_version may be None (AIP-66).
+                _bundle_name = ti.dag_version.bundle_name if ti.dag_version else ti.dag_model.bundle_name
+                # Mirror dag_run pinning: if the run wasn't pinned (e.g. dag.disable_bundle_versioning=True),
+                # leave the callback unpinned so it runs against the same code as the task.
+                _bundle_version = (
+                    ti.dag_version.bundle_version
+                    if ti.dag_version and ti.dag_run.bundle_version is not None
+                    else ti.dag_run.bundle_version
+                )
+                _version_data = _resolve_version_data(ti.dag_version, ti.dag_run.bundle_version)
+                # Backfill dag_version_id for legacy tasks (Pydantic requires uuid.UUID).
+                if not _ensure_ti_has_dag_version_id(ti, session, cls.logger()):
                     continue
+                request = TaskCallbackRequest(
+                    filepath=ti.dag_model.relative_fileloc or "",
+                    bundle_name=_bundle_name,
+                    bundle_version=_bundle_version,
+                    version_data=_version_data,
+                    ti=ti,
+                    msg=msg,
+                    task_callback_type=(
+                        TaskInstanceState.UP_FOR_RETRY
+                        if ti.is_eligible_to_retry()
+                        else TaskInstanceState.FAILED
+                    ),
+                    context_from_server=TIRunContext(
+                        dag_run=DRDataModel.model_validate(ti.dag_run, from_attributes=True),
+                        max_tries=ti.max_tries,
+                        variables=[],
+                        connections=[],
+                        xcom_keys_to_clear=[],
+                    ),
+                )
+                executor.send_callback(request)
 
-                # Send email notification request to DAG processor via DB
-                if task.email and (task.email_on_failure or task.email_on_retry):
-                    cls.logger().info(
-                        "Sending email request for task %s to DAG Processor",
-                        ti,
-                    )
-                    # Safely extract bundle info with fallback for legacy tasks
-                    # (dag_version may be None after Airflow 2 → 3 migration).
-                    _email_bundle_name = (
-                        ti.dag_version.bundle_name if ti.dag_version else ti.dag_model.bundle_name
-                    )
-                    _email_bundle_version = (
-                        ti.dag_version.bundle_version if ti.dag_version else ti.dag_run.bundle_version
-                    )
-                    _email_version_data = _resolve_version_data(ti.dag_version, ti.dag_run.bundle_version)
-                    # Backfill dag_version_id for legacy tasks (Pydantic requires uuid.UUID).
-                    if not _ensure_ti_has_dag_version_id(ti, session, cls.logger()):
-                        continue
-                    email_request = EmailRequest(
-                        filepath=ti.dag_model.relative_fileloc or "",
-                        bundle_name=_email_bundle_name,
-                        bundle_version=_email_bundle_version,
-                        version_data=_email_version_data,
-                        ti=ti,
-                        msg=msg,
-                        email_type="retry" if ti.is_eligible_to_retry() else "failure",
-                        context_from_server=TIRunContext(
-                            dag_run=DRDataModel.model_validate(ti.dag_run, from_attributes=True),
-                            max_tries=ti.max_tries,
-                            variables=[],
-                            connections=[],
-                            xcom_keys_to_clear=[],
-                        ),
-                    )
-                    executor.send_callback(email_request)
+            # Handle cleared tasks that were successfully terminated by executor
+            if ti.state == TaskInstanceState.RESTARTING and state == TaskInstanceState.SUCCESS:
+                cls.logger().info(
+                    "Task %s was cleared and successfully terminated. Setting to scheduled for retry.",
+                    ti,
+                )
+                # Adjust max_tries to allow retry beyond normal limits (like clearing does)
+                ti.max_tries = ti.try_number + ti.task.retries
+                ti.set_state(None)
+                if concurrency_ledger is not None:
+                    concurrency_ledger.record_finished(ti)
+                continue
 
-                # Update task state - emails are handled by DAG processor now
-                ti.handle_failure(error=msg, session=session)
+            # Send email notification request to DAG processor via DB
+            if task.email and (task.email_on_failure or task.email_on_retry):
+                cls.logger().info(
+                    "Sending email request for task %s to DAG Processor",
+                    ti,
+                )
+                # Safely extract bundle info with fallback for legacy tasks
+                # (dag_version may be None after Airflow 2 → 3 migration).
+                _email_bundle_name = (
+                    ti.dag_version.bundle_name if ti.dag_version else ti.dag_model.bundle_name
+                )
+                _email_bundle_version = (
+                    ti.dag_version.bundle_version if ti.dag_version else ti.dag_run.bundle_version
+                )
+                _email_version_data = _resolve_version_data(ti.dag_version, ti.dag_run.bundle_version)
+                # Backfill dag_version_id for legacy tasks (Pydantic requires uuid.UUID).
+                if not _ensure_ti_has_dag_version_id(ti, session, cls.logger()):
+                    continue
+                email_request = EmailRequest(
+                    filepath=ti.dag_model.relative_fileloc or "",
+                    bundle_name=_email_bundle_name,
+                    bundle_version=_email_bundle_version,
+                    version_data=_email_version_data,
+                    ti=ti,
+                    msg=msg,
+                    email_type="retry" if ti.is_eligible_to_retry() else "failure",
+                    context_from_server=TIRunContext(
+                        dag_run=DRDataModel.model_validate(ti.dag_run, from_attributes=True),
+                        max_tries=ti.max_tries,
+                        variables=[],
+                        connections=[],
+                        xcom_keys_to_clear=[],
+                    ),
+                )
+                executor.send_callback(email_request)
+
+            # Update task state - emails are handled by DAG processor now
+            ti.handle_failure(error=msg, session=session)
+            if concurrency_ledger is not None:
+                concurrency_ledger.record_finished(ti)
 
-        cls._emit_executor_events_batch_metrics(num_events)
+        cls._process_task_event_logs(state_mismatch_logs, session)
+        cls._emit_executor_events_batch_metrics(num_events, started_at)
         return len(event_buffer)
 
     def _execute(self) -> int | None:
@@ -1715,6 +1944,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 export_legacy_names=conf.getboolean("metrics", "legacy_names_on"),
             )
 
+            if self._loop_profiler is not None:
+                self._loop_profiler.install()
+
             self._run_scheduler_loop()
 
             if settings.Session is not None:
@@ -1730,6 +1962,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 except Exception:
                     self.log.exception("Exception when executing Executor.end on %s", executor)
 
+            if self._loop_profiler is not None:
+                self._loop_profiler.uninstall()
+
             # Under normal execution, this doesn't matter, but by resetting signals it lets us run more things
             # in the same process under testing without leaking global state
             reset_signals.close()
@@ -1869,8 +2104,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # Reset per-loop team name cache so changes to bundle-team assignments
             # are picked up each iteration without requiring a scheduler restart.
             self._dag_id_to_team_name = {}
-            with stats.timer("scheduler.scheduler_loop_duration") as timer:
-                with create_session() as session:
+            with (
+                stats.timer("scheduler.scheduler_loop_duration") as timer,
+                self._loop_profiler.loop(loop_count) if self._loop_profiler is not None else nullcontext(),
+            ):
+                with self._profile_phase("do_scheduling"), create_session() as session:
                     # This will schedule for as many executors as possible.
                     num_queued_tis = self._do_scheduling(session)
                     # Don't keep any objects alive -- we've possibly just looked at 500+ ORM objects!
@@ -1879,33 +2117,35 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Heartbeat all executors, even if they're not receiving new tasks this loop. It will be
                 # either a no-op, or they will check-in on currently running tasks and send out new
                 # events to be processed below.
-                for executor in self.executors:
-                    with stats.timer(
-                        "scheduler.executor_heartbeat_duration",
-                        tags=prune_dict(
-                            {
-                                "executor": type(executor).__name__,
-                                "team_name": executor.team_name,
-                            }
-                        ),
-                    ):
-                        executor.heartbeat()
+                with self._profile_phase("executor_heartbeat"):
+                    for executor in self.executors:
+                        with stats.timer(
+                            "scheduler.executor_heartbeat_duration",
+                            tags=prune_dict(
+                                {
+                                    "executor": type(executor).__name__,
+                                    "team_name": executor.team_name,
+                                }
+                            ),
+                        ):
+                            executor.heartbeat()
 
-                with create_session() as session:
+                with self._profile_phase("process_executor_events"), create_session() as session:
                     num_finished_events = 0
                     for executor in self.executors:
                         num_finished_events += self._process_executor_events(
                             executor=executor, session=session
                         )
 
-                for executor in self.executors:
-                    try:
-                        with create_session() as session:
-                            self._process_task_event_logs(executor._task_event_logs, session)
-                    except Exception:
-                        self.log.exception("Something went wrong when trying to save task event logs.")
+                with self._profile_phase("task_event_logs"):
+                    for executor in self.executors:
+                        try:
+                            with create_session() as session:
+                                self._process_task_event_logs(executor._task_event_logs, session)
+                        except Exception:
+                            self.log.exception("Something went wrong when trying to save task event logs.")
 
-                with create_session() as session:
+                with self._profile_phase("deadlines_and_callbacks"), create_session() as session:
                     # Lock expired, unhandled deadlines with FOR UPDATE SKIP LOCKED so
                     # concurrent HA scheduler replicas don't both process the same row
                     # and create duplicate callbacks.
@@ -1932,12 +2172,14 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     self._enqueue_connection_tests(session=session)
 
                 # Heartbeat the scheduler periodically
-                perform_heartbeat(
-                    job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
-                )
+                with self._profile_phase("job_heartbeat"):
+                    perform_heartbeat(
+                        job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
+                    )
 
                 # Run any pending timed events
-                next_event = timers.run(blocking=False)
+                with self._profile_phase("timers"):
+                    next_event = timers.run(blocking=False)
                 self.log.debug("Next timed event is in %f", next_event)
 
             self.log.debug("Ran scheduling loop in %.2f ms", timer.duration)
@@ -1997,9 +2239,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # Put a check in place to make sure we don't commit unexpectedly
         with prohibit_commit(session) as guard:
             if self._scheduler_use_job_schedule:
-                self._create_dagruns_for_dags(guard, session)
+                with self._profile_phase("create_dagruns"):
+                    self._create_dagruns_for_dags(guard, session)
+
+            if Trigger.scheduler_resumes_time_deferrals():
+                with self._profile_phase("resume_time_deferrals"):
+                    self._resume_expired_time_deferrals(session)
 
-            self._start_queued_dagruns(session)
+            with self._profile_phase("start_queued_dagruns"):
+                self._start_queued_dagruns(session)
             guard.commit()
 
             # Bulk fetch the currently active dag runs for the dags we are
@@ -2015,7 +2263,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # Team name should be added before listeners are called in _schedule_all_dag_runs()
             self._stamp_team_names(dag_runs, session)
 
-            callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+            with self._profile_phase("schedule_dag_runs"):
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
 
         # Send the callbacks after we commit to ensure the context is up to date when it gets run
         # cache saves time during scheduling of many dag_runs for same dag
@@ -2030,39 +2279,51 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             else:
                 self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
 
-        with prohibit_commit(session) as guard:
-            # Without this, the session has an invalid view of the DB
-            session.expunge_all()
-            # END: schedule TIs
-
-            # Attempt to schedule even if some executors are full but not all.
-            total_free_executor_slots = sum([executor.slots_available for executor in self.executors])
-            if total_free_executor_slots <= 0:
-                # We know we can't do anything here, so don't even try!
-                self.log.debug("All executors are full, skipping critical section")
-                num_queued_tis = 0
-            else:
-                try:
-                    timer = stats.timer("scheduler.critical_section_duration")
-                    timer.start()
-
-                    # Find any TIs in state SCHEDULED, try to QUEUE them (send it to the executors)
-                    num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
-
-                    # Make sure we only sent this metric if we obtained the lock, otherwise we'll skew the
-                    # metric, way down
-                    timer.stop(send=True)
-                except OperationalError as e:
-                    timer.stop(send=False)
-
-                    if is_lock_not_available_error(error=e):
-                        self.log.debug("Critical section lock held by another Scheduler")
-                        stats.incr("scheduler.critical_section_busy")
-                        session.rollback()
-                        return 0
-                    raise
-
-            guard.commit()
+        # Task instances the critical section records as queued in the concurrency ledger are only
+        # queued once the transaction commits.
+        try:
+            with prohibit_commit(session) as guard:
+                # Without this, the session has an invalid view of the DB
+                session.expunge_all()
+                # END: schedule TIs
+
+                # Attempt to schedule even if some executors are full but not all.
+                total_free_executor_slots = sum([executor.slots_available for executor in self.executors])
+                if total_free_executor_slots <= 0:
+                    # We know we can't do anything here, so don't even try!
+                    self.log.debug("All executors are full, skipping critical section")
+                    num_queued_tis = 0
+                else:
+                    try:
+                        timer = stats.timer("scheduler.critical_section_duration")
+                        timer.start()
+
+                        # Find any TIs in state SCHEDULED, try to QUEUE them (send it to the executors)
+                        with self._profile_phase("critical_section"):
+                            num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
+
+                        # Make sure we only sent this metric if we obtained the lock, otherwise we'll skew
+                        # the metric, way down
+                        timer.stop(send=True)
+                    except OperationalError as e:
+                        timer.stop(send=False)
+
+                        if is_lock_not_available_error(error=e):
+                            self.log.debug("Critical section lock held by another Scheduler")
+                            stats.incr("scheduler.critical_section_busy")
+                            session.rollback()
+                            if self._concurrency_ledger is not None:
+                                self._concurrency_ledger.rollback()
+                            return 0
+                        raise
+
+                guard.commit()
+        except BaseException:
+            if self._concurrency_ledger is not None:
+                self._concurrency_ledger.rollback()
+            raise
+        if self._concurrency_ledger is not None:
+            self._concurrency_ledger.commit()
 
         return num_queued_tis
 
@@ -2892,16 +3153,43 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         dag_runs: Iterable[DagRun],
         session: Session,
     ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
-        """Make scheduling decisions for all `dag_runs`."""
+        """
+        Make scheduling decisions for all `dag_runs`.
+
+        With ``[scheduler] batch_dag_run_scheduling`` enabled, the task instances of all the runs are
+        loaded with one query up front, and the task instances that become schedulable are written with
+        shared bulk UPDATEs once every run has been examined, instead of once per run.
+        """
         callback_tuples = []
+        task_instances_by_run: dict[tuple[str, str], list[TI]] = {}
+        schedulable_tis: list[TI] | None = None
+        self._dag_runs_with_new_dag_version.clear()
+        if self._batch_dag_run_scheduling:
+            dag_runs = list(dag_runs)
+            task_instances_by_run = DagRun.fetch_task_instances_for_dag_runs(
+                dag_runs, state=State.task_states, session=session
+            )
+            schedulable_tis = []
         for run in dag_runs:
             try:
-                callback = self._schedule_dag_run(run, session=session)
+                callback = self._schedule_dag_run(
+                    run,
+                    session=session,
+                    task_instances=task_instances_by_run.get((run.dag_id, run.run_id)),
+                    schedulable_tis=schedulable_tis,
+                )
                 callback_tuples.append((run, callback))
             except DBAPIError:
                 raise  # let @retry_db_transaction handle DB errors
             except Exception:
                 self.log.exception("Error scheduling DAG run %s of %s", run.run_id, run.dag_id)
+        if schedulable_tis:
+            DagRun.schedule_tis_for_dag_runs(
+                schedulable_tis,
+                session=session,
+                max_tis_per_query=self.job.max_tis_per_query,
+                scheduled_by_job_id=self.job.id,
+            )
         guard.commit()
         return callback_tuples
 
@@ -2909,11 +3197,16 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self,
         dag_run: DagRun,
         session: Session,
+        task_instances: list[TI] | None = None,
+        schedulable_tis: list[TI] | None = None,
     ) -> DagCallbackRequest | None:
         """
         Make scheduling decisions about an individual dag run.
 
         :param dag_run: The DagRun to schedule
+        :param task_instances: The run's task instances, if already loaded by the caller
+        :param schedulable_tis: If given, TIs ready to be scheduled are appended to this list for the
+            caller to write in bulk, rather than being set to scheduled right away
         :return: Callback that needs to be executed
         """
         callback: DagCallbackRequest | None = None
@@ -3012,8 +3305,13 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         dag_run.scheduled_by_job_id = self.job.id
 
+        if dag_run.id in self._dag_runs_with_new_dag_version:
+            task_instances = None
+
         # TODO[HA]: Rename update_state -> schedule_dag_run, ?? something else?
-        schedulable_tis, callback_to_run = dag_run.update_state(session=session, execute_callbacks=False)
+        ready_tis, callback_to_run = dag_run.update_state(
+            session=session, execute_callbacks=False, task_instances=task_instances
+        )
 
         if dag_run.state in State.finished_dr_states and dag_run.run_type in (
             DagRunType.SCHEDULED,
@@ -3022,11 +3320,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         ):
             self._set_exceeds_max_active_runs(dag_model=dag_model, session=session)
 
-        # This will do one query per dag run. We "could" build up a complex
-        # query to update all the TIs across all the logical dates and dag
-        # IDs in a single query, but it turns out that can be _very very slow_
-        # see #11147/commit ee90807ac for more details
-        if schedulable_tis and self.log.isEnabledFor(logging.DEBUG):
+        # Without batching this will do one query per dag run. Matching TIs across all the logical dates
+        # and dag IDs by (dag_id, run_id, task_id) in a single query turns out to be _very very slow_
+        # (see #11147/commit ee90807ac for more details); batch mode instead updates by TI id.
+        if ready_tis and self.log.isEnabledFor(logging.DEBUG):
             self.log.debug(
                 "Scheduling TIs for dag_run=%s/%s (scheduler job_id=%s): %s",
                 dag_run.dag_id,
@@ -3034,10 +3331,13 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 self.job.id,
                 [
                     f"{ti.task_id} (id={ti.id}, state={ti.state}, try_number={ti.try_number})"
-                    for ti in schedulable_tis
+                    for ti in ready_tis
                 ],
             )
-        dag_run.schedule_tis(schedulable_tis, session=session, max_tis_per_query=self.job.max_tis_per_query)
+        if schedulable_tis is not None:
+            schedulable_tis.extend(ready_tis)
+        else:
+            dag_run.schedule_tis(ready_tis, session=session, max_tis_per_query=self.job.max_tis_per_query)
 
         return callback_to_run
 
@@ -3074,6 +3374,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         )
         # Expire task_instances relationship so next access fetches fresh data from DB
         session.expire(dag_run, ["task_instances"])
+        self._dag_runs_with_new_dag_version.add(dag_run.id)
         # Verify integrity also takes care of session.flush
         dag_run.verify_integrity(dag_version_id=latest_dag_version.id, session=session)
 
@@ -3217,6 +3518,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             .where(filter_for_tis)
             .values(
                 state=TaskInstanceState.SCHEDULED,
+                state_changed_at=timezone.utcnow(),
                 queued_dttm=None,
                 queued_by_job_id=None,
                 scheduled_dttm=timezone.utcnow(),
@@ -3482,6 +3784,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     )
                     .values(
                         state=TaskInstanceState.SCHEDULED,
+                        state_changed_at=timezone.utcnow(),
                         next_method=TRIGGER_FAIL_REPR,
                         next_kwargs={"error": TriggerFailureReason.TRIGGER_TIMEOUT},
                         scheduled_dttm=timezone.utcnow(),
@@ -3492,6 +3795,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 if num_timed_out_tasks:
                     self.log.info("Timed out %i deferred tasks without fired triggers", num_timed_out_tasks)
 
+    def _resume_expired_time_deferrals(self, session: Session) -> None:
+        """Resume deferred tasks whose trigger only waited for a moment that has now passed."""
+        # Bound the batch so a burst of expiring deferrals cannot hold up the loop; the rest are
+        # resumed on the next loops.
+        num_resumed = Trigger.resume_expired_time_deferrals(limit=1000, session=session)
+        if num_resumed:
+            self.log.info("Resumed %i deferred tasks whose time trigger has fired", num_resumed)
+            stats.incr("scheduler.time_deferrals_resumed", num_resumed)
+
     @provide_session
     def check_awaiting_input_timeouts(
         self, max_retries: int = MAX_DB_RETRIES, *, session: Session = NEW_SESSION
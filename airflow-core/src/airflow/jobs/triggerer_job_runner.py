@@ -17,7 +17,9 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import functools
+import heapq
 import logging
 import math
 import os
@@ -29,7 +31,7 @@ import time
 from collections import deque
 from collections.abc import Callable, Generator, Hashable, Iterable, Iterator
 from contextlib import contextmanager, suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 from socket import socket
 from traceback import format_exception
 from typing import TYPE_CHECKING, Annotated, Any, BinaryIO, ClassVar, Literal, NamedTuple, TextIO, TypedDict
@@ -129,12 +131,16 @@ from airflow.sdk.execution_time.supervisor import WatchedSubprocess, make_buffer
 from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance
 from airflow.serialization.serialized_objects import DagSerialization
 from airflow.triggers.base import BaseEventTrigger, BaseTrigger, DiscrimatedTriggerEvent, TriggerEvent
+from airflow.triggers.load import LoopLagHistogram, TimedCoroutine, TriggerLoadTracker
 from airflow.triggers.shared_stream import SharedStreamManager
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.helpers import log_filename_template_renderer, prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.session import create_session, provide_session
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from opentelemetry.util._decorator import _AgnosticContextManager
     from sqlalchemy.orm import Session
     from structlog.typing import FilteringBoundLogger, WrappedLogger
@@ -152,6 +158,28 @@ _USER_ACTION_CANCEL_MSG = "__airflow_user_action__"
 
 _ON_CANCEL_TIMEOUT: int = conf.getint("triggerer", "on_kill_timeout", fallback=30)
 
+# How often (in seconds) the TriggerRunner reports the loop time used by its triggers.
+LOOP_TIME_REPORT_INTERVAL = 10.0
+
+# Longest time (in seconds) the timer of the TriggerRunner sleeps without checking the clock, so
+# timers still fire on time when the system clock jumps.
+TIMER_MAX_SLEEP = 10.0
+
+# How long (in seconds) the watchdog of the TriggerRunner sleeps between two event loop lag samples.
+WATCHDOG_INTERVAL = 0.1
+
+
+def _import_uvloop() -> ModuleType | None:
+    """Return the uvloop module when ``[triggerer] use_uvloop`` is enabled and uvloop is installed."""
+    if not conf.getboolean("triggerer", "use_uvloop", fallback=False):
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        log.warning("[triggerer] use_uvloop is enabled but uvloop is not installed, using the asyncio loop")
+        return None
+    return uvloop
+
 
 def _make_trigger_span(
     ti: TaskInstanceDTO | None, trigger_id: int, name: str
@@ -193,6 +221,9 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
     It runs as two threads:
      - The main thread does DB calls/checkins
      - A subthread runs all the async code
+
+    With ``[triggerer] runner_processes`` above 1, the async code runs in several subprocesses
+    instead, see :class:`TriggerRunnerPool`.
     """
 
     job_type = "TriggererJob"
@@ -213,9 +244,12 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             raise ValueError(f"Capacity number {capacity!r} is invalid")
         self.queues = queues
         self.team_name = team_name
+        self.runner_processes = conf.getint("triggerer", "runner_processes")
+        if self.runner_processes < 1:
+            raise ValueError(f"Number of runner processes {self.runner_processes!r} is invalid")
         # Set up only when _execute() starts the subprocess; keep it defined so that
         # signal handlers (or other code) firing before startup don't hit AttributeError.
-        self.trigger_runner: TriggerRunnerSupervisor | None = None
+        self.trigger_runner: TriggerRunnerSupervisor | TriggerRunnerPool | None = None
 
     def register_signals(self) -> None:
         """Register signals that stop child processes."""
@@ -268,14 +302,24 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         )
         self.trigger_runner = None
         try:
-            # Kick off runner sub-process without DB access
-            self.trigger_runner = TriggerRunnerSupervisor.start(
-                job=self.job,
-                capacity=self.capacity,
-                logger=log,
-                queues=self.queues,
-                team_name=self.team_name,
-            )
+            # Kick off runner sub-process(es) without DB access
+            if self.runner_processes > 1:
+                self.trigger_runner = TriggerRunnerPool.start(
+                    job=self.job,
+                    capacity=self.capacity,
+                    runner_processes=self.runner_processes,
+                    logger=log,
+                    queues=self.queues,
+                    team_name=self.team_name,
+                )
+            else:
+                self.trigger_runner = TriggerRunnerSupervisor.start(
+                    job=self.job,
+                    capacity=self.capacity,
+                    logger=log,
+                    queues=self.queues,
+                    team_name=self.team_name,
+                )
             # Run the main DB comms loop in this process
             self.trigger_runner.run()
             return self.trigger_runner._exit_code
@@ -332,6 +376,9 @@ class messages:
         # Format of list[str] is the exc traceback format
         failures: list[tuple[int, list[str] | None]] | None = None
         finished: list[int] | None = None
+        # Event loop time (in seconds) each trigger has used since it started, reported periodically
+        # for the triggers that used any since the previous report.
+        loop_time: dict[int, float] | None = None
 
     class TriggerStateSync(BaseModel):
         type: Literal["TriggerStateSync"] = "TriggerStateSync"
@@ -342,6 +389,8 @@ class messages:
         # since the previous sync; the runner releases the matching broker
         # advances on receipt.
         events_persisted: list[int] | None = None
+        # Triggers moving to another triggerer: cancelled without invoking on_kill().
+        to_move: set[int] | None = None
 
 
 class HITLDetailResponseResult(HITLDetailResponse):
@@ -491,6 +540,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
     runner_health_check_threshold = conf.getfloat("triggerer", "runner_health_check_threshold")
+    load_budget = conf.getfloat("triggerer", "load_budget")
+    load_rebalance_interval = conf.getfloat("triggerer", "load_rebalance_interval")
 
     runner: TriggerRunner | None = None
     stop: bool = False
@@ -528,6 +579,18 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, list[str] | None]] = attrs.field(factory=deque, init=False)
 
+    # Cost and event rate of the triggers running in the sub process
+    load: TriggerLoadTracker = attrs.field(factory=TriggerLoadTracker, init=False)
+
+    # Triggers released to other triggerers that we have told the async process to cancel. Like
+    # cancelling_triggers, we keep them here until we receive the FinishedTriggers message
+    moving_triggers: set[int] = attrs.field(factory=set, init=False)
+
+    _last_rebalance: float = attrs.field(factory=time.monotonic, init=False)
+    # No new triggers are assigned until then after moving triggers away, so that other triggerers
+    # pick the moved triggers up rather than this one.
+    _assign_paused_until: float = attrs.field(init=False, default=0.0)
+
     def is_alive(self) -> bool:
         # Set by `_service_subprocess` in the loop
         return self._exit_code is None
@@ -588,11 +651,19 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         if isinstance(msg, messages.TriggerStateChanges):
             if msg.events:
                 self.events.extend(msg.events)
+                for entry in msg.events:
+                    self.load.record_event(entry.trigger_id)
             if msg.failures:
                 self.failed_triggers.extend(msg.failures)
+                for trigger_id, _ in msg.failures:
+                    self.load.remove(trigger_id)
+            if msg.loop_time:
+                self.load.record_loop_time(msg.loop_time)
             for id in msg.finished or ():
                 self.running_triggers.discard(id)
                 self.cancelling_triggers.discard(id)
+                self.moving_triggers.discard(id)
+                self.load.remove(id)
                 if factory := self.logger_cache.pop(id, None):
                     try:
                         factory.upload_to_remote()
@@ -612,6 +683,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 to_create=[],
                 to_cancel=self.cancelling_triggers,
                 events_persisted=events_persisted or None,
+                to_move=self.moving_triggers or None,
             )
 
             # Pull out of these dequeues in a thread-safe manner
@@ -715,6 +787,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         self.handle_events()
         self.handle_failed_triggers()
+        self.rebalance()
         self.clean_unused()
         self.heartbeat()
 
@@ -726,6 +799,11 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 "TriggerRunnerSupervisor.heartbeat() requires a Job; "
                 "subclasses without a metadata-DB Job must override this method."
             )
+        if self.is_responsive():
+            perform_heartbeat(self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True)
+
+    def is_responsive(self) -> bool:
+        """Whether the subprocess communicated within ``[triggerer] runner_health_check_threshold``."""
         elapsed = time.monotonic() - self._last_runner_comms
         if self.runner_health_check_threshold > 0 and elapsed > self.runner_health_check_threshold:
             if not self._runner_comms_silence_logged:
@@ -737,9 +815,9 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                     self.runner_health_check_threshold,
                 )
                 self._runner_comms_silence_logged = True
-            return
+            return False
         self._runner_comms_silence_logged = False
-        perform_heartbeat(self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True)
+        return True
 
     def heartbeat_callback(self, session: Session | None = None) -> None:
         stats.incr("triggerer_heartbeat", 1, 1, tags=prune_dict({"team_name": self.team_name}))
@@ -751,18 +829,84 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 "TriggerRunnerSupervisor.load_triggers() requires a Job; "
                 "subclasses without a metadata-DB Job must override this method."
             )
-        Trigger.assign_unassigned(
-            self.job.id,
-            self.capacity,
-            self.health_check_threshold,
-            queues=self.queues,
-            team_name=self.team_name,
-        )
+        if time.monotonic() >= self._assign_paused_until:
+            Trigger.assign_unassigned(
+                self.job.id,
+                self.capacity,
+                self.health_check_threshold,
+                queues=self.queues,
+                team_name=self.team_name,
+                load_budget=self.remaining_load_budget(),
+                trigger_cost=self.load.class_cost,
+            )
         ids = Trigger.ids_for_triggerer(self.job.id, queues=self.queues, team_name=self.team_name)
         self.update_triggers(set(ids))
 
+    def remaining_load_budget(self) -> float | None:
+        """Return the part of ``[triggerer] load_budget`` not used by running triggers, if set."""
+        if self.load_budget <= 0:
+            return None
+        return self.load_budget - self.load.total_cost()
+
+    def rebalance(self) -> None:
+        """
+        Move triggers to other triggerers while the running triggers cost more than the load budget.
+
+        The costliest triggers not watching assets are unassigned from this triggerer, and picked up
+        by triggerers with budget left.
+        """
+        if self.job is None or self.load_budget <= 0:
+            return
+        if (now := time.monotonic()) - self._last_rebalance < self.load_rebalance_interval:
+            return
+        self._last_rebalance = now
+        to_move = self.load.triggers_to_move(
+            self.load_budget, exclude=self.cancelling_triggers | self.moving_triggers
+        )
+        if not to_move:
+            return
+        log.info(
+            "Triggerer is over its load budget, moving triggers to other triggerers",
+            load=round(self.load.total_cost(), 3),
+            load_budget=self.load_budget,
+            trigger_ids=to_move,
+        )
+        Trigger.release(to_move, self.job.id)
+        self.moving_triggers.update(to_move)
+        self._assign_paused_until = now + self.load_rebalance_interval
+        stats.incr("triggers.moved", len(to_move), tags=prune_dict({"team_name": self.team_name}))
+
     def handle_events(self):
-        """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
+        """
+        Dispatch outbound events to the Trigger model which pushes them to the relevant task instances.
+
+        All events received since the last call are persisted together. If that fails, they are
+        persisted one at a time instead, so a single bad event does not hold back the others.
+        """
+        if not self.events:
+            return
+        entries = list(self.events)
+        self.events.clear()
+        try:
+            # Tell the model to wake up the tasks of all events at once
+            self.on_trigger_events(entries)
+        except Exception:
+            log.warning(
+                "Failed to persist trigger events together, persisting them one by one",
+                count=len(entries),
+                exc_info=True,
+            )
+            self.events.extendleft(reversed(entries))
+            self._handle_events_one_by_one()
+            return
+        # Only reached when all events were persisted; see _handle_events_one_by_one.
+        self.persisted_event_seqs.extend(
+            entry.persist_seq for entry in entries if entry.persist_seq is not None
+        )
+        # Emit stat event
+        stats.incr("triggers.succeeded", len(entries), tags=prune_dict({"team_name": self.team_name}))
+
+    def _handle_events_one_by_one(self):
         while self.events:
             entry = self.events.popleft()
             # Tell the model to wake up its tasks
@@ -779,6 +923,15 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         """Record that a trigger fired an event."""
         Trigger.submit_event(trigger_id=trigger_id, event=event)
 
+    def on_trigger_events(self, entries: list[TriggerEventEntry]) -> None:
+        """
+        Record that triggers fired a batch of events, all or none of them.
+
+        Subclasses overriding :meth:`on_trigger_event` should override this too, or have it raise so
+        that events are recorded one at a time.
+        """
+        Trigger.submit_events((entry.trigger_id, entry.event) for entry in entries)
+
     def clean_unused(self) -> None:
         """Remove triggers that are no longer needed."""
         Trigger.clean_unused()
@@ -832,6 +985,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             capacity_left,
             tags=tags,
         )
+        stats.gauge("triggerer.load", self.load.total_cost(), tags=tags)
+        stats.gauge("triggerer.event_rate", self.load.total_event_rate(), tags=tags)
 
     def _create_workload(
         self,
@@ -969,12 +1124,14 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         known_trigger_ids = self.running_triggers.union(
             (x[0] for x in self.events),
             self.cancelling_triggers,
+            self.moving_triggers,
             (trigger[0] for trigger in self.failed_triggers),
             (trigger.id for trigger in self.creating_triggers),
         )
         # Work out the two difference sets
         new_trigger_ids = requested_trigger_ids - known_trigger_ids
-        cancel_trigger_ids = self.running_triggers - requested_trigger_ids
+        # Triggers being moved are no longer assigned to us either, but are cancelled through to_move
+        cancel_trigger_ids = self.running_triggers - requested_trigger_ids - self.moving_triggers
 
         if new_trigger_ids:
             workloads_to_create = self.build_trigger_workloads(new_trigger_ids)
@@ -983,6 +1140,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
             for workload in workloads_to_create:
                 workload.queued_at = queued_at
+                self.load.add(workload.id, workload.classpath, movable=workload.ti is not None, now=queued_at)
 
             self.creating_triggers.extend(workloads_to_create)
 
@@ -1061,10 +1219,366 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         TriggerRunner().run()
 
 
+class _HashRing:
+    """
+    Consistent hash ring mapping shard keys to runner slots.
+
+    Each slot is placed on the ring at several points, so removing a slot only moves the keys that
+    mapped to it, spread over the remaining slots.
+    """
+
+    def __init__(self, slots: Iterable[int], replicas: int = 64):
+        self._points = sorted(
+            (self._hash(f"{slot}:{replica}"), slot) for slot in slots for replica in range(replicas)
+        )
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(md5(key.encode()).digest()[:8], "big")
+
+    @property
+    def slots(self) -> set[int]:
+        return {slot for _, slot in self._points}
+
+    def remove(self, slot: int) -> None:
+        self._points = [point for point in self._points if point[1] != slot]
+
+    def get(self, key: str) -> int:
+        """Return the slot owning ``key``."""
+        if not self._points:
+            raise LookupError("The hash ring has no slots")
+        index = bisect.bisect(self._points, (self._hash(key), -1))
+        return self._points[index % len(self._points)][1]
+
+
+@attrs.define(kw_only=True)
+class TriggerRunnerPool:
+    """
+    Run the triggers of one triggerer job in several TriggerRunner subprocesses.
+
+    A single TriggerRunner drives all its triggers from one asyncio loop, so it can only use one
+    core. The pool starts ``runner_processes`` :class:`TriggerRunnerSupervisor` subprocesses and
+    does the DB work for all of them from this process: it assigns triggers to the job up to
+    ``capacity`` and shards them over the runners by consistent hashing.
+
+    Triggers watching assets are sharded by classpath, so triggers that can share a stream (see
+    ``BaseEventTrigger.shared_stream_key``) always end up in the same runner; other triggers are
+    sharded by ID. A trigger stays on its runner until it finishes. When a runner dies a new one is
+    started in its place and picks up its triggers; only if that fails are its triggers moved to
+    the remaining runners. The pool exits once no runner is left.
+    """
+
+    job: Job
+    capacity: int
+    queues: set[str] | None = None
+    team_name: str | None = None
+
+    runners: dict[int, TriggerRunnerSupervisor] = attrs.field(factory=dict)
+    logger: Any = None
+    stop: bool = False
+
+    health_check_threshold: int = attrs.field(
+        factory=lambda: conf.getint("triggerer", "triggerer_health_check_threshold"), init=False
+    )
+
+    # Maps trigger IDs to the slot of the runner they were placed on
+    placements: dict[int, int] = attrs.field(factory=dict, init=False)
+
+    _ring: _HashRing = attrs.field(init=False)
+
+    @_ring.default
+    def _default_ring(self) -> _HashRing:
+        return _HashRing(self.runners)
+
+    @classmethod
+    def start(
+        cls,
+        *,
+        job: Job,
+        capacity: int,
+        runner_processes: int,
+        logger=None,
+        queues: set[str] | None = None,
+        team_name: str | None = None,
+    ) -> TriggerRunnerPool:
+        runners: dict[int, TriggerRunnerSupervisor] = {}
+        try:
+            for slot in range(runner_processes):
+                runners[slot] = cls._start_runner(
+                    job=job,
+                    capacity=math.ceil(capacity / runner_processes),
+                    logger=logger,
+                    queues=queues,
+                    team_name=team_name,
+                )
+        except Exception:
+            for runner in runners.values():
+                runner.kill(escalation_delay=10, force=True)
+            raise
+        return cls(
+            job=job, capacity=capacity, queues=queues, team_name=team_name, runners=runners, logger=logger
+        )
+
+    @staticmethod
+    def _start_runner(
+        *,
+        job: Job,
+        capacity: int,
+        logger,
+        queues: set[str] | None,
+        team_name: str | None,
+    ) -> TriggerRunnerSupervisor:
+        return TriggerRunnerSupervisor.start(
+            job=job, capacity=capacity, logger=logger, queues=queues, team_name=team_name
+        )
+
+    @property
+    def live_runners(self) -> dict[int, TriggerRunnerSupervisor]:
+        """Runners that triggers are placed on, by slot."""
+        return {slot: self.runners[slot] for slot in sorted(self._ring.slots)}
+
+    @property
+    def _exit_code(self) -> int | None:
+        exit_codes = [runner._exit_code for runner in self.runners.values()]
+        if None in exit_codes:
+            return None
+        return next((exit_code for exit_code in exit_codes if exit_code), 0)
+
+    def kill(
+        self,
+        signal_to_send: signal.Signals = signal.SIGINT,
+        escalation_delay: float = 5.0,
+        force: bool = False,
+    ) -> None:
+        for runner in self.runners.values():
+            runner.kill(signal_to_send, escalation_delay=escalation_delay, force=force)
+
+    def run(self) -> None:
+        """Run synchronously and handle all database reads/writes of all runners."""
+        while not self.stop:
+            if not self.live_runners:
+                log.error("All trigger runner processes have died! Exiting.")
+                break
+            self.run_once()
+
+    def run_once(self) -> None:
+        """Perform a single iteration of the run loop."""
+        self.load_triggers()
+
+        # Wait for up to 1 second in total for activity
+        runners = self.live_runners.values()
+        for runner in runners:
+            runner._service_subprocess(1 / len(runners))
+
+        for runner in runners:
+            runner.handle_events()
+            runner.handle_failed_triggers()
+            runner.rebalance()
+        self.remove_dead_runners()
+        Trigger.clean_unused()
+        self.heartbeat()
+
+        self.emit_metrics()
+
+    def shard_keys(self, trigger_ids: set[int]) -> dict[int, str]:
+        """Return the key each trigger is sharded by."""
+        from airflow.models.asset import AssetWatcherModel
+
+        with create_session() as session:
+            watcher_ids = set(
+                session.scalars(
+                    select(AssetWatcherModel.trigger_id).where(AssetWatcherModel.trigger_id.in_(trigger_ids))
+                )
+            )
+            rows = session.execute(select(Trigger.id, Trigger.classpath).where(Trigger.id.in_(trigger_ids)))
+            return {
+                trigger_id: classpath if trigger_id in watcher_ids else str(trigger_id)
+                for trigger_id, classpath in rows
+            }
+
+    def load_triggers(self) -> None:
+        """Assign triggers to this triggerer and update each runner with the IDs it should run."""
+        runners = self.live_runners.values()
+        if all(time.monotonic() >= runner._assign_paused_until for runner in runners):
+            Trigger.assign_unassigned(
+                self.job.id,
+                self.capacity,
+                self.health_check_threshold,
+                queues=self.queues,
+                team_name=self.team_name,
+                load_budget=self.remaining_load_budget(),
+                trigger_cost=self.trigger_cost,
+            )
+        ids = set(Trigger.ids_for_triggerer(self.job.id, queues=self.queues, team_name=self.team_name))
+        self.placements = {
+            trigger_id: slot for trigger_id, slot in self.placements.items() if trigger_id in ids
+        }
+        if unplaced_ids := ids - self.placements.keys():
+            for trigger_id, key in self.shard_keys(unplaced_ids).items():
+                self.placements[trigger_id] = self._ring.get(key)
+
+        requested_trigger_ids: dict[int, set[int]] = {slot: set() for slot in self._ring.slots}
+        for trigger_id, slot in self.placements.items():
+            requested_trigger_ids[slot].add(trigger_id)
+        for slot, runner in self.live_runners.items():
+            runner.update_triggers(requested_trigger_ids[slot])
+
+    def remaining_load_budget(self) -> float | None:
+        """
+        Return the budget to pick up new triggers within, if ``[triggerer] load_budget`` is set.
+
+        The budget applies to each runner, which moves triggers away once it goes over it. New triggers
+        are spread evenly over the runners by hashing rather than by the budget each has left, so only
+        as much is picked up as the runner with the least budget left can take its share of.
+        """
+        budgets = [
+            budget
+            for runner in self.live_runners.values()
+            if (budget := runner.remaining_load_budget()) is not None
+        ]
+        if not budgets:
+            return None
+        return len(budgets) * min(budgets)
+
+    def trigger_cost(self, classpath: str) -> float:
+        """Estimate the cost of a trigger of the given class from the measurements of all runners."""
+        return max((runner.load.class_cost(classpath) for runner in self.live_runners.values()), default=0.0)
+
+    def remove_dead_runners(self) -> None:
+        """
+        Replace runners that died with new ones in the same slot.
+
+        The new runner keeps the slot, so it is sent the triggers placed on the dead one on the next
+        :meth:`load_triggers`. If it cannot be started the slot is dropped instead, so its triggers
+        move to the other runners.
+        """
+        for slot, runner in self.live_runners.items():
+            if runner.is_alive():
+                continue
+            for factory in runner.logger_cache.values():
+                factory.close()
+            runner.logger_cache.clear()
+            try:
+                self.runners[slot] = self._start_runner(
+                    job=self.job,
+                    capacity=math.ceil(self.capacity / len(self.runners)),
+                    logger=self.logger,
+                    queues=self.queues,
+                    team_name=self.team_name,
+                )
+            except Exception:
+                log.exception(
+                    "Trigger runner process has died and could not be restarted! "
+                    "Moving its triggers to the remaining runners.",
+                    pid=runner.pid,
+                    exit_code=runner._exit_code,
+                )
+                self._ring.remove(slot)
+                self.placements = {
+                    trigger_id: placed_on
+                    for trigger_id, placed_on in self.placements.items()
+                    if placed_on != slot
+                }
+                continue
+            log.error(
+                "Trigger runner process has died! Started a new one in its place.",
+                pid=runner.pid,
+                exit_code=runner._exit_code,
+                new_pid=self.runners[slot].pid,
+            )
+            stats.incr("triggerer.runner_restarts", tags=prune_dict({"team_name": self.team_name}))
+
+    def heartbeat(self) -> None:
+        if all(runner.is_responsive() for runner in self.live_runners.values()):
+            perform_heartbeat(self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True)
+
+    def heartbeat_callback(self, session: Session | None = None) -> None:
+        stats.incr("triggerer_heartbeat", 1, 1, tags=prune_dict({"team_name": self.team_name}))
+
+    def emit_metrics(self) -> None:
+        runners = self.live_runners.values()
+        if not runners:
+            return
+        tags = next(iter(runners)).metric_tags()
+        running = sum(len(runner.running_triggers) for runner in runners)
+        stats.gauge("triggers.running", running, tags=tags)
+        stats.gauge("triggerer.capacity_left", self.capacity - running, tags=tags)
+        stats.gauge("triggerer.runner_processes", len(runners), tags=tags)
+        stats.gauge("triggerer.load", sum(runner.load.total_cost() for runner in runners), tags=tags)
+        stats.gauge(
+            "triggerer.event_rate", sum(runner.load.total_event_rate() for runner in runners), tags=tags
+        )
+
+
+class _Timer(NamedTuple):
+    fire_at: float
+    event: TriggerEvent
+    name: str
+
+
+class TriggerTimers:
+    """
+    The time-based triggers of a TriggerRunner, fired from a single coroutine.
+
+    Triggers that only wait for a moment (see ``BaseTrigger.timer_event``) do not get a coroutine
+    of their own. Their moments are kept in a heap instead, and the TriggerRunner pops the due ones
+    and queues their events all at once. Removed timers stay in the heap until they are popped or
+    the heap is compacted.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int]] = []
+        self._timers: dict[int, _Timer] = {}
+        # Set when a timer is added that fires before all the others
+        self.wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, trigger_id: object) -> bool:
+        return trigger_id in self._timers
+
+    def add(self, trigger_id: int, fire_at: datetime, event: TriggerEvent, name: str) -> None:
+        timestamp = fire_at.timestamp()
+        self._timers[trigger_id] = _Timer(timestamp, event, name)
+        heapq.heappush(self._heap, (timestamp, trigger_id))
+        if self._heap[0] == (timestamp, trigger_id):
+            self.wakeup.set()
+
+    def remove(self, trigger_id: int) -> bool:
+        """Remove a timer, returning whether there was one for this trigger."""
+        if self._timers.pop(trigger_id, None) is None:
+            return False
+        if len(self._heap) > 2 * len(self._timers) + 64:
+            self._heap = [(fire_at, tid) for fire_at, tid in self._heap if tid in self._timers]
+            heapq.heapify(self._heap)
+        return True
+
+    def next_delay(self, now: float) -> float | None:
+        """Return the number of seconds until the next timer fires, or None if there are no timers."""
+        while self._heap:
+            fire_at, trigger_id = self._heap[0]
+            if (timer := self._timers.get(trigger_id)) is not None and timer.fire_at == fire_at:
+                return max(fire_at - now, 0.0)
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: float) -> list[tuple[int, _Timer]]:
+        """Remove and return the timers due at ``now`` (a POSIX timestamp), earliest first."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, trigger_id = heapq.heappop(self._heap)
+            if (timer := self._timers.get(trigger_id)) is not None and timer.fire_at == fire_at:
+                del self._timers[trigger_id]
+                due.append((trigger_id, timer))
+        return due
+
+
 class TriggerDetails(TypedDict):
     """Type class for the trigger details dictionary."""
 
     task: asyncio.Task
+    coro: TimedCoroutine
     is_watcher: bool
     name: str
     events: int
@@ -1166,6 +1680,9 @@ class TriggerRunner:
     # Maps trigger IDs to their running tasks and other info
     triggers: dict[int, TriggerDetails]
 
+    # Time-based triggers, fired from run_timers() rather than running on their own
+    timers: TriggerTimers
+
     # Cache for looking up triggers by classpath
     trigger_cache: dict[str, type[BaseTrigger]]
 
@@ -1175,6 +1692,9 @@ class TriggerRunner:
     # Inbound queue of deleted triggers
     to_cancel: deque[int]
 
+    # Inbound queue of triggers moved to another triggerer
+    to_move: deque[int]
+
     # Outbound queue of events
     events: deque[TriggerEventEntry]
 
@@ -1196,9 +1716,16 @@ class TriggerRunner:
     def __init__(self):
         super().__init__()
         self.triggers = {}
+        self.timers = TriggerTimers()
+        # Timers fired or removed since the last cleanup_finished_triggers()
+        self._finished_timers: list[int] = []
         self.trigger_cache = {}
         self.to_create = deque()
         self.to_cancel = deque()
+        self.to_move = deque()
+        # Loop time of each trigger as of the last report to the supervisor
+        self._reported_loop_time: dict[int, float] = {}
+        self._last_loop_time_report = time.monotonic()
         self.events = deque()
         self.failed_triggers = deque()
         self.team_name = None
@@ -1213,6 +1740,13 @@ class TriggerRunner:
         self.blocked_main_thread_warning_threshold = conf.getfloat(
             "triggerer", "blocked_main_thread_warning_threshold"
         )
+        self.loop_lag = LoopLagHistogram()
+        # Largest event loop lag since it was last emitted as a metric, every job heartbeat
+        self._max_loop_lag = 0.0
+        self.loop_lag_metric_interval = conf.getfloat("triggerer", "job_heartbeat_sec")
+        self.slowest_triggers_to_log = conf.getint("triggerer", "slowest_triggers_to_log", fallback=5)
+        # Loop time of each trigger as of the last status log
+        self._status_loop_time: dict[int, float] = {}
 
     def _handle_signal(self, signum, frame) -> None:
         """Handle termination signals gracefully."""
@@ -1229,7 +1763,10 @@ class TriggerRunner:
         try:
             signal.signal(signal.SIGINT, self._handle_signal)
             signal.signal(signal.SIGTERM, self._handle_signal)
-            asyncio.run(self.arun())
+            if (uvloop := _import_uvloop()) is not None:
+                uvloop.run(self.arun())
+            else:
+                asyncio.run(self.arun())
         finally:
             if prev_ctx is None:
                 os.environ.pop("_AIRFLOW_PROCESS_CONTEXT", None)
@@ -1246,14 +1783,17 @@ class TriggerRunner:
         await self.init_comms()
 
         watchdog = asyncio.create_task(self.block_watchdog())
+        timers = asyncio.create_task(self.run_timers())
         stop_event = self._stop_event = anyio.Event()
 
-        last_status = time.monotonic()
+        last_status = last_loop_lag_metric = time.monotonic()
         try:
             while not self.stop:
                 # Raise exceptions from the tasks
                 if watchdog.done():
                     watchdog.result()
+                if timers.done():
+                    timers.result()
 
                 if self.comms_decoder._reader_task.done():
                     self.comms_decoder._reader_task.result()
@@ -1269,12 +1809,13 @@ class TriggerRunner:
                 # Sleep for a bit, or exit early if stop is requested.
                 with anyio.move_on_after(1):
                     await stop_event.wait()
+                now = time.monotonic()
+                if now - last_loop_lag_metric >= self.loop_lag_metric_interval:
+                    self.emit_loop_lag()
+                    last_loop_lag_metric = now
                 # Every minute, log status
-                if (now := time.monotonic()) - last_status >= 60:
-                    watchers = len([trigger for trigger in self.triggers.values() if trigger["is_watcher"]])
-                    triggers = len(self.triggers) - watchers
-                    self.log.info("%i triggers currently running", triggers)
-                    self.log.info("%i watchers currently running", watchers)
+                if now - last_status >= 60:
+                    self.log_status()
                     last_status = now
 
         except Exception:
@@ -1293,9 +1834,64 @@ class TriggerRunner:
             # finally; this call only matters when that path was bypassed
             # (e.g. the unsubscribe coroutine raised and was swallowed).
             await self._shared_streams.stop_all()
+            timers.cancel()
+            with suppress(asyncio.CancelledError):
+                await timers
         # Wait for supporting tasks to complete
         await watchdog
 
+    def log_status(self) -> None:
+        """Log the number of running triggers, the event loop lag and the slowest triggers."""
+        watchers = len([trigger for trigger in self.triggers.values() if trigger["is_watcher"]])
+        triggers = len(self.triggers) - watchers + len(self.timers)
+        self.log.info("%i triggers currently running", triggers)
+        self.log.info("%i watchers currently running", watchers)
+        if self.loop_lag:
+            self.log.info(
+                "Event loop lag since last status",
+                max_lag_ms=round(self.loop_lag.max * 1000, 1),
+                histogram=self.loop_lag.buckets(),
+            )
+            self.loop_lag.reset()
+        if slowest := self.slowest_triggers(self.slowest_triggers_to_log):
+            self.log.info(
+                "Triggers that used the most event loop time since last status",
+                triggers=[
+                    {"trigger_id": trigger_id, "name": name, "loop_time_ms": round(seconds * 1000, 1)}
+                    for seconds, trigger_id, name in slowest
+                ],
+            )
+
+    def emit_loop_lag(self) -> None:
+        """Emit the largest event loop lag since the last call, rather than every sampled lag."""
+        stats.timing(
+            "triggerer.loop_lag",
+            timedelta(seconds=self._max_loop_lag),
+            tags=prune_dict({"team_name": self.team_name}),
+        )
+        self._max_loop_lag = 0.0
+
+    def slowest_triggers(self, n: int) -> list[tuple[float, int, str]]:
+        """
+        Return the ``n`` triggers that used the most event loop time since the last call.
+
+        :return: ``(loop time in seconds, trigger id, trigger name)`` tuples, slowest first.
+        """
+        previous = self._status_loop_time
+        self._status_loop_time = {
+            trigger_id: details["coro"].loop_time for trigger_id, details in self.triggers.items()
+        }
+        if n <= 0:
+            return []
+        return heapq.nlargest(
+            n,
+            (
+                (seconds - previous.get(trigger_id, 0.0), trigger_id, self.triggers[trigger_id]["name"])
+                for trigger_id, seconds in self._status_loop_time.items()
+                if seconds > previous.get(trigger_id, 0.0)
+            ),
+        )
+
     async def init_comms(self):
         """
         Set up the communications pipe between this process and the supervisor.
@@ -1356,7 +1952,7 @@ class TriggerRunner:
             context: Context | None = None
             workload = self.to_create.popleft()
             trigger_id = workload.id
-            if trigger_id in self.triggers:
+            if trigger_id in self.triggers or trigger_id in self.timers:
                 self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
                 continue
             try:
@@ -1415,11 +2011,19 @@ class TriggerRunner:
                     tags=prune_dict({"team_name": self.team_name}),
                 )
 
+            # Templated triggers are not put on a timer, as rendering could change their moment.
+            if context is None and (timer := self._timer_event(trigger_instance)) is not None:
+                fire_at, event = timer
+                self.timers.add(trigger_id, fire_at, event, trigger_name)
+                self.log.info("trigger %s waiting for %s", trigger_name, fire_at, trigger_id=trigger_id)
+                continue
+
+            coro = TimedCoroutine(
+                self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context)
+            )
             self.triggers[trigger_id] = {
-                "task": asyncio.create_task(
-                    self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context),
-                    name=trigger_name,
-                ),
+                "task": asyncio.create_task(coro, name=trigger_name),
+                "coro": coro,
                 "is_watcher": isinstance(trigger_instance, BaseEventTrigger),
                 "name": trigger_name,
                 "events": 0,
@@ -1446,6 +2050,17 @@ class TriggerRunner:
             trigger_id = self.to_cancel.popleft()
             if trigger_id in self.triggers:
                 self.triggers[trigger_id]["task"].cancel(_USER_ACTION_CANCEL_MSG)
+            elif self.timers.remove(trigger_id):
+                self._finished_timers.append(trigger_id)
+            await asyncio.sleep(0)
+
+        # Triggers moved to another triggerer keep running there, so on_kill() must not be invoked.
+        while self.to_move:
+            trigger_id = self.to_move.popleft()
+            if trigger_id in self.triggers:
+                self.triggers[trigger_id]["task"].cancel()
+            elif self.timers.remove(trigger_id):
+                self._finished_timers.append(trigger_id)
             await asyncio.sleep(0)
 
     async def cleanup_finished_triggers(self) -> list[int]:
@@ -1454,7 +2069,8 @@ class TriggerRunner:
 
         Optionally warn users if the exit was not normal.
         """
-        finished_ids: list[int] = []
+        finished_ids: list[int] = self._finished_timers
+        self._finished_timers = []
         for trigger_id, details in list(self.triggers.items()):
             if details["task"].done():
                 finished_ids.append(trigger_id)
@@ -1496,6 +2112,40 @@ class TriggerRunner:
             await asyncio.sleep(0)
         return finished_ids
 
+    def _timer_event(self, trigger: BaseTrigger) -> tuple[datetime, TriggerEvent] | None:
+        try:
+            return trigger.timer_event()
+        except Exception:
+            self.log.exception(
+                "timer_event() raised; running the trigger instead", trigger_id=trigger.trigger_id
+            )
+            return None
+
+    async def run_timers(self) -> None:
+        """
+        Fire the events of time-based triggers when they are due.
+
+        All timers due at once are fired together, so their events go to the supervisor in the
+        same batch.
+        """
+        while True:
+            self.timers.wakeup.clear()
+            delay = self.timers.next_delay(time.time())
+            if delay is None or delay > 0:
+                with anyio.move_on_after(min(delay if delay is not None else math.inf, TIMER_MAX_SLEEP)):
+                    await self.timers.wakeup.wait()
+                continue
+            due = self.timers.pop_due(time.time())
+            for trigger_id, timer in due:
+                self.log.info(
+                    "Trigger fired event", name=timer.name, result=timer.event, trigger_id=trigger_id
+                )
+                self.events.append(
+                    TriggerEventEntry(trigger_id=trigger_id, event=timer.event, persist_seq=None)
+                )
+                self._finished_timers.append(trigger_id)
+            await asyncio.sleep(0)
+
     def process_trigger_events(self, finished_ids: list[int]) -> messages.TriggerStateChanges:
         # Copy out of our dequeues in threadsafe manner to sync state with parent
         events_to_send: list[TriggerEventEntry] = []
@@ -1513,8 +2163,23 @@ class TriggerRunner:
             events=events_to_send if events_to_send else None,
             finished=finished_ids if finished_ids else None,
             failures=failures_to_send if failures_to_send else None,
+            loop_time=self.collect_loop_time(finished_ids),
         )
 
+    def collect_loop_time(self, finished_ids: list[int]) -> dict[int, float] | None:
+        """Return the loop time of the triggers that used any since the last report, if it is due."""
+        for trigger_id in finished_ids:
+            self._reported_loop_time.pop(trigger_id, None)
+        if (now := time.monotonic()) - self._last_loop_time_report < LOOP_TIME_REPORT_INTERVAL:
+            return None
+        self._last_loop_time_report = now
+        loop_time: dict[int, float] = {}
+        for trigger_id, details in self.triggers.items():
+            seconds = details["coro"].loop_time
+            if seconds != self._reported_loop_time.get(trigger_id):
+                loop_time[trigger_id] = self._reported_loop_time[trigger_id] = seconds
+        return loop_time or None
+
     def sanitize_trigger_events(self, msg: messages.TriggerStateChanges) -> messages.TriggerStateChanges:
         req_encoder = _new_encoder()
         events_to_send: list[TriggerEventEntry] = []
@@ -1541,6 +2206,7 @@ class TriggerRunner:
             events=events_to_send if events_to_send else None,
             finished=msg.finished,
             failures=msg.failures,
+            loop_time=msg.loop_time,
         )
 
     async def sync_state_to_supervisor(self, finished_ids: list[int]) -> None:
@@ -1556,6 +2222,7 @@ class TriggerRunner:
         if resp:
             self.to_create.extend(resp.to_create)
             self.to_cancel.extend(resp.to_cancel)
+            self.to_move.extend(resp.to_move or ())
             if resp.events_persisted:
                 self._shared_streams.confirm_persisted(resp.events_persisted)
 
@@ -1584,13 +2251,19 @@ class TriggerRunner:
 
         Unfortunately, we can't tell what trigger is blocking things, but
         we can at least detect the top-level problem.
+
+        How much later than 100ms the loop wakes up is also recorded as the
+        event loop lag.
         """
         while not self.stop:
             last_run = time.monotonic()
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(WATCHDOG_INTERVAL)
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
+            lag = max(time_elapsed - WATCHDOG_INTERVAL, 0.0)
+            self.loop_lag.record(lag)
+            self._max_loop_lag = max(self._max_loop_lag, lag)
             if time_elapsed > self.blocked_main_thread_warning_threshold:
                 await self.log.ainfo(
                     "Triggerer's async thread was blocked for %.2f seconds, "
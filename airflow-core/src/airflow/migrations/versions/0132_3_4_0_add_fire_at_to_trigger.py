@@ -0,0 +1,54 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add fire_at to trigger.
+
+Revision ID: f87f7ce271d3
+Revises: c7f0a5d2e9b4
+Create Date: 2026-10-18 10:12:41.310925
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.utils.sqlalchemy import UtcDateTime
+
+# revision identifiers, used by Alembic.
+revision = "f87f7ce271d3"
+down_revision = "c7f0a5d2e9b4"
+branch_labels = None
+depends_on = None
+airflow_version = "3.4.0"
+
+
+def upgrade():
+    """Add fire_at to trigger."""
+    with op.batch_alter_table("trigger", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("fire_at", UtcDateTime(timezone=True), nullable=True))
+        batch_op.create_index("idx_trigger_fire_at", ["fire_at"], unique=False)
+
+
+def downgrade():
+    """Remove fire_at from trigger."""
+    with op.batch_alter_table("trigger", schema=None) as batch_op:
+        batch_op.drop_index("idx_trigger_fire_at")
+        batch_op.drop_column("fire_at")
@@ -0,0 +1,58 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add state_changed_at to task_instance for the change feed.
+
+Revision ID: 5b2e8d9c4a71
+Revises: f87f7ce271d3
+Create Date: 2026-10-18 14:02:17.518342
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.utils.sqlalchemy import UtcDateTime
+
+# revision identifiers, used by Alembic.
+revision = "5b2e8d9c4a71"
+down_revision = "f87f7ce271d3"
+branch_labels = None
+depends_on = None
+airflow_version = "3.4.0"
+
+
+def upgrade():
+    """Add state_changed_at to task_instance and the indexes the UI change feed polls."""
+    with op.batch_alter_table("dag_run", schema=None) as batch_op:
+        batch_op.create_index("idx_dag_run_dag_id_updated_at", ["dag_id", "updated_at"], unique=False)
+    with op.batch_alter_table("task_instance", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("state_changed_at", UtcDateTime(timezone=True), nullable=True))
+        batch_op.create_index("ti_dag_state_changed_at", ["dag_id", "state_changed_at"], unique=False)
+
+
+def downgrade():
+    """Remove state_changed_at from task_instance and the indexes the UI change feed polls."""
+    with op.batch_alter_table("task_instance", schema=None) as batch_op:
+        batch_op.drop_index("ti_dag_state_changed_at")
+        batch_op.drop_column("state_changed_at")
+    with op.batch_alter_table("dag_run", schema=None) as batch_op:
+        batch_op.drop_index("idx_dag_run_dag_id_updated_at")
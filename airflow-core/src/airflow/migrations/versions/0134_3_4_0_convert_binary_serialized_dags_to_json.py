@@ -0,0 +1,108 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Convert binary serialized Dags to JSON on downgrade.
+
+Revision ID: 8d3f1c6b2e57
+Revises: 5b2e8d9c4a71
+Create Date: 2026-10-18 18:40:12.204518
+
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+import structlog
+from alembic import context, op
+
+from airflow.serialization.binary_storage import BinarySerializedDag, is_binary_serialized_dag
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+# revision identifiers, used by Alembic.
+revision = "8d3f1c6b2e57"
+down_revision = "5b2e8d9c4a71"
+branch_labels = None
+depends_on = None
+airflow_version = "3.4.0"
+
+BATCH_SIZE = 1000
+
+log = structlog.get_logger(__name__)
+
+
+def upgrade():
+    """Nothing to do: serialized Dags are written in the binary format once it is configured."""
+
+
+def downgrade():
+    """
+    Convert serialized Dags stored in the binary format back to zlib-compressed JSON.
+
+    Earlier versions, and the downgrades of earlier migrations, read ``data_compressed`` as
+    zlib-compressed JSON only.
+    """
+    if context.is_offline_mode():
+        log.warning(
+            "Unable to convert binary serialized Dags while in offline mode -- "
+            "run the downgrade in online mode, or they can't be read by earlier versions."
+        )
+        return
+    convert_binary_serialized_dags(op.get_bind())
+
+
+def convert_binary_serialized_dags(conn: Connection) -> None:
+    """Rewrite the serialized Dags stored in the binary format as zlib-compressed JSON."""
+    last_id = "00000000-0000-0000-0000-000000000000"
+    while True:
+        # Select the ids first, to keep the large data_compressed column out of the sort.
+        ids = list(
+            conn.execute(
+                sa.text("""
+                    SELECT id FROM serialized_dag
+                    WHERE id > :last_id AND data_compressed IS NOT NULL
+                    ORDER BY id
+                    LIMIT :batch_size
+                """),
+                {"last_id": last_id, "batch_size": BATCH_SIZE},
+            ).scalars()
+        )
+        if not ids:
+            break
+        last_id = str(ids[-1])
+        for serialized_dag_id in ids:
+            data_compressed = conn.execute(
+                sa.text("SELECT data_compressed FROM serialized_dag WHERE id = :id"),
+                {"id": serialized_dag_id},
+            ).scalar()
+            if not is_binary_serialized_dag(data_compressed):
+                continue
+            dag_data = BinarySerializedDag(data_compressed).to_dict()
+            conn.execute(
+                sa.text("UPDATE serialized_dag SET data_compressed = :data WHERE id = :id"),
+                {
+                    "data": zlib.compress(json.dumps(dag_data, sort_keys=True).encode("utf-8")),
+                    "id": serialized_dag_id,
+                },
+            )
@@ -42,6 +42,7 @@ if TYPE_CHECKING:
     from airflow.models import DagRun
     from airflow.models.serialized_dag import SerializedDagModel
     from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.serialization.shared_dag_cache import SharedSerializedDagCache
 
 
 class _CacheEntry(NamedTuple):
@@ -74,6 +75,7 @@ class DBDagBag:
         load_op_links: bool = True,
         cache_size: int | None = None,
         cache_ttl: int | None = None,
+        shared_cache: SharedSerializedDagCache | None = None,
     ) -> None:
         """
         Initialize DBDagBag.
@@ -81,8 +83,11 @@ class DBDagBag:
         :param load_op_links: Should the extra operator link be loaded when de-serializing the DAG?
         :param cache_size: Size of LRU cache. If None or 0, uses unbounded dict (no eviction).
         :param cache_ttl: Time-to-live for cache entries in seconds. If None or 0, no TTL (LRU only).
+        :param shared_cache: Host-wide store of serialized DAG data consulted before the database
+            when a DAG version is not cached in this process.
         """
         self.load_op_links = load_op_links
+        self._shared_cache = shared_cache
         self._dags: MutableMapping[UUID | str, _CacheEntry] = {}
         self._use_cache = False
 
@@ -107,11 +112,29 @@ class DBDagBag:
         dag = serdag.dag
         if not dag:
             return None
+        if self._shared_cache is not None and serdag.data is not None:
+            self._shared_cache.put(serdag.dag_version_id, serdag.dag_hash, serdag.data)
+        self._cache_dag(serdag.dag_version_id, dag, serdag.dag_hash)
+        return dag
+
+    def _cache_dag(self, version_id: UUID | str, dag: SerializedDAG, dag_hash: str) -> None:
         with self._lock:
-            self._dags[serdag.dag_version_id] = _CacheEntry(dag, serdag.dag_hash, time.monotonic())
+            self._dags[version_id] = _CacheEntry(dag, dag_hash, time.monotonic())
             cache_size = len(self._dags)
         if self._use_cache:
             stats.gauge("api_server.dag_bag.cache_size", cache_size, rate=0.1)
+
+    def _read_dag_from_shared_cache(self, version_id: UUID | str, session: Session) -> SerializedDAG | None:
+        """Read and cache a SerializedDAG from the shared cache, if it holds the current version of it."""
+        from airflow.serialization.serialized_objects import DagSerialization
+
+        if self._shared_cache is None or (dag_hash := self._current_dag_hash(version_id, session)) is None:
+            return None
+        if (data := self._shared_cache.get(version_id, dag_hash)) is None:
+            return None
+        DagSerialization._load_operator_extra_links = self.load_op_links
+        dag = DagSerialization.from_dict(data)
+        self._cache_dag(version_id, dag, dag_hash)
         return dag
 
     @staticmethod
@@ -155,6 +178,12 @@ class DBDagBag:
             with self._lock:
                 self._dags.pop(version_id, None)
 
+        # Another worker process on this host may already have loaded this version.
+        if (dag := self._read_dag_from_shared_cache(version_id, session)) is not None:
+            if self._use_cache:
+                stats.incr("api_server.dag_bag.cache_miss")
+            return dag
+
         dag_version = session.get(DagVersion, version_id, options=[joinedload(DagVersion.serialized_dag)])
         if not dag_version:
             return None
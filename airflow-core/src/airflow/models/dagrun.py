@@ -50,6 +50,7 @@ from sqlalchemy import (
     not_,
     or_,
     text,
+    tuple_,
     update,
 )
 from sqlalchemy.dialects import postgresql
@@ -120,6 +121,7 @@ if TYPE_CHECKING:
     from sqlalchemy.sql.elements import Case, ColumnElement
     from sqlalchemy.sql.selectable import Select
 
+    from airflow._shared.logging.types import Logger
     from airflow.api_fastapi.execution_api.datamodels.taskinstance import DagRun as DRDataModel
     from airflow.models.dag_version import DagVersion
     from airflow.models.taskinstancekey import TaskInstanceKey
@@ -333,6 +335,7 @@ class DagRun(Base, LoggingMixin):
         Index("idx_dag_run_dag_id", dag_id),
         Index("idx_dag_run_run_after", run_after),
         Index("idx_dag_run_created_dag_version_id", created_dag_version_id),
+        Index("idx_dag_run_dag_id_updated_at", dag_id, updated_at),
         Index(
             "idx_dag_run_running_dags",
             "state",
@@ -980,25 +983,64 @@ class DagRun(Base, LoggingMixin):
             )
             .order_by(TI.task_id, TI.map_index)
         )
-
-        if state:
-            if isinstance(state, str):
-                tis = tis.where(TI.state == state)
-            else:
-                # this is required to deal with NULL values
-                if None in state:
-                    if all(x is None for x in state):
-                        tis = tis.where(TI.state.is_(None))
-                    else:
-                        not_none_state = (s for s in state if s)
-                        tis = tis.where(or_(TI.state.in_(not_none_state), TI.state.is_(None)))
-                else:
-                    tis = tis.where(TI.state.in_(state))
+        tis = DagRun._filter_task_instances_by_state(tis, state)
 
         if task_ids is not None:
             tis = tis.where(TI.task_id.in_(task_ids))
         return list(session.scalars(tis).all())
 
+    @staticmethod
+    def fetch_task_instances_for_dag_runs(
+        dag_runs: Iterable[DagRun],
+        state: TaskInstanceState | Iterable[TaskInstanceState | None] | None = None,
+        *,
+        session: Session,
+    ) -> dict[tuple[str, str], list[TI]]:
+        """
+        Return the task instances of several dag runs with a single query.
+
+        This is the batched counterpart of :meth:`get_task_instances`, keyed by ``(dag_id, run_id)``.
+        Every given dag run has an entry, even if it has no matching task instances.
+        """
+        partial_task_ids: dict[tuple[str, str], set[str]] = {}
+        tis_by_run: dict[tuple[str, str], list[TI]] = {}
+        for dag_run in dag_runs:
+            tis_by_run[dag_run.dag_id, dag_run.run_id] = []
+            if (task_ids := DagRun._get_partial_task_ids(dag_run.dag)) is not None:
+                partial_task_ids[dag_run.dag_id, dag_run.run_id] = set(task_ids)
+        if not tis_by_run:
+            return tis_by_run
+
+        query = (
+            select(TI)
+            .options(joinedload(TI.dag_run))
+            .where(tuple_(TI.dag_id, TI.run_id).in_(list(tis_by_run)))
+            .order_by(TI.dag_id, TI.run_id, TI.task_id, TI.map_index)
+        )
+        query = DagRun._filter_task_instances_by_state(query, state)
+        for ti in session.scalars(query):
+            run_key = (ti.dag_id, ti.run_id)
+            task_ids = partial_task_ids.get(run_key)
+            if task_ids is None or ti.task_id in task_ids:
+                tis_by_run[run_key].append(ti)
+        return tis_by_run
+
+    @staticmethod
+    def _filter_task_instances_by_state(
+        query: Select, state: TaskInstanceState | Iterable[TaskInstanceState | None] | None
+    ) -> Select:
+        if not state:
+            return query
+        if isinstance(state, str):
+            return query.where(TI.state == state)
+        # this is required to deal with NULL values
+        if None in state:
+            if all(x is None for x in state):
+                return query.where(TI.state.is_(None))
+            not_none_state = (s for s in state if s)
+            return query.where(or_(TI.state.in_(not_none_state), TI.state.is_(None)))
+        return query.where(TI.state.in_(state))
+
     def _check_last_n_dagruns_failed(self, dag_id, max_consecutive_failed_dag_runs, session):
         """Check if last N dags failed."""
         dag_runs = session.scalars(
@@ -1250,7 +1292,11 @@ class DagRun(Base, LoggingMixin):
 
     @provide_session
     def update_state(
-        self, *, session: Session = NEW_SESSION, execute_callbacks: bool = True
+        self,
+        *,
+        session: Session = NEW_SESSION,
+        execute_callbacks: bool = True,
+        task_instances: list[TI] | None = None,
     ) -> tuple[list[TI], DagCallbackRequest | None]:
         """
         Determine the overall state of the DagRun based on the state of its TaskInstances.
@@ -1258,6 +1304,8 @@ class DagRun(Base, LoggingMixin):
         :param session: Sqlalchemy ORM Session
         :param execute_callbacks: Should dag callbacks (success/failure, SLA etc.) be invoked
             directly (default: true) or recorded as a pending request in the ``returned_callback`` property
+        :param task_instances: Task instances of this run already loaded by the caller (see
+            :meth:`fetch_task_instances_for_dag_runs`). If not given, they are queried.
         :return: Tuple containing tis that can be scheduled in the current loop & `returned_callback` that
             needs to be executed
         """
@@ -1298,7 +1346,7 @@ class DagRun(Base, LoggingMixin):
             tags=self.stats_tags,
         ):
             dag = self.get_dag()
-            info = self.task_instance_scheduling_decisions(session=session)
+            info = self.task_instance_scheduling_decisions(session=session, task_instances=task_instances)
 
             tis = info.tis
             schedulable_tis = info.schedulable_tis
@@ -1448,8 +1496,13 @@ class DagRun(Base, LoggingMixin):
         return schedulable_tis, callback
 
     @provide_session
-    def task_instance_scheduling_decisions(self, *, session: Session = NEW_SESSION) -> TISchedulingDecision:
-        tis = self.get_task_instances(session=session, state=State.task_states)
+    def task_instance_scheduling_decisions(
+        self, *, session: Session = NEW_SESSION, task_instances: list[TI] | None = None
+    ) -> TISchedulingDecision:
+        if task_instances is None:
+            tis = self.get_task_instances(session=session, state=State.task_states)
+        else:
+            tis = task_instances
         self.log.debug("number of tis tasks for %s: %s task(s)", self, len(tis))
 
         def _filter_tis_and_exclude_removed(dag: SerializedDAG, tis: list[TI]) -> Iterable[TI]:
@@ -2141,7 +2194,7 @@ class DagRun(Base, LoggingMixin):
                     TI.run_id == self.run_id,
                     TI.map_index.in_(removed_indexes),
                 )
-                .values(state=TaskInstanceState.REMOVED)
+                .values(state=TaskInstanceState.REMOVED, state_changed_at=timezone.utcnow())
             )
             session.flush()
 
@@ -2193,14 +2246,54 @@ class DagRun(Base, LoggingMixin):
 
         All the TIs should belong to this DagRun, but this code is in the hot-path, this is not checked -- it
         is the caller's responsibility to call this function only with TIs from a single dag run.
+        Use :meth:`schedule_tis_for_dag_runs` to schedule TIs of several dag runs at once.
+        """
+        return DagRun._schedule_tis(
+            schedulable_tis,
+            session=session,
+            max_tis_per_query=max_tis_per_query,
+            logger=self.log,
+            scheduled_by_job_id=self.scheduled_by_job_id,
+        )
+
+    @staticmethod
+    def schedule_tis_for_dag_runs(
+        schedulable_tis: Iterable[TI],
+        *,
+        session: Session,
+        max_tis_per_query: int | None = None,
+        scheduled_by_job_id: int | None = None,
+    ) -> int:
         """
+        Set task instances of any number of dag runs in to the scheduled state.
+
+        Behaves like :meth:`schedule_tis`, but the UPDATE statements are shared by all the given dag runs
+        instead of being issued once per run.
+        """
+        return DagRun._schedule_tis(
+            schedulable_tis,
+            session=session,
+            max_tis_per_query=max_tis_per_query,
+            logger=DagRun.logger(),
+            scheduled_by_job_id=scheduled_by_job_id,
+        )
+
+    @staticmethod
+    def _schedule_tis(
+        schedulable_tis: Iterable[TI],
+        *,
+        session: Session,
+        max_tis_per_query: int | None,
+        logger: Logger,
+        scheduled_by_job_id: int | None,
+    ) -> int:
         # Get list of TI IDs that do not need to executed, these are
         # tasks using EmptyOperator and without on_execute_callback / on_success_callback
         empty_ti_ids: list[UUID] = []
         schedulable_ti_ids: list[UUID] = []
         reschedule_ti_ids: set[UUID] = set()
-        debug_try_number_check = self.log.isEnabledFor(logging.DEBUG)
-        expected_try_number_by_ti_id: dict[UUID, tuple[int, int, str | None]] = {}
+        debug_try_number_check = logger.isEnabledFor(logging.DEBUG)
+        expected_try_number_by_ti_id: dict[UUID, tuple[int, int, str | None, str, str]] = {}
         for ti in schedulable_tis:
             if not ti.is_schedulable:
                 empty_ti_ids.append(ti.id)
@@ -2220,6 +2313,8 @@ class DagRun(Base, LoggingMixin):
                         else ti.try_number + 1,
                         ti.try_number,
                         ti.state,
+                        ti.dag_id,
+                        ti.run_id,
                     )
 
         count = 0
@@ -2252,6 +2347,7 @@ class DagRun(Base, LoggingMixin):
                     .where(TI.id.in_(id_chunk), schedulable_state_clause)
                     .values(
                         state=TaskInstanceState.SCHEDULED,
+                        state_changed_at=timezone.utcnow(),
                         scheduled_dttm=timezone.utcnow(),
                         try_number=next_try_number,
                     )
@@ -2272,18 +2368,20 @@ class DagRun(Base, LoggingMixin):
                         db_row = rows_by_ti_id.get(ti_id)
                         if db_row is None:
                             continue
-                        expected_try_number, pre_update_try_number, pre_update_state = expected
+                        expected_try_number, pre_update_try_number, pre_update_state, dag_id, run_id = (
+                            expected
+                        )
                         db_try_number, db_state = db_row
                         if db_try_number != expected_try_number:
-                            self.log.warning(
+                            logger.warning(
                                 "schedule_tis: try_number mismatch after scheduling for ti_id=%s "
                                 "dag_run=%s/%s scheduler_job_id=%s "
                                 "pre_state=%s pre_try_number=%d expected_try_number=%d "
                                 "db_state=%s db_try_number=%d",
                                 ti_id,
-                                self.dag_id,
-                                self.run_id,
-                                self.scheduled_by_job_id,
+                                dag_id,
+                                run_id,
+                                scheduled_by_job_id,
                                 pre_update_state,
                                 pre_update_try_number,
                                 expected_try_number,
@@ -2300,6 +2398,7 @@ class DagRun(Base, LoggingMixin):
                     .where(TI.id.in_(id_chunk), schedulable_state_clause)
                     .values(
                         state=TaskInstanceState.SUCCESS,
+                        state_changed_at=timezone.utcnow(),
                         start_date=timezone.utcnow(),
                         end_date=timezone.utcnow(),
                         duration=0,
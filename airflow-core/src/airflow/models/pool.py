@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from sqlalchemy import Boolean, ForeignKey, Integer, String, Text, func, select
@@ -185,6 +185,7 @@ class Pool(Base):
     def slots_stats(
         *,
         lock_rows: bool = False,
+        slot_counts: Iterable[tuple[str, TaskInstanceState, int]] | None = None,
         session: Session = NEW_SESSION,
     ) -> dict[str, PoolStats]:
         """
@@ -195,6 +196,8 @@ class Pool(Base):
         OperationalError.
 
         :param lock_rows: Should we attempt to obtain a row-level lock on all the Pool rows returns
+        :param slot_counts: Pre-computed ``(pool, state, slots)`` usage rows. When given, they are used
+            instead of aggregating the ``task_instance`` table (the pool rows are still read and locked).
         :param session: SQLAlchemy ORM Session
         """
         from airflow.models.taskinstance import TaskInstance  # Avoid circular import
@@ -220,11 +223,15 @@ class Pool(Base):
             TaskInstanceState.DEFERRED,
             TaskInstanceState.SCHEDULED,
         }
-        state_count_by_pool = session.execute(
-            select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
-            .filter(TaskInstance.state.in_(allowed_execution_states))
-            .group_by(TaskInstance.pool, TaskInstance.state)
-        )
+        state_count_by_pool: Iterable[Any]
+        if slot_counts is not None:
+            state_count_by_pool = slot_counts
+        else:
+            state_count_by_pool = session.execute(
+                select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
+                .filter(TaskInstance.state.in_(allowed_execution_states))
+                .group_by(TaskInstance.pool, TaskInstance.state)
+            )
 
         # calculate queued and running metrics
         for pool_name, state, decimal_count in state_count_by_pool:
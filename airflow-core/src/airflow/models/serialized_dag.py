@@ -28,6 +28,7 @@ from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 from uuid import UUID
 
 import uuid6
+from cachetools import LRUCache
 from sqlalchemy import JSON, ForeignKey, Index, LargeBinary, String, Uuid, exists, select, tuple_, update
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, backref, foreign, mapped_column, relationship
@@ -47,11 +48,17 @@ from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun
 from airflow.models.deadline_alert import DeadlineAlert as DeadlineAlertModel
 from airflow.models.taskinstance import TaskInstance
+from airflow.serialization.binary_storage import (
+    BinarySerializedDag,
+    encode_serialized_dag,
+    is_binary_serialized_dag,
+)
 from airflow.serialization.dag_dependency import DagDependency
 from airflow.serialization.definitions.assets import SerializedAssetUniqueKey as UKey
 from airflow.serialization.definitions.deadline import DeadlineAlertFields
 from airflow.serialization.enums import Encoding
 from airflow.serialization.serialized_objects import DagSerialization
+from airflow.serialization.structure_hash import DagStructureHash
 from airflow.settings import json
 from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -71,6 +78,25 @@ log = logging.getLogger(__name__)
 
 # If set to True, serialized DAGs is compressed before writing to DB,
 _COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
+# If set to "msgpack", serialized DAGs are written in the binary format of airflow.serialization.binary_storage
+_SERIALIZED_DAG_STORAGE_FORMAT = conf.get("core", "serialized_dag_storage_format", fallback="json")
+
+# Structure hash and dag_hash of the DAGs last written by this process, keyed by dag_id. This lets
+# write_dag reuse the dag_hash of a DAG that did not change instead of sorting and dumping it again.
+# Bounded so that long-lived processes writing many DAGs do not keep every one of them.
+_DAG_HASH_CACHE_SIZE = 4096
+_dag_hash_by_structure: LRUCache[str, tuple[DagStructureHash, str]] = LRUCache(maxsize=_DAG_HASH_CACHE_SIZE)
+
+
+def _compress_json(dag_data: dict) -> bytes:
+    # partially ordered json data
+    return zlib.compress(json.dumps(dag_data, sort_keys=True).encode("utf-8"))
+
+
+def _decompress_data(data_compressed: bytes) -> dict:
+    if is_binary_serialized_dag(data_compressed):
+        return BinarySerializedDag(data_compressed).to_dict()
+    return json.loads(zlib.decompress(data_compressed))
 
 
 class DagWriteMetadata(NamedTuple):
@@ -347,17 +373,24 @@ class SerializedDagModel(Base):
     load_op_links = True
     __table_args__ = (Index("idx_serialized_dag_dag_id_created_at", dag_id, created_at),)
 
-    def __init__(self, dag: LazyDeserializedDAG) -> None:
+    def __init__(self, dag: LazyDeserializedDAG, dag_hash: str | None = None) -> None:
         self.dag_id = dag.dag_id
         dag_data = dag.data
-        self.dag_hash = SerializedDagModel.hash(dag_data)
-
-        # partially ordered json data
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
+        self.dag_hash = dag_hash or SerializedDagModel.hash(dag_data)
 
-        if _COMPRESS_SERIALIZED_DAGS:
+        if _SERIALIZED_DAG_STORAGE_FORMAT == "msgpack":
             self._data = None
-            self._data_compressed = zlib.compress(dag_data_json)
+            try:
+                self._data_compressed = encode_serialized_dag(dag_data)
+            except OverflowError:
+                log.warning(
+                    "DAG (%s) can't be stored in the msgpack format, storing it as compressed JSON",
+                    self.dag_id,
+                )
+                self._data_compressed = _compress_json(dag_data)
+        elif _COMPRESS_SERIALIZED_DAGS:
+            self._data = None
+            self._data_compressed = _compress_json(dag_data)
         else:
             self._data = dag_data
             self._data_compressed = None
@@ -383,6 +416,30 @@ class SerializedDagModel(Base):
         data_json = json.dumps(data_, sort_keys=True).encode("utf-8")
         return md5(data_json).hexdigest()
 
+    @classmethod
+    def _hash_unless_unchanged(cls, dag_id: str, dag_data: dict[str, Any]) -> str:
+        """
+        Get the dag_hash of the data, reusing the last one computed for the DAG if its structure is unchanged.
+
+        The structure hash is compared first, which is much cheaper to compute than :meth:`hash` for
+        large DAGs. When it differs, the tasks and sections that changed are logged.
+        """
+        structure = DagStructureHash.from_data(dag_data)
+        previous = _dag_hash_by_structure.get(dag_id)
+        if previous is not None:
+            previous_structure, previous_dag_hash = previous
+            if previous_structure.root == structure.root:
+                return previous_dag_hash
+            log.debug(
+                "Structure of DAG (%s) changed: sections %s, tasks %s",
+                dag_id,
+                sorted(structure.changed_sections(previous_structure)),
+                sorted(structure.changed_tasks(previous_structure)),
+            )
+        dag_hash = cls.hash(dag_data)
+        _dag_hash_by_structure[dag_id] = (structure, dag_hash)
+        return dag_hash
+
     @classmethod
     def _sort_serialized_dag_dict(cls, serialized_dag: Any):
         """Recursively sort json_dict and its nested dictionaries and lists."""
@@ -659,10 +716,8 @@ class SerializedDagModel(Base):
                 select(cls).where(cls.dag_id == dag.dag_id).order_by(cls.created_at.desc()).limit(1)
             )
 
-            if (
-                existing_serialized_dag
-                and existing_serialized_dag.data
-                and (existing_deadline_uuids := existing_serialized_dag.data.get("dag", {}).get("deadline"))
+            if existing_serialized_dag and (
+                existing_deadline_uuids := existing_serialized_dag.dag_attributes.get("deadline")
             ):
                 reuse_result = cls._try_reuse_deadline_uuids(
                     existing_deadline_uuids,
@@ -694,7 +749,7 @@ class SerializedDagModel(Base):
         else:
             deadline_uuid_mapping = {}
 
-        new_dag_hash = cls.hash(dag.data)
+        new_dag_hash = cls._hash_unless_unchanged(dag.dag_id, dag.data)
 
         if serialized_dag_hash == new_dag_hash and dag_version and dag_version.bundle_name == bundle_name:
             # Serialized content is unchanged, so we don't create a new DagVersion.
@@ -734,7 +789,7 @@ class SerializedDagModel(Base):
             # This is for dynamic DAGs that the hashes changes often. We should update
             # the serialized dag, the dag_version and the dag_code instead of a new version
             # if the dag_version is not associated with any task instances
-            new_serialized_dag = cls(dag)
+            new_serialized_dag = cls(dag, dag_hash=new_dag_hash)
 
             # Use direct UPDATE to avoid loading the full serialized DAG
             result = session.execute(
@@ -788,8 +843,10 @@ class SerializedDagModel(Base):
         if reused_deadline_data:
             deadline_uuid_mapping = {str(uuid6.uuid7()): data for data in reused_deadline_data.values()}
             dag.data["dag"]["deadline"] = list(deadline_uuid_mapping.keys())
+            # The deadline UUIDs are part of the hash.
+            new_dag_hash = cls.hash(dag.data)
 
-        new_serialized_dag = cls(dag)
+        new_serialized_dag = cls(dag, dag_hash=new_dag_hash)
         new_serialized_dag.dag_version = dagv
         session.add(new_serialized_dag)
 
@@ -903,12 +960,31 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                self.__data_cache = _decompress_data(self._data_compressed)
             else:
                 self.__data_cache = self._data
 
         return self.__data_cache
 
+    def _undecoded_binary_data(self) -> BinarySerializedDag | None:
+        if getattr(self, "_SerializedDagModel__data_cache", None) is not None:
+            return None
+        if self._data_compressed is None or not is_binary_serialized_dag(self._data_compressed):
+            return None
+        return BinarySerializedDag(self._data_compressed)
+
+    @property
+    def dag_attributes(self) -> dict:
+        """
+        The DAG-level fields of ``data["dag"]``, i.e. everything but the tasks.
+
+        For DAGs stored in the binary format this does not decode the tasks, unless ``data`` was
+        already decoded.
+        """
+        if (binary_data := self._undecoded_binary_data()) is not None:
+            return binary_data.dag_fields
+        return {key: value for key, value in (self.data or {}).get("dag", {}).items() if key != "tasks"}
+
     @property
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
@@ -961,7 +1037,8 @@ class SerializedDagModel(Base):
         """
         load_json: Callable
         data_col_to_select: ColumnElement[Any] | InstrumentedAttribute[bytes | None]
-        if _COMPRESS_SERIALIZED_DAGS is False:
+        data_cols_to_select: tuple[ColumnElement[Any] | InstrumentedAttribute[Any], ...]
+        if _COMPRESS_SERIALIZED_DAGS is False and _SERIALIZED_DAG_STORAGE_FORMAT == "json":
             dialect = get_dialect_name(session)
             if dialect in ["sqlite", "mysql"]:
                 data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
@@ -978,17 +1055,24 @@ class SerializedDagModel(Base):
             else:
                 data_col_to_select = func.json_extract_path(cls._data, "dag", "dag_dependencies")
                 load_json = lambda x: x
+            data_cols_to_select = (data_col_to_select,)
         else:
-            data_col_to_select = cls._data_compressed
+            # Rows written before the storage format was changed may only have the JSON column.
+            data_cols_to_select = (cls._data_compressed, cls._data)
 
-            def load_json(deps_data):
-                return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"] if deps_data else []
+            def load_json(deps_data, uncompressed_data):
+                if not deps_data:
+                    return (uncompressed_data or {}).get("dag", {}).get("dag_dependencies", [])
+                if is_binary_serialized_dag(deps_data):
+                    # Only the header is decoded, the tasks are not needed.
+                    return BinarySerializedDag(deps_data).dag_fields["dag_dependencies"]
+                return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"]
 
         latest_sdag_subquery = (
             select(cls.dag_id, func.max(cls.created_at).label("max_created")).group_by(cls.dag_id).subquery()
         )
         query = session.execute(
-            select(cls.dag_id, data_col_to_select)
+            select(cls.dag_id, *data_cols_to_select)
             .join(
                 latest_sdag_subquery,
                 (cls.dag_id == latest_sdag_subquery.c.dag_id)
@@ -997,7 +1081,7 @@ class SerializedDagModel(Base):
             .join(cls.dag_model)
             .where(~DagModel.is_stale)
         )
-        dag_depdendencies = [(str(dag_id), load_json(deps_data)) for dag_id, deps_data in query]
+        dag_depdendencies = [(str(dag_id), load_json(*deps_data)) for dag_id, *deps_data in query]
         resolver = _DagDependenciesResolver(dag_id_dependencies=dag_depdendencies, session=session)
         dag_depdendencies_by_dag = resolver.resolve()
         return dag_depdendencies_by_dag
@@ -64,7 +64,7 @@ from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.ext.mutable import MutableDict
-from sqlalchemy.orm import Mapped, lazyload, mapped_column, reconstructor, relationship
+from sqlalchemy.orm import Mapped, lazyload, mapped_column, reconstructor, relationship, validates
 from sqlalchemy.orm.attributes import NO_VALUE, set_committed_value
 from sqlalchemy.orm.exc import DetachedInstanceError, ObjectDeletedError
 
@@ -655,6 +655,12 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
     updated_at: Mapped[datetime | None] = mapped_column(
         UtcDateTime, default=timezone.utcnow, onupdate=timezone.utcnow, nullable=True
     )
+    # Unlike updated_at, which every heartbeat bumps, this only moves when the state does, so the
+    # UI change feed can follow state transitions through an index heartbeats never touch. Bulk
+    # UPDATEs that set ``state`` must set it too.
+    state_changed_at: Mapped[datetime | None] = mapped_column(
+        UtcDateTime, default=timezone.utcnow, nullable=True
+    )
     _rendered_map_index: Mapped[str | None] = mapped_column("rendered_map_index", String(250), nullable=True)
     context_carrier: Mapped[dict | None] = mapped_column(MutableDict.as_mutable(ExtendedJSON), nullable=True)
 
@@ -697,6 +703,7 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
         Index("ti_trigger_id", trigger_id),
         Index("ti_heartbeat", last_heartbeat_at),
         Index("ti_dag_version_id", dag_version_id),
+        Index("ti_dag_state_changed_at", dag_id, state_changed_at),
         PrimaryKeyConstraint("id", name="task_instance_pkey"),
         UniqueConstraint("dag_id", "task_id", "run_id", "map_index", name="task_instance_composite_key"),
         ForeignKeyConstraint(
@@ -791,6 +798,14 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
     def __hash__(self):
         return hash((self.task_id, self.dag_id, self.run_id, self.map_index))
 
+    @validates("state")
+    def _stamp_state_change(self, _key: str, value: str | None) -> str | None:
+        # Compare with the loaded value rather than self.state so an expired or detached instance
+        # is not reloaded just to be assigned a state.
+        if value != inspect(self).attrs.state.loaded_value:
+            self.state_changed_at = timezone.utcnow()
+        return value
+
     @property
     def stats_tags(self) -> dict[str, str]:
         """Returns task instance tags."""
@@ -18,7 +18,8 @@ from __future__ import annotations
 
 import datetime
 import logging
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from enum import Enum
 from functools import singledispatch
 from traceback import format_exception
@@ -36,7 +37,7 @@ from airflow.models.asset import AssetWatcherModel
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
 from airflow.serialization.enums import stringify_encoding_keys
-from airflow.triggers.base import BaseTaskEndEvent
+from airflow.triggers.base import BaseTaskEndEvent, TriggerEvent
 from airflow.utils.retries import run_with_db_retries
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name, with_row_locks
@@ -46,7 +47,7 @@ if TYPE_CHECKING:
     from sqlalchemy import Row
     from sqlalchemy.sql import Select
 
-    from airflow.triggers.base import BaseTrigger, TriggerEvent
+    from airflow.triggers.base import BaseTrigger
 
 TRIGGER_FAIL_REPR = "__fail__"
 """String value to represent trigger failure.
@@ -92,7 +93,10 @@ class Trigger(Base):
     """
 
     __tablename__ = "trigger"
-    __table_args__ = (Index("idx_trigger_triggerer_queue_id", "triggerer_id", "queue", "id"),)
+    __table_args__ = (
+        Index("idx_trigger_triggerer_queue_id", "triggerer_id", "queue", "id"),
+        Index("idx_trigger_fire_at", "fire_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     classpath: Mapped[str] = mapped_column(String(1000), nullable=False)
@@ -100,6 +104,9 @@ class Trigger(Base):
     created_date: Mapped[datetime.datetime] = mapped_column(UtcDateTime, nullable=False)
     triggerer_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     queue: Mapped[str | None] = mapped_column(String(256), nullable=True)
+    # Set for triggers of deferred tasks that only wait for this moment; the scheduler can resume
+    # those tasks itself once it has passed, see ``[scheduler] resume_time_deferrals``.
+    fire_at: Mapped[datetime.datetime | None] = mapped_column(UtcDateTime, nullable=True)
 
     # Denormalized from dag_bundle_team to keep the triggerer's ~1s polling queries join-free,
     # especially since it's eventually consistent and trigger rows are ephemeral.
@@ -133,6 +140,7 @@ class Trigger(Base):
         created_date: datetime.datetime | None = None,
         queue: str | None = None,
         team_name: str | None = None,
+        fire_at: datetime.datetime | None = None,
     ) -> None:
         super().__init__()
         self.classpath = classpath
@@ -140,6 +148,7 @@ class Trigger(Base):
         self.created_date = created_date or timezone.utcnow()
         self.queue = queue
         self.team_name = team_name
+        self.fire_at = fire_at
 
     @property
     def kwargs(self) -> dict[str, Any]:
@@ -277,31 +286,131 @@ class Trigger(Base):
         Resume all tasks that were in deferred state.
         Send an event to all assets associated to the trigger.
         """
-        # Resume deferred tasks
+        cls.submit_events([(trigger_id, event)], session=session)
+
+    @classmethod
+    @provide_session
+    def submit_events(
+        cls, events: Iterable[tuple[int, TriggerEvent]], *, session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Fire many events at once.
+
+        This does the same as calling :meth:`submit_event` for each event in turn, but the deferred
+        tasks and the triggers of all events are each loaded with a single query, and everything is
+        written in one transaction.
+
+        :param events: Pairs of trigger id and the event the trigger fired, in the order they fired.
+        """
+        events = list(events)
+        if not events:
+            return
+        trigger_ids = {trigger_id for trigger_id, _ in events}
+
+        deferred: dict[int, list[TaskInstance]] = defaultdict(list)
         for task_instance in session.scalars(
             select(TaskInstance).where(
-                TaskInstance.trigger_id == trigger_id, TaskInstance.state == TaskInstanceState.DEFERRED
+                TaskInstance.trigger_id.in_(trigger_ids), TaskInstance.state == TaskInstanceState.DEFERRED
             )
         ):
-            handle_event_submit(event, task_instance=task_instance, session=session)
+            deferred[task_instance.trigger_id].append(task_instance)
+
+        triggers = {
+            trigger.id: trigger
+            for trigger in session.scalars(
+                select(cls)
+                .where(cls.id.in_(trigger_ids))
+                .options(
+                    selectinload(cls.asset_watchers).selectinload(AssetWatcherModel.asset),
+                    selectinload(cls.callback),
+                )
+            )
+        }
+
+        for trigger_id, event in events:
+            # Resume deferred tasks; only the first event of a trigger finds them still deferred
+            for task_instance in deferred.pop(trigger_id, ()):
+                handle_event_submit(event, task_instance=task_instance, session=session)
+
+            # Send an event to assets
+            if (trigger := triggers.get(trigger_id)) is None:
+                # Already deleted for some reason
+                continue
+            for asset in trigger.assets:
+                AssetManager.register_asset_change(
+                    asset=asset.to_serialized(),
+                    extra={"from_trigger": True, "payload": event.payload},
+                    session=session,
+                )
+            if trigger.callback:
+                trigger.callback.handle_event(event, session)
 
-        # Send an event to assets
-        trigger = session.scalars(
-            select(cls)
-            .where(cls.id == trigger_id)
-            .options(selectinload(cls.asset_watchers).selectinload(AssetWatcherModel.asset))
-        ).one_or_none()
-        if trigger is None:
-            # Already deleted for some reason
-            return
-        for asset in trigger.assets:
-            AssetManager.register_asset_change(
-                asset=asset.to_serialized(),
-                extra={"from_trigger": True, "payload": event.payload},
-                session=session,
+    @staticmethod
+    def scheduler_resumes_time_deferrals() -> bool:
+        """
+        Whether the scheduler resumes the tasks of triggers with a ``fire_at`` once it has passed.
+
+        Triggerers then leave these triggers alone, so the scheduler and the triggerers both ask
+        here rather than reading ``[scheduler] resume_time_deferrals`` themselves.
+        """
+        return conf.getboolean("scheduler", "resume_time_deferrals", fallback=False)
+
+    @classmethod
+    @provide_session
+    def resume_expired_time_deferrals(cls, limit: int, *, session: Session = NEW_SESSION) -> int:
+        """
+        Resume deferred tasks whose trigger only waits for a moment that has passed.
+
+        These tasks are resumed as if their trigger had fired, with the moment as the event payload,
+        without running the trigger. All tasks resumable at once are updated with a single bulk
+        UPDATE, and their rows are locked with SKIP LOCKED so concurrent schedulers resume different
+        tasks.
+
+        :param limit: Maximum number of tasks to resume.
+        :return: The number of tasks resumed.
+        """
+        now = timezone.utcnow()
+        query = (
+            select(TaskInstance.id, TaskInstance.next_kwargs, cls.fire_at)
+            .join(cls, TaskInstance.trigger_id == cls.id)
+            .where(TaskInstance.state == TaskInstanceState.DEFERRED, cls.fire_at <= now)
+            .limit(limit)
+        )
+        rows = session.execute(with_row_locks(query, of=TaskInstance, session=session, skip_locked=True))
+        resumed = []
+        for ti_id, next_kwargs_raw, fire_at in rows:
+            payload = timezone.coerce_datetime(fire_at)
+            try:
+                serialized_next_kwargs = _next_kwargs_with_event(next_kwargs_raw, payload)
+            except _UnresumableNextKwargs:
+                # Leave it to the regular path, which fails the task instance with the reason.
+                if (task_instance := session.get(TaskInstance, ti_id)) is not None:
+                    handle_event_submit(TriggerEvent(payload), task_instance=task_instance, session=session)
+                continue
+            resumed.append(
+                {
+                    "id": ti_id,
+                    "next_kwargs": serialized_next_kwargs,
+                    "trigger_id": None,
+                    "state": TaskInstanceState.SCHEDULED,
+                    "state_changed_at": now,
+                    "scheduled_dttm": now,
+                }
             )
-        if trigger.callback:
-            trigger.callback.handle_event(event, session)
+        if resumed:
+            session.execute(
+                update(TaskInstance).where(TaskInstance.state == TaskInstanceState.DEFERRED),
+                resumed,
+                execution_options={"synchronize_session": None},
+            )
+            # SQLAlchemy cannot synchronize the session for a bulk UPDATE by primary key with extra
+            # WHERE criteria, so expire the task instances the session has loaded instead; they read
+            # the resumed state on next access rather than keep the deferred one.
+            for params in resumed:
+                key = session.identity_key(TaskInstance, (params["id"],))
+                if (task_instance := session.identity_map.get(key)) is not None:
+                    session.expire(task_instance)
+        return len(resumed)
 
     @classmethod
     @provide_session
@@ -378,6 +487,8 @@ class Trigger(Base):
         queues: set[str] | None = None,
         team_name: str | None = None,
         *,
+        load_budget: float | None = None,
+        trigger_cost: Callable[[str], float] | None = None,
         session: Session = NEW_SESSION,
     ) -> None:
         """
@@ -386,6 +497,11 @@ class Trigger(Base):
         Takes a triggerer_id, the capacity for that triggerer, the Triggerer job heartrate
         health check threshold, and the queues and assigns unassigned triggers until that
         capacity is reached, or there are no more unassigned triggers.
+
+        When ``load_budget`` is given, triggers are also only assigned while their summed cost,
+        as estimated from their classpath by ``trigger_cost``, fits in it. The first trigger is
+        assigned regardless of its cost, so a trigger costlier than any budget still runs
+        somewhere.
         """
         from airflow.jobs.job import Job  # To avoid circular import
 
@@ -399,6 +515,12 @@ class Trigger(Base):
                 count,
             )
             return
+        if load_budget is not None and load_budget <= 0:
+            log.info(
+                "Triggerer %s has no load budget left. Not assigning any more triggers",
+                triggerer_id,
+            )
+            return
 
         alive_triggerer_ids = select(Job.id).where(
             Job.end_date.is_(None),
@@ -415,16 +537,51 @@ class Trigger(Base):
             team_name=team_name,
             session=session,
         )
-        if trigger_ids_query:
+        trigger_ids = [i[0] for i in trigger_ids_query]
+        if trigger_ids and load_budget is not None and trigger_cost is not None:
+            trigger_ids = cls._fit_load_budget(trigger_ids, load_budget, trigger_cost, session=session)
+        if trigger_ids:
             session.execute(
                 update(cls)
-                .where(cls.id.in_([i[0] for i in trigger_ids_query]))
+                .where(cls.id.in_(trigger_ids))
                 .values(triggerer_id=triggerer_id)
                 .execution_options(synchronize_session=False)
             )
 
         session.commit()
 
+    @classmethod
+    def _fit_load_budget(
+        cls,
+        trigger_ids: list[int],
+        load_budget: float,
+        trigger_cost: Callable[[str], float],
+        *,
+        session: Session,
+    ) -> list[int]:
+        """Return the leading triggers of ``trigger_ids`` whose summed cost fits in ``load_budget``."""
+        classpaths = dict(session.execute(select(cls.id, cls.classpath).where(cls.id.in_(trigger_ids))).all())
+        fitting: list[int] = []
+        for trigger_id in trigger_ids:
+            load_budget -= trigger_cost(classpaths.get(trigger_id, ""))
+            if fitting and load_budget < 0:
+                break
+            fitting.append(trigger_id)
+        return fitting
+
+    @classmethod
+    @provide_session
+    def release(
+        cls, trigger_ids: Iterable[int], triggerer_id: int, *, session: Session = NEW_SESSION
+    ) -> None:
+        """Unassign triggers from a triggerer, so that other triggerers can pick them up."""
+        session.execute(
+            update(cls)
+            .where(cls.id.in_(trigger_ids), cls.triggerer_id == triggerer_id)
+            .values(triggerer_id=None)
+            .execution_options(synchronize_session=False)
+        )
+
     @classmethod
     def get_sorted_triggers(
         cls,
@@ -447,6 +604,16 @@ class Trigger(Base):
 
         result: list[Row[Any]] = []
 
+        ti_triggers = (
+            select(cls.id)
+            .prefix_with("STRAIGHT_JOIN", dialect="mysql")
+            .join(TaskInstance, cls.id == TaskInstance.trigger_id, isouter=False)
+            .where(or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids)))
+            .order_by(coalesce(TaskInstance.priority_weight, 0).desc(), cls.created_date)
+        )
+        if cls.scheduler_resumes_time_deferrals():
+            ti_triggers = ti_triggers.where(cls.fire_at.is_(None))
+
         # Add triggers associated to callbacks first, then tasks, then assets
         # It prioritizes callbacks, then DAGs over event driven scheduling which is fair
         queries = [
@@ -455,11 +622,7 @@ class Trigger(Base):
             .join(Callback, isouter=False)
             .order_by(Callback.priority_weight.desc(), cls.created_date),
             # Task Instance triggers
-            select(cls.id)
-            .prefix_with("STRAIGHT_JOIN", dialect="mysql")
-            .join(TaskInstance, cls.id == TaskInstance.trigger_id, isouter=False)
-            .where(or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids)))
-            .order_by(coalesce(TaskInstance.priority_weight, 0).desc(), cls.created_date),
+            ti_triggers,
             # Asset triggers
             select(cls.id)
             .where(
@@ -529,6 +692,42 @@ def _decode_next_kwargs(next_kwargs_raw: Any) -> dict[str, Any]:
     return next_kwargs
 
 
+class _UnresumableNextKwargs(Exception):
+    """The event payload could not be added to the stored ``next_kwargs`` of a task instance."""
+
+
+def _next_kwargs_with_event(next_kwargs_raw: Any, payload: Any) -> Any:
+    """
+    Add ``payload`` as the event to stored ``next_kwargs`` and return them serialized for storage.
+
+    The event is added to the decoded plain dict and everything is serialized together, so nested
+    non-primitive values get proper serde encoding. The Execution API version converter
+    (ModifyDeferredTaskKwargsToJsonValue) converts this to BaseSerialization format when serving
+    old workers.
+
+    :raise _UnresumableNextKwargs: The stored kwargs could not be decoded, or the result could not
+        be serialized. The message says which, and the cause is the original error.
+    """
+    from airflow.sdk.serde import serialize
+
+    # Decoding and re-encoding fail for different reasons and are reported separately: blaming the
+    # stored kwargs for a payload the trigger just yielded would point the author at DB state that
+    # was never the problem.
+    try:
+        next_kwargs = _decode_next_kwargs(next_kwargs_raw or {})
+    except Exception as exc:
+        raise _UnresumableNextKwargs(
+            f"its stored next_kwargs could not be decoded ({type(exc).__name__}: {exc})"
+        ) from exc
+    next_kwargs["event"] = payload
+    try:
+        return serialize(next_kwargs)
+    except Exception as exc:
+        raise _UnresumableNextKwargs(
+            f"the event payload could not be serialized ({type(exc).__name__}: {exc})"
+        ) from exc
+
+
 def _fail_unresumable_task_instance(
     task_instance: TaskInstance, reason: str, exc: BaseException, *, session: Session
 ) -> None:
@@ -573,48 +772,13 @@ def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, ses
     :param task_instance: The task instance to handle the submit event for.
     :param session: The session to be used for the database callback sink.
     """
-    from airflow.sdk.serde import serialize
-
-    next_kwargs_raw = task_instance.next_kwargs or {}
-
-    # Decoding and re-encoding fail for different reasons and are reported separately: blaming the
-    # stored kwargs for a payload the trigger just yielded would point the author at DB state that
-    # was never the problem.
     try:
-        next_kwargs = _decode_next_kwargs(next_kwargs_raw)
-    except Exception as exc:
-        log.exception(
-            "Could not decode the stored next_kwargs of %s; failing it instead of resuming it",
-            task_instance,
-        )
+        serialized_next_kwargs = _next_kwargs_with_event(task_instance.next_kwargs, event.payload)
+    except _UnresumableNextKwargs as exc:
+        log.exception("Could not resume %s; failing it instead", task_instance)
+        cause = exc.__cause__ or exc
         _fail_unresumable_task_instance(
-            task_instance,
-            "Could not resume the task: its stored next_kwargs could not be decoded "
-            f"({type(exc).__name__}: {exc})",
-            exc,
-            session=session,
-        )
-        return
-
-    # Add event to the plain dict, then serialize everything together so nested
-    # non-primitive values get proper serde encoding.
-    next_kwargs["event"] = event.payload
-    try:
-        # Re-serialize using serde. The Execution API version converter
-        # (ModifyDeferredTaskKwargsToJsonValue) handles converting this to
-        # BaseSerialization format when serving old workers.
-        serialized_next_kwargs = serialize(next_kwargs)
-    except Exception as exc:
-        log.exception(
-            "Could not serialize the event payload for %s; failing it instead of resuming it",
-            task_instance,
-        )
-        _fail_unresumable_task_instance(
-            task_instance,
-            f"Could not resume the task: the event payload could not be serialized "
-            f"({type(exc).__name__}: {exc})",
-            exc,
-            session=session,
+            task_instance, f"Could not resume the task: {exc}", cause, session=session
         )
         return
 
@@ -0,0 +1,206 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Per-phase profiling of the main loop of a job."""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from airflow._shared.observability.metrics import stats
+from airflow._shared.timezones import timezone
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@dataclass
+class PhaseTiming:
+    """
+    Wall time and database activity of one phase of a loop.
+
+    :param name: Name of the phase, nested phases are prefixed with the name of their parent.
+    :param duration: Wall time of the phase in seconds.
+    :param queries: Number of statements executed on the database during the phase.
+    :param rows: Number of rows reported by the database cursor for those statements.
+    """
+
+    name: str
+    duration: float = 0.0
+    queries: int = 0
+    rows: int = 0
+
+
+@dataclass
+class LoopTrace:
+    """Timings of all the phases of one loop iteration."""
+
+    loop_number: int
+    started_at: datetime
+    duration: float = 0.0
+    phases: list[PhaseTiming] = field(default_factory=list)
+
+    def format(self) -> str:
+        lines = [
+            f"Loop {self.loop_number} started at {self.started_at.isoformat()} "
+            f"took {self.duration * 1000:.2f} ms"
+        ]
+        lines.extend(
+            f"\t{phase.name:<40} {phase.duration * 1000:>10.2f} ms "
+            f"{phase.queries:>6} queries {phase.rows:>8} rows"
+            for phase in self.phases
+        )
+        return "\n".join(lines)
+
+
+class LoopProfiler(LoggingMixin):
+    """
+    Record the wall time, query count and rows touched of each phase of a loop.
+
+    Phases are delimited with :meth:`phase` inside :meth:`loop`. Database statements are counted
+    with a SQLAlchemy ``after_cursor_execute`` hook, only for the thread running the loop, and are
+    attributed to every phase open when they run. The traces of the last ``history_size`` loops are
+    kept in memory for :meth:`dump`, and each phase is emitted as the
+    ``<metric_prefix>.loop_phase_duration``, ``<metric_prefix>.loop_phase_queries`` and
+    ``<metric_prefix>.loop_phase_rows`` metrics, tagged with the phase name.
+
+    :param metric_prefix: Prefix of the emitted metrics, e.g. ``scheduler``.
+    :param history_size: Number of loop traces to keep.
+    """
+
+    def __init__(self, metric_prefix: str, history_size: int) -> None:
+        super().__init__()
+        self.metric_prefix = metric_prefix
+        self.traces: deque[LoopTrace] = deque(maxlen=history_size)
+        self._current: LoopTrace | None = None
+        self._open_phases: list[PhaseTiming] = []
+        self._thread_id: int | None = None
+        self._installed = False
+
+    def install(self) -> None:
+        """Start counting database statements."""
+        if not self._installed:
+            event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+            self._installed = True
+
+    def uninstall(self) -> None:
+        """Stop counting database statements."""
+        if self._installed:
+            event.remove(Engine, "after_cursor_execute", self._after_cursor_execute)
+            self._installed = False
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not self._open_phases or threading.get_ident() != self._thread_id:
+            return
+        rows = max(getattr(cursor, "rowcount", 0) or 0, 0)
+        for phase in self._open_phases:
+            phase.queries += 1
+            phase.rows += rows
+
+    @contextmanager
+    def loop(self, loop_number: int) -> Generator[LoopTrace, None, None]:
+        """Profile one iteration of the loop."""
+        trace = LoopTrace(loop_number=loop_number, started_at=timezone.utcnow())
+        self._current = trace
+        self._thread_id = threading.get_ident()
+        start = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            trace.duration = time.perf_counter() - start
+            self._current = None
+            self._open_phases.clear()
+            self.traces.append(trace)
+            self._emit_metrics(trace)
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Profile one phase of the current loop; a no-op outside of :meth:`loop`."""
+        if self._current is None:
+            yield
+            return
+        if self._open_phases:
+            name = f"{self._open_phases[-1].name}.{name}"
+        timing = PhaseTiming(name=name)
+        self._current.phases.append(timing)
+        self._open_phases.append(timing)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing.duration = time.perf_counter() - start
+            if timing in self._open_phases:
+                self._open_phases.remove(timing)
+
+    def _emit_metrics(self, trace: LoopTrace) -> None:
+        for phase in trace.phases:
+            tags = {"phase": phase.name}
+            stats.timing(
+                f"{self.metric_prefix}.loop_phase_duration", timedelta(seconds=phase.duration), tags=tags
+            )
+            stats.gauge(f"{self.metric_prefix}.loop_phase_queries", phase.queries, tags=tags)
+            stats.gauge(f"{self.metric_prefix}.loop_phase_rows", phase.rows, tags=tags)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Summarize the duration of each phase over the kept traces, in milliseconds."""
+        durations: dict[str, list[float]] = {}
+        for trace in self.traces:
+            for phase in trace.phases:
+                durations.setdefault(phase.name, []).append(phase.duration * 1000)
+        return {
+            name: {
+                "count": len(values),
+                "mean": statistics.fmean(values),
+                "p50": statistics.median(values),
+                "p95": _percentile(values, 95),
+                "max": max(values),
+            }
+            for name, values in durations.items()
+        }
+
+    def dump(self) -> None:
+        """Log the kept loop traces and a summary of their phase durations."""
+        self.log.info("Last %d loop traces:", len(self.traces))
+        for trace in self.traces:
+            self.log.info("%s", trace.format())
+        for name, summary in self.summary().items():
+            self.log.info(
+                "Phase %s over %d loops: mean %.2f ms, p50 %.2f ms, p95 %.2f ms, max %.2f ms",
+                name,
+                summary["count"],
+                summary["mean"],
+                summary["p50"],
+                summary["p95"],
+                summary["max"],
+            )
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
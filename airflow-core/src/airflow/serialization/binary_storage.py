@@ -0,0 +1,140 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Binary storage format of serialized DAGs, decodable lazily per task.
+
+A blob in this format is laid out as::
+
+    MAGIC | header length (uint32, big endian) | header | task 0 | task 1 | ...
+
+The header is zlib-compressed msgpack holding the top-level fields of the serialized DAG, the
+DAG-level fields of ``data["dag"]`` (everything but the tasks), and the ID, offset and length of
+each task. Each task is zlib-compressed msgpack on its own, so the DAG-level fields and individual
+tasks can be decoded without decoding the whole DAG.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from functools import cached_property
+from typing import Any
+
+import msgspec
+
+MAGIC = b"AFSD\x01"
+_HEADER_LENGTH = struct.Struct(">I")
+_HEADER_START = len(MAGIC) + _HEADER_LENGTH.size
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+
+def is_binary_serialized_dag(blob: bytes | None) -> bool:
+    """Whether ``blob`` is in the binary format, as opposed to zlib-compressed JSON."""
+    return blob is not None and bytes(blob[: len(MAGIC)]) == MAGIC
+
+
+def encode_serialized_dag(data: dict[str, Any]) -> bytes:
+    """
+    Encode a serialized DAG to the binary format.
+
+    :param data: The serialized DAG, as returned by ``DagSerialization.to_dict``.
+    :raises OverflowError: if the DAG holds an integer msgpack cannot represent.
+    """
+    dag = data["dag"]
+    tasks = dag.get("tasks")
+    if not isinstance(tasks, list):
+        # Nothing to decode lazily, keep the tasks with the DAG-level fields.
+        tasks = None
+    task_ids: list[str | None] = []
+    task_offsets: list[tuple[int, int]] = []
+    task_blobs: list[bytes] = []
+    offset = 0
+    for task in tasks or ():
+        task_blob = zlib.compress(_encoder.encode(task))
+        task_var = task.get("__var") if isinstance(task, dict) else None
+        task_ids.append(task_var.get("task_id") if isinstance(task_var, dict) else None)
+        task_offsets.append((offset, len(task_blob)))
+        task_blobs.append(task_blob)
+        offset += len(task_blob)
+
+    header = zlib.compress(
+        _encoder.encode(
+            {
+                "fields": {key: value for key, value in data.items() if key != "dag"},
+                "dag": {key: value for key, value in dag.items() if tasks is None or key != "tasks"},
+                "task_ids": task_ids if tasks is not None else None,
+                "task_offsets": task_offsets,
+            }
+        )
+    )
+    return b"".join((MAGIC, _HEADER_LENGTH.pack(len(header)), header, *task_blobs))
+
+
+class BinarySerializedDag:
+    """
+    A serialized DAG stored in the binary format, decoded on access.
+
+    Only the header is decoded on creation; tasks are decoded one at a time when requested.
+
+    :param blob: The encoded DAG, as returned by :func:`encode_serialized_dag`.
+    """
+
+    def __init__(self, blob: bytes) -> None:
+        if not is_binary_serialized_dag(blob):
+            raise ValueError("Not a serialized DAG in the binary format")
+        self._blob = memoryview(blob)
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._blob, len(MAGIC))
+        self._body_start = _HEADER_START + header_length
+        header = _decoder.decode(zlib.decompress(self._blob[_HEADER_START : self._body_start]))
+        self.fields: dict[str, Any] = header["fields"]
+        """Top-level fields of the serialized DAG, other than ``dag``."""
+        self.dag_fields: dict[str, Any] = header["dag"]
+        """DAG-level fields of the serialized DAG, i.e. ``data["dag"]`` without the tasks."""
+        self._task_ids: list[str | None] | None = header["task_ids"]
+        self._task_offsets: list[list[int]] = header["task_offsets"]
+
+    @property
+    def task_ids(self) -> list[str]:
+        """IDs of the tasks of the DAG, in their serialized order."""
+        return [task_id for task_id in self._task_ids or () if task_id is not None]
+
+    @cached_property
+    def _task_positions(self) -> dict[str, int]:
+        return {task_id: pos for pos, task_id in enumerate(self._task_ids or ()) if task_id is not None}
+
+    def _decode_task(self, pos: int) -> dict[str, Any]:
+        offset, length = self._task_offsets[pos]
+        start = self._body_start + offset
+        return _decoder.decode(zlib.decompress(self._blob[start : start + length]))
+
+    def get_task(self, task_id: str) -> dict[str, Any]:
+        """
+        Decode the serialized form of one task.
+
+        :raises KeyError: if the DAG has no task with this ID.
+        """
+        return self._decode_task(self._task_positions[task_id])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decode the whole serialized DAG."""
+        dag = dict(self.dag_fields)
+        if self._task_ids is not None:
+            dag["tasks"] = [self._decode_task(pos) for pos in range(len(self._task_offsets))]
+        return {**self.fields, "dag": dag}
@@ -0,0 +1,102 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+import attrs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from airflow.serialization.serialized_objects import SerializedOperator
+
+__all__ = ["TaskAdjacencyIndex"]
+
+
+@attrs.define(frozen=True, slots=True)
+class TaskAdjacencyIndex:
+    """
+    Compact, integer-indexed view of the upstream edges of a serialized DAG.
+
+    Tasks are numbered by their position in ``task_ids``, and the direct upstreams of
+    the task at position ``i`` are ``upstream_positions[upstream_offsets[i]:upstream_offsets[i + 1]]``
+    (the usual compressed sparse row layout). Alongside the edges, the flags the trigger
+    rule dependency needs for every task are precomputed, so evaluating a task instance
+    no longer walks operator objects and task group parents for each of its upstreams.
+
+    The index is immutable and only describes the structure of the DAG. It is built
+    once per :class:`~airflow.serialization.definitions.dag.SerializedDAG` object.
+
+    :meta private:
+    """
+
+    task_ids: tuple[str, ...]
+    positions: Mapping[str, int]
+    upstream_offsets: array
+    upstream_positions: array
+    setup_flags: array
+    in_mapped_task_group: array
+    needs_expansion: array
+    upstreams_need_expansion: array
+    upstream_setup_counts: array
+
+    @classmethod
+    def build(cls, tasks: Iterable[SerializedOperator]) -> TaskAdjacencyIndex:
+        """Build the index from the tasks of a DAG."""
+        tasks = list(tasks)
+        task_ids = tuple(t.task_id for t in tasks)
+        positions = {task_id: i for i, task_id in enumerate(task_ids)}
+        setup_flags = array("b", (bool(t.is_setup) for t in tasks))
+        needs_expansion = array("b", (t.get_needs_expansion() for t in tasks))
+
+        upstream_offsets = array("l", [0])
+        upstream_positions = array("l")
+        upstreams_need_expansion = array("b")
+        upstream_setup_counts = array("l")
+        for task in tasks:
+            upstreams = sorted(positions[u] for u in task.upstream_task_ids if u in positions)
+            upstream_positions.extend(upstreams)
+            upstream_offsets.append(len(upstream_positions))
+            upstreams_need_expansion.append(any(needs_expansion[u] for u in upstreams))
+            upstream_setup_counts.append(sum(setup_flags[u] for u in upstreams))
+
+        return cls(
+            task_ids=task_ids,
+            positions=positions,
+            upstream_offsets=upstream_offsets,
+            upstream_positions=upstream_positions,
+            setup_flags=setup_flags,
+            in_mapped_task_group=array("b", (t.get_closest_mapped_task_group() is not None for t in tasks)),
+            needs_expansion=needs_expansion,
+            upstreams_need_expansion=upstreams_need_expansion,
+            upstream_setup_counts=upstream_setup_counts,
+        )
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    def upstreams_of(self, position: int) -> array:
+        """Return the positions of the direct upstreams of the task at ``position``."""
+        return self.upstream_positions[self.upstream_offsets[position] : self.upstream_offsets[position + 1]]
+
+    def upstream_count(self, position: int) -> int:
+        """Return the number of direct upstreams of the task at ``position``."""
+        return self.upstream_offsets[position + 1] - self.upstream_offsets[position]
@@ -73,6 +73,7 @@ if TYPE_CHECKING:
 
     from airflow.models.taskinstance import TaskInstance
     from airflow.sdk import DAG
+    from airflow.serialization.definitions.adjacency import TaskAdjacencyIndex
     from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
     from airflow.serialization.serialized_objects import LazyDeserializedDAG, SerializedOperator
     from airflow.timetables.base import Timetable
@@ -297,6 +298,8 @@ class SerializedDAG:
         # the tasks anyway, so we copy the tasks manually later
         memo = {id(self.task_dict): None, id(self.task_group): None}
         dag = copy.deepcopy(self, memo)
+        # The adjacency index describes the full task graph; let the subset build its own.
+        dag.__dict__.pop("adjacency_index", None)
 
         if isinstance(task_ids, str):
             matched_tasks = [t for t in self.tasks if task_ids in t.task_id]
@@ -395,6 +398,19 @@ class SerializedDAG:
 
         return dag
 
+    @functools.cached_property
+    def adjacency_index(self) -> TaskAdjacencyIndex:
+        """
+        Integer-indexed upstream graph of this DAG, used by the trigger rule dependency.
+
+        Built lazily, once per deserialized DAG object.
+
+        :meta private:
+        """
+        from airflow.serialization.definitions.adjacency import TaskAdjacencyIndex
+
+        return TaskAdjacencyIndex.build(self.task_dict.values())
+
     @functools.cached_property
     def _time_restriction(self) -> TimeRestriction:
         start_dates = [t.start_date for t in self.tasks if t.start_date]
@@ -0,0 +1,147 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Serialized DAG data shared by the worker processes of the API server on a host."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from airflow._shared.observability.metrics import stats
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+_SUFFIX = ".msgpack"
+
+
+def _check_private_dir(path: Path) -> None:
+    """Raise unless ``path`` is a directory, not a symlink, that only the current user can access."""
+    st = path.lstat()
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f"{path} is not a directory")
+    if st.st_uid != os.geteuid():
+        raise PermissionError(f"{path} is not owned by the current user")
+    if st.st_mode & 0o077:
+        raise PermissionError(
+            f"{path} can be accessed by other users, its mode is {stat.filemode(st.st_mode)}"
+        )
+
+
+class SharedSerializedDagCache(LoggingMixin):
+    """
+    Host-wide store of serialized DAG data, keyed by DAG version and ``dag_hash``.
+
+    Each API server worker keeps its own cache of deserialized DAGs, so without this every worker
+    fetches and decodes the same serialized DAGs from the database. With it, the first worker to
+    load a DAG version writes its serialized data to ``path`` as msgpack, and other workers on the
+    host read it from there (memory-mapped) instead of querying the database for it. Putting
+    ``path`` on a tmpfs such as ``/dev/shm`` keeps the store in memory.
+
+    Entries are files named ``<version id>-<dag_hash>.msgpack``; a version updated in place gets a
+    new ``dag_hash``, so a stale entry is never read. Files are written atomically, and the oldest
+    ones are removed once the store grows past ``max_size`` bytes.
+
+    Entries are deserialized into DAGs, so the directory must only be writable by the user running
+    the API server: it is created private, and an existing directory owned by another user or open
+    to other users is refused.
+
+    :param path: Directory of the store, created if missing.
+    :param max_size: Maximum total size of the entries in bytes.
+    :raises PermissionError: if the directory is not private to the current user.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_size: int) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.max_size = max_size
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_private_dir(self.path)
+
+    def _entry_path(self, version_id: UUID | str, dag_hash: str) -> Path:
+        return self.path / f"{version_id}-{dag_hash}{_SUFFIX}"
+
+    def get(self, version_id: UUID | str, dag_hash: str) -> dict[str, Any] | None:
+        """Return the serialized data of the DAG version with this ``dag_hash``, if stored."""
+        try:
+            with (
+                open(self._entry_path(version_id, dag_hash), "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+            ):
+                data = _decoder.decode(buffer)
+        except (OSError, ValueError, msgspec.DecodeError):
+            # Missing (or empty, which mmap rejects) entries, and entries removed while being read.
+            stats.incr("api_server.dag_bag.shared_cache_miss")
+            return None
+        stats.incr("api_server.dag_bag.shared_cache_hit")
+        return data
+
+    def put(self, version_id: UUID | str, dag_hash: str, data: dict[str, Any]) -> None:
+        """Store the serialized data of a DAG version, replacing entries of its previous hashes."""
+        entry_path = self._entry_path(version_id, dag_hash)
+        if entry_path.exists():
+            return
+        try:
+            encoded = _encoder.encode(data)
+        except OverflowError:
+            self.log.debug("DAG version %s can't be encoded as msgpack, not sharing it", version_id)
+            return
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            self.log.warning("Failed to write DAG version %s to %s", version_id, self.path, exc_info=True)
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            return
+        for stale in self.path.glob(f"{version_id}-*{_SUFFIX}"):
+            if stale != entry_path:
+                stale.unlink(missing_ok=True)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if not entry.name.endswith(_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            Path(path).unlink(missing_ok=True)
+            total_size -= size
@@ -0,0 +1,100 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Structural hashing of serialized DAGs, per task and per top-level section."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import attrs
+import msgspec
+
+from airflow.utils.hashlib_wrapper import md5
+
+# Keys of the serialized DAG that do not affect its hash, see SerializedDagModel.hash.
+_IGNORED_DAG_KEYS = frozenset({"fileloc", "bundle_name", "tasks"})
+
+
+_encoder = msgspec.json.Encoder()
+
+
+def _digest(value: Any) -> str:
+    # Keys are encoded in their order in the serialized DAG, without sorting them.
+    return md5(_encoder.encode(value)).hexdigest()
+
+
+@attrs.frozen
+class DagStructureHash:
+    """
+    Merkle-style hash of a serialized DAG.
+
+    Each task and each top-level section of the serialized DAG is hashed on its own, and the root
+    hash is computed from those hashes. Two DAGs with the same root hash have the same serialized
+    content (ignoring the keys excluded from ``SerializedDagModel.hash``), and comparing the task
+    and section hashes tells which parts of a DAG changed.
+
+    Unlike ``SerializedDagModel.hash`` this does not sort the keys of the serialized DAG, and
+    encodes each part with msgspec instead of ``json.dumps``. It relies on the serialized DAG
+    being deterministic, which holds for the output of ``DagSerialization.to_dict``; the same
+    content encoded in another key order only results in a different root hash, never in a false
+    match.
+
+    :param root: Hash of the whole DAG.
+    :param sections: Hash of each top-level section, keyed by its path, e.g. ``dag.timetable``.
+    :param tasks: Hash of each task, keyed by task ID.
+    """
+
+    root: str
+    sections: dict[str, str]
+    tasks: dict[str, str]
+
+    @classmethod
+    def from_data(cls, dag_data: dict[str, Any]) -> DagStructureHash:
+        """Hash the tasks and sections of a serialized DAG."""
+        sections = {key: _digest(value) for key, value in dag_data.items() if key != "dag"}
+        dag = dag_data.get("dag", {})
+        sections.update(
+            (f"dag.{key}", _digest(value)) for key, value in dag.items() if key not in _IGNORED_DAG_KEYS
+        )
+        tasks = {}
+        encoded_tasks = dag.get("tasks", [])
+        if isinstance(encoded_tasks, list):
+            for index, task in enumerate(encoded_tasks):
+                task_var = task.get("__var") if isinstance(task, dict) else None
+                task_id = task_var.get("task_id") if isinstance(task_var, dict) else None
+                tasks[task_id if task_id is not None else f"<task {index}>"] = _digest(task)
+        else:
+            sections["dag.tasks"] = _digest(encoded_tasks)
+
+        root = md5()
+        for prefix, hashes in (("section", sections), ("task", tasks)):
+            for key, value in sorted(hashes.items()):
+                root.update(f"{prefix}:{key}={value};".encode())
+        return cls(root=root.hexdigest(), sections=sections, tasks=tasks)
+
+    def changed_sections(self, other: DagStructureHash) -> set[str]:
+        """Return the sections added, removed or modified compared to ``other``."""
+        return _changed_keys(self.sections, other.sections)
+
+    def changed_tasks(self, other: DagStructureHash) -> set[str]:
+        """Return the IDs of the tasks added, removed or modified compared to ``other``."""
+        return _changed_keys(self.tasks, other.tasks)
+
+
+def _changed_keys(current: dict[str, str], previous: dict[str, str]) -> set[str]:
+    return {key for key in current.keys() | previous.keys() if current.get(key) != previous.get(key)}
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import contextlib
+from collections import Counter, defaultdict
 from typing import TYPE_CHECKING
 
 import attr
@@ -107,6 +108,19 @@ class DepContext:
     fresh empty dict, so they would neither read the memo nor warm it for anything else.
     """
 
+    finished_ti_state_counts: dict[tuple[str, str], tuple[int, dict[str, Counter[str]]]] = attr.ib(
+        factory=dict, repr=False
+    )
+    """
+    Per-pass memo of the states of ``finished_tis``, grouped by task_id and keyed by ``(dag_id, run_id)``.
+
+    The trigger rule dependency sums these per-task counters over the direct upstreams of a task
+    instead of scanning every finished task instance of the run for each task instance it
+    evaluates. The number of finished task instances the counters were built from is stored next
+    to them, so they are rebuilt if ``finished_tis`` grows. Like ``upstream_task_id_counts`` this is
+    an ``init=True`` field so ``attrs.evolve`` carries it over.
+    """
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -126,6 +140,24 @@ class DepContext:
             finished_tis = self.finished_tis
         return finished_tis
 
+    def ensure_finished_ti_state_counts(self, dag_run: DagRun, session: Session) -> dict[str, Counter[str]]:
+        """
+        Count the states of the finished task instances of ``dag_run``, per task_id.
+
+        :param dag_run: The DagRun for which to count finished tasks
+        :return: A mapping of task_id to a counter of the states of its finished task instances
+        """
+        finished_tis = self.ensure_finished_tis(dag_run, session)
+        key = (dag_run.dag_id, dag_run.run_id)
+        cached = self.finished_ti_state_counts.get(key)
+        if cached is not None and cached[0] == len(finished_tis):
+            return cached[1]
+        counts: dict[str, Counter[str]] = defaultdict(Counter)
+        for ti in finished_tis:
+            counts[ti.task_id][ti.state] += 1
+        self.finished_ti_state_counts[key] = (len(finished_tis), dict(counts))
+        return self.finished_ti_state_counts[key][1]
+
     def invalidate_upstream_task_id_counts(self) -> None:
         """
         Drop the memoized trigger-rule upstream counts.
@@ -20,7 +20,7 @@ from __future__ import annotations
 import collections.abc
 import functools
 from collections import Counter
-from collections.abc import Iterator, KeysView, Mapping
+from collections.abc import Iterable, Iterator, KeysView, Mapping
 from typing import TYPE_CHECKING, NamedTuple
 
 from sqlalchemy import and_, func, or_, select
@@ -35,6 +35,7 @@ if TYPE_CHECKING:
     from sqlalchemy.sql import ColumnElement
 
     from airflow.models.taskinstance import TaskInstance
+    from airflow.serialization.definitions.adjacency import TaskAdjacencyIndex
     from airflow.serialization.definitions.mappedoperator import Operator
     from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
     from airflow.ti_deps.dep_context import DepContext
@@ -77,6 +78,33 @@ class _UpstreamTIStates(NamedTuple):
             counter.update(curr_state)
             if ti.task.is_setup:
                 setup_counter.update(curr_state)
+        return cls._from_counters(counter, setup_counter)
+
+    @classmethod
+    def from_state_counts(
+        cls, state_counts: Mapping[str, Counter[str]], upstreams: Iterable[tuple[str, bool]]
+    ) -> _UpstreamTIStates:
+        """
+        Calculate states for a task instance from finished states already grouped by task_id.
+
+        This gives the same result as :meth:`calculate` when every finished ti of the upstream
+        tasks is relevant, i.e. when the task is not in a mapped task group.
+
+        :param state_counts: states of the finished tis of the dag_run, per task_id
+        :param upstreams: ``(task_id, is_setup)`` of each relevant upstream task
+        """
+        counter: Counter[str] = Counter()
+        setup_counter: Counter[str] = Counter()
+        for task_id, is_setup in upstreams:
+            if (task_counter := state_counts.get(task_id)) is None:
+                continue
+            counter.update(task_counter)
+            if is_setup:
+                setup_counter.update(task_counter)
+        return cls._from_counters(counter, setup_counter)
+
+    @classmethod
+    def _from_counters(cls, counter: Counter[str], setup_counter: Counter[str]) -> _UpstreamTIStates:
         return _UpstreamTIStates(
             success=counter.get(TaskInstanceState.SUCCESS, 0),
             skipped=counter.get(TaskInstanceState.SKIPPED, 0),
@@ -281,12 +309,20 @@ class TriggerRuleDep(BaseTIDep):
                 return
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            if task.get_closest_mapped_task_group() is None:
+                upstream_states = _UpstreamTIStates.from_state_counts(
+                    dep_context.ensure_finished_ti_state_counts(
+                        ti.get_dagrun(session=session), session=session
+                    ),
+                    ((k, v.is_setup) for k, v in indirect_setups.items()),
+                )
+            else:
+                finished_upstream_tis = (
+                    x
+                    for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
+                    if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
+                )
+                upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -364,14 +400,28 @@ class TriggerRuleDep(BaseTIDep):
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(
-                    ti.get_dagrun(session=session), session=session
+            # Fast path: outside a mapped task group every finished ti of a direct upstream is
+            # relevant, so the DAG's adjacency index and the per-task state counts memoized on the
+            # DepContext replace the scan over all finished tis of the run for every ti.
+            index: TaskAdjacencyIndex | None = getattr(task.dag, "adjacency_index", None)
+            position = -1 if index is None else index.positions.get(task.task_id, -1)
+            if index is not None and position >= 0 and not index.in_mapped_task_group[position]:
+                upstream_states = _UpstreamTIStates.from_state_counts(
+                    dep_context.ensure_finished_ti_state_counts(
+                        ti.get_dagrun(session=session), session=session
+                    ),
+                    ((index.task_ids[u], bool(index.setup_flags[u])) for u in index.upstreams_of(position)),
                 )
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            else:
+                index = None
+                finished_upstream_tis = (
+                    finished_ti
+                    for finished_ti in dep_context.ensure_finished_tis(
+                        ti.get_dagrun(session=session), session=session
+                    )
+                    if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
+                )
+                upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -384,7 +434,10 @@ class TriggerRuleDep(BaseTIDep):
 
             # Optimization: Don't need to hit the database if all upstreams are
             # "simple" tasks (no task or task group mapping involved).
-            if not any(t.get_needs_expansion() for t in upstream_tasks.values()):
+            if index is not None and not index.upstreams_need_expansion[position]:
+                upstream = index.upstream_count(position)
+                upstream_setup = index.upstream_setup_counts[position]
+            elif index is None and not any(t.get_needs_expansion() for t in upstream_tasks.values()):
                 upstream = len(upstream_tasks)
                 upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
             else:
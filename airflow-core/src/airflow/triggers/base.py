@@ -20,7 +20,7 @@ import abc
 import json
 from collections.abc import AsyncIterator, Hashable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Annotated, Any
 
 import structlog
@@ -237,6 +237,19 @@ class BaseTrigger(abc.ABC, Templater, LoggingMixin):
         the framework bound.
         """
 
+    def timer_event(self) -> tuple[datetime, TriggerEvent] | None:
+        """
+        Return the moment this trigger fires and the event it fires, if it only waits for a time.
+
+        Triggers that do nothing but wait for a moment can return it here, so the triggerer
+        fires their event from a timer it shares between all such triggers rather than running
+        each of them in its own coroutine. When a value is returned, ``run()``, ``cleanup()``
+        and ``on_kill()`` are not called.
+
+        :return: Tuple of (moment in UTC, event to fire), or None to run the trigger normally.
+        """
+        return None
+
     @staticmethod
     def repr(classpath: str, kwargs: dict[str, Any]):
         kwargs_str = ", ".join(f"{k}={v}" for k, v in kwargs.items())
@@ -0,0 +1,242 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measurement of the load triggers put on the event loop of the triggerer.
+
+The cost of a trigger is the fraction of event loop time it uses: a trigger that keeps the loop
+busy for 50ms every second has a cost of 0.05. The TriggerRunner measures the loop time of each
+trigger with :class:`TimedCoroutine` and reports it to its supervisor, which keeps track of the
+cost and event rate of each trigger in a :class:`TriggerLoadTracker`. The supervisor uses those to
+only take triggers it has room for, and to move triggers to other triggerers when it is
+overloaded.
+
+How late the event loop runs callbacks, its lag, is sampled by the TriggerRunner into a
+:class:`LoopLagHistogram`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections.abc import Coroutine, Generator, Iterable, Mapping
+from typing import Any
+
+import attrs
+
+# Smoothing factor of the cost of each trigger class, see TriggerLoadTracker.class_cost.
+_CLASS_COST_SMOOTHING = 0.2
+
+# Triggers are not measured before they have run for this many seconds, to avoid over-estimating
+# the cost of a trigger from the work it does when it starts.
+_MIN_MEASURED_AGE = 5.0
+
+# Excess cost, in seconds of loop time per second, below which a triggerer counts as within budget.
+# Sums of float costs rarely come back to exactly 0.
+_COST_TOLERANCE = 1e-9
+
+
+class TimedCoroutine(Coroutine):
+    """
+    Wrap a coroutine to measure the time the event loop spends running it.
+
+    Every step of the coroutine (from one ``await`` that suspends it to the next) is timed, so
+    :attr:`loop_time` is the time the coroutine kept the event loop busy, not the time it waited.
+    Coroutines and tasks started by the wrapped coroutine are not included.
+
+    Steps are timed by wall clock rather than CPU time: a trigger blocking the loop on a
+    synchronous call or ``time.sleep`` holds it up just as much as one computing, without using CPU.
+    """
+
+    __slots__ = ("_coro", "loop_time")
+
+    def __init__(self, coro: Coroutine) -> None:
+        self._coro = coro
+        self.loop_time = 0.0
+
+    def send(self, value: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._coro.send(value)
+        finally:
+            self.loop_time += time.perf_counter() - start
+
+    def throw(self, *args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            self.loop_time += time.perf_counter() - start
+
+    def close(self) -> None:
+        self._coro.close()
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self._coro.__await__()
+
+
+@attrs.define
+class _TriggerLoad:
+    classpath: str
+    movable: bool
+    started_at: float
+    loop_time: float = 0.0
+    measured_at: float | None = None
+    events: int = 0
+
+    def cost(self) -> float | None:
+        if self.measured_at is None or self.measured_at - self.started_at < _MIN_MEASURED_AGE:
+            return None
+        return self.loop_time / (self.measured_at - self.started_at)
+
+
+class TriggerLoadTracker:
+    """
+    Keep track of the cost and event rate of the triggers run by one TriggerRunner.
+
+    Besides the triggers currently running, the tracker remembers a smoothed cost per trigger
+    class, used to estimate the cost of triggers before they run.
+    """
+
+    def __init__(self) -> None:
+        self._triggers: dict[int, _TriggerLoad] = {}
+        self._class_costs: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._triggers)
+
+    def add(self, trigger_id: int, classpath: str, *, movable: bool, now: float | None = None) -> None:
+        """
+        Start tracking a trigger.
+
+        :param movable: Whether the trigger can be moved to another triggerer when this one is
+            overloaded. Triggers watching assets are not, as they may share a stream.
+        """
+        self._triggers[trigger_id] = _TriggerLoad(
+            classpath=classpath, movable=movable, started_at=time.monotonic() if now is None else now
+        )
+
+    def remove(self, trigger_id: int) -> None:
+        self._triggers.pop(trigger_id, None)
+
+    def record_loop_time(self, loop_time: Mapping[int, float], now: float | None = None) -> None:
+        """Record the loop time each trigger used since it started, as reported by the TriggerRunner."""
+        now = time.monotonic() if now is None else now
+        for trigger_id, seconds in loop_time.items():
+            if (load := self._triggers.get(trigger_id)) is None:
+                continue
+            load.loop_time = seconds
+            load.measured_at = now
+            if (cost := load.cost()) is not None:
+                previous = self._class_costs.get(load.classpath, cost)
+                self._class_costs[load.classpath] = previous + _CLASS_COST_SMOOTHING * (cost - previous)
+
+    def record_event(self, trigger_id: int) -> None:
+        if (load := self._triggers.get(trigger_id)) is not None:
+            load.events += 1
+
+    def class_cost(self, classpath: str) -> float:
+        """
+        Estimate the cost of a trigger of the given class.
+
+        Classes that have not been measured yet are estimated at the average cost of the classes
+        that have, or at 0 when nothing has been measured.
+        """
+        if (cost := self._class_costs.get(classpath)) is not None:
+            return cost
+        if not self._class_costs:
+            return 0.0
+        return sum(self._class_costs.values()) / len(self._class_costs)
+
+    def cost(self, trigger_id: int) -> float:
+        """Return the measured cost of a trigger, or the estimated cost of its class."""
+        load = self._triggers[trigger_id]
+        if (cost := load.cost()) is not None:
+            return cost
+        return self.class_cost(load.classpath)
+
+    def event_rate(self, trigger_id: int, now: float | None = None) -> float:
+        """Return the number of events per second a trigger fired since it started."""
+        load = self._triggers[trigger_id]
+        age = (time.monotonic() if now is None else now) - load.started_at
+        return load.events / max(age, _MIN_MEASURED_AGE)
+
+    def total_cost(self) -> float:
+        return sum(self.cost(trigger_id) for trigger_id in self._triggers)
+
+    def total_event_rate(self, now: float | None = None) -> float:
+        return sum(self.event_rate(trigger_id, now) for trigger_id in self._triggers)
+
+    def triggers_to_move(self, budget: float, exclude: Iterable[int] = ()) -> list[int]:
+        """
+        Pick the triggers to move elsewhere to bring the total cost down to ``budget``.
+
+        The costliest movable triggers are picked first, so as few triggers as possible move.
+        """
+        excluded = set(exclude)
+        excess = sum(self.cost(trigger_id) for trigger_id in self._triggers if trigger_id not in excluded)
+        excess -= budget
+        if excess <= _COST_TOLERANCE:
+            return []
+        candidates = sorted(
+            (
+                (self.cost(trigger_id), trigger_id)
+                for trigger_id, load in self._triggers.items()
+                if load.movable and trigger_id not in excluded
+            ),
+            reverse=True,
+        )
+        to_move = []
+        for cost, trigger_id in candidates:
+            if excess <= _COST_TOLERANCE or cost <= 0:
+                break
+            to_move.append(trigger_id)
+            excess -= cost
+        return to_move
+
+
+class LoopLagHistogram:
+    """
+    Count how often the event loop lagged by how much.
+
+    The lag is how much later than asked a sleeping coroutine is woken up, i.e. how long callbacks
+    wait for the event loop to be free.
+    """
+
+    # Upper bounds (in seconds) of the buckets; lags above the last bound go to a final bucket.
+    BOUNDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.max = 0.0
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def record(self, lag: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS, lag)] += 1
+        self.max = max(self.max, lag)
+
+    def buckets(self) -> dict[str, int]:
+        """Return the number of samples per bucket, keyed by the bucket bound in milliseconds."""
+        labels = [f"<={bound * 1000:g}ms" for bound in self.BOUNDS]
+        labels.append(f">{self.BOUNDS[-1] * 1000:g}ms")
+        return dict(zip(labels, self.counts))
+
+    def reset(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self.max = 0.0
@@ -1,7 +1,7 @@
 // generated with @7nohe/openapi-react-query-codegen@1.6.2 
 
 import { UseMutationOptions, UseQueryOptions, useMutation, useQuery } from "@tanstack/react-query";
-import { AssetService, AssetStateStoreService, AuthLinksService, BackfillService, CalendarService, ConfigService, ConnectionService, DagParsingService, DagRunService, DagService, DagSourceService, DagStatsService, DagVersionService, DagWarningService, DashboardService, DeadlinesService, DependenciesService, EventLogService, ExperimentalService, ExtraLinksService, GanttService, GridService, ImportErrorService, JobService, LoginService, MonitorService, PartitionedDagRunService, PluginService, PoolService, ProviderService, StructureService, TaskInstanceService, TaskService, TaskStateStoreService, TeamsService, VariableService, VersionService, XcomService } from "../requests/services.gen";
+import { AssetService, AssetStateStoreService, AuthLinksService, BackfillService, CalendarService, ChangesService, ConfigService, ConnectionService, DagParsingService, DagRunService, DagService, DagSourceService, DagStatsService, DagVersionService, DagWarningService, DashboardService, DeadlinesService, DependenciesService, EventLogService, ExperimentalService, ExtraLinksService, GanttService, GridService, ImportErrorService, JobService, LoginService, MonitorService, PartitionedDagRunService, PluginService, PoolService, ProviderService, StructureService, TaskInstanceService, TaskService, TaskStateStoreService, TeamsService, VariableService, VersionService, XcomService } from "../requests/services.gen";
 import { AssetStateStoreBody, BackfillPostBody, BulkBody_BulkDAGRunBody_, BulkBody_BulkTaskInstanceBody_, BulkBody_ConnectionBody_, BulkBody_PoolBody_, BulkBody_VariableBody_, BulkDAGRunClearBody, ClearPartitionsBody, ClearTaskInstancesBody, ConnectionBody, ConnectionTestRequestBody, CreateAssetEventsBody, DAGPatchBody, DAGRunClearBody, DAGRunPatchBody, DAGRunsBatchBody, DagRunState, DagWarningType, GenerateTokenBody, MaterializeAssetBody, PatchTaskInstanceBody, PoolBody, PoolPatchBody, TaskInstancesBatchBody, TaskStateStoreBody, TaskStateStorePatchBody, TriggerDAGRunPostBody, UpdateHITLDetailPayload, VariableBody, XComCreateBody, XComUpdateBody } from "../requests/types.gen";
 import * as Common from "./common";
 /**
@@ -1266,6 +1266,11 @@ export const useTaskInstanceServiceGetMappedTaskInstanceTryDetails = <TData = Co
 /**
 * Get Log
 * Get logs for a specific task instance.
+*
+* ``tail_lines`` returns only the last lines of the log, and ``since`` only the lines logged from
+* that time on. When the log is read from local files, both seek through an index of the files
+* instead of reading them from the start, and the continuation token resumes where the previous
+* read stopped.
 * @param data The data for the request.
 * @param data.dagId
 * @param data.dagRunId
@@ -1274,20 +1279,24 @@ export const useTaskInstanceServiceGetMappedTaskInstanceTryDetails = <TData = Co
 * @param data.fullContent
 * @param data.mapIndex
 * @param data.token
+* @param data.tailLines
+* @param data.since
 * @param data.accept
 * @returns TaskInstancesLogResponse Successful Response
 * @throws ApiError
 */
-export const useTaskInstanceServiceGetLog = <TData = Common.TaskInstanceServiceGetLogDefaultResponse, TError = unknown, TQueryKey extends Array<unknown> = unknown[]>({ accept, dagId, dagRunId, fullContent, mapIndex, taskId, token, tryNumber }: {
+export const useTaskInstanceServiceGetLog = <TData = Common.TaskInstanceServiceGetLogDefaultResponse, TError = unknown, TQueryKey extends Array<unknown> = unknown[]>({ accept, dagId, dagRunId, fullContent, mapIndex, since, tailLines, taskId, token, tryNumber }: {
   accept?: "application/json" | "*/*" | "application/x-ndjson";
   dagId: string;
   dagRunId: string;
   fullContent?: boolean;
   mapIndex?: number;
+  since?: string;
+  tailLines?: number;
   taskId: string;
   token?: string;
   tryNumber: number;
-}, queryKey?: TQueryKey, options?: Omit<UseQueryOptions<TData, TError>, "queryKey" | "queryFn">) => useQuery<TData, TError>({ queryKey: Common.UseTaskInstanceServiceGetLogKeyFn({ accept, dagId, dagRunId, fullContent, mapIndex, taskId, token, tryNumber }, queryKey), queryFn: () => TaskInstanceService.getLog({ accept, dagId, dagRunId, fullContent, mapIndex, taskId, token, tryNumber }) as TData, ...options });
+}, queryKey?: TQueryKey, options?: Omit<UseQueryOptions<TData, TError>, "queryKey" | "queryFn">) => useQuery<TData, TError>({ queryKey: Common.UseTaskInstanceServiceGetLogKeyFn({ accept, dagId, dagRunId, fullContent, mapIndex, since, tailLines, taskId, token, tryNumber }, queryKey), queryFn: () => TaskInstanceService.getLog({ accept, dagId, dagRunId, fullContent, mapIndex, since, tailLines, taskId, token, tryNumber }) as TData, ...options });
 /**
 * Get External Log Url
 * Get external log URL for a specific task instance.
@@ -2058,6 +2067,11 @@ export const useGridServiceGetGridRuns = <TData = Common.GridServiceGetGridRunsD
 * The serialized Dag structure is served from the app-wide ``DBDagBag`` cache
 * (keyed by ``dag_version_id``), which avoids repeated deserialization across
 * runs of the same version *and* across requests.
+*
+* The task instances of all requested runs are first fingerprinted with a single
+* aggregate query. Runs whose fingerprint is unchanged are served from the
+* in-process grid summary cache, and the response carries an ``ETag`` so that a
+* request whose ``If-None-Match`` still matches gets an empty 304 response.
 * @param data The data for the request.
 * @param data.dagId
 * @param data.runIds
@@ -2132,6 +2146,27 @@ export const useCalendarServiceGetCalendarDeadlines = <TData = Common.CalendarSe
   granularity?: "hourly" | "daily";
 }, queryKey?: TQueryKey, options?: Omit<UseQueryOptions<TData, TError>, "queryKey" | "queryFn">) => useQuery<TData, TError>({ queryKey: Common.UseCalendarServiceGetCalendarDeadlinesKeyFn({ dagId, deadlineTimeGt, deadlineTimeGte, deadlineTimeLt, deadlineTimeLte, granularity }, queryKey), queryFn: () => CalendarService.getCalendarDeadlines({ dagId, deadlineTimeGt, deadlineTimeGte, deadlineTimeLt, deadlineTimeLte, granularity }) as TData, ...options });
 /**
+* Get Dag Changes
+* Stream the changes to the runs and task instances of a Dag as NDJSON.
+*
+* The first line is sent right away and carries the cursor to resume from. After that a line is
+* sent whenever runs or task instances changed, holding only those rows. The stream ends after
+* ``timeout`` seconds; clients then reconnect with the ``cursor`` of the last line as ``since``.
+* @param data The data for the request.
+* @param data.dagId
+* @param data.since Cursor of a previous ``DagChanges`` line to resume from. Defaults to now.
+* @param data.interval Seconds to wait between checks for changes
+* @param data.timeout Seconds after which the stream ends
+* @returns string NDJSON stream — one ``DagChanges`` JSON object per line
+* @throws ApiError
+*/
+export const useChangesServiceGetDagChanges = <TData = Common.ChangesServiceGetDagChangesDefaultResponse, TError = unknown, TQueryKey extends Array<unknown> = unknown[]>({ dagId, interval, since, timeout }: {
+  dagId: string;
+  interval?: number;
+  since?: string;
+  timeout?: number;
+}, queryKey?: TQueryKey, options?: Omit<UseQueryOptions<TData, TError>, "queryKey" | "queryFn">) => useQuery<TData, TError>({ queryKey: Common.UseChangesServiceGetDagChangesKeyFn({ dagId, interval, since, timeout }, queryKey), queryFn: () => ChangesService.getDagChanges({ dagId, interval, since, timeout }) as TData, ...options });
+/**
 * List Teams
 * @param data The data for the request.
 * @param data.limit
@@ -9581,6 +9581,86 @@ export const $DAGsRunStateCountsCollectionResponse = {
     description: 'Collection of per-Dag DagRun-state counts for the Dag list page.'
 } as const;
 
+export const $DagChanges = {
+    properties: {
+        dag_id: {
+            type: 'string',
+            title: 'Dag Id'
+        },
+        cursor: {
+            type: 'string',
+            format: 'date-time',
+            title: 'Cursor'
+        },
+        reset: {
+            type: 'boolean',
+            title: 'Reset',
+            default: false
+        },
+        dag_runs: {
+            items: {
+                '$ref': '#/components/schemas/DagRunChange'
+            },
+            type: 'array',
+            title: 'Dag Runs'
+        },
+        task_instances: {
+            items: {
+                '$ref': '#/components/schemas/TaskInstanceChange'
+            },
+            type: 'array',
+            title: 'Task Instances'
+        }
+    },
+    type: 'object',
+    required: ['dag_id', 'cursor', 'dag_runs', 'task_instances'],
+    title: 'DagChanges',
+    description: `One batch of changes to the runs and task instances of a Dag.
+
+\`\`cursor\`\` can be passed back as \`\`since\`\` to resume the feed. When \`\`reset\`\` is set, too much
+changed to be sent as a delta and the client should reload its views instead.`
+} as const;
+
+export const $DagRunChange = {
+    properties: {
+        run_id: {
+            type: 'string',
+            title: 'Run Id'
+        },
+        state: {
+            '$ref': '#/components/schemas/DagRunState'
+        },
+        start_date: {
+            anyOf: [
+                {
+                    type: 'string',
+                    format: 'date-time'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Start Date'
+        },
+        end_date: {
+            anyOf: [
+                {
+                    type: 'string',
+                    format: 'date-time'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'End Date'
+        }
+    },
+    type: 'object',
+    required: ['run_id', 'state', 'start_date', 'end_date'],
+    title: 'DagRunChange',
+    description: 'A Dag run that changed, as sent by the change feed.'
+} as const;
+
 export const $DagRunStatsResponse = {
     properties: {
         duration: {
@@ -10987,6 +11067,65 @@ export const $StructureDataResponse = {
     description: 'Structure Data serializer for responses.'
 } as const;
 
+export const $TaskInstanceChange = {
+    properties: {
+        run_id: {
+            type: 'string',
+            title: 'Run Id'
+        },
+        task_id: {
+            type: 'string',
+            title: 'Task Id'
+        },
+        map_index: {
+            type: 'integer',
+            title: 'Map Index'
+        },
+        state: {
+            anyOf: [
+                {
+                    '$ref': '#/components/schemas/TaskInstanceState'
+                },
+                {
+                    type: 'null'
+                }
+            ]
+        },
+        try_number: {
+            type: 'integer',
+            title: 'Try Number'
+        },
+        start_date: {
+            anyOf: [
+                {
+                    type: 'string',
+                    format: 'date-time'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Start Date'
+        },
+        end_date: {
+            anyOf: [
+                {
+                    type: 'string',
+                    format: 'date-time'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'End Date'
+        }
+    },
+    type: 'object',
+    required: ['run_id', 'task_id', 'map_index', 'state', 'try_number', 'start_date', 'end_date'],
+    title: 'TaskInstanceChange',
+    description: 'A task instance that changed, as sent by the change feed.'
+} as const;
+
 export const $TaskInstanceStateCount = {
     properties: {
         no_status: {
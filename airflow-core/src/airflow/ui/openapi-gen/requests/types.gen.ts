@@ -2418,6 +2418,30 @@ export type DAGsRunStateCountsCollectionResponse = {
     state_count_limit: number;
 };
 
+/**
+ * One batch of changes to the runs and task instances of a Dag.
+ *
+ * ``cursor`` can be passed back as ``since`` to resume the feed. When ``reset`` is set, too much
+ * changed to be sent as a delta and the client should reload its views instead.
+ */
+export type DagChanges = {
+    dag_id: string;
+    cursor: string;
+    reset?: boolean;
+    dag_runs: Array<DagRunChange>;
+    task_instances: Array<TaskInstanceChange>;
+};
+
+/**
+ * A Dag run that changed, as sent by the change feed.
+ */
+export type DagRunChange = {
+    run_id: string;
+    state: DagRunState;
+    start_date: string | null;
+    end_date: string | null;
+};
+
 /**
  * DAG Run statistics serializer for responses.
  */
@@ -2760,6 +2784,19 @@ export type StructureDataResponse = {
     nodes: Array<NodeResponse>;
 };
 
+/**
+ * A task instance that changed, as sent by the change feed.
+ */
+export type TaskInstanceChange = {
+    run_id: string;
+    task_id: string;
+    map_index: number;
+    state: TaskInstanceState | null;
+    try_number: number;
+    start_date: string | null;
+    end_date: string | null;
+};
+
 /**
  * TaskInstance serializer for responses.
  */
@@ -4098,6 +4135,8 @@ export type GetLogData = {
     dagRunId: string;
     fullContent?: boolean;
     mapIndex?: number;
+    since?: string | null;
+    tailLines?: number | null;
     taskId: string;
     token?: string | null;
     tryNumber: number;
@@ -4818,6 +4857,24 @@ export type GetCalendarDeadlinesData = {
 
 export type GetCalendarDeadlinesResponse = CalendarDeadlineCollectionResponse;
 
+export type GetDagChangesData = {
+    dagId: string;
+    /**
+     * Seconds to wait between checks for changes
+     */
+    interval?: number;
+    /**
+     * Cursor of a previous ``DagChanges`` line to resume from. Defaults to now.
+     */
+    since?: string | null;
+    /**
+     * Seconds after which the stream ends
+     */
+    timeout?: number;
+};
+
+export type GetDagChangesResponse = string;
+
 export type ListTeamsData = {
     limit?: number;
     offset?: number;
@@ -8780,6 +8837,25 @@ export type $OpenApiTs = {
             };
         };
     };
+    '/ui/changes/{dag_id}': {
+        get: {
+            req: GetDagChangesData;
+            res: {
+                /**
+                 * NDJSON stream — one ``DagChanges`` JSON object per line
+                 */
+                200: string;
+                /**
+                 * Not Found
+                 */
+                404: HTTPExceptionResponse;
+                /**
+                 * Validation Error
+                 */
+                422: HTTPValidationError;
+            };
+        };
+    };
     '/ui/teams': {
         get: {
             req: ListTeamsData;
@@ -19,27 +19,33 @@
 
 from __future__ import annotations
 
+import gzip
 import heapq
 import io
 import logging
 import os
+from collections import deque
 from collections.abc import Generator, Iterator
 from contextlib import suppress
 from datetime import datetime
 from enum import Enum
-from itertools import chain, islice
+from itertools import chain, dropwhile, islice
 from pathlib import Path
 from types import GeneratorType
-from typing import IO, TYPE_CHECKING, TypedDict, cast
+from typing import IO, TYPE_CHECKING, Any, TypedDict, cast
 from urllib.parse import urljoin
 
+import msgspec
 import pendulum
 from pydantic import BaseModel, ConfigDict, ValidationError
 from typing_extensions import NotRequired
 
+from airflow._shared.logging.archive import ARCHIVE_SUFFIX, LogArchive, is_log_archive
+from airflow._shared.timezones.timezone import coerce_datetime
 from airflow.configuration import conf
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.utils.helpers import parse_template_string, render_template
+from airflow.utils.log.log_index import LogIndex
 from airflow.utils.log.log_stream_accumulator import LogStreamAccumulator
 from airflow.utils.log.logging_mixin import SetContextPropagate
 from airflow.utils.log.non_caching_file_handler import NonCachingRotatingFileHandler
@@ -72,6 +78,8 @@ Assuming 50 characters per line, an offset of 10,000,000 can represent approxima
 """
 HEAP_DUMP_SIZE = 5000
 HALF_HEAP_DUMP_SIZE = HEAP_DUMP_SIZE // 2
+DECODE_BATCH_SIZE = 1000
+"""Number of log lines decoded from JSON at once by _log_stream_to_parsed_log_stream."""
 
 StructuredLogStream: TypeAlias = Generator["StructuredLogMessage", None, None]
 """Structured log stream, containing structured log messages."""
@@ -106,6 +114,13 @@ class LogMetadata(TypedDict):
 
     end_of_log: bool
     log_pos: NotRequired[int]
+    # the following attributes are used when all logs are read from local files
+    log_offsets: NotRequired[dict[str, int]]
+    """Byte offset up to which each local log file was read, to resume reading from there."""
+    tail_lines: NotRequired[int]
+    """Only read this many lines from the end of the log."""
+    since: NotRequired[str]
+    """Only read the lines logged from this ISO 8601 timestamp on."""
     # the following attributes are used for Elasticsearch and OpenSearch log handlers
     offset: NotRequired[str | int]
     # Ensure a string here. Large offset numbers will get JSON.parsed incorrectly
@@ -187,10 +202,16 @@ def _fetch_logs_from_service(url: str, log_relative_path: str) -> Response:
     response = requests.get(
         url,
         timeout=timeout,
-        headers={"Authorization": generator.generate({"filename": log_relative_path})},
+        headers={
+            "Authorization": generator.generate({"filename": log_relative_path}),
+            # Logs of completed attempts are archived compressed, and are sent as they are stored.
+            "Accept-Encoding": "gzip",
+        },
         stream=True,
     )
     response.encoding = "utf-8"
+    # The response is read from ``raw``, which is only decompressed when asked to.
+    response.raw.decode_content = True
     return response
 
 
@@ -247,35 +268,113 @@ def _stream_lines_by_chunk(
         yield from buffer.split("\n")
 
 
+_log_line_decoder = msgspec.json.Decoder(dict[str, Any])
+
+
+def _decode_log_lines(lines: list[str]) -> list[dict[str, Any]] | None:
+    """
+    Decode a batch of JSON log lines in one call.
+
+    :param lines: The non-empty log lines to decode.
+    :return: The decoded lines, or None if any of them is not a JSON object.
+    """
+    try:
+        decoded = _log_line_decoder.decode_lines("\n".join(lines))
+    except (msgspec.DecodeError, TypeError):
+        return None
+    # A line holding several JSON values or none would shift the others.
+    return decoded if len(decoded) == len(lines) else None
+
+
+def _structured_log_from_dict(data: dict[str, Any]) -> StructuredLogMessage | None:
+    """
+    Build a structured log message from a decoded JSON log line, without validating it.
+
+    Only the usual shape of a line is handled: a string ``event`` and an ISO 8601 ``timestamp``, if
+    any. The other fields are passed through as decoded.
+
+    :param data: The decoded log line.
+    :return: The log message, or None if the line has another shape.
+    """
+    if not isinstance(data.get("event"), str):
+        return None
+    timestamp = data.get("timestamp")
+    if timestamp is not None:
+        if not isinstance(timestamp, str):
+            return None
+        if timestamp.endswith("Z"):
+            # Not accepted by datetime.fromisoformat before Python 3.11
+            timestamp = f"{timestamp[:-1]}+00:00"
+        try:
+            data["timestamp"] = coerce_datetime(datetime.fromisoformat(timestamp))
+        except ValueError:
+            return None
+    try:
+        return StructuredLogMessage.model_construct(**data)
+    except TypeError:
+        # A field name clashing with an argument of model_construct
+        return None
+
+
+def _parse_log_line(line: str, data: dict[str, Any] | None = None) -> StructuredLogMessage | None:
+    """
+    Parse a structured log line.
+
+    :param line: The log line.
+    :param data: The log line already decoded from JSON, if it was.
+    :return: The log message, or None if the line is not a structured log message.
+    """
+    if data is None:
+        try:
+            data = _log_line_decoder.decode(line)
+        except (msgspec.DecodeError, TypeError):
+            if not isinstance(line, str) or not line.lstrip().startswith("{"):
+                return None
+    if data is not None and (log := _structured_log_from_dict(data)) is not None:
+        return log
+    # Let pydantic deal with whatever the fast path does not handle, such as numeric timestamps.
+    try:
+        log = StructuredLogMessage.model_validate_json(line)
+    except ValidationError:
+        return None
+    if log.timestamp:
+        log.timestamp = coerce_datetime(log.timestamp)
+    return log
+
+
 def _log_stream_to_parsed_log_stream(
     log_stream: RawLogStream,
 ) -> ParsedLogStream:
     """
     Turn a str log stream into a generator of parsed log lines.
 
+    Lines are decoded from JSON :data:`DECODE_BATCH_SIZE` at a time, and turned into log messages
+    without going through pydantic validation. Lines which are not structured log messages get the
+    timestamp of the last line which starts with one, if any.
+
     :param log_stream: The stream to parse.
     :return: A generator of parsed log lines.
     """
-    from airflow._shared.timezones.timezone import coerce_datetime
-
     timestamp = None
     next_timestamp = None
     idx = 0
-    for line in log_stream:
-        if line:
-            try:
-                log = StructuredLogMessage.model_validate_json(line)
-            except ValidationError:
-                with suppress(Exception):
-                    # If we can't parse the timestamp, don't attach one to the row
-                    if isinstance(line, str):
-                        next_timestamp = _parse_timestamp(line)
-                log = StructuredLogMessage(event=str(line), timestamp=next_timestamp)
-            if log.timestamp:
-                log.timestamp = coerce_datetime(log.timestamp)
-                timestamp = log.timestamp
-            yield timestamp, idx, log
-        idx += 1
+    log_stream = iter(log_stream)
+    while batch := list(islice(log_stream, DECODE_BATCH_SIZE)):
+        decoded = _decode_log_lines([line for line in batch if line])
+        decoded_lines = iter(decoded) if decoded is not None else None
+        for line in batch:
+            if line:
+                log = _parse_log_line(line, next(decoded_lines) if decoded_lines is not None else None)
+                if log is None:
+                    with suppress(Exception):
+                        # If we can't parse the timestamp, don't attach one to the row
+                        if isinstance(line, str):
+                            next_timestamp = _parse_timestamp(line)
+                    log = StructuredLogMessage(event=str(line), timestamp=next_timestamp)
+                if log.timestamp:
+                    timestamp = log.timestamp
+                yield timestamp, idx, log
+            idx += 1
 
 
 def _create_sort_key(timestamp: datetime | None, line_num: int) -> int:
@@ -286,7 +385,9 @@ def _create_sort_key(timestamp: datetime | None, line_num: int) -> int:
     :param line_num: line number of the log line
     :return: a integer as sort key to avoid overhead of memory usage
     """
-    return int((timestamp or DEFAULT_SORT_DATETIME).timestamp() * 1000) * SORT_KEY_OFFSET + line_num
+    if timestamp is None:
+        return DEFAULT_SORT_TIMESTAMP * SORT_KEY_OFFSET + line_num
+    return int(timestamp.timestamp() * 1000) * SORT_KEY_OFFSET + line_num
 
 
 def _is_sort_key_with_default_timestamp(sort_key: int) -> bool:
@@ -396,6 +497,30 @@ def _interleave_logs(*log_streams: RawLogStream) -> StructuredLogStream:
     del parsed_log_streams
 
 
+def _parse_since(metadata: LogMetadata | None) -> datetime | None:
+    """Return the ``since`` of log metadata as an aware datetime."""
+    if not metadata or not metadata.get("since"):
+        return None
+    return coerce_datetime(datetime.fromisoformat(metadata["since"]))
+
+
+def _select_log_range(
+    log_stream: LogHandlerOutputStream, metadata: LogMetadata | None
+) -> LogHandlerOutputStream:
+    """
+    Narrow a log stream down to the ``since`` or ``tail_lines`` range of the metadata.
+
+    :param log_stream: The interleaved log stream.
+    :param metadata: Log metadata, possibly with ``since`` or ``tail_lines``.
+    :return: The lines logged from ``since`` on, or else the last ``tail_lines`` lines.
+    """
+    if (since := _parse_since(metadata)) is not None:
+        return dropwhile(lambda log: log.timestamp is None or log.timestamp < since, log_stream)
+    if metadata and (tail_lines := metadata.get("tail_lines")) is not None:
+        return iter(deque(log_stream, maxlen=tail_lines))
+    return log_stream
+
+
 def _is_logs_stream_like(log) -> bool:
     """Check if the logs are stream-like."""
     return isinstance(log, (chain, islice, GeneratorType))
@@ -595,12 +720,18 @@ class FileTaskHandler(logging.Handler):
                                   which was retrieved in previous calls, this
                                   part will be skipped and only following test
                                   returned to be added to tail.
+                         log_offsets: Byte offset of each local log file up to
+                                      which it was read in previous calls.
+                         tail_lines: Only return this many lines from the end.
+                         since: Only return the lines logged from this time on.
         :return: log message as a string and metadata.
                  Following attributes are used in metadata:
                  end_of_log: Boolean, True if end of log is reached or False
                              if further calls might get more log text.
                              This is determined by the status of the TaskInstance
                  log_pos: (absolute) Char position to which the log is retrieved
+                 log_offsets: Byte offset of each local log file to which it is
+                              retrieved, when only local files were read.
         """
         # Task instance here might be different from task instance when
         # initializing the handler. Thus explicitly getting log location
@@ -650,6 +781,15 @@ class FileTaskHandler(logging.Handler):
         if not (remote_logs and ti.state not in State.unfinished):
             # when finished, if we have remote logs, no need to check local
             worker_log_full_path = Path(self.local_base, worker_log_rel_path)
+            local_paths = self._get_local_log_paths(worker_log_full_path)
+            if (
+                local_paths
+                and not remote_logs
+                and ti.state not in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED)
+                and not (metadata and "log_pos" in metadata and "log_offsets" not in metadata)
+            ):
+                # Every log line is in local files: read them through their indexes.
+                return self._read_from_local_indexed(local_paths, ti, try_number, metadata)
             sources, local_logs = self._read_from_local(worker_log_full_path)
             source_list.extend(sources)
         if ti.state in (TaskInstanceState.RUNNING, TaskInstanceState.DEFERRED) and not has_executor_log:
@@ -691,6 +831,7 @@ class FileTaskHandler(logging.Handler):
             if metadata and "log_pos" in metadata:
                 out_stream = islice(out_stream, metadata["log_pos"], None)
             else:
+                out_stream = _select_log_range(out_stream, metadata)
                 # first time reading log, add messages before interleaved log stream
                 out_stream = chain(header, out_stream)
 
@@ -878,18 +1019,22 @@ class FileTaskHandler(logging.Handler):
         self,
         worker_log_path: Path,
     ) -> StreamingLogResponse:
-        sources: LogSourceInfo = []
-        log_streams: list[RawLogStream] = []
+        return self._open_local_logs(self._get_local_log_paths(worker_log_path))
+
+    def _get_local_log_paths(self, worker_log_path: Path) -> list[tuple[Path, str]]:
+        """Return the local log files of a worker log path, with their resolved paths."""
         # The glob below can match symlinks as well as regular files, so
-        # resolve each hit and only open the ones that stay inside the base
+        # resolve each hit and only keep the ones that stay inside the base
         # log folder. Canonicalising ``self.local_base`` once up front makes
         # the containment check compare two already-resolved paths.
         base_log_folder = os.path.realpath(self.local_base)
-        paths = sorted(worker_log_path.parent.glob(worker_log_path.name + "*"))
-        if not paths:
-            return sources, log_streams
-
-        for path in paths:
+        paths: list[tuple[Path, str]] = []
+        found = sorted(worker_log_path.parent.glob(worker_log_path.name + "*"))
+        for path in found:
+            # archive_log publishes the archive before removing the log it was made from; skip the
+            # archive while both exist so their lines are not read twice.
+            if is_log_archive(path) and path.with_name(path.name.removesuffix(ARCHIVE_SUFFIX)) in found:
+                continue
             resolved_path = os.path.realpath(path)
             try:
                 if os.path.commonpath([base_log_folder, resolved_path]) != base_log_folder:
@@ -899,19 +1044,100 @@ class FileTaskHandler(logging.Handler):
                 # paths have nothing in common (e.g. different drives on
                 # Windows); treat that as "not contained" and skip the file.
                 continue
+            paths.append((path, resolved_path))
+        return paths
 
+    @staticmethod
+    def _open_local_logs(paths: list[tuple[Path, str]]) -> StreamingLogResponse:
+        sources: LogSourceInfo = []
+        log_streams: list[RawLogStream] = []
+        for path, resolved_path in paths:
             # Open the resolved path so the file we read is the same one we
-            # just validated above. Append to ``sources`` only after a
-            # successful ``open`` so ``sources`` and ``log_streams`` stay
-            # aligned.
+            # just validated. Append to ``sources`` only after a successful
+            # ``open`` so ``sources`` and ``log_streams`` stay aligned.
             try:
-                log_stream = _stream_lines_by_chunk(open(resolved_path, encoding="utf-8"))
+                if is_log_archive(resolved_path):
+                    log_io = gzip.open(resolved_path, "rt", encoding="utf-8")
+                else:
+                    log_io = open(resolved_path, encoding="utf-8")
+                log_stream = _stream_lines_by_chunk(log_io)
             except OSError:
                 continue
             sources.append(os.fspath(path))
             log_streams.append(log_stream)
         return sources, log_streams
 
+    def _read_from_local_indexed(
+        self,
+        paths: list[tuple[Path, str]],
+        ti: TaskInstance | TaskInstanceHistory,
+        try_number: int,
+        metadata: LogMetadata | None,
+    ) -> tuple[LogHandlerOutputStream, LogMetadata]:
+        """
+        Read local log files from a position found through their :class:`~.log_index.LogIndex`.
+
+        Archived logs are read through the seek table of their blocks instead, with the same offsets
+        as the log file they were archived from.
+
+        Where reading starts is, by priority: the ``log_offsets`` of a previous read, which resumes
+        it; ``since``, the first line logged from that time; ``tail_lines``, that many lines from the
+        end. Without any of them the files are read from the start. The returned ``log_offsets``
+        are the ends of the files, so the next read only returns lines logged after.
+        """
+        metadata = metadata or {"end_of_log": False}
+        resume_offsets = metadata.get("log_offsets")
+        tail_lines = metadata.get("tail_lines")
+        since_datetime = _parse_since(metadata)
+
+        sources: LogSourceInfo = []
+        log_streams: list[RawLogStream] = []
+        log_offsets: dict[str, int] = {}
+        log_pos = 0
+        for path, resolved_path in paths:
+            try:
+                index: LogIndex | LogArchive = (
+                    LogArchive.load(resolved_path)
+                    if is_log_archive(resolved_path)
+                    else LogIndex.load(resolved_path)
+                )
+            except OSError:
+                continue
+            source = os.fspath(path)
+            if resume_offsets is not None:
+                start = resume_offsets.get(source, 0)
+                if source not in resume_offsets and is_log_archive(source):
+                    # Archived since the previous read: uncompressed offsets are those of the log file.
+                    start = resume_offsets.get(source.removesuffix(ARCHIVE_SUFFIX), 0)
+            elif since_datetime is not None:
+                start = index.offset_of_time(since_datetime)
+            elif tail_lines is not None:
+                start = index.offset_of_line(index.lines - tail_lines)
+            else:
+                start = 0
+            sources.append(source)
+            # The task is not running, so a trailing partial line will not be completed: read it too.
+            log_streams.append(index.read_lines(start, index.file_size))
+            log_offsets[source] = index.file_size
+            log_pos += index.lines + (index.file_size > index.size)
+
+        out_stream: LogHandlerOutputStream = _interleave_logs(*log_streams)
+        if resume_offsets is None:
+            # The index only seeks to the checkpoint before ``since``, and each file was read from
+            # its own last lines; narrow the merged stream down to the range asked for.
+            out_stream = _select_log_range(out_stream, metadata)
+            header = [
+                StructuredLogMessage(event="::group::Log message source details"),
+                *[StructuredLogMessage(event=source) for source in sources],
+                StructuredLogMessage(event="::endgroup::"),
+            ]
+            out_stream = chain(header, out_stream)
+        end_of_log = ti.try_number != try_number or ti.state not in (
+            TaskInstanceState.RUNNING,
+            TaskInstanceState.DEFERRED,
+        )
+        return out_stream, {"end_of_log": end_of_log, "log_pos": log_pos, "log_offsets": log_offsets}
+
     def _read_from_logs_server(
         self,
         ti: TaskInstance | TaskInstanceHistory,
@@ -0,0 +1,235 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Sidecar line and time index of local task log files, to read them from any position."""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import tempfile
+from itertools import accumulate
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from airflow._shared.logging.archive import parse_line_timestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+INDEX_INTERVAL = 1000
+"""Number of lines between two checkpoints of the index."""
+
+INDEX_VERSION = 1
+
+_READ_SIZE = 1024 * 1024
+
+
+def index_path_for(log_path: str | os.PathLike[str]) -> Path:
+    """
+    Return the path of the index of a log file.
+
+    The index is a hidden file next to the log, so globs for the log file and its rotated backups
+    (``<name>*``) do not pick it up.
+    """
+    log_path = Path(log_path)
+    return log_path.with_name(f".{log_path.name}.idx")
+
+
+class LogIndex:
+    """
+    Line and time index of an append-only log file.
+
+    Every :data:`INDEX_INTERVAL` lines the index records a checkpoint: the line number, its byte
+    offset and the timestamp of the line if it has one. With it a reader can seek close to a line
+    number, a timestamp or the last lines of the file without reading and decoding the lines before.
+
+    The index covers complete lines only and is brought up to date incrementally by
+    :meth:`update`, which reads just the bytes appended since the last update. It is kept in a
+    sidecar file (see :func:`index_path_for`) so it survives between reads; when the sidecar cannot
+    be written the index still works, it is just rebuilt on the next read.
+
+    :param log_path: Path of the log file.
+    """
+
+    def __init__(self, log_path: str | os.PathLike[str]) -> None:
+        self.log_path = Path(log_path)
+        self.inode: int | None = None
+        self.size = 0
+        """Byte offset of the end of the last complete line indexed."""
+        self.lines = 0
+        """Number of complete lines indexed."""
+        self.file_size = 0
+        """Size of the log file at the last update, including a trailing partial line."""
+        self.checkpoints: list[tuple[int, int, float | None]] = []
+        """``(line number, byte offset, timestamp)`` of every ``INDEX_INTERVAL``-th line."""
+
+    @classmethod
+    def load(cls, log_path: str | os.PathLike[str]) -> LogIndex:
+        """Load the index of a log file from its sidecar, and bring it up to date with the file."""
+        index = cls(log_path)
+        try:
+            data = json.loads(index_path_for(log_path).read_bytes())
+            if data.get("version") == INDEX_VERSION and data.get("interval") == INDEX_INTERVAL:
+                index.inode = data["inode"]
+                index.size = data["size"]
+                index.lines = data["lines"]
+                index.checkpoints = [tuple(c) for c in data["checkpoints"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or unreadable sidecar; build the index from the start of the file.
+            pass
+        index.update()
+        return index
+
+    def _reset(self, inode: int) -> None:
+        self.inode = inode
+        self.size = 0
+        self.lines = 0
+        self.checkpoints = []
+
+    def update(self) -> None:
+        """Index the lines appended to the log file since the last update."""
+        try:
+            stat = os.stat(self.log_path)
+        except OSError:
+            return
+        self.file_size = stat.st_size
+        if stat.st_ino != self.inode or stat.st_size < self.size:
+            # Replaced or truncated (e.g. rotated): start over.
+            self._reset(stat.st_ino)
+        if stat.st_size == self.size:
+            return
+        size = self.size
+        with open(self.log_path, "rb") as f:
+            f.seek(self.size)
+            pending = b""
+            while chunk := f.read(_READ_SIZE):
+                pending += chunk
+                end = pending.rfind(b"\n")
+                if end == -1:
+                    continue
+                self._index_block(pending[: end + 1])
+                # Keep the trailing partial line for the next chunk.
+                pending = pending[end + 1 :]
+        if self.size != size:
+            self._save()
+
+    def _index_block(self, block: bytes) -> None:
+        """Index a block of complete lines starting at ``self.size``."""
+        lines = block.split(b"\n")[:-1]
+        # Byte length of the lines before each line, separators excluded.
+        lengths = [0, *accumulate(map(len, lines))]
+        for i in range((-self.lines) % INDEX_INTERVAL, len(lines), INDEX_INTERVAL):
+            offset = self.size + lengths[i] + i
+            self.checkpoints.append((self.lines + i, offset, parse_line_timestamp(lines[i])))
+        self.lines += len(lines)
+        self.size += len(block)
+
+    def _save(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "interval": INDEX_INTERVAL,
+            "inode": self.inode,
+            "size": self.size,
+            "lines": self.lines,
+            "checkpoints": self.checkpoints,
+        }
+        path = index_path_for(self.log_path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # The reader may not be allowed to write to the log folder.
+            logger.debug("Could not write log index %s: %s", path, e)
+
+    def offset_of_line(self, line: int) -> int:
+        """Return the byte offset of a line (0-based), reading at most ``INDEX_INTERVAL`` lines."""
+        if line <= 0 or not self.checkpoints:
+            return 0
+        if line >= self.lines:
+            return self.size
+        checkpoint = self.checkpoints[bisect.bisect_right(self.checkpoints, (line, float("inf"))) - 1]
+        current, offset, _ = checkpoint
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            for _ in range(line - current):
+                offset += len(f.readline())
+        return offset
+
+    def offset_of_time(self, timestamp: datetime) -> int:
+        """
+        Return the offset of the last checkpoint before ``timestamp``.
+
+        Reading from there yields every line from ``timestamp`` on, preceded by at most
+        ``INDEX_INTERVAL`` earlier lines.
+        """
+        target = timestamp.timestamp()
+        offset = 0
+        for _, checkpoint_offset, checkpoint_time in self.checkpoints:
+            if checkpoint_time is None:
+                continue
+            if checkpoint_time >= target:
+                break
+            offset = checkpoint_offset
+        return offset
+
+    def line_of_offset(self, offset: int) -> int:
+        """Return the number of complete lines before a byte offset that starts a line."""
+        if offset >= self.size:
+            return self.lines
+        position = bisect.bisect_right([c[1] for c in self.checkpoints], offset) - 1
+        if position < 0:
+            return 0
+        current, checkpoint_offset, _ = self.checkpoints[position]
+        with open(self.log_path, "rb") as f:
+            f.seek(checkpoint_offset)
+            while checkpoint_offset < offset:
+                checkpoint_offset += len(f.readline())
+                current += 1
+        return current
+
+    def read_lines(self, start: int, end: int | None = None) -> Generator[str, None, None]:
+        """
+        Yield the lines from byte offset ``start`` to ``end``.
+
+        ``end`` defaults to the end of the index, leaving out a trailing partial line; pass
+        :attr:`file_size` to read it too once the log is not written to anymore.
+        """
+        remaining = (self.size if end is None else end) - start
+        if remaining <= 0:
+            return
+        with open(self.log_path, "rb") as f:
+            f.seek(start)
+            pending = b""
+            while remaining > 0 and (chunk := f.read(min(_READ_SIZE, remaining))):
+                remaining -= len(chunk)
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    yield line.decode("utf-8", errors="replace")
+            if pending:
+                yield pending.decode("utf-8", errors="replace")
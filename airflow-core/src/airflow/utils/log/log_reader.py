@@ -120,7 +120,7 @@ class TaskLogReader:
                 yield f"{msg.model_dump_json()}\n"
             return
 
-        for key in ("end_of_log", "max_offset", "offset", "log_pos"):
+        for key in ("end_of_log", "max_offset", "offset", "log_pos", "log_offsets"):
             # https://mypy.readthedocs.io/en/stable/typed_dict.html#supported-operations
             metadata.pop(key, None)  # type: ignore[misc]
         empty_iterations = 0
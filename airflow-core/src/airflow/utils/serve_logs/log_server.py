@@ -20,10 +20,13 @@ from __future__ import annotations
 
 import logging
 import os
+import stat
 from functools import cache
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
+from anyio import to_thread
 from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from jwt.exceptions import (
     ExpiredSignatureError,
@@ -32,12 +35,18 @@ from jwt.exceptions import (
     InvalidIssuedAtError,
     InvalidSignatureError,
 )
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from airflow._shared.logging.archive import ARCHIVE_SUFFIX, LogArchive
 from airflow._shared.module_loading import import_string
 from airflow.api_fastapi.auth.tokens import JWTValidator, get_signing_key
 from airflow.configuration import conf
 from airflow.utils.docs import get_docs_url
 
+if TYPE_CHECKING:
+    from starlette.responses import Response
+    from starlette.types import Scope
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +63,18 @@ class JWTAuthStaticFiles(StaticFiles):
         await self.validate_jwt_token(request)
         await super().__call__(scope, receive, send)
 
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as e:
+            # The log of a completed attempt may have been archived.
+            if e.status_code != status.HTTP_404_NOT_FOUND:
+                raise
+            full_path, stat_result = await to_thread.run_sync(self.lookup_path, path + ARCHIVE_SUFFIX)
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                raise
+        return await to_thread.run_sync(_archived_log_response, full_path, Request(scope))
+
     async def validate_jwt_token(self, request: Request):
         # we get the signer from the app state instead of creating a new instance for each request
         signer = cast("JWTValidator", request.app.state.signer)
@@ -113,6 +134,21 @@ class JWTAuthStaticFiles(StaticFiles):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
 
 
+def _archived_log_response(archive_path: str, request: Request) -> Response:
+    """
+    Serve an archived log in place of the log file it was archived from.
+
+    Clients accepting gzip get the archive as it is stored; the others get it decompressed.
+    """
+    headers = {"Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return FileResponse(archive_path, media_type="text/plain", headers=headers)
+    archive = LogArchive.load(archive_path)
+    headers["Content-Length"] = str(archive.size)
+    return StreamingResponse(archive.read_chunks(), media_type="text/plain", headers=headers)
+
+
 def create_app():
     leeway = conf.getint("webserver", "log_request_clock_grace", fallback=30)
     log_directory = os.path.expanduser(conf.get("logging", "BASE_LOG_FOLDER"))
@@ -335,6 +335,38 @@ class TestTaskInstancesLog:
             assert "3rd line" in response.content.decode("utf-8")
             assert "should never be read" not in response.content.decode("utf-8")
 
+    @pytest.mark.parametrize(
+        ("query", "expected_metadata"),
+        [
+            pytest.param({"tail_lines": 50}, {"tail_lines": 50}, id="tail_lines"),
+            pytest.param(
+                {"since": "2024-01-01T00:00:00Z"},
+                {"since": "2024-01-01T00:00:00+00:00"},
+                id="since",
+            ),
+        ],
+    )
+    def test_get_logs_passes_range_to_reader(self, query, expected_metadata):
+        with mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read") as read_mock:
+            read_mock.return_value = (convert_list_to_stream([]), {"end_of_log": True})
+
+            response = self.client.get(
+                f"/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/1",
+                params=query,
+                headers={"Accept": "application/json"},
+            )
+
+        assert response.status_code == 200
+        metadata = read_mock.call_args.kwargs["metadata"]
+        assert metadata.items() >= expected_metadata.items()
+
+    def test_get_logs_rejects_non_positive_tail_lines(self):
+        response = self.client.get(
+            f"/dags/{self.DAG_ID}/dagRuns/{self.RUN_ID}/taskInstances/{self.TASK_ID}/logs/1",
+            params={"tail_lines": 0},
+        )
+        assert response.status_code == 422
+
     @pytest.mark.parametrize("try_number", [1, 2])
     @mock.patch("airflow.api_fastapi.core_api.routes.public.log.TaskLogReader")
     def test_get_logs_for_handler_without_read_method(self, mock_log_reader, try_number):
@@ -0,0 +1,144 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from airflow._shared.timezones import timezone
+from airflow.api_fastapi.core_api.services.ui import change_feed
+from airflow.models.taskinstance import TaskInstance
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.settings import _configure_async_session
+from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.state import DagRunState, TaskInstanceState
+from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+from tests_common.test_utils.db import clear_db_dags, clear_db_runs, clear_db_serialized_dags
+
+pytestmark = pytest.mark.db_test
+
+DAG_ID = "test_changes_dag"
+TASK_ID = "task"
+TASK_ID_2 = "task2"
+SINCE = "2000-01-01T00:00:00Z"
+
+
+@pytest.fixture(autouse=True)
+@provide_session
+def setup(dag_maker, *, session: Session = NEW_SESSION):
+    clear_db_runs()
+    clear_db_dags()
+    clear_db_serialized_dags()
+
+    with dag_maker(dag_id=DAG_ID, serialized=True, session=session):
+        EmptyOperator(task_id=TASK_ID) >> EmptyOperator(task_id=TASK_ID_2)
+
+    dag_run = dag_maker.create_dagrun(
+        run_id="run_1",
+        state=DagRunState.RUNNING,
+        run_type=DagRunType.MANUAL,
+        triggered_by=DagRunTriggeredByType.TEST,
+    )
+    for ti in dag_run.task_instances:
+        ti.state = TaskInstanceState.SUCCESS if ti.task_id == TASK_ID else TaskInstanceState.RUNNING
+    session.commit()
+
+    yield
+
+    clear_db_runs()
+    clear_db_dags()
+    clear_db_serialized_dags()
+
+
+def _parse_ndjson(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+
+class TestGetDagChanges:
+    # The async engine has to be configured again for each test, see TestWaitDagRun.
+    @pytest.fixture(autouse=True)
+    def reconfigure_async_db_engine(self):
+        _configure_async_session()
+
+    def test_should_response_401(self, unauthenticated_test_client):
+        response = unauthenticated_test_client.get(f"/changes/{DAG_ID}", params={"timeout": 0.1})
+        assert response.status_code == 401
+
+    def test_should_response_403(self, unauthorized_test_client):
+        response = unauthorized_test_client.get(f"/changes/{DAG_ID}", params={"timeout": 0.1})
+        assert response.status_code == 403
+
+    def test_should_response_404(self, test_client):
+        response = test_client.get("/changes/does_not_exist", params={"timeout": 0.1})
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("params", [{"interval": 0}, {"timeout": 0}, {"timeout": 601}])
+    def test_should_response_422(self, test_client, params):
+        response = test_client.get(f"/changes/{DAG_ID}", params=params)
+        assert response.status_code == 422
+
+    def test_without_since_sends_only_cursor(self, test_client):
+        response = test_client.get(f"/changes/{DAG_ID}", params={"timeout": 0.1})
+        assert response.status_code == 200
+        [changes] = _parse_ndjson(response)
+        assert changes["dag_id"] == DAG_ID
+        assert changes["cursor"]
+        assert changes["reset"] is False
+        assert changes["dag_runs"] == []
+        assert changes["task_instances"] == []
+
+    def test_since_sends_changed_rows_once(self, test_client):
+        response = test_client.get(
+            f"/changes/{DAG_ID}", params={"since": SINCE, "interval": 0.05, "timeout": 0.3}
+        )
+        assert response.status_code == 200
+        # Later polls find the same rows unchanged and send nothing.
+        [changes] = _parse_ndjson(response)
+        assert [(dr["run_id"], dr["state"]) for dr in changes["dag_runs"]] == [("run_1", "running")]
+        assert sorted((ti["task_id"], ti["state"]) for ti in changes["task_instances"]) == [
+            (TASK_ID, "success"),
+            (TASK_ID_2, "running"),
+        ]
+
+    def test_heartbeats_do_not_send_task_instances(self, test_client, session):
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.dag_id == DAG_ID, TaskInstance.task_id == TASK_ID_2)
+            .values(
+                state_changed_at=datetime(1999, 1, 1, tzinfo=timezone.utc),
+                last_heartbeat_at=timezone.utcnow(),
+            )
+        )
+        session.commit()
+        response = test_client.get(f"/changes/{DAG_ID}", params={"since": SINCE, "timeout": 0.1})
+        assert response.status_code == 200
+        [changes] = _parse_ndjson(response)
+        assert [ti["task_id"] for ti in changes["task_instances"]] == [TASK_ID]
+
+    def test_too_many_changes_asks_for_reset(self, test_client, monkeypatch):
+        monkeypatch.setattr(change_feed, "MAX_CHANGES", 1)
+        response = test_client.get(f"/changes/{DAG_ID}", params={"since": SINCE, "timeout": 0.1})
+        assert response.status_code == 200
+        [changes] = _parse_ndjson(response)
+        assert changes["reset"] is True
+        assert changes["task_instances"] == []
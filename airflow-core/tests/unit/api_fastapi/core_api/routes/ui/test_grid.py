@@ -1273,9 +1273,62 @@ class TestGetGridDataEndpoint:
         session.commit()
 
         run_ids = ["run_1", "run_2"]
-        # 2 auth queries + 1 serdag query shared across both runs
-        # + 1 TI query per run = 5 total (not 1 serdag per run which would be 6+).
-        with assert_queries_count(5):
+        # 2 auth queries + 1 fingerprint query + 1 serdag query shared across both runs
+        # + 1 TI query per run = 6 total (not 1 serdag per run which would be 7+).
+        with assert_queries_count(6):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
         assert response.status_code == 200
         assert len(self._parse_ndjson(response)) == len(run_ids)
+
+    def test_grid_ti_summaries_stream_serves_unchanged_runs_from_cache(self, session, test_client):
+        """A second request for unchanged runs only runs the fingerprint query."""
+        session.commit()
+
+        run_ids = ["run_1", "run_2"]
+        first = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        assert first.status_code == 200
+
+        # 2 auth queries + 1 fingerprint query.
+        with assert_queries_count(3):
+            second = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        assert second.status_code == 200
+        assert second.text == first.text
+
+    def test_grid_ti_summaries_stream_rebuilds_changed_runs(self, session, test_client):
+        """A run whose task instances changed is summarized again."""
+        session.commit()
+
+        first = test_client.get(f"/grid/ti_summaries/{DAG_ID}?run_ids=run_1")
+        [before] = self._parse_ndjson(first)
+
+        ti = session.scalar(
+            select(TaskInstance).where(TaskInstance.run_id == "run_1", TaskInstance.task_id == TASK_ID)
+        )
+        ti.task_instance_note = TaskInstanceNote(content="test note")
+        session.commit()
+
+        second = test_client.get(f"/grid/ti_summaries/{DAG_ID}?run_ids=run_1")
+        [after] = self._parse_ndjson(second)
+        assert second.headers["etag"] != first.headers["etag"]
+        assert not {ti["task_id"]: ti for ti in before["task_instances"]}[TASK_ID]["has_note"]
+        assert {ti["task_id"]: ti for ti in after["task_instances"]}[TASK_ID]["has_note"]
+
+    def test_grid_ti_summaries_stream_not_modified(self, session, test_client):
+        """A request whose If-None-Match matches the current ETag gets an empty 304."""
+        session.commit()
+
+        run_ids = ["run_1", "run_2"]
+        first = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
+        etag = first.headers["etag"]
+
+        response = test_client.get(
+            f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+        response = test_client.get(
+            f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": ["run_1"]}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
@@ -17,7 +17,14 @@
 
 from __future__ import annotations
 
-from airflow.api_fastapi.core_api.services.ui.grid import _merge_node_dicts
+import pytest
+
+from airflow.api_fastapi.core_api.services.ui.grid import (
+    GridSummaryCache,
+    _merge_node_dicts,
+    etag_matches,
+    make_grid_etag,
+)
 
 
 def test_merge_node_dicts_with_none_new_list():
@@ -136,3 +143,55 @@ def test_merge_node_dicts_large_merge_keeps_unique_nodes():
         "group_399.old_task",
         "group_399.new_task",
     }
+
+
+def test_grid_summary_cache_serves_only_matching_fingerprint():
+    cache = GridSummaryCache(maxsize=2)
+    cache.put("dag", "run_1", (("success", 1),), "line\n")
+
+    assert cache.get("dag", "run_1", (("success", 1),)) == "line\n"
+    assert cache.get("dag", "run_1", (("success", 2),)) is None
+    assert cache.get("other_dag", "run_1", (("success", 1),)) is None
+
+
+def test_grid_summary_cache_evicts_least_recently_used():
+    cache = GridSummaryCache(maxsize=2)
+    cache.put("dag", "run_1", (), "1")
+    cache.put("dag", "run_2", (), "2")
+    cache.get("dag", "run_1", ())
+    cache.put("dag", "run_3", (), "3")
+
+    assert cache.get("dag", "run_1", ()) == "1"
+    assert cache.get("dag", "run_2", ()) is None
+    assert cache.get("dag", "run_3", ()) == "3"
+
+
+def test_grid_summary_cache_disabled():
+    cache = GridSummaryCache(maxsize=0)
+    cache.put("dag", "run_1", (), "line")
+
+    assert cache.get("dag", "run_1", ()) is None
+
+
+def test_make_grid_etag_depends_on_runs_and_fingerprints():
+    etag = make_grid_etag("dag", ["run_1"], {"run_1": (("success", 1),)})
+
+    assert etag.startswith('W/"')
+    assert etag == make_grid_etag("dag", ["run_1"], {"run_1": (("success", 1),)})
+    assert etag != make_grid_etag("dag", ["run_1"], {"run_1": (("running", 1),)})
+    assert etag != make_grid_etag("dag", ["run_1", "run_2"], {"run_1": (("success", 1),)})
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        pytest.param(None, False, id="missing"),
+        pytest.param('W/"abc"', True, id="same"),
+        pytest.param('"abc"', True, id="strong-form"),
+        pytest.param('"other", W/"abc"', True, id="in-list"),
+        pytest.param("*", True, id="wildcard"),
+        pytest.param('W/"other"', False, id="different"),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, 'W/"abc"') is expected
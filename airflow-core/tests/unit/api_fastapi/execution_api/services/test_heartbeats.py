@@ -0,0 +1,120 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import pytest
+import uuid6
+
+from airflow.api_fastapi.execution_api.datamodels.taskinstance import TIHeartbeatInfo
+from airflow.api_fastapi.execution_api.services import heartbeats
+from airflow.api_fastapi.execution_api.services.heartbeats import (
+    HeartbeatCoalescer,
+    get_heartbeat_coalescer,
+    record_heartbeats,
+)
+from airflow.utils.state import State
+
+from tests_common.test_utils.config import conf_vars
+from tests_common.test_utils.db import clear_db_runs
+
+pytestmark = pytest.mark.db_test
+
+
+class TestRecordHeartbeats:
+    def setup_method(self):
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_runs()
+
+    def test_writes_matching_running_task_instances(self, session, create_task_instance):
+        running = create_task_instance(
+            task_id="running", state=State.RUNNING, hostname="host", pid=1, session=session
+        )
+        session.commit()
+        missing = uuid6.uuid7()
+
+        updated = record_heartbeats(
+            {
+                running.id: TIHeartbeatInfo(hostname="host", pid=1),
+                missing: TIHeartbeatInfo(hostname="host", pid=1),
+            },
+            session=session,
+        )
+
+        assert updated == {running.id}
+        session.refresh(running)
+        assert running.last_heartbeat_at is not None
+
+    def test_skips_task_instances_running_elsewhere(self, session, create_task_instance):
+        ti = create_task_instance(task_id="ti", state=State.RUNNING, hostname="host", pid=1, session=session)
+        session.commit()
+
+        assert record_heartbeats({ti.id: TIHeartbeatInfo(hostname="host", pid=2)}, session=session) == set()
+
+
+class TestHeartbeatCoalescer:
+    @pytest.mark.asyncio
+    async def test_concurrent_heartbeats_are_written_together(self):
+        ti_ids = [uuid6.uuid7() for _ in range(5)]
+        coalescer = HeartbeatCoalescer(window=10, max_size=len(ti_ids))
+        with mock.patch.object(heartbeats, "_write_heartbeats", return_value=set(ti_ids[1:])) as write:
+            written = await asyncio.gather(
+                *(coalescer.heartbeat(ti_id, TIHeartbeatInfo(hostname="host", pid=1)) for ti_id in ti_ids)
+            )
+
+        # The window is not waited for once max_size heartbeats arrived
+        write.assert_called_once()
+        assert set(write.call_args.args[0]) == set(ti_ids)
+        assert written == [False, True, True, True, True]
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_are_written_at_the_end_of_the_window(self):
+        coalescer = HeartbeatCoalescer(window=0.01)
+        first, second = uuid6.uuid7(), uuid6.uuid7()
+        with mock.patch.object(heartbeats, "_write_heartbeats", return_value={first}) as write:
+            written = await asyncio.gather(
+                coalescer.heartbeat(first, TIHeartbeatInfo(hostname="host", pid=1)),
+                coalescer.heartbeat(second, TIHeartbeatInfo(hostname="host", pid=2)),
+            )
+            # A heartbeat arriving after the write starts a new window
+            assert not await coalescer.heartbeat(second, TIHeartbeatInfo(hostname="host", pid=2))
+
+        assert written == [True, False]
+        assert write.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_are_not_written_when_the_write_fails(self):
+        coalescer = HeartbeatCoalescer(window=0)
+        with mock.patch.object(heartbeats, "_write_heartbeats", side_effect=RuntimeError):
+            assert not await coalescer.heartbeat(uuid6.uuid7(), TIHeartbeatInfo(hostname="h", pid=1))
+
+    def test_get_heartbeat_coalescer(self):
+        get_heartbeat_coalescer.cache_clear()
+        try:
+            assert get_heartbeat_coalescer() is None
+            get_heartbeat_coalescer.cache_clear()
+            with conf_vars({("execution_api", "heartbeat_coalesce_window"): "0.05"}):
+                coalescer = get_heartbeat_coalescer()
+        finally:
+            get_heartbeat_coalescer.cache_clear()
+
+        assert coalescer is not None
+        assert (coalescer.window, coalescer.max_size) == (0.05, 500)
@@ -45,6 +45,7 @@ from airflow.api_fastapi.execution_api.app import lifespan
 from airflow.api_fastapi.execution_api.datamodels.token import TIClaims, TIToken
 from airflow.api_fastapi.execution_api.routes.task_instances import _emit_task_span
 from airflow.api_fastapi.execution_api.security import require_auth
+from airflow.api_fastapi.execution_api.services.heartbeats import get_heartbeat_coalescer
 from airflow.exceptions import AirflowSkipException
 from airflow.models import RenderedTaskInstanceFields, TaskReschedule, Trigger
 from airflow.models.asset import AssetActive, AssetAliasModel, AssetEvent, AssetModel
@@ -1909,6 +1910,32 @@ class TestTIUpdateState:
                 assert t[0].queue == "default"
             else:
                 assert t[0].queue is None
+            assert t[0].fire_at is None
+
+    def test_ti_update_state_to_deferred_stores_trigger_fire_at(self, client, session, create_task_instance):
+        """The moment a time-only trigger fires is stored on the trigger for the scheduler."""
+        from airflow.models.trigger import Trigger
+
+        ti = create_task_instance(
+            task_id="test_ti_update_state_to_deferred_stores_trigger_fire_at",
+            state=State.RUNNING,
+            session=session,
+        )
+        session.commit()
+
+        payload = {
+            "state": "deferred",
+            "trigger_kwargs": {},
+            "trigger_fire_at": "2024-12-18T00:00:01Z",
+            "classpath": "my-classpath",
+            "next_method": "execute_callback",
+        }
+        response = client.patch(f"/execution/task-instances/{ti.id}/state", json=payload)
+        assert response.status_code == 204
+
+        session.expire_all()
+        trigger = session.scalars(select(Trigger)).one()
+        assert trigger.fire_at == datetime(2024, 12, 18, 0, 0, 1, tzinfo=timezone.utc)
 
     @staticmethod
     def _defer_ti_in_team_bundle(client, session, create_task_instance):
@@ -2913,6 +2940,32 @@ class TestTIHealthEndpoint:
             # If there's an error, check the error detail
             assert response.json()["detail"] == expected_detail
 
+    @pytest.mark.parametrize(("pid", "expected_status_code"), [(1789, 204), (1054, 409)])
+    def test_ti_heartbeat_coalesced(self, client, session, create_task_instance, pid, expected_status_code):
+        ti = create_task_instance(
+            task_id="test_ti_heartbeat_coalesced",
+            state=State.RUNNING,
+            hostname="random-hostname",
+            pid=1789,
+            session=session,
+        )
+        session.commit()
+
+        get_heartbeat_coalescer.cache_clear()
+        try:
+            with conf_vars({("execution_api", "heartbeat_coalesce_window"): "0.01"}):
+                assert get_heartbeat_coalescer() is not None
+                response = client.put(
+                    f"/execution/task-instances/{ti.id}/heartbeat",
+                    json={"hostname": "random-hostname", "pid": pid},
+                )
+        finally:
+            get_heartbeat_coalescer.cache_clear()
+
+        assert response.status_code == expected_status_code
+        session.refresh(ti)
+        assert (ti.last_heartbeat_at is not None) == (expected_status_code == 204)
+
     def test_ti_heartbeat_non_existent_task(self, client, session, create_task_instance):
         """Test that a 404 error is returned when the Task Instance does not exist."""
         task_instance_id = UUID("0182e924-0f1e-77e6-ab50-e977118bc139")
@@ -3167,6 +3220,131 @@ class TestTIHealthEndpoint:
         assert ti.last_heartbeat_at == new_time
 
 
+class TestTIBatch:
+    def setup_method(self):
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_runs()
+
+    @pytest.fixture
+    def validator(self):
+        """Validate the fake tokens of the tests, whose subject is the token itself."""
+        validator = mock.AsyncMock(spec=JWTValidator)
+        validator.validated_claims.side_effect = lambda token, required_claims: {
+            "sub": token,
+            "scope": "execution",
+            "exp": 9999999999,
+            "iat": 1000000000,
+        }
+        lifespan.registry.register_value(JWTValidator, validator)
+        return validator
+
+    def test_heartbeats(self, client, session, create_task_instance, validator, time_machine):
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+        ti = create_task_instance(
+            task_id="test_batch_heartbeats", state=State.RUNNING, hostname="random-hostname", pid=1789
+        )
+        session.commit()
+        other_ti_id = "0182e924-0f1e-77e6-ab50-e977118bc139"
+
+        response = client.post(
+            "/execution/task-instances/batch",
+            json={
+                "items": [
+                    {
+                        "task_instance_id": str(ti.id),
+                        "token": str(ti.id),
+                        "heartbeat": {"hostname": "random-hostname", "pid": 1789},
+                    },
+                    {
+                        "task_instance_id": str(ti.id),
+                        "token": str(ti.id),
+                        "heartbeat": {"hostname": "random-hostname", "pid": 1054},
+                    },
+                    {
+                        "task_instance_id": str(ti.id),
+                        "token": other_ti_id,
+                        "heartbeat": {"hostname": "random-hostname", "pid": 1789},
+                    },
+                    {
+                        "task_instance_id": other_ti_id,
+                        "token": other_ti_id,
+                        "heartbeat": {"hostname": "random-hostname", "pid": 1789},
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["status_code"] for result in results] == [204, 409, 403, 404]
+        assert results[1]["detail"]["reason"] == "running_elsewhere"
+        assert results[2]["detail"] == "Token subject does not match task instance ID"
+        session.refresh(ti)
+        assert ti.last_heartbeat_at == time_now
+
+    def test_state_update_and_refreshed_token(self, client, session, create_task_instance, validator):
+        ti = create_task_instance(task_id="test_batch_state", state=State.RUNNING)
+        session.commit()
+        validator.validated_claims.side_effect = lambda token, required_claims: {
+            "sub": token,
+            "scope": "execution",
+            "exp": int(timezone.utcnow().timestamp()) + 10,
+            "iat": int(timezone.utcnow().timestamp()) - 600,
+        }
+        generator = mock.Mock(spec=JWTGenerator)
+        generator.generate.return_value = "refreshed"
+        lifespan.registry.register_value(JWTGenerator, generator)
+
+        response = client.post(
+            "/execution/task-instances/batch",
+            json={
+                "items": [
+                    {
+                        "task_instance_id": str(ti.id),
+                        "token": str(ti.id),
+                        "state": {"state": "failed", "end_date": "2024-10-31T12:30:00Z"},
+                    },
+                    {
+                        "task_instance_id": str(ti.id),
+                        "token": str(ti.id),
+                        "state": {"state": "failed", "end_date": "2024-10-31T12:30:00Z"},
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {
+                "task_instance_id": str(ti.id),
+                "status_code": 204,
+                "detail": None,
+                "refreshed_token": "refreshed",
+            },
+            # Already in the requested state
+            {
+                "task_instance_id": str(ti.id),
+                "status_code": 200,
+                "detail": None,
+                "refreshed_token": "refreshed",
+            },
+        ]
+        session.expire_all()
+        assert session.get(TaskInstance, ti.id).state == State.FAILED
+
+    def test_item_needs_exactly_one_operation(self, client, validator):
+        ti_id = "0182e924-0f1e-77e6-ab50-e977118bc139"
+        response = client.post(
+            "/execution/task-instances/batch",
+            json={"items": [{"task_instance_id": ti_id, "token": ti_id}]},
+        )
+
+        assert response.status_code == 422
+
+
 class TestTIPutRTIF:
     def setup_method(self):
         clear_db_runs()
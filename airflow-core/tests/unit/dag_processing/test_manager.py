@@ -1597,6 +1597,63 @@ class TestDagFileProcessorManager:
         assert manager._file_stats[file].last_finish_time > original_stat.last_finish_time
         assert manager._file_stats[file].num_dags == 0
 
+    @conf_vars({("dag_processor", "parse_cache_ttl"): "600"})
+    def test_start_new_processes_reuses_cached_parsing_result(self, tmp_path):
+        dag_file = tmp_path / "abc.py"
+        dag_file.write_text("# dag file")
+        manager = DagFileProcessorManager(max_runs=1)
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("abc.py"), bundle_path=tmp_path)
+        manager._bundle_versions["testing"] = None
+
+        processor, _ = self.mock_processor(start_time=time.monotonic() - 1)
+        processor.parsing_result = DagFileParsingResult(fileloc=str(dag_file), serialized_dags=[])
+        processor.parse_started_at = time.time() + 1
+        with mock.patch.object(manager, "persist_parsing_result"):
+            manager.handle_parsing_result(file, processor)
+
+        manager._file_queue = OrderedDict({file: None})
+        with (
+            mock.patch.object(manager, "persist_parsing_result") as mock_persist,
+            mock.patch.object(DagFileProcessorManager, "_create_process") as mock_create_process,
+        ):
+            manager._start_new_processes()
+
+        mock_create_process.assert_not_called()
+        mock_persist.assert_called_once_with(
+            bundle_name="testing",
+            bundle_version=None,
+            version_data=None,
+            parsing_result=processor.parsing_result,
+            run_duration=mock.ANY,
+            relative_fileloc="abc.py",
+            session=mock.ANY,
+        )
+        assert manager._file_stats[file].run_count == 2
+
+        # Once the file changes, it is parsed again.
+        dag_file.write_text("# dag file, changed")
+        manager._file_queue = OrderedDict({file: None})
+        with mock.patch.object(DagFileProcessorManager, "_create_process") as mock_create_process:
+            manager._start_new_processes()
+        mock_create_process.assert_called_once_with(file)
+
+    @conf_vars({("dag_processor", "parse_cache_ttl"): "600"})
+    def test_handle_parsing_result_does_not_cache_when_external_state_accessed(self, tmp_path):
+        (tmp_path / "abc.py").write_text("# dag file")
+        manager = DagFileProcessorManager(max_runs=1)
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("abc.py"), bundle_path=tmp_path)
+        manager._bundle_versions["testing"] = None
+
+        processor, _ = self.mock_processor(start_time=time.monotonic() - 1)
+        processor.parsing_result = DagFileParsingResult(fileloc="abc.py", serialized_dags=[])
+        processor.parse_started_at = time.time() + 1
+        processor.accessed_external_state = True
+        with mock.patch.object(manager, "persist_parsing_result"):
+            manager.handle_parsing_result(file, processor)
+
+        assert manager._parse_cache is not None
+        assert len(manager._parse_cache) == 0
+
     def test_collect_results_processes_remaining_files_when_one_persist_fails(self, session):
         manager = DagFileProcessorManager(max_runs=1)
         file_a = DagFileInfo(bundle_name="testing", rel_path=Path("a.py"), bundle_path=TEST_DAGS_FOLDER)
@@ -2999,6 +3056,32 @@ class TestDagFileProcessorManager:
                 manager.run()
             assert calls == ["before", "loop", "after"]
 
+    @conf_vars({("dag_processor", "parsing_pre_import_module_list"): "json, airflow.models"})
+    def test_before_run_pre_imports_configured_modules(self, tmp_path, configure_testing_dag_bundle):
+        """Configured modules are imported before the GC is collected and frozen, once."""
+        with configure_testing_dag_bundle(tmp_path):
+            manager = DagFileProcessorManager(max_runs=1)
+            calls: list[str] = []
+            with (
+                mock.patch(
+                    "airflow.dag_processing.manager.pre_import_modules",
+                    side_effect=lambda modules, log: calls.append(f"import {','.join(modules)}"),
+                ),
+                mock.patch(
+                    "airflow.dag_processing.manager.gc.collect", side_effect=lambda: calls.append("collect")
+                ),
+                mock.patch(
+                    "airflow.dag_processing.manager.gc.freeze", side_effect=lambda: calls.append("freeze")
+                ),
+                mock.patch.object(manager, "prepare_server_process_context"),
+                mock.patch.object(manager, "prepare_process_context"),
+                mock.patch.object(manager, "register_exit_signals"),
+                mock.patch.object(manager, "prepare_bundles"),
+                mock.patch.object(manager, "_symlink_latest_log_directory"),
+            ):
+                manager.before_run()
+            assert calls == ["import json,airflow.models", "collect", "freeze"]
+
     def test_after_run_runs_when_parsing_loop_raises(self, tmp_path, configure_testing_dag_bundle):
         """`after_run` must execute even when the parsing loop raises."""
         with configure_testing_dag_bundle(tmp_path):
@@ -0,0 +1,115 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from airflow.dag_processing.manager import DagFileInfo
+from airflow.dag_processing.parse_cache import DagFileParseCache, fingerprint_files
+from airflow.dag_processing.processor import DagFileParsingResult
+
+
+@pytest.fixture
+def bundle(tmp_path: Path) -> Path:
+    (tmp_path / "dag.py").write_text("import helpers")
+    (tmp_path / "helpers.py").write_text("VALUE = 1")
+    return tmp_path
+
+
+def _put(cache: DagFileParseCache, file: DagFileInfo, **kwargs) -> bool:
+    result = DagFileParsingResult(
+        fileloc=os.fspath(file.absolute_path),
+        serialized_dags=[],
+        imported_module_files=[os.fspath(file.absolute_path.parent / "helpers.py")],
+        **kwargs,
+    )
+    return cache.put(file, result, parse_duration=1.0, parse_started_at=time.time() + 1)
+
+
+class TestDagFileParseCache:
+    def test_hit_while_unchanged(self, bundle):
+        cache = DagFileParseCache(ttl=600)
+        file = DagFileInfo(rel_path=Path("dag.py"), bundle_name="testing", bundle_path=bundle)
+
+        assert _put(cache, file)
+
+        entry = cache.get(file)
+        assert entry is not None
+        assert entry.parse_duration == 1.0
+
+    @pytest.mark.parametrize("changed", ["dag.py", "helpers.py"])
+    def test_miss_when_file_or_imported_module_changes(self, bundle, changed):
+        cache = DagFileParseCache(ttl=600)
+        file = DagFileInfo(rel_path=Path("dag.py"), bundle_name="testing", bundle_path=bundle)
+        _put(cache, file)
+
+        (bundle / changed).write_text("changed")
+
+        assert cache.get(file) is None
+        assert len(cache) == 0
+
+    def test_miss_when_expired(self, bundle):
+        cache = DagFileParseCache(ttl=60)
+        file = DagFileInfo(rel_path=Path("dag.py"), bundle_name="testing", bundle_path=bundle)
+        _put(cache, file)
+        cache.get(file).cached_at -= 120
+
+        assert cache.get(file) is None
+
+    def test_results_with_import_errors_are_not_cached(self, bundle):
+        cache = DagFileParseCache(ttl=600)
+        file = DagFileInfo(rel_path=Path("dag.py"), bundle_name="testing", bundle_path=bundle)
+
+        assert not _put(cache, file, import_errors={"dag.py": "boom"})
+        assert cache.get(file) is None
+
+    def test_results_of_files_modified_during_parsing_are_not_cached(self, bundle):
+        cache = DagFileParseCache(ttl=600)
+        file = DagFileInfo(rel_path=Path("dag.py"), bundle_name="testing", bundle_path=bundle)
+        result = DagFileParsingResult(fileloc=os.fspath(bundle / "dag.py"), serialized_dags=[])
+
+        assert not cache.put(file, result, parse_duration=1.0, parse_started_at=time.time() - 60)
+
+    def test_invalidate_ignores_bundle_version(self, bundle):
+        cache = DagFileParseCache(ttl=600)
+        file = DagFileInfo(
+            rel_path=Path("dag.py"), bundle_name="testing", bundle_path=bundle, bundle_version="v1"
+        )
+        _put(cache, file)
+
+        cache.invalidate([DagFileInfo(rel_path=Path("dag.py"), bundle_name="testing")])
+
+        assert cache.get(file) is None
+
+    def test_retain(self, bundle):
+        cache = DagFileParseCache(ttl=600)
+        file = DagFileInfo(rel_path=Path("dag.py"), bundle_name="testing", bundle_path=bundle)
+        _put(cache, file)
+
+        cache.retain(present=[file])
+        assert len(cache) == 1
+        cache.retain(present=[])
+        assert len(cache) == 0
+
+
+def test_fingerprint_files_missing_file(tmp_path):
+    assert fingerprint_files([tmp_path / "missing.py"]) is None
@@ -27,7 +27,7 @@ import uuid
 from collections.abc import Callable, Iterable
 from socket import socketpair
 from typing import TYPE_CHECKING, Any, BinaryIO
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 import structlog
@@ -64,6 +64,7 @@ from airflow.dag_processing.processor import (
     _parse_file,
     _parse_file_entrypoint,
     _pre_import_airflow_modules,
+    pre_import_modules,
 )
 from airflow.models import DagRun
 from airflow.sdk import DAG, BaseOperator
@@ -481,6 +482,18 @@ class TestDagFileProcessor:
 
         assert logger.warning.call_count == 1
 
+    def test_pre_import_modules(self):
+        logger = MagicMock(spec=FilteringBoundLogger)
+        with patch(
+            "airflow.dag_processing.processor.importlib.import_module",
+            side_effect=[None, ModuleNotFoundError("module not found")],
+        ) as mock_import:
+            pre_import_modules(["airflow.models", "non_existent_module"], logger)
+
+        assert mock_import.call_args_list == [call("airflow.models"), call("non_existent_module")]
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args[0][1] == "non_existent_module"
+
 
 @pytest.mark.parametrize(
     ("platform_uses_exec", "target", "expected_use_exec"),
@@ -2188,6 +2201,7 @@ class TestDagProcessingMessageTypes:
             "GetTaskRescheduleStartDate",
             "GetTICount",
             "GetTaskStates",
+            "PrefetchRequests",
             "RescheduleTask",
             "RetryTask",
             "SetRenderedFields",
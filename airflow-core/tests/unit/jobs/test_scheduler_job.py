@@ -64,7 +64,7 @@ from airflow.executors.executor_loader import ExecutorLoader
 from airflow.executors.executor_utils import ExecutorName
 from airflow.executors.local_executor import LocalExecutor
 from airflow.jobs.job import Job, run_job
-from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+from airflow.jobs.scheduler_job_runner import ConcurrencyLedger, SchedulerJobRunner
 from airflow.models.asset import (
     AssetActive,
     AssetAliasModel,
@@ -1054,6 +1054,36 @@ class TestSchedulerJob:
         # must not trigger any error/mismatch metrics.
         mock_stats.incr.assert_called_once_with("scheduler.executor_events.processed", count=2)
 
+    def test_process_executor_events_only_loads_relationships_of_state_mismatches(self, dag_maker):
+        """A batch of regular completions is handled without loading the relationships of its TIs."""
+        session = settings.Session()
+        with dag_maker(dag_id="test_process_executor_events_batch", fileloc="/test_path1/"):
+            tasks = [EmptyOperator(task_id=f"task_{i}") for i in range(3)]
+        dag_run = dag_maker.create_dagrun()
+        tis = [dag_run.get_task_instance(task.task_id) for task in tasks]
+
+        executor = MockExecutor(do_update=False)
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(scheduler_job, executors=[executor])
+        for ti in tis:
+            ti.state = State.SUCCESS
+            session.merge(ti)
+        session.commit()
+        for ti in tis:
+            executor.event_buffer[ti.key] = State.SUCCESS, None
+
+        with (
+            mock.patch(
+                "airflow.jobs.scheduler_job_runner._eager_load_dag_run_for_validation"
+            ) as mock_eager_load,
+            mock.patch("airflow.jobs.scheduler_job_runner.stats") as mock_stats,
+        ):
+            self.job_runner._process_executor_events(executor=executor, session=session)
+
+        mock_eager_load.assert_not_called()
+        assert executor.event_buffer == {}
+        mock_stats.gauge.assert_any_call("scheduler.executor_events.per_second", mock.ANY)
+
     @pytest.mark.usefixtures("testing_dag_bundle")
     def test_process_executor_events_with_asset_events(self, session, dag_maker):
         """
@@ -2414,6 +2444,86 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "concurrency_ledger_reconcile_interval"): "3600"})
+    def test_find_executable_task_instances_concurrency_ledger(self, dag_maker, session):
+        """The ledger enforces max_active_tasks and pool slots without re-aggregating between reloads."""
+        with dag_maker(dag_id="check_ledger_dag", max_active_tasks=2, session=session):
+            EmptyOperator(task_id="task_1", pool="ledger_pool")
+            EmptyOperator(task_id="task_2", pool="ledger_pool")
+            EmptyOperator(task_id="task_3", pool="ledger_pool")
+        session.add(Pool(pool="ledger_pool", slots=3, include_deferred=False))
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+        assert isinstance(self.job_runner._concurrency_ledger, ConcurrencyLedger)
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, run_id="run_1", session=session)
+        dr2 = dag_maker.create_dagrun_after(
+            dr1, run_type=DagRunType.SCHEDULED, run_id="run_2", session=session
+        )
+        t1, t2, t3 = dr1.get_task_instances(session=session)
+        t1.state = State.RUNNING
+        t2.state = State.RUNNING
+        t3.state = State.SCHEDULED
+        for ti in dr2.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        with mock.patch.object(
+            ConcurrencyLedger, "load", autospec=True, side_effect=ConcurrencyLedger.load
+        ) as mock_load:
+            queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            # run_1 is already at max_active_tasks and the pool (3 slots, 2 running) has one slot left.
+            assert Counter(ti.run_id for ti in queued_tis) == {"run_2": 1}
+            session.flush()
+
+            # The pool is now full according to the ledger, without reloading it.
+            assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+            assert mock_load.call_count == 1
+
+        ledger = self.job_runner._concurrency_ledger
+        assert ledger.dag_run_active_tasks_map == {
+            ("check_ledger_dag", "run_1"): 2,
+            ("check_ledger_dag", "run_2"): 1,
+        }
+        # Scheduled task instances only count towards the pool stats.
+        assert {state: slots for _, state, slots in ledger.pool_slot_counts()} == {
+            State.RUNNING: 2,
+            State.QUEUED: 1,
+            State.SCHEDULED: 3,
+        }
+
+        t1.state = State.SUCCESS
+        ledger.record_finished(t1)
+        assert ledger.dag_run_active_tasks_map[("check_ledger_dag", "run_1")] == 1
+        assert {state: slots for _, state, slots in ledger.pool_slot_counts()}[State.RUNNING] == 1
+        # Removing an already removed task instance is a no-op.
+        ledger.record_finished(t1)
+        assert {state: slots for _, state, slots in ledger.pool_slot_counts()}[State.RUNNING] == 1
+
+        session.rollback()
+
+    def test_concurrency_ledger_reloaded_after_rollback(self, dag_maker, session):
+        """Task instances recorded as queued in a rolled back transaction make the ledger stale."""
+        with dag_maker(dag_id="ledger_rollback_dag", session=session):
+            EmptyOperator(task_id="task_1")
+        (ti,) = dag_maker.create_dagrun(session=session).get_task_instances(session=session)
+        ledger = ConcurrencyLedger(reconcile_interval=3600)
+        ledger.load(session=session)
+
+        # Nothing recorded since the last commit: a rollback keeps the ledger.
+        ledger.rollback()
+        assert not ledger.is_stale
+
+        ledger.record_queued(ti)
+        ledger.commit()
+        ledger.rollback()
+        assert not ledger.is_stale
+
+        ledger.record_queued(ti)
+        ledger.rollback()
+        assert ledger.is_stale
+
     # TODO: This is a hack, I think I need to just remove the setting and have it on always
     def test_find_executable_task_instances_max_active_tis_per_dag(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_max_active_tis_per_dag"
@@ -6564,6 +6674,51 @@ class TestSchedulerJob:
 
             assert mock_schedule.call_count == 1
 
+    @conf_vars({("scheduler", "batch_dag_run_scheduling"): "True"})
+    def test_schedule_all_dag_runs_in_batch(self, dag_maker, session):
+        """In batch mode the TIs of all runs are loaded at once and scheduled with shared UPDATEs."""
+        with dag_maker(dag_id="batch_dag", schedule="@daily", max_active_runs=2, session=session):
+            EmptyOperator(task_id="upstream") >> BashOperator(task_id="downstream", bash_command="true")
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, state=DagRunState.RUNNING)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED, state=DagRunState.RUNNING)
+        dr1.get_task_instance("upstream", session=session).state = TaskInstanceState.SUCCESS
+        session.flush()
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job, executors=[self.null_exec])
+
+        with (
+            patch.object(
+                DagRun,
+                "fetch_task_instances_for_dag_runs",
+                autospec=True,
+                side_effect=DagRun.fetch_task_instances_for_dag_runs,
+            ) as mock_fetch_batch,
+            patch.object(DagRun, "fetch_task_instances", autospec=True) as mock_fetch_single,
+            patch.object(DagRun, "schedule_tis", autospec=True) as mock_schedule_single,
+        ):
+            from airflow.utils.sqlalchemy import prohibit_commit
+
+            with prohibit_commit(session) as guard:
+                self.job_runner._schedule_all_dag_runs(guard, [dr1, dr2], session=session)
+
+        assert mock_fetch_batch.call_count == 1
+        mock_fetch_single.assert_not_called()
+        mock_schedule_single.assert_not_called()
+
+        session.expire_all()
+        states = {
+            (ti.run_id, ti.task_id): ti.state
+            for ti in session.scalars(select(TaskInstance).where(TaskInstance.dag_id == "batch_dag"))
+        }
+        assert states == {
+            (dr1.run_id, "upstream"): TaskInstanceState.SUCCESS,
+            (dr1.run_id, "downstream"): TaskInstanceState.SCHEDULED,
+            # EmptyOperator is marked successful straight away by the bulk update.
+            (dr2.run_id, "upstream"): TaskInstanceState.SUCCESS,
+            (dr2.run_id, "downstream"): None,
+        }
+
     def test_bulk_write_to_db_external_trigger_dont_skip_scheduled_run(self, dag_maker, testing_dag_bundle):
         """
         Test that externally triggered Dag Runs should not affect (by skipping) next
@@ -62,7 +62,11 @@ from airflow.jobs.triggerer_job_runner import (
     TriggerEventEntry,
     TriggerLoggingFactory,
     TriggerRunner,
+    TriggerRunnerPool,
     TriggerRunnerSupervisor,
+    TriggerTimers,
+    _HashRing,
+    _import_uvloop,
     _make_trigger_span,
     messages,
 )
@@ -581,7 +585,7 @@ def test_emit_metrics_uses_metric_tags_override(jobless_supervisor, mocker):
 
     jobless_supervisor.emit_metrics()
 
-    assert gauge.call_count == 2
+    assert gauge.call_count == 4
     for call in gauge.call_args_list:
         assert call.kwargs["tags"] == {"hostname": "astro-host", "deployment": "demo"}
 
@@ -619,10 +623,141 @@ def test_load_triggers_passes_team_name(supervisor_builder, mocker):
         proc.health_check_threshold,
         queues=proc.queues,
         team_name="team_x",
+        load_budget=None,
+        trigger_cost=proc.load.class_cost,
     )
     ids_for_triggerer.assert_called_once_with(proc.job.id, queues=proc.queues, team_name="team_x")
 
 
+def test_hash_ring_removing_a_slot_only_moves_its_keys():
+    ring = _HashRing(range(4))
+    keys = [str(i) for i in range(1000)]
+    before = {key: ring.get(key) for key in keys}
+    assert set(before.values()) == {0, 1, 2, 3}
+
+    ring.remove(2)
+
+    after = {key: ring.get(key) for key in keys}
+    assert ring.slots == {0, 1, 3}
+    assert {key for key in keys if before[key] != after[key]} == {key for key in keys if before[key] == 2}
+
+
+@pytest.fixture
+def runner_pool(supervisor_builder, session, mocker):
+    job = Job()
+    session.add(job)
+    session.flush()
+    mocker.patch.object(TriggerRunnerSupervisor, "update_triggers", autospec=True)
+    runners = {slot: supervisor_builder(job=job) for slot in range(3)}
+    return TriggerRunnerPool(job=job, capacity=30, runners=runners)
+
+
+def test_pool_load_triggers_shards_triggers_across_runners(runner_pool, mocker):
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.assign_unassigned")
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.ids_for_triggerer", return_value=range(1, 101))
+    shard_keys = {trigger_id: str(trigger_id) for trigger_id in range(1, 91)}
+    # Asset watchers of the same class share their shard key
+    shard_keys.update((trigger_id, "kafka.AwaitMessageTrigger") for trigger_id in range(91, 101))
+    mocker.patch.object(TriggerRunnerPool, "shard_keys", return_value=shard_keys)
+
+    runner_pool.load_triggers()
+
+    requested = {
+        slot: call.args[1]
+        for call in TriggerRunnerSupervisor.update_triggers.call_args_list
+        for slot, runner in runner_pool.runners.items()
+        if call.args[0] is runner
+    }
+    assert all(requested.values())
+    assert set().union(*requested.values()) == set(range(1, 101))
+    assert sum(len(trigger_ids) for trigger_ids in requested.values()) == 100
+    assert len({runner_pool.placements[trigger_id] for trigger_id in range(91, 101)}) == 1
+
+    # Placed triggers are not sharded again
+    runner_pool.load_triggers()
+    assert TriggerRunnerPool.shard_keys.call_count == 1
+
+
+def test_pool_restarts_dead_runner(runner_pool, supervisor_builder, mocker):
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.assign_unassigned")
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.ids_for_triggerer", return_value=range(1, 61))
+    mocker.patch.object(
+        TriggerRunnerPool,
+        "shard_keys",
+        side_effect=lambda ids: {trigger_id: str(trigger_id) for trigger_id in ids},
+    )
+    runner_pool.load_triggers()
+    before = dict(runner_pool.placements)
+
+    new_runner = supervisor_builder(job=runner_pool.job)
+    start_runner = mocker.patch.object(TriggerRunnerPool, "_start_runner", return_value=new_runner)
+    runner_pool.runners[1]._exit_code = 1
+    runner_pool.remove_dead_runners()
+    runner_pool.load_triggers()
+
+    start_runner.assert_called_once_with(
+        job=runner_pool.job, capacity=10, logger=None, queues=None, team_name=None
+    )
+    assert runner_pool.live_runners[1] is new_runner
+    assert runner_pool.placements == before
+    TriggerRunnerSupervisor.update_triggers.assert_any_call(
+        new_runner, {trigger_id for trigger_id, slot in before.items() if slot == 1}
+    )
+
+
+def test_pool_moves_triggers_of_runner_that_cannot_be_restarted(runner_pool, mocker):
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.assign_unassigned")
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.ids_for_triggerer", return_value=range(1, 61))
+    mocker.patch.object(
+        TriggerRunnerPool,
+        "shard_keys",
+        side_effect=lambda ids: {trigger_id: str(trigger_id) for trigger_id in ids},
+    )
+    runner_pool.load_triggers()
+    before = dict(runner_pool.placements)
+
+    mocker.patch.object(TriggerRunnerPool, "_start_runner", side_effect=OSError("fork failed"))
+    runner_pool.runners[1]._exit_code = 1
+    runner_pool.remove_dead_runners()
+    runner_pool.load_triggers()
+
+    assert set(runner_pool.live_runners) == {0, 2}
+    assert set(runner_pool.placements) == set(range(1, 61))
+    moved = {trigger_id for trigger_id, slot in before.items() if slot == 1}
+    assert moved
+    assert all(
+        runner_pool.placements[trigger_id] == before[trigger_id] for trigger_id in before.keys() - moved
+    )
+    assert {runner_pool.placements[trigger_id] for trigger_id in moved} <= {0, 2}
+    assert runner_pool._exit_code is None
+
+
+def test_pool_load_triggers_passes_per_runner_load_budget(runner_pool, mocker):
+    mocker.patch.object(TriggerRunnerSupervisor, "load_budget", new=0.5)
+    runner_pool.runners[0].load.add(1, "a.Trigger", movable=True, now=0)
+    runner_pool.runners[0].load.record_loop_time({1: 2.0}, now=10)
+    assign_unassigned = mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.assign_unassigned")
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.ids_for_triggerer", return_value=[])
+
+    runner_pool.load_triggers()
+
+    # New triggers are spread over all 3 runners, so the busiest runner limits what is picked up
+    assert assign_unassigned.call_args.kwargs["load_budget"] == pytest.approx(3 * 0.3)
+
+
+def test_pool_heartbeat_skipped_while_a_runner_is_unresponsive(runner_pool, mocker):
+    perform_heartbeat = mocker.patch("airflow.jobs.triggerer_job_runner.perform_heartbeat")
+    for runner in runner_pool.runners.values():
+        runner._last_runner_comms = time.monotonic()
+
+    runner_pool.heartbeat()
+    assert perform_heartbeat.call_count == 1
+
+    runner_pool.runners[0]._last_runner_comms = time.monotonic() - 3600
+    runner_pool.heartbeat()
+    assert perform_heartbeat.call_count == 1
+
+
 def test_create_workload_uses_supervisor_id_without_job(jobless_supervisor, mocker):
     """_create_workload() should fall back to self.id for the log filename when job is None."""
     trigger = mocker.Mock()
@@ -1166,6 +1301,57 @@ def test_trigger_logger_fd_closed_when_upload_to_remote_raises(jobless_superviso
     assert 42 not in jobless_supervisor.running_triggers
 
 
+class TestTriggerTimers:
+    @staticmethod
+    def at(timestamp: float) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+
+    def test_pop_due_returns_due_timers_in_order(self):
+        timers = TriggerTimers()
+        timers.add(1, self.at(30), TriggerEvent(1), "one")
+        timers.add(2, self.at(10), TriggerEvent(2), "two")
+        timers.add(3, self.at(20), TriggerEvent(3), "three")
+
+        assert timers.next_delay(now=5) == 5
+        assert [trigger_id for trigger_id, _ in timers.pop_due(now=20)] == [2, 3]
+        assert timers.pop_due(now=20) == []
+        assert list(timers._timers) == [1]
+
+    def test_removed_timers_do_not_fire(self):
+        timers = TriggerTimers()
+        timers.add(1, self.at(10), TriggerEvent(1), "one")
+        timers.add(2, self.at(20), TriggerEvent(2), "two")
+
+        assert timers.remove(1)
+        assert not timers.remove(1)
+        assert 1 not in timers
+        assert timers.next_delay(now=0) == 20
+        assert [trigger_id for trigger_id, _ in timers.pop_due(now=30)] == [2]
+        assert timers.next_delay(now=30) is None
+
+    def test_heap_is_compacted_after_many_removals(self):
+        timers = TriggerTimers()
+        for trigger_id in range(200):
+            timers.add(trigger_id, self.at(trigger_id), TriggerEvent(trigger_id), str(trigger_id))
+        for trigger_id in range(190):
+            timers.remove(trigger_id)
+
+        assert len(timers._heap) <= 2 * len(timers) + 64
+        assert [trigger_id for trigger_id, _ in timers.pop_due(now=1000)] == list(range(190, 200))
+
+    def test_wakeup_is_set_only_for_a_new_earliest_timer(self):
+        timers = TriggerTimers()
+        timers.add(1, self.at(10), TriggerEvent(1), "one")
+        assert timers.wakeup.is_set()
+
+        timers.wakeup.clear()
+        timers.add(2, self.at(20), TriggerEvent(2), "two")
+        assert not timers.wakeup.is_set()
+
+        timers.add(3, self.at(5), TriggerEvent(3), "three")
+        assert timers.wakeup.is_set()
+
+
 class TestTriggerRunner:
     def test_blocked_main_thread_warning_threshold_decode(self) -> None:
         with conf_vars({("triggerer", "blocked_main_thread_warning_threshold"): "0.5"}):
@@ -1237,6 +1423,63 @@ class TestTriggerRunner:
         assert threshold == 0.5
         mock_stats_incr.assert_called_once_with("triggers.blocked_main_thread", tags=expected_tags)
 
+    @pytest.mark.asyncio
+    async def test_block_watchdog_records_loop_lag(self) -> None:
+        trigger_runner = TriggerRunner()
+        trigger_runner.log = AsyncMock()
+
+        async def fake_sleep(_):
+            trigger_runner.stop = True
+
+        with (
+            patch("airflow.jobs.triggerer_job_runner.asyncio.sleep", side_effect=fake_sleep),
+            patch("airflow.jobs.triggerer_job_runner.time.monotonic", side_effect=[1.0, 1.13]),
+            patch("airflow.jobs.triggerer_job_runner.stats.timing") as mock_stats_timing,
+        ):
+            await trigger_runner.block_watchdog()
+
+        assert trigger_runner.loop_lag.max == pytest.approx(0.03)
+        assert trigger_runner.loop_lag.buckets()["<=50ms"] == 1
+        # Sampled lags are only emitted together, by emit_loop_lag
+        mock_stats_timing.assert_not_called()
+
+    def test_emit_loop_lag_emits_largest_lag_since_last_call(self) -> None:
+        trigger_runner = TriggerRunner()
+        trigger_runner._max_loop_lag = 0.03
+
+        with patch("airflow.jobs.triggerer_job_runner.stats.timing") as mock_stats_timing:
+            trigger_runner.emit_loop_lag()
+            trigger_runner.emit_loop_lag()
+
+        lags = [c.args[1].total_seconds() for c in mock_stats_timing.call_args_list]
+        assert lags == [pytest.approx(0.03), 0.0]
+        assert all(c.args[0] == "triggerer.loop_lag" for c in mock_stats_timing.call_args_list)
+
+    def test_slowest_triggers_ranks_loop_time_since_last_call(self) -> None:
+        trigger_runner = TriggerRunner()
+        trigger_runner.triggers = {
+            trigger_id: {
+                "coro": MagicMock(loop_time=loop_time),
+                "is_watcher": False,
+                "name": f"t{trigger_id}",
+            }
+            for trigger_id, loop_time in ((1, 5.0), (2, 1.0), (3, 0.0))
+        }
+        assert trigger_runner.slowest_triggers(2) == [(5.0, 1, "t1"), (1.0, 2, "t2")]
+
+        trigger_runner.triggers[1]["coro"].loop_time = 5.5
+        trigger_runner.triggers[2]["coro"].loop_time = 3.0
+        assert trigger_runner.slowest_triggers(2) == [(2.0, 2, "t2"), (0.5, 1, "t1")]
+
+    def test_use_uvloop_falls_back_to_asyncio_when_not_installed(self) -> None:
+        with conf_vars({("triggerer", "use_uvloop"): "False"}):
+            assert _import_uvloop() is None
+        with (
+            conf_vars({("triggerer", "use_uvloop"): "True"}),
+            patch.dict("sys.modules", {"uvloop": None}),
+        ):
+            assert _import_uvloop() is None
+
     def test_run_inline_trigger_canceled(self, session) -> None:
         trigger_runner = TriggerRunner()
         trigger_runner.triggers = {
@@ -1291,6 +1534,22 @@ class TestTriggerRunner:
             "name": "mock_name",
         } in cap_structlog
 
+    def test_cancel_triggers_cancels_moved_triggers_without_user_action_message(self) -> None:
+        trigger_runner = TriggerRunner()
+        cancelled_task = MagicMock(spec=asyncio.Task)
+        moved_task = MagicMock(spec=asyncio.Task)
+        trigger_runner.triggers = {
+            1: {"task": cancelled_task, "is_watcher": False, "name": "cancelled", "events": 0},
+            2: {"task": moved_task, "is_watcher": False, "name": "moved", "events": 0},
+        }
+        trigger_runner.to_cancel.append(1)
+        trigger_runner.to_move.append(2)
+
+        asyncio.run(trigger_runner.cancel_triggers())
+
+        cancelled_task.cancel.assert_called_once_with(_USER_ACTION_CANCEL_MSG)
+        moved_task.cancel.assert_called_once_with()
+
     def test_run_trigger_skips_on_kill_without_user_action_message(self, session) -> None:
         """on_kill() is not called when CancelledError has no user-action sentinel (shutdown/EOF)."""
         trigger_runner = TriggerRunner()
@@ -1697,12 +1956,53 @@ class TestTriggerRunner:
         # to mock deterministically.
         assert metric_value >= 0
         assert mock_timing.call_args.kwargs == {"tags": expected_tags}
+        # DateTimeTrigger waits on the timer rather than in a task of its own
+        assert workload.id in runner.timers
+
+    @pytest.mark.asyncio
+    @patch("airflow.jobs.triggerer_job_runner.Trigger._decrypt_kwargs")
+    @patch(
+        "airflow.jobs.triggerer_job_runner.TriggerRunner.get_trigger_by_classpath",
+        return_value=DateTimeTrigger,
+    )
+    async def test_time_based_triggers_fire_from_timer(
+        self, mock_get_trigger_by_classpath, mock_decrypt_kwargs
+    ):
+        now = timezone.utcnow()
+        mock_decrypt_kwargs.side_effect = [
+            {"moment": now - datetime.timedelta(seconds=2)},
+            {"moment": now - datetime.timedelta(seconds=1)},
+            {"moment": now + datetime.timedelta(hours=1)},
+        ]
+        runner = TriggerRunner()
+        runner.to_create.extend(
+            workloads.RunTrigger.model_construct(id=trigger_id, ti=None, classpath="abc", encrypted_kwargs="")
+            for trigger_id in (1, 2, 3)
+        )
 
-        task = runner.triggers[workload.id]["task"]
-        task.cancel()
-        await asyncio.gather(task, return_exceptions=True)
+        await runner.create_triggers()
+        assert runner.triggers == {}
+        assert len(runner.timers) == 3
 
-        await runner.cleanup_finished_triggers()
+        timers = asyncio.create_task(runner.run_timers())
+        try:
+            for _ in range(100):
+                if len(runner.events) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            timers.cancel()
+            await asyncio.gather(timers, return_exceptions=True)
+
+        assert [(entry.trigger_id, entry.event.payload) for entry in runner.events] == [
+            (1, now - datetime.timedelta(seconds=2)),
+            (2, now - datetime.timedelta(seconds=1)),
+        ]
+
+        runner.to_cancel.append(3)
+        await runner.cancel_triggers()
+        assert sorted(await runner.cleanup_finished_triggers()) == [1, 2, 3]
+        assert len(runner.timers) == 0
 
     @pytest.mark.asyncio
     @patch(
@@ -2489,6 +2789,65 @@ def test_update_triggers_delegates_workload_creation(supervisor_builder, mocker)
     assert supervisor.cancelling_triggers == {1}
 
 
+def test_rebalance_moves_costliest_triggers_over_load_budget(supervisor_builder, mocker):
+    supervisor = supervisor_builder()
+    mocker.patch.object(TriggerRunnerSupervisor, "load_budget", new=0.5)
+    supervisor._last_rebalance = 0
+    release = mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.release")
+    supervisor.running_triggers = {1, 2, 3}
+    supervisor.load.add(1, "a.Trigger", movable=True, now=0)
+    supervisor.load.add(2, "a.Trigger", movable=True, now=0)
+    supervisor.load.add(3, "watcher.Trigger", movable=False, now=0)
+    supervisor.load.record_loop_time({1: 1.0, 2: 5.0, 3: 3.0}, now=10)
+
+    supervisor.rebalance()
+
+    release.assert_called_once_with([2], supervisor.job.id)
+    assert supervisor.moving_triggers == {2}
+    assert supervisor._assign_paused_until > time.monotonic()
+
+    # Moving triggers are not cancelled as if the user killed them once they are not ours anymore
+    supervisor.update_triggers({1, 3})
+    assert supervisor.cancelling_triggers == set()
+
+    with mock.patch.object(TriggerRunnerSupervisor, "send_msg", autospec=True) as mock_send:
+        supervisor._handle_request(
+            messages.TriggerStateChanges(events=None, failures=None, finished=None),
+            log=MagicMock(spec=FilteringBoundLogger),
+            req_id=1,
+        )
+    assert mock_send.call_args.args[1].to_move == {2}
+
+    with mock.patch.object(TriggerRunnerSupervisor, "send_msg", autospec=True):
+        supervisor._handle_request(
+            messages.TriggerStateChanges(events=None, failures=None, finished=[2]),
+            log=MagicMock(spec=FilteringBoundLogger),
+            req_id=2,
+        )
+    assert supervisor.moving_triggers == set()
+    assert len(supervisor.load) == 2
+
+
+def test_load_triggers_passes_remaining_load_budget(supervisor_builder, mocker):
+    supervisor = supervisor_builder()
+    mocker.patch.object(TriggerRunnerSupervisor, "load_budget", new=0.5)
+    supervisor.load.add(1, "a.Trigger", movable=True, now=0)
+    supervisor.load.record_loop_time({1: 2.0}, now=10)
+    assign_unassigned = mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.assign_unassigned")
+    mocker.patch("airflow.jobs.triggerer_job_runner.Trigger.ids_for_triggerer", return_value=[1])
+    mocker.patch.object(TriggerRunnerSupervisor, "update_triggers")
+
+    supervisor.load_triggers()
+
+    assert assign_unassigned.call_args.kwargs["load_budget"] == pytest.approx(0.3)
+    assert assign_unassigned.call_args.kwargs["trigger_cost"]("a.Trigger") == pytest.approx(0.2)
+
+    # No triggers are assigned for a while after moving triggers away
+    supervisor._assign_paused_until = time.monotonic() + 60
+    supervisor.load_triggers()
+    assign_unassigned.assert_called_once()
+
+
 def test_update_triggers_uses_fetch_hooks(session, supervisor_builder, mocker):
     trigger = TimeDeltaTrigger(datetime.timedelta(days=7))
     _, _, trigger_orm, _ = create_trigger_in_db(session, trigger)
@@ -2674,6 +3033,29 @@ class TestTriggererJobRunner:
         # Verify env var is restored after _execute() returns.
         assert os.environ.get("_AIRFLOW_PROCESS_CONTEXT") is None
 
+    @conf_vars({("triggerer", "runner_processes"): "4"})
+    @patch.object(TriggerRunnerPool, "start")
+    def test_execute_starts_runner_pool(self, mock_pool_start, session):
+        mock_pool_start.return_value.stop = False
+        mock_pool_start.return_value._exit_code = 0
+
+        job = Job()
+        session.add(job)
+        session.flush()
+        job_runner = TriggererJobRunner(job, capacity=100)
+
+        with (
+            patch.object(job_runner, "register_signals"),
+            patch("airflow.jobs.triggerer_job_runner.stats.initialize"),
+        ):
+            job_runner._execute()
+
+        mock_pool_start.assert_called_once_with(
+            job=job, capacity=100, runner_processes=4, logger=ANY, queues=None, team_name=None
+        )
+        mock_pool_start.return_value.run.assert_called_once_with()
+        mock_pool_start.return_value.kill.assert_called_once_with(escalation_delay=10, force=True)
+
     def test_trigger_runner_sets_client_process_context(self, monkeypatch):
         """TriggerRunner.run() marks subprocess as client context to prevent inheriting server privileges."""
         captured_context = {}
@@ -2729,6 +3111,7 @@ class TestTriggererMessageTypes:
             "GetXComCount",
             "GetXComSequenceItem",
             "GetXComSequenceSlice",
+            "PrefetchRequests",
             "RescheduleTask",
             "RetryTask",
             "SetRenderedFields",
@@ -3070,32 +3453,75 @@ def test_trigger_state_messages_round_trip_with_seqs():
 
 
 def test_handle_events_records_persist_confirmations(jobless_supervisor):
-    """handle_events confirms the seq of a persisted event; events without a seq are not confirmed."""
-    event_with_seq = TriggerEvent(True)
-    event_without_seq = TriggerEvent("x")
-    jobless_supervisor.events.append(TriggerEventEntry(1, event_with_seq, 7))
-    jobless_supervisor.events.append(TriggerEventEntry(2, event_without_seq, None))
+    """handle_events persists all events in one batch and confirms the seqs of those that have one."""
+    entries = [
+        TriggerEventEntry(1, TriggerEvent(True), 7),
+        TriggerEventEntry(2, TriggerEvent("x"), None),
+        TriggerEventEntry(3, TriggerEvent("y"), 9),
+    ]
+    jobless_supervisor.events.extend(entries)
 
-    with mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True) as mock_event:
+    with (
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True) as mock_events,
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True) as mock_event,
+    ):
         jobless_supervisor.handle_events()
 
+    mock_events.assert_called_once_with(jobless_supervisor, entries)
+    mock_event.assert_not_called()
+    assert list(jobless_supervisor.persisted_event_seqs) == [7, 9]
+    assert len(jobless_supervisor.events) == 0
+
+
+def test_handle_events_persists_one_by_one_when_batch_fails(jobless_supervisor):
+    """When the batch fails, events are persisted one at a time and only persisted seqs are confirmed."""
+    good_event = TriggerEvent(True)
+    bad_event = TriggerEvent("bad")
+    jobless_supervisor.events.append(TriggerEventEntry(1, good_event, 7))
+    jobless_supervisor.events.append(TriggerEventEntry(2, bad_event, 8))
+
+    def on_trigger_event(supervisor, trigger_id, event):
+        if event is bad_event:
+            raise RuntimeError("bad event")
+
+    with (
+        mock.patch.object(
+            TriggerRunnerSupervisor,
+            "on_trigger_events",
+            autospec=True,
+            side_effect=RuntimeError("bad event"),
+        ),
+        mock.patch.object(
+            TriggerRunnerSupervisor, "on_trigger_event", autospec=True, side_effect=on_trigger_event
+        ) as mock_event,
+    ):
+        with pytest.raises(RuntimeError, match="bad event"):
+            jobless_supervisor.handle_events()
+
     assert mock_event.mock_calls == [
-        mock.call(jobless_supervisor, trigger_id=1, event=event_with_seq),
-        mock.call(jobless_supervisor, trigger_id=2, event=event_without_seq),
+        mock.call(jobless_supervisor, trigger_id=1, event=good_event),
+        mock.call(jobless_supervisor, trigger_id=2, event=bad_event),
     ]
     assert list(jobless_supervisor.persisted_event_seqs) == [7]
-    assert len(jobless_supervisor.events) == 0
 
 
 def test_handle_events_does_not_confirm_seq_when_persist_fails(jobless_supervisor):
     """A seq whose event failed to persist is never confirmed, so the broker advance fails out."""
     jobless_supervisor.events.append(TriggerEventEntry(1, TriggerEvent(True), 7))
 
-    with mock.patch.object(
-        TriggerRunnerSupervisor,
-        "on_trigger_event",
-        autospec=True,
-        side_effect=RuntimeError("db down"),
+    with (
+        mock.patch.object(
+            TriggerRunnerSupervisor,
+            "on_trigger_events",
+            autospec=True,
+            side_effect=RuntimeError("db down"),
+        ),
+        mock.patch.object(
+            TriggerRunnerSupervisor,
+            "on_trigger_event",
+            autospec=True,
+            side_effect=RuntimeError("db down"),
+        ),
     ):
         with pytest.raises(RuntimeError, match="db down"):
             jobless_supervisor.handle_events()
@@ -3121,18 +3547,12 @@ def test_handle_events_emits_team_name(jobless_supervisor, team_name, expected_t
     )
 
     with (
-        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True),
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True),
         mock.patch("airflow.jobs.triggerer_job_runner.stats.incr") as mock_incr,
     ):
         jobless_supervisor.handle_events()
 
-    mock_incr.assert_has_calls(
-        [
-            mock.call("triggers.succeeded", tags=expected_tags),
-            mock.call("triggers.succeeded", tags=expected_tags),
-        ]
-    )
-    assert mock_incr.call_count == 2
+    mock_incr.assert_called_once_with("triggers.succeeded", 2, tags=expected_tags)
 
 
 @pytest.mark.parametrize(
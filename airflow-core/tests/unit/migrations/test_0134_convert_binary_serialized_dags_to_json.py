@@ -0,0 +1,92 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Tests for migration 0134 (8d3f1c6b2e57), which converts binary serialized Dags to JSON on downgrade.
+
+Earlier versions, and the downgrades of earlier migrations, decompress ``data_compressed`` as
+zlib-compressed JSON, so rows in the binary format must be rewritten before going below it.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import zlib
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+
+from airflow import settings
+from airflow.models.serialized_dag import SerializedDagModel
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.serialization.binary_storage import is_binary_serialized_dag
+
+from tests_common.test_utils import db
+from tests_common.test_utils.paths import AIRFLOW_CORE_SOURCES_PATH
+
+pytestmark = pytest.mark.db_test
+
+# Migration filenames start with a digit so they cannot be imported via the normal import
+# system; load the module by file path instead.
+_MIGRATION_PATH = (
+    Path(AIRFLOW_CORE_SOURCES_PATH)
+    / "airflow/migrations/versions/0134_3_4_0_convert_binary_serialized_dags_to_json.py"
+)
+_spec = importlib.util.spec_from_file_location("migration_0134", _MIGRATION_PATH)
+_migration = importlib.util.module_from_spec(_spec)  # type: ignore[arg-type]
+_spec.loader.exec_module(_migration)  # type: ignore[union-attr]
+
+
+def _data_compressed(conn, dag_id: str) -> bytes:
+    return conn.scalar(
+        sa.select(SerializedDagModel._data_compressed).where(SerializedDagModel.dag_id == dag_id)
+    )
+
+
+class TestMigration0134:
+    @pytest.fixture(autouse=True)
+    def clean_serialized_dags(self):
+        db.clear_db_serialized_dags()
+        yield
+        db.clear_db_serialized_dags()
+
+    def test_converts_binary_rows_to_compressed_json(self, dag_maker, monkeypatch):
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "msgpack")
+        with dag_maker("test_migration_0134_binary"):
+            EmptyOperator(task_id="task1") >> EmptyOperator(task_id="task2")
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "json")
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", True)
+        with dag_maker("test_migration_0134_json"):
+            EmptyOperator(task_id="task1")
+
+        with settings.engine.connect() as conn:
+            binary = _data_compressed(conn, "test_migration_0134_binary")
+            compressed_json = _data_compressed(conn, "test_migration_0134_json")
+        assert is_binary_serialized_dag(binary)
+        expected = SerializedDagModel.get("test_migration_0134_binary").data
+
+        with settings.engine.begin() as conn:
+            _migration.convert_binary_serialized_dags(conn)
+
+        with settings.engine.connect() as conn:
+            converted = _data_compressed(conn, "test_migration_0134_binary")
+            assert _data_compressed(conn, "test_migration_0134_json") == compressed_json
+        assert not is_binary_serialized_dag(converted)
+        assert json.loads(zlib.decompress(converted)) == json.loads(json.dumps(expected))
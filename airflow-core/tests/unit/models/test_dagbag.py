@@ -243,6 +243,56 @@ class TestDBDagBag:
         db.clear_db_dag_bundles()
 
 
+class TestDBDagBagSharedCache:
+    """Tests for the serialized DAG data shared by the API server workers of a host."""
+
+    def setup_method(self):
+        self.shared_cache = MagicMock()
+        self.db_dag_bag = DBDagBag(cache_size=10, shared_cache=self.shared_cache)
+        self.session = MagicMock()
+
+    def test_get_dag_reads_current_version_from_shared_cache(self):
+        mock_dag = MagicMock(spec=SerializedDAG)
+        self.session.scalar.return_value = "hash1"
+        self.shared_cache.get.return_value = {"dag": {}}
+
+        with patch(
+            "airflow.serialization.serialized_objects.DagSerialization.from_dict", return_value=mock_dag
+        ) as from_dict:
+            result = self.db_dag_bag.get_dag("v1", session=self.session)
+
+        assert result == mock_dag
+        from_dict.assert_called_once_with({"dag": {}})
+        self.shared_cache.get.assert_called_once_with("v1", "hash1")
+        self.session.get.assert_not_called()
+        entry = self.db_dag_bag._dags["v1"]
+        assert (entry.dag, entry.dag_hash) == (mock_dag, "hash1")
+
+    def test_get_dag_shares_dag_loaded_from_db(self):
+        mock_serdag = MagicMock(spec=SerializedDagModel)
+        mock_serdag.dag = MagicMock(spec=SerializedDAG)
+        mock_serdag.data = {"dag": {}}
+        mock_serdag.dag_version_id = "v1"
+        mock_serdag.dag_hash = "hash1"
+        mock_dag_version = MagicMock()
+        mock_dag_version.serialized_dag = mock_serdag
+        self.session.scalar.return_value = "hash1"
+        self.session.get.return_value = mock_dag_version
+        self.shared_cache.get.return_value = None
+
+        result = self.db_dag_bag.get_dag("v1", session=self.session)
+
+        assert result == mock_serdag.dag
+        self.shared_cache.put.assert_called_once_with("v1", "hash1", {"dag": {}})
+
+    def test_get_dag_skips_shared_cache_for_missing_version(self):
+        self.session.scalar.return_value = None
+        self.session.get.return_value = None
+
+        assert self.db_dag_bag.get_dag("v1", session=self.session) is None
+        self.shared_cache.get.assert_not_called()
+
+
 class TestDBDagBagCache:
     """Tests for DBDagBag optional caching behavior."""
 
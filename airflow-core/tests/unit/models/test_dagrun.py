@@ -796,6 +796,25 @@ class TestDagRun:
         ti = dag_run.get_task_instance("test_short_circuit_false")
         assert ti is None
 
+    def test_fetch_task_instances_for_dag_runs(self, dag_maker, session):
+        with dag_maker(dag_id="test_fetch_task_instances_for_dag_runs", schedule="@daily", session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        dr1.get_task_instance("task_2", session=session).state = TaskInstanceState.SUCCESS
+        session.flush()
+
+        tis_by_run = DagRun.fetch_task_instances_for_dag_runs(
+            [dr1, dr2], state=[None, TaskInstanceState.SCHEDULED], session=session
+        )
+
+        assert {run_key: [ti.task_id for ti in tis] for run_key, tis in tis_by_run.items()} == {
+            (dr1.dag_id, dr1.run_id): ["task_1"],
+            (dr2.dag_id, dr2.run_id): ["task_1", "task_2"],
+        }
+        assert DagRun.fetch_task_instances_for_dag_runs([], session=session) == {}
+
     def test_get_latest_runs(self, dag_maker, session):
         with dag_maker(
             dag_id="test_latest_runs_1", schedule=datetime.timedelta(days=1), start_date=DEFAULT_DATE
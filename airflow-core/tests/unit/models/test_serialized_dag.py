@@ -26,6 +26,7 @@ from unittest import mock
 
 import pendulum
 import pytest
+from cachetools import LRUCache
 from sqlalchemy import delete, func, select, update
 
 import airflow.example_dags as example_dags_module
@@ -100,13 +101,16 @@ class TestSerializedDagModel:
         params=[
             pytest.param(False, id="raw-serialized_dags"),
             pytest.param(True, id="compress-serialized_dags"),
+            pytest.param("msgpack", id="msgpack-serialized_dags"),
         ],
     )
     def setup_test_cases(self, request, monkeypatch):
         db.clear_db_dags()
         db.clear_db_runs()
         db.clear_db_serialized_dags()
-        with conf_vars({("core", "compress_serialized_dags"): str(request.param)}):
+        if request.param == "msgpack":
+            monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "msgpack")
+        with conf_vars({("core", "compress_serialized_dags"): str(request.param is True)}):
             yield
         db.clear_db_serialized_dags()
 
@@ -771,6 +775,59 @@ class TestSerializedDagModel:
         assert did_write is False
         assert session.scalar(select(func.count()).select_from(DagVersion)) == 1
 
+    @pytest.mark.parametrize("storage_format", ["json", "msgpack"])
+    def test_lazy_access_to_dag_attributes(self, dag_maker, session, monkeypatch, storage_format):
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", storage_format)
+        with dag_maker("test_dag_lazy_access", bundle_name="bundleA") as dag:
+            EmptyOperator(task_id="task1") >> EmptyOperator(task_id="task2")
+        data = LazyDeserializedDAG.from_dag(dag).data
+
+        serialized_dag = SDM(LazyDeserializedDAG(data=data))
+        serialized_dag._SerializedDagModel__data_cache = None
+
+        def as_json(value):
+            # Tuples and enums in the serialized data are decoded as lists and strings, as from JSON
+            return json.loads(json.dumps(value))
+
+        assert as_json(serialized_dag.dag_attributes) == as_json(
+            {k: v for k, v in data["dag"].items() if k != "tasks"}
+        )
+        assert as_json(serialized_dag.data) == as_json(data)
+
+    def test_write_dag_reuses_hash_of_unchanged_structure(self, dag_maker, session):
+        """Re-writing a DAG whose structure is unchanged does not recompute the full hash."""
+        with dag_maker("test_dag_structure_unchanged", bundle_name="bundleA") as dag:
+            EmptyOperator(task_id="task1")
+
+        SDM.write_dag(LazyDeserializedDAG.from_dag(dag), bundle_name="bundleA", session=session)
+        with mock.patch.object(SDM, "hash", wraps=SDM.hash) as hash_mock:
+            did_write = SDM.write_dag(
+                LazyDeserializedDAG.from_dag(dag), bundle_name="bundleA", session=session
+            )
+            assert did_write is False
+            hash_mock.assert_not_called()
+
+            EmptyOperator(task_id="task2", dag=dag)
+            did_write = SDM.write_dag(
+                LazyDeserializedDAG.from_dag(dag), bundle_name="bundleA", session=session
+            )
+            assert did_write is True
+            hash_mock.assert_called_once()
+
+        serialized_dag = SDM.get(dag.dag_id, session=session)
+        assert serialized_dag.dag_hash == SDM.hash(serialized_dag.data)
+
+    def test_write_dag_keeps_bounded_structure_hashes(self):
+        """The structure hashes of the DAGs written by the process are kept in a bounded LRU cache."""
+        data = {"__version": 3, "dag": {"dag_id": "test_dag", "tasks": []}}
+        with mock.patch(
+            "airflow.models.serialized_dag._dag_hash_by_structure", LRUCache(maxsize=2)
+        ) as dag_hash_by_structure:
+            for dag_id in ("dag_1", "dag_2", "dag_3"):
+                SDM._hash_unless_unchanged(dag_id, data)
+
+            assert set(dag_hash_by_structure) == {"dag_2", "dag_3"}
+
     def test_hash_method_removes_fileloc_and_remains_consistent(self):
         """Test that the hash method removes fileloc before hashing."""
         test_data = {
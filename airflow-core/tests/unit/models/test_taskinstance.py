@@ -2547,6 +2547,17 @@ class TestTaskInstance:
         assert ti.start_date < ti.end_date
         assert ti.duration > 0
 
+    def test_state_changed_at_only_moves_with_state(self, create_task_instance, session):
+        ti = create_task_instance(state=State.QUEUED, session=session)
+        with time_machine.travel(DEFAULT_DATE, tick=False):
+            ti.state = State.RUNNING
+        assert ti.state_changed_at == DEFAULT_DATE
+
+        with time_machine.travel(DEFAULT_DATE + datetime.timedelta(minutes=1), tick=False):
+            ti.state = State.RUNNING
+            ti.last_heartbeat_at = timezone.utcnow()
+        assert ti.state_changed_at == DEFAULT_DATE
+
     def test_refresh_from_db(self, create_task_instance):
         run_date = timezone.utcnow()
         hybrid_props = ["rendered_map_index", "task_display_name"]
@@ -2584,6 +2595,7 @@ class TestTaskInstance:
             "next_kwargs": None,
             "next_method": None,
             "updated_at": None,
+            "state_changed_at": run_date + datetime.timedelta(hours=1, seconds=5),
             "task_display_name": "Test Refresh from DB Task",
             "dag_version_id": mock.ANY,
             "context_carrier": {},
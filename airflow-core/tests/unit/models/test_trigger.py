@@ -258,6 +258,53 @@ def test_submit_event_no_n_plus_one_for_assets(_, session, asset_count, expected
         Trigger.submit_event(trigger_id, TriggerEvent("payload"), session=session)
 
 
+@patch("airflow.models.trigger.AssetManager.register_asset_change")
+def test_submit_events(mock_register_asset_change, session, dag_maker):
+    """
+    Tests that a batch of events re-wakes the task instances of every trigger, each with the first
+    event its trigger fired, and notifies the assets of every event.
+    """
+    trigger1 = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    trigger2 = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([trigger1, trigger2])
+    session.flush()
+
+    with dag_maker(session=session):
+        EmptyOperator(task_id="waiting1")
+        EmptyOperator(task_id="waiting2")
+
+    dr = dag_maker.create_dagrun(logical_date=timezone.utcnow())
+    # Added after the Dag is synced, which would orphan the watcher of an asset it does not use
+    asset = AssetModel("test_submit_events")
+    asset.add_trigger(trigger2, "test_asset_watcher")
+    session.add(asset)
+    tis = {ti.task_id: ti for ti in dr.task_instances}
+    for task_id, trigger in (("waiting1", trigger1), ("waiting2", trigger2)):
+        tis[task_id].state = State.DEFERRED
+        tis[task_id].trigger_id = trigger.id
+        tis[task_id].next_kwargs = {}
+    session.commit()
+
+    Trigger.submit_events(
+        [
+            (trigger1.id, TriggerEvent("first")),
+            (trigger2.id, TriggerEvent("asset")),
+            (trigger1.id, TriggerEvent("second")),
+        ],
+        session=session,
+    )
+    session.flush()
+
+    for ti in tis.values():
+        session.refresh(ti)
+        assert ti.state == State.SCHEDULED
+        assert ti.trigger_id is None
+    assert tis["waiting1"].next_kwargs == {"event": "first"}
+    assert tis["waiting2"].next_kwargs == {"event": "asset"}
+    mock_register_asset_change.assert_called_once()
+    assert mock_register_asset_change.call_args.kwargs["extra"] == {"from_trigger": True, "payload": "asset"}
+
+
 @pytest.mark.parametrize(
     "stored_next_kwargs",
     [
@@ -737,6 +784,129 @@ def test_queue_column_max_len_matches_ti_column_max_len() -> None:
     assert trigger_queue_col_max_length == expected_queue_col_max_length_from_ti
 
 
+@pytest.mark.need_serialized_dag
+@pytest.mark.parametrize(
+    ("load_budget", "expected_assigned"),
+    [
+        pytest.param(0.25, 2, id="fits-two"),
+        pytest.param(0.05, 1, id="first-always-fits"),
+        pytest.param(0, 0, id="no-budget-left"),
+    ],
+)
+def test_assign_unassigned_with_load_budget(
+    session, create_triggerer, create_trigger, load_budget, expected_assigned
+):
+    time_now = timezone.utcnow()
+    triggerer = create_triggerer(session, State.RUNNING, latest_heartbeat=time_now)
+    session.commit()
+    triggers = [
+        create_trigger(
+            session=session, name=f"trigger_{i}", logical_date=time_now + datetime.timedelta(hours=i)
+        )
+        for i in range(3)
+    ]
+    session.commit()
+
+    Trigger.assign_unassigned(
+        triggerer.id,
+        capacity=100,
+        health_check_threshold=30,
+        load_budget=load_budget,
+        trigger_cost=lambda classpath: 0.1,
+    )
+
+    session.expire_all()
+    assigned = session.scalars(
+        select(Trigger.id).where(Trigger.id.in_(t.id for t in triggers), Trigger.triggerer_id == triggerer.id)
+    ).all()
+    assert len(assigned) == expected_assigned
+
+
+def test_release(session):
+    kept = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    released = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    other = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    kept.triggerer_id = released.triggerer_id = 1
+    other.triggerer_id = 2
+    session.add_all([kept, released, other])
+    session.commit()
+
+    Trigger.release([released.id, other.id], triggerer_id=1, session=session)
+
+    session.expire_all()
+    assert kept.triggerer_id == 1
+    assert released.triggerer_id is None
+    assert other.triggerer_id == 2
+
+
+def test_resume_expired_time_deferrals(session, create_task_instance):
+    from airflow.sdk.serde import deserialize
+
+    now = timezone.utcnow()
+    expired = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}, fire_at=now)
+    pending = Trigger(
+        classpath="airflow.triggers.testing.SuccessTrigger",
+        kwargs={},
+        fire_at=now + datetime.timedelta(hours=1),
+    )
+    untimed = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([expired, pending, untimed])
+    session.flush()
+    tis = {}
+    for trigger, task_id in ((expired, "expired"), (pending, "pending"), (untimed, "untimed")):
+        ti = create_task_instance(
+            dag_id=f"{task_id}_dag",
+            task_id=task_id,
+            run_id=f"{task_id}_run",
+            logical_date=now,
+            state=State.DEFERRED,
+            session=session,
+        )
+        ti.trigger_id = trigger.id
+        ti.next_kwargs = {"cheesecake": True}
+        tis[task_id] = ti
+    session.commit()
+    assert tis["expired"].state == State.DEFERRED
+
+    assert Trigger.resume_expired_time_deferrals(limit=10, session=session) == 1
+
+    # Task instances already loaded in the session see the bulk update
+    assert tis["expired"].state == State.SCHEDULED
+    assert tis["expired"].trigger_id is None
+    assert deserialize(tis["expired"].next_kwargs) == {"cheesecake": True, "event": now}
+    assert tis["pending"].state == State.DEFERRED
+    assert tis["untimed"].state == State.DEFERRED
+
+
+@pytest.mark.parametrize("resumed_by_scheduler", [True, False])
+def test_get_sorted_triggers_leaves_time_triggers_to_scheduler(
+    session, create_task_instance, resumed_by_scheduler
+):
+    timed = Trigger(
+        classpath="airflow.triggers.testing.SuccessTrigger",
+        kwargs={},
+        fire_at=timezone.utcnow() + datetime.timedelta(hours=1),
+    )
+    untimed = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([timed, untimed])
+    session.flush()
+    for trigger, task_id in ((timed, "timed"), (untimed, "untimed")):
+        ti = create_task_instance(task_id=task_id, run_id=f"{task_id}_run", session=session)
+        ti.trigger_id = trigger.id
+    session.commit()
+
+    with conf_vars({("scheduler", "resume_time_deferrals"): str(resumed_by_scheduler)}):
+        trigger_ids = [
+            trigger_id
+            for (trigger_id,) in Trigger.get_sorted_triggers(
+                capacity=10, alive_triggerer_ids=[], queues=None, session=session
+            )
+        ]
+
+    expected = [untimed.id] if resumed_by_scheduler else [timed.id, untimed.id]
+    assert sorted(trigger_ids) == sorted(expected)
+
+
 @pytest.mark.need_serialized_dag
 @pytest.mark.parametrize("use_queues", [False, True])
 def test_get_sorted_triggers_same_priority_weight(session, create_task_instance, use_queues: bool):
@@ -0,0 +1,80 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from sqlalchemy import text
+
+from airflow.observability.loop_profiler import LoopProfiler
+from airflow.utils.session import create_session
+
+pytestmark = pytest.mark.db_test
+
+
+class TestLoopProfiler:
+    def test_phases_and_queries_are_recorded(self):
+        profiler = LoopProfiler(metric_prefix="scheduler", history_size=2)
+        profiler.install()
+        try:
+            with profiler.loop(1):
+                with profiler.phase("outer"), create_session() as session:
+                    session.execute(text("SELECT 1"))
+                    with profiler.phase("inner"):
+                        session.execute(text("SELECT 1"))
+        finally:
+            profiler.uninstall()
+
+        (trace,) = profiler.traces
+        assert [phase.name for phase in trace.phases] == ["outer", "outer.inner"]
+        outer, inner = trace.phases
+        assert outer.queries >= 2
+        assert inner.queries == 1
+        assert outer.duration >= inner.duration
+
+    def test_history_is_bounded(self):
+        profiler = LoopProfiler(metric_prefix="scheduler", history_size=2)
+        for loop_number in range(1, 4):
+            with profiler.loop(loop_number), profiler.phase("work"):
+                pass
+
+        assert [trace.loop_number for trace in profiler.traces] == [2, 3]
+        assert profiler.summary()["work"]["count"] == 2
+
+    def test_phase_outside_loop_is_noop(self):
+        profiler = LoopProfiler(metric_prefix="scheduler", history_size=2)
+        with profiler.phase("work"):
+            pass
+        assert not profiler.traces
+
+    @mock.patch("airflow.observability.loop_profiler.stats")
+    def test_metrics_are_emitted_per_phase(self, mock_stats):
+        profiler = LoopProfiler(metric_prefix="scheduler", history_size=1)
+        with profiler.loop(1), profiler.phase("work"):
+            pass
+
+        mock_stats.timing.assert_called_once_with(
+            "scheduler.loop_phase_duration", mock.ANY, tags={"phase": "work"}
+        )
+        mock_stats.gauge.assert_has_calls(
+            [
+                mock.call("scheduler.loop_phase_queries", 0, tags={"phase": "work"}),
+                mock.call("scheduler.loop_phase_rows", 0, tags={"phase": "work"}),
+            ]
+        )
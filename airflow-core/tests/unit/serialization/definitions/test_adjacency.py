@@ -0,0 +1,84 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import DAG, TaskGroup, task
+from airflow.task.trigger_rule import TriggerRule
+
+from tests_common.test_utils.dag import create_scheduler_dag
+
+
+def _build_dag():
+    with DAG("test_adjacency") as dag:
+        setup = EmptyOperator(task_id="setup").as_setup()
+        a = EmptyOperator(task_id="a")
+        b = EmptyOperator(task_id="b", trigger_rule=TriggerRule.ONE_SUCCESS)
+        join = EmptyOperator(task_id="join", trigger_rule=TriggerRule.ALL_DONE)
+        setup >> a >> join
+        setup >> b >> join
+
+        @task
+        def double(x):
+            return x * 2
+
+        with TaskGroup("plain"):
+            mapped = double.expand(x=[1, 2])
+        join >> mapped
+    return create_scheduler_dag(dag)
+
+
+class TestTaskAdjacencyIndex:
+    def test_build(self):
+        dag = _build_dag()
+        index = dag.adjacency_index
+
+        assert len(index) == len(dag.task_dict)
+        for task_id, serialized_task in dag.task_dict.items():
+            position = index.positions[task_id]
+            assert index.task_ids[position] == task_id
+            assert {index.task_ids[u] for u in index.upstreams_of(position)} == set(
+                serialized_task.upstream_task_ids
+            )
+            assert index.upstream_count(position) == len(serialized_task.upstream_task_ids)
+
+        join = index.positions["join"]
+        assert index.upstream_setup_counts[join] == 0
+        assert index.upstream_setup_counts[index.positions["a"]] == 1
+        assert index.setup_flags[index.positions["setup"]]
+        assert not index.upstreams_need_expansion[join]
+
+        mapped = index.positions["plain.double"]
+        assert index.needs_expansion[mapped]
+        assert not index.in_mapped_task_group[mapped]
+
+    def test_cached_per_dag_object(self):
+        dag = _build_dag()
+        assert dag.adjacency_index is dag.adjacency_index
+
+    def test_partial_subset_builds_own_index(self):
+        dag = _build_dag()
+        full_index = dag.adjacency_index
+
+        subset = dag.partial_subset(task_ids=["a"], include_upstream=False, include_downstream=False)
+
+        assert subset.adjacency_index is not full_index
+        assert subset.adjacency_index.task_ids == tuple(subset.task_dict)
+        assert "join" not in subset.adjacency_index.positions
+        assert subset.adjacency_index.upstream_count(subset.adjacency_index.positions["a"]) == len(
+            subset.task_dict["a"].upstream_task_ids
+        )
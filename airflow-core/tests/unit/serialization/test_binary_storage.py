@@ -0,0 +1,71 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import zlib
+
+import pytest
+
+from airflow.serialization.binary_storage import (
+    BinarySerializedDag,
+    encode_serialized_dag,
+    is_binary_serialized_dag,
+)
+
+DAG_DATA = {
+    "__version": 3,
+    "dag": {
+        "dag_id": "test_dag",
+        "dag_dependencies": [],
+        "timetable": {"__type": "airflow.timetables.simple.NullTimetable", "__var": {}},
+        "tasks": [
+            {"__type": "operator", "__var": {"task_id": "task1", "retries": 1, "weight": 1.5}},
+            {"__type": "operator", "__var": {"task_id": "task2", "downstream_task_ids": ["task1"]}},
+        ],
+    },
+}
+
+
+class TestBinarySerializedDag:
+    def test_round_trip(self):
+        blob = encode_serialized_dag(DAG_DATA)
+
+        assert is_binary_serialized_dag(blob)
+        assert BinarySerializedDag(blob).to_dict() == DAG_DATA
+
+    def test_lazy_access(self):
+        binary_dag = BinarySerializedDag(encode_serialized_dag(DAG_DATA))
+
+        assert binary_dag.fields == {"__version": 3}
+        assert binary_dag.dag_fields == {k: v for k, v in DAG_DATA["dag"].items() if k != "tasks"}
+        assert binary_dag.task_ids == ["task1", "task2"]
+        assert binary_dag.get_task("task2") == DAG_DATA["dag"]["tasks"][1]
+        with pytest.raises(KeyError):
+            binary_dag.get_task("missing")
+
+    def test_compressed_json_is_not_binary(self):
+        blob = zlib.compress(json.dumps(DAG_DATA).encode())
+
+        assert not is_binary_serialized_dag(blob)
+        with pytest.raises(ValueError, match="Not a serialized DAG in the binary format"):
+            BinarySerializedDag(blob)
+
+    def test_integers_msgpack_cannot_represent(self):
+        with pytest.raises(OverflowError):
+            encode_serialized_dag({"dag": {"dag_id": "test_dag", "params": 2**70, "tasks": []}})
@@ -0,0 +1,89 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from airflow.serialization.shared_dag_cache import SharedSerializedDagCache
+
+DAG_DATA = {"__version": 3, "dag": {"dag_id": "test_dag", "tasks": [{"__var": {"task_id": "task1"}}]}}
+
+
+class TestSharedSerializedDagCache:
+    def test_put_and_get(self, tmp_path):
+        writer = SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
+        writer.put("v1", "hash1", DAG_DATA)
+
+        # Another worker on the same host.
+        reader = SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
+        assert reader.get("v1", "hash1") == DAG_DATA
+        assert reader.get("v1", "hash2") is None
+        assert reader.get("v2", "hash1") is None
+
+    def test_put_replaces_previous_hash_of_version(self, tmp_path):
+        cache = SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
+        cache.put("v1", "hash1", DAG_DATA)
+        cache.put("v1", "hash2", {**DAG_DATA, "__version": 4})
+
+        assert cache.get("v1", "hash1") is None
+        assert cache.get("v1", "hash2") == {**DAG_DATA, "__version": 4}
+        assert sorted(os.listdir(tmp_path / "cache")) == ["v1-hash2.msgpack"]
+
+    def test_oldest_entries_are_evicted(self, tmp_path):
+        cache = SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
+        cache.put("v1", "hash1", DAG_DATA)
+        os.utime(tmp_path / "cache" / "v1-hash1.msgpack", (0, 0))
+        cache.max_size = os.path.getsize(tmp_path / "cache" / "v1-hash1.msgpack")
+        cache.put("v2", "hash1", DAG_DATA)
+
+        assert cache.get("v1", "hash1") is None
+        assert cache.get("v2", "hash1") == DAG_DATA
+
+    def test_unencodable_data_is_not_stored(self, tmp_path):
+        cache = SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
+        cache.put("v1", "hash1", {"dag": {"params": 2**70}})
+
+        assert cache.get("v1", "hash1") is None
+        assert os.listdir(tmp_path / "cache") == []
+
+    def test_creates_private_directory(self, tmp_path):
+        SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
+
+        assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+
+    def test_refuses_directory_open_to_other_users(self, tmp_path):
+        (tmp_path / "cache").mkdir(mode=0o700)
+        (tmp_path / "cache").chmod(0o777)
+
+        with pytest.raises(PermissionError, match="can be accessed by other users"):
+            SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
+
+    def test_refuses_symlink(self, tmp_path):
+        (tmp_path / "target").mkdir(mode=0o700)
+        (tmp_path / "cache").symlink_to(tmp_path / "target")
+
+        with pytest.raises(PermissionError, match="is not a directory"):
+            SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
+
+    def test_refuses_directory_of_another_user(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(os, "geteuid", lambda: os.stat(tmp_path).st_uid + 1)
+
+        with pytest.raises(PermissionError, match="is not owned by the current user"):
+            SharedSerializedDagCache(tmp_path / "cache", max_size=1024 * 1024)
@@ -0,0 +1,78 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from airflow.serialization.structure_hash import DagStructureHash
+
+
+@pytest.fixture
+def dag_data():
+    return {
+        "__version": 3,
+        "dag": {
+            "dag_id": "test_dag",
+            "fileloc": "/path/to/dag.py",
+            "bundle_name": "bundle_a",
+            "timetable": {"__type": "airflow.timetables.simple.NullTimetable", "__var": {}},
+            "tasks": [
+                {"__type": "operator", "__var": {"task_id": "task1", "retries": 1}},
+                {"__type": "operator", "__var": {"task_id": "task2", "retries": 1}},
+            ],
+        },
+    }
+
+
+class TestDagStructureHash:
+    def test_same_content_same_root(self, dag_data):
+        assert DagStructureHash.from_data(dag_data) == DagStructureHash.from_data(copy.deepcopy(dag_data))
+
+    @pytest.mark.parametrize("key", ["fileloc", "bundle_name"])
+    def test_ignored_keys(self, dag_data, key):
+        before = DagStructureHash.from_data(dag_data)
+        dag_data["dag"][key] = "changed"
+
+        assert DagStructureHash.from_data(dag_data).root == before.root
+
+    def test_changed_task(self, dag_data):
+        before = DagStructureHash.from_data(dag_data)
+        dag_data["dag"]["tasks"][1]["__var"]["retries"] = 2
+        after = DagStructureHash.from_data(dag_data)
+
+        assert after.root != before.root
+        assert after.changed_tasks(before) == {"task2"}
+        assert after.changed_sections(before) == set()
+
+    def test_added_and_removed_tasks(self, dag_data):
+        before = DagStructureHash.from_data(dag_data)
+        dag_data["dag"]["tasks"][0] = {"__type": "operator", "__var": {"task_id": "task3"}}
+        after = DagStructureHash.from_data(dag_data)
+
+        assert after.changed_tasks(before) == {"task1", "task3"}
+
+    def test_changed_section(self, dag_data):
+        before = DagStructureHash.from_data(dag_data)
+        dag_data["dag"]["timetable"]["__var"] = {"interval": 60}
+        after = DagStructureHash.from_data(dag_data)
+
+        assert after.root != before.root
+        assert after.changed_sections(before) == {"dag.timetable"}
+        assert after.changed_tasks(before) == set()
@@ -94,6 +94,7 @@ def get_task_instance(monkeypatch, session, dag_maker):
             success_setup=success_setup,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: fake_upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "from_state_counts", lambda *_: fake_upstream_states)
 
         return ti
 
@@ -1415,6 +1416,39 @@ class TestTriggerRuleDep:
         dr.update_state(session=session)
         assert dr.state == DagRunState.SUCCESS
 
+    def test_UpstreamTIStates_from_state_counts(self, session, dag_maker):
+        """The per-task state counts memoized on the DepContext give the same result as ``calculate``."""
+        with dag_maker(session=session):
+            setup = EmptyOperator(task_id="setup").as_setup()
+            op1 = EmptyOperator(task_id="op1")
+            op2 = EmptyOperator(task_id="op2")
+            op3 = EmptyOperator(task_id="op3", trigger_rule=TriggerRule.ONE_FAILED)
+
+            setup >> (op1, op2) >> op3
+
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.task_instances}
+        tis["setup"].state = SUCCESS
+        tis["op1"].state = FAILED
+        tis["op2"].state = SKIPPED
+        finished_tis = [tis["setup"], tis["op1"], tis["op2"]]
+
+        dep_context = DepContext(finished_tis=finished_tis)
+        state_counts = dep_context.ensure_finished_ti_state_counts(dr, session=session)
+        assert dep_context.ensure_finished_ti_state_counts(dr, session=session) is state_counts
+
+        serialized_dag = dag_maker.serialized_dag
+        index = serialized_dag.adjacency_index
+        for task_id in ("op1", "op3"):
+            position = index.positions[task_id]
+            upstream_ids = serialized_dag.task_dict[task_id].upstream_task_ids
+            expected = _UpstreamTIStates.calculate(ti for ti in finished_tis if ti.task_id in upstream_ids)
+            actual = _UpstreamTIStates.from_state_counts(
+                state_counts,
+                ((index.task_ids[u], bool(index.setup_flags[u])) for u in index.upstreams_of(position)),
+            )
+            assert actual == expected
+
     @pytest.mark.parametrize(("flag_upstream_failed", "expected_ti_state"), [(True, REMOVED), (False, None)])
     def test_mapped_task_upstream_removed_with_all_success_trigger_rules(
         self,
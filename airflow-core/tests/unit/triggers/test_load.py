@@ -0,0 +1,113 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from airflow.triggers.load import LoopLagHistogram, TimedCoroutine, TriggerLoadTracker
+
+
+class TestTimedCoroutine:
+    @pytest.mark.asyncio
+    async def test_measures_loop_time_not_waiting_time(self):
+        async def busy_then_idle():
+            busy_until = time.perf_counter() + 0.05
+            while time.perf_counter() < busy_until:
+                pass
+            await asyncio.sleep(0.1)
+            return "done"
+
+        coro = TimedCoroutine(busy_then_idle())
+
+        assert await asyncio.create_task(coro) == "done"
+        assert 0.05 <= coro.loop_time < 0.1
+
+    @pytest.mark.asyncio
+    async def test_measures_cancelled_coroutine(self):
+        async def forever():
+            await asyncio.Event().wait()
+
+        coro = TimedCoroutine(forever())
+        task = asyncio.create_task(coro)
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert coro.loop_time > 0
+
+
+class TestTriggerLoadTracker:
+    def test_cost_and_event_rate(self):
+        tracker = TriggerLoadTracker()
+        tracker.add(1, "a.Trigger", movable=True, now=0)
+        tracker.record_event(1)
+
+        tracker.record_loop_time({1: 2.0}, now=10)
+
+        assert tracker.cost(1) == pytest.approx(0.2)
+        assert tracker.event_rate(1, now=10) == pytest.approx(0.1)
+
+    def test_unmeasured_triggers_are_estimated_by_class(self):
+        tracker = TriggerLoadTracker()
+        assert tracker.class_cost("a.Trigger") == 0
+
+        tracker.add(1, "a.Trigger", movable=True, now=0)
+        tracker.add(2, "b.Trigger", movable=True, now=0)
+        tracker.record_loop_time({1: 1.0, 2: 3.0}, now=10)
+        tracker.remove(1)
+        tracker.add(3, "a.Trigger", movable=True, now=10)
+
+        assert tracker.cost(3) == pytest.approx(0.1)
+        assert tracker.class_cost("c.Trigger") == pytest.approx(0.2)
+        assert tracker.total_cost() == pytest.approx(0.4)
+
+    def test_triggers_to_move_picks_costliest_movable_triggers(self):
+        tracker = TriggerLoadTracker()
+        tracker.add(1, "a.Trigger", movable=True, now=0)
+        tracker.add(2, "a.Trigger", movable=True, now=0)
+        tracker.add(3, "a.Trigger", movable=True, now=0)
+        tracker.add(4, "watcher.Trigger", movable=False, now=0)
+        tracker.record_loop_time({1: 1.0, 2: 3.0, 3: 2.0, 4: 5.0}, now=10)
+
+        assert tracker.triggers_to_move(budget=2.0) == []
+        assert tracker.triggers_to_move(budget=0.8) == [2]
+        assert tracker.triggers_to_move(budget=0.7) == [2, 3]
+        assert tracker.triggers_to_move(budget=0.6, exclude=[2]) == [3]
+
+
+class TestLoopLagHistogram:
+    def test_record_and_reset(self):
+        histogram = LoopLagHistogram()
+        for lag in (0.0, 0.0005, 0.003, 0.2, 7.0):
+            histogram.record(lag)
+
+        assert len(histogram) == 5
+        assert histogram.max == 7.0
+        buckets = histogram.buckets()
+        assert buckets["<=1ms"] == 2
+        assert buckets["<=5ms"] == 1
+        assert buckets["<=500ms"] == 1
+        assert buckets[">5000ms"] == 1
+
+        histogram.reset()
+        assert len(histogram) == 0
+        assert histogram.max == 0.0
@@ -17,9 +17,14 @@
 # under the License.
 from __future__ import annotations
 
+import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from airflow._shared.logging.archive import LogArchive, archive_log
 from airflow.utils.log.file_task_handler import FileTaskHandler
 from airflow.utils.state import TaskInstanceState
 
@@ -294,3 +299,138 @@ class TestFileTaskHandlerExecutorLogs:
             "legacy log",
         ]
         assert metadata == {"end_of_log": False, "log_pos": 1}
+
+
+class TestFileTaskHandlerIndexedLocalRead:
+    """Tests for reading finished tasks' local logs through their index."""
+
+    START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def handler(self, tmp_path):
+        log_file = tmp_path / "dag" / "run" / "task" / "1.log"
+        log_file.parent.mkdir(parents=True)
+        log_file.write_text("".join(self._log_line(i) for i in range(10)))
+        self.log_file = log_file
+        handler = FileTaskHandler(base_log_folder=str(tmp_path))
+        with (
+            patch.object(handler, "_render_filename", return_value="dag/run/task/1.log"),
+            patch.object(handler, "_read_remote_logs", side_effect=NotImplementedError),
+            patch.object(handler, "_read_from_logs_server") as read_from_logs_server,
+        ):
+            yield handler
+        read_from_logs_server.assert_not_called()
+
+    @pytest.fixture
+    def ti(self):
+        ti = MagicMock()
+        ti.state = TaskInstanceState.SUCCESS
+        ti.try_number = 1
+        return ti
+
+    def _log_line(self, number: int) -> str:
+        timestamp = (self.START + timedelta(seconds=number)).isoformat()
+        return json.dumps({"timestamp": timestamp, "event": f"line {number}"}) + "\n"
+
+    def test_reads_whole_log(self, handler, ti):
+        logs, metadata = handler._read(ti=ti, try_number=1)
+
+        assert extract_events(logs, skip_source_info=False) == [
+            "::group::Log message source details",
+            str(self.log_file),
+            "::endgroup::",
+            *(f"line {i}" for i in range(10)),
+        ]
+        assert metadata == {
+            "end_of_log": True,
+            "log_pos": 10,
+            "log_offsets": {str(self.log_file): self.log_file.stat().st_size},
+        }
+
+    def test_reads_tail_lines(self, handler, ti):
+        logs, metadata = handler._read(ti=ti, try_number=1, metadata={"end_of_log": False, "tail_lines": 3})
+
+        assert extract_events(logs) == ["line 7", "line 8", "line 9"]
+        assert metadata["log_pos"] == 10
+
+    def test_reads_since(self, handler, ti):
+        since = (self.START + timedelta(seconds=6)).isoformat()
+
+        logs, _ = handler._read(ti=ti, try_number=1, metadata={"end_of_log": False, "since": since})
+
+        assert extract_events(logs) == ["line 6", "line 7", "line 8", "line 9"]
+
+    def test_resumes_from_log_offsets(self, handler, ti):
+        _, metadata = handler._read(ti=ti, try_number=1)
+        with self.log_file.open("a") as f:
+            f.write(self._log_line(10))
+            # A finished task won't complete its last line, so it is read as well.
+            f.write('{"event": "line 11"}')
+
+        logs, metadata = handler._read(ti=ti, try_number=1, metadata=metadata)
+
+        assert extract_events(logs, skip_source_info=False) == ["line 10", "line 11"]
+        assert metadata == {
+            "end_of_log": True,
+            "log_pos": 12,
+            "log_offsets": {str(self.log_file): self.log_file.stat().st_size},
+        }
+
+    def test_running_task_is_not_read_through_index(self, handler, ti):
+        ti.state = TaskInstanceState.RUNNING
+        with (
+            patch.object(handler, "_get_executor") as get_executor,
+            patch.object(handler, "_read_from_local_indexed") as read_from_local_indexed,
+        ):
+            get_executor.return_value.get_streaming_task_log.return_value = (
+                ["executor"],
+                [convert_list_to_stream(["executor log"])],
+            )
+            handler._read(ti=ti, try_number=1)
+
+        read_from_local_indexed.assert_not_called()
+
+    def test_reads_archived_log(self, handler, ti):
+        archive_path = archive_log(self.log_file, block_size=100)
+
+        logs, metadata = handler._read(ti=ti, try_number=1, metadata={"end_of_log": False, "tail_lines": 3})
+
+        assert extract_events(logs, skip_source_info=False) == [
+            "::group::Log message source details",
+            str(archive_path),
+            "::endgroup::",
+            "line 7",
+            "line 8",
+            "line 9",
+        ]
+        assert metadata["log_offsets"] == {str(archive_path): LogArchive.load(archive_path).size}
+
+    def test_resumes_from_log_file_offset_after_archiving(self, handler, ti):
+        _, metadata = handler._read(ti=ti, try_number=1)
+        with self.log_file.open("a") as f:
+            f.write(self._log_line(10))
+        archive_log(self.log_file, block_size=100)
+
+        logs, metadata = handler._read(ti=ti, try_number=1, metadata=metadata)
+
+        assert extract_events(logs) == ["line 10"]
+        assert metadata["log_pos"] == 11
+
+    def test_reads_archived_log_from_local(self, handler, ti):
+        archive_path = archive_log(self.log_file)
+
+        log_source_info, log_streams = handler._read_from_local(self.log_file)
+
+        assert log_source_info == [str(archive_path)]
+        assert [json.loads(line)["event"] for line in log_streams[0]] == [f"line {i}" for i in range(10)]
+
+    def test_skips_archive_until_log_file_is_removed(self, handler, ti):
+        content = self.log_file.read_bytes()
+        archive_log(self.log_file)
+        # As between archive_log publishing the archive and removing the log file.
+        self.log_file.write_bytes(content)
+
+        log_source_info, log_streams = handler._read_from_local(self.log_file)
+
+        assert log_source_info == [str(self.log_file)]
+        assert [json.loads(line)["event"] for line in log_streams[0]] == [f"line {i}" for i in range(10)]
@@ -0,0 +1,126 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+
+from airflow.utils.log import log_index
+from airflow.utils.log.log_index import LogIndex, index_path_for
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _log_line(number: int) -> str:
+    timestamp = (START + timedelta(seconds=number)).isoformat()
+    return json.dumps({"timestamp": timestamp, "event": f"line {number}"}) + "\n"
+
+
+@pytest.fixture(autouse=True)
+def small_interval():
+    with mock.patch.object(log_index, "INDEX_INTERVAL", 10):
+        yield
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "attempt=1.log"
+    path.write_text("".join(_log_line(i) for i in range(95)))
+    return path
+
+
+class TestLogIndex:
+    def test_load_builds_index_and_sidecar(self, log_file):
+        index = LogIndex.load(log_file)
+
+        assert index.lines == 95
+        assert index.size == log_file.stat().st_size
+        assert [line for line, _, _ in index.checkpoints] == list(range(0, 95, 10))
+        assert index_path_for(log_file).name == ".attempt=1.log.idx"
+        assert index_path_for(log_file).exists()
+        # The sidecar must not match the glob for the log file and its backups.
+        assert list(log_file.parent.glob(log_file.name + "*")) == [log_file]
+
+    def test_load_reuses_sidecar(self, log_file):
+        LogIndex.load(log_file)
+        with mock.patch.object(LogIndex, "_index_block") as index_block:
+            index = LogIndex.load(log_file)
+
+        index_block.assert_not_called()
+        assert index.lines == 95
+
+    def test_update_indexes_appended_lines_only(self, log_file):
+        index = LogIndex.load(log_file)
+        with log_file.open("a") as f:
+            f.writelines(_log_line(i) for i in range(95, 120))
+            f.write('{"event": "partial')
+
+        index.update()
+
+        assert index.lines == 120
+        assert [line for line, _, _ in index.checkpoints] == list(range(0, 120, 10))
+        assert index.size < index.file_size == log_file.stat().st_size
+        assert list(index.read_lines(index.offset_of_line(118))) == [
+            _log_line(118).rstrip("\n"),
+            _log_line(119).rstrip("\n"),
+        ]
+        assert list(index.read_lines(index.offset_of_line(119), index.file_size))[-1] == '{"event": "partial'
+
+    def test_update_resets_on_truncation(self, log_file):
+        index = LogIndex.load(log_file)
+        log_file.write_text(_log_line(0))
+
+        index.update()
+
+        assert index.lines == 1
+        assert index.checkpoints == [(0, 0, START.timestamp())]
+
+    @pytest.mark.parametrize("line", [0, 1, 10, 37, 94])
+    def test_offset_of_line(self, log_file, line):
+        index = LogIndex.load(log_file)
+
+        offset = index.offset_of_line(line)
+
+        assert offset == len("".join(_log_line(i) for i in range(line)))
+        assert index.line_of_offset(offset) == line
+        assert next(index.read_lines(offset)) == _log_line(line).rstrip("\n")
+
+    def test_offset_of_line_past_the_end(self, log_file):
+        index = LogIndex.load(log_file)
+
+        assert index.offset_of_line(200) == index.size
+        assert list(index.read_lines(index.size)) == []
+
+    def test_offset_of_time(self, log_file):
+        index = LogIndex.load(log_file)
+
+        offset = index.offset_of_time(START + timedelta(seconds=42))
+
+        lines = list(index.read_lines(offset))
+        assert lines[0] == _log_line(40).rstrip("\n")
+        assert lines[-1] == _log_line(94).rstrip("\n")
+
+    def test_unwritable_sidecar_is_ignored(self, log_file):
+        with mock.patch.object(log_index.tempfile, "mkstemp", side_effect=PermissionError):
+            index = LogIndex.load(log_file)
+
+        assert index.lines == 95
+        assert not index_path_for(log_file).exists()
@@ -20,6 +20,7 @@ from __future__ import annotations
 import heapq
 import io
 import itertools
+import json
 import logging
 import os
 from http import HTTPStatus
@@ -38,6 +39,7 @@ from requests.adapters import Response
 from sqlalchemy import delete, select
 
 from airflow import settings
+from airflow._shared.timezones.timezone import coerce_datetime
 from airflow.config_templates.airflow_local_settings import DEFAULT_LOGGING_CONFIG
 from airflow.executors import executor_constants, executor_loader
 from airflow.jobs.job import Job
@@ -1145,6 +1147,66 @@ def test__log_stream_to_parsed_log_stream():
     ]
 
 
+@pytest.mark.parametrize(
+    "line",
+    [
+        pytest.param(
+            '{"timestamp": "2024-01-01T00:00:00.123456Z", "event": "hello", "level": "info", "logger": "task"}',
+            id="utc",
+        ),
+        pytest.param(
+            '{"timestamp": "2024-01-01T00:00:00+02:00", "event": "hello", "extra": {"a": [1, 2]}}',
+            id="offset_and_nested_extra",
+        ),
+        pytest.param('{"event": "no timestamp", "level": "warning"}', id="no_timestamp"),
+        pytest.param('{"timestamp": 1704067200, "event": "numeric timestamp"}', id="numeric_timestamp"),
+    ],
+)
+def test__log_stream_to_parsed_log_stream_matches_validated_messages(line):
+    ((timestamp, idx, log),) = _log_stream_to_parsed_log_stream(convert_list_to_stream([line]))
+
+    # What the line was parsed into before, by validating it
+    expected = StructuredLogMessage.model_validate_json(line)
+    if expected.timestamp:
+        expected.timestamp = coerce_datetime(expected.timestamp)
+    assert idx == 0
+    assert timestamp == expected.timestamp
+    assert log.model_dump() == expected.model_dump()
+    assert json.loads(log.model_dump_json()) == json.loads(expected.model_dump_json())
+
+
+@mock.patch("airflow.utils.log.file_task_handler.DECODE_BATCH_SIZE", 2)
+def test__log_stream_to_parsed_log_stream_mixed_lines():
+    lines = [
+        '{"timestamp": "2024-01-01T00:00:01Z", "event": "first"}',
+        "",
+        "[2024-01-01T00:00:02.000+0000] {taskinstance.py:1} INFO - plain",
+        "Traceback (most recent call last):",
+        '{"event": "no timestamp"}',
+        '{"timestamp": "2024-01-01T00:00:03Z", "event": "last", "lineno": 3}',
+    ]
+
+    parsed = list(_log_stream_to_parsed_log_stream(convert_list_to_stream(lines)))
+
+    assert [(idx, log.event) for _, idx, log in parsed] == [
+        (0, "first"),
+        (2, lines[2]),
+        (3, lines[3]),
+        (4, "no timestamp"),
+        (5, "last"),
+    ]
+    assert [log.timestamp for _, _, log in parsed] == [
+        pendulum.datetime(2024, 1, 1, 0, 0, 1),
+        pendulum.datetime(2024, 1, 1, 0, 0, 2),
+        # A plain line without a timestamp gets the one of the last plain line
+        pendulum.datetime(2024, 1, 1, 0, 0, 2),
+        None,
+        pendulum.datetime(2024, 1, 1, 0, 0, 3),
+    ]
+    assert [timestamp for timestamp, _, _ in parsed][3] == pendulum.datetime(2024, 1, 1, 0, 0, 2)
+    assert parsed[4][2].model_extra == {"lineno": 3}
+
+
 def test__create_sort_key():
     # assert _sort_key should return int
     sort_key = _create_sort_key(pendulum.parse("2022-11-16T00:05:54.278000-08:00"), 10)
@@ -24,6 +24,7 @@ import pytest
 import time_machine
 from fastapi.testclient import TestClient
 
+from airflow._shared.logging.archive import archive_log
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.auth.tokens import JWTGenerator
 from airflow.config_templates.airflow_local_settings import DEFAULT_LOGGING_CONFIG
@@ -252,3 +253,36 @@ class TestServeLogs:
             ).status_code
             == 403
         )
+
+
+class TestServeArchivedLogs:
+    @pytest.fixture(autouse=True)
+    def archived_log(self, tmp_path):
+        log = tmp_path.joinpath("sample.log")
+        log.write_text(LOG_DATA + "\n")
+        archive_log(log, block_size=64)
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "content_encoding"),
+        [("gzip, deflate", "gzip"), ("identity", None)],
+    )
+    def test_should_serve_archive_in_place_of_log(
+        self, client_without_config: TestClient, jwt_generator, accept_encoding, content_encoding
+    ):
+        response = client_without_config.get(
+            "/log/sample.log",
+            headers={
+                "Authorization": jwt_generator.generate({"filename": "sample.log"}),
+                "Accept-Encoding": accept_encoding,
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers.get("Content-Encoding") == content_encoding
+        assert response.text == LOG_DATA + "\n"
+
+    def test_should_not_serve_missing_log(self, client_without_config: TestClient, jwt_generator):
+        response = client_without_config.get(
+            "/log/missing.log",
+            headers={"Authorization": jwt_generator.generate({"filename": "missing.log"})},
+        )
+        assert response.status_code == 404
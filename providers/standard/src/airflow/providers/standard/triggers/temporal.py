@@ -57,6 +57,12 @@ class DateTimeTrigger(BaseTrigger):
             {"moment": self.moment, "end_from_trigger": self.end_from_trigger},
         )
 
+    def timer_event(self) -> tuple[datetime.datetime, TriggerEvent]:
+        """Fire from the shared timer of the triggerer, on triggerers that support it."""
+        if self.end_from_trigger:
+            return self.moment, TaskSuccessEvent()
+        return self.moment, TriggerEvent(self.moment)
+
     async def run(self) -> AsyncIterator[TriggerEvent]:
         """
         Loop until the relevant time is met.
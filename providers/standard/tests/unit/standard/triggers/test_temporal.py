@@ -145,3 +145,17 @@ async def test_datetime_trigger_mocked(mock_sleep, mock_utcnow):
     result = trigger_task.result()
     assert isinstance(result, TriggerEvent)
     assert result.payload == trigger_moment
+
+
+@pytest.mark.parametrize("end_from_trigger", [True, False])
+def test_datetime_trigger_timer_event(end_from_trigger):
+    """
+    Tests that the DateTimeTrigger hands its moment and event to the shared timer of the triggerer.
+    """
+    moment = pendulum.instance(datetime.datetime(2020, 4, 1, 13, 0), pendulum.UTC)
+    trigger = DateTimeTrigger(moment, end_from_trigger=end_from_trigger)
+
+    fire_at, event = trigger.timer_event()
+
+    assert fire_at == moment
+    assert event.payload == (TaskInstanceState.SUCCESS if end_from_trigger else moment)
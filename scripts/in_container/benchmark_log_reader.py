@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark script to measure how many task log lines per second the API server can render.
+
+This script:
+1. Writes a structured task log and a trigger log of the same task to a temporary log folder
+2. Reads them through ``TaskLogReader.read_log_stream``, which merges both files into one stream
+   of JSON lines, as the log endpoint of the API server does
+3. Reports the lines rendered per second, with the fast decoder of structured log lines and with
+   every line validated by pydantic
+
+Usage: benchmark_log_reader.py [NUMBER_OF_LINES]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from airflow.utils.log import file_task_handler
+from airflow.utils.log.file_task_handler import FileTaskHandler
+from airflow.utils.log.log_reader import TaskLogReader
+from airflow.utils.state import TaskInstanceState
+
+LOG_PATH = "dag_id=benchmark/run_id=run/task_id=task/attempt=1.log"
+
+
+class BenchmarkFileTaskHandler(FileTaskHandler):
+    """File task handler reading a fixed log path, so no Dag run is needed to render it."""
+
+    def _render_filename(self, ti, try_number, session=None) -> str:
+        return LOG_PATH
+
+
+def write_log(path: Path, lines: int, start: datetime, logger: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        for i in range(lines):
+            record = {
+                "timestamp": (start + timedelta(milliseconds=i)).isoformat(),
+                "level": "info",
+                "event": f"Processed record {i} of the batch",
+                "logger": logger,
+                "filename": "benchmark.py",
+                "lineno": i % 500,
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+def render(base_log_folder: str) -> tuple[int, float]:
+    """Render the task log and return the number of lines and the seconds it took."""
+    reader = TaskLogReader()
+    # log_handler is a cached property; set it instead of configuring logging.
+    reader.log_handler = BenchmarkFileTaskHandler(base_log_folder=base_log_folder)
+    ti = SimpleNamespace(state=TaskInstanceState.SUCCESS, try_number=1)
+    start = time.perf_counter()
+    rendered = sum(1 for _ in reader.read_log_stream(ti=ti, try_number=1, metadata={}))
+    return rendered, time.perf_counter() - start
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with tempfile.TemporaryDirectory() as base_log_folder:
+        log_path = Path(base_log_folder, LOG_PATH)
+        write_log(log_path, lines // 2, start, "airflow.task")
+        write_log(Path(f"{log_path}.trigger.1.log"), lines // 2, start, "airflow.triggers")
+
+        print("| Decoder | Lines | Seconds | Lines/s |")
+        print("|---------|-------|---------|---------|")
+        for mode in ("msgspec", "pydantic"):
+            if mode == "pydantic":
+                # Leave every line to StructuredLogMessage.model_validate_json, as before the fast decoder.
+                patch = mock.patch.object(file_task_handler, "_structured_log_from_dict", return_value=None)
+            else:
+                patch = nullcontext()
+            with patch:
+                rendered, seconds = render(base_log_folder)
+            print(f"| {mode} | {rendered} | {seconds:.2f} | {rendered / seconds:,.0f} |")
+
+
+if __name__ == "__main__":
+    main()
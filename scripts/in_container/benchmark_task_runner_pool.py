@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark script to measure the throughput of short tasks with and without the task runner pool.
+
+This script:
+1. Writes a Dag of short tasks to a temporary Dag bundle
+2. Runs its tasks one after the other through the task supervisor, with a dry-run API client,
+   first forking every task process from the supervisor, then from the task runner pool
+3. Reports the tasks run per second and the median time of a task in each mode
+
+Usage: benchmark_task_runner_pool.py [NUMBER_OF_TASKS]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+DAG_ID = "test_dag"
+
+DAG_FILE = textwrap.dedent(
+    f"""
+    from airflow.sdk import DAG
+    from airflow.providers.standard.operators.empty import EmptyOperator
+
+    with DAG("{DAG_ID}", schedule=None):
+        EmptyOperator(task_id="task")
+    """
+)
+
+RUN_TASKS = textwrap.dedent(
+    f"""
+    import json
+    import sys
+    import time
+
+    import httpx
+    from uuid6 import uuid7
+
+    from airflow.executors.workloads import BundleInfo
+    from airflow.sdk.api.client import Client, noop_handler
+    from airflow.sdk.api.datamodels._generated import TaskInstance
+    from airflow.sdk.execution_time.supervisor import supervise_task
+
+    DAG_RUN = {{
+        "dag_id": "{DAG_ID}",
+        "run_id": "run",
+        "logical_date": None,
+        "data_interval_start": None,
+        "data_interval_end": None,
+        "run_after": "2021-01-01T00:00:00Z",
+        "start_date": "2021-01-01T00:00:00Z",
+        "end_date": None,
+        "run_type": "manual",
+        "state": "running",
+        "consumed_asset_events": [],
+        "partition_key": None,
+    }}
+
+
+    def handler(request):
+        if request.url.path.endswith("/run"):
+            return httpx.Response(200, json={{"dag_run": DAG_RUN, "max_tries": 0}})
+        return noop_handler(request)
+
+
+    durations = []
+    for _ in range(int(sys.argv[1])):
+        ti = TaskInstance(
+            id=uuid7(),
+            task_id="task",
+            dag_id="{DAG_ID}",
+            run_id="run",
+            try_number=1,
+            dag_version_id=uuid7(),
+        )
+        start = time.perf_counter()
+        exit_code = supervise_task(
+            ti=ti,
+            bundle_info=BundleInfo(name="benchmark", version=None),
+            dag_rel_path="benchmark_dag.py",
+            token="",
+            client=Client(base_url="", dry_run=True, token="", transport=httpx.MockTransport(handler)),
+        )
+        durations.append(time.perf_counter() - start)
+        if exit_code != 0:
+            sys.exit(f"Task exited with {{exit_code}}")
+    print(json.dumps(durations))
+    """
+)
+
+
+def run_tasks(dags_folder: Path, tasks: int, pool_size: int) -> list[float]:
+    """Run the tasks in a new interpreter and return the duration of each task."""
+    bundle_config = [
+        {
+            "name": "benchmark",
+            "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+            "kwargs": {"path": str(dags_folder)},
+        }
+    ]
+    env = {
+        **os.environ,
+        "AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(bundle_config),
+        "AIRFLOW__WORKERS__TASK_RUNNER_POOL_SIZE": str(pool_size),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", RUN_TASKS, str(tasks)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        sys.exit(f"Running the tasks failed with exit code {result.returncode}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as dags_folder:
+        Path(dags_folder, "benchmark_dag.py").write_text(DAG_FILE)
+
+        print("| Mode | Tasks | Tasks/s | Median task (ms) |")
+        print("|------|-------|---------|------------------|")
+        for mode, pool_size in (("Fork from supervisor", 0), ("Task runner pool", 1)):
+            durations = run_tasks(Path(dags_folder), tasks, pool_size)
+            print(
+                f"| {mode} | {tasks} | {tasks / sum(durations):.1f} "
+                f"| {statistics.median(durations) * 1000:.1f} |"
+            )
+
+
+if __name__ == "__main__":
+    main()
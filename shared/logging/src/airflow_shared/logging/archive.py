@@ -0,0 +1,332 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Block-compressed archives of task log files.
+
+An archive is a gzip file made of several gzip members, each holding a block of whole lines of the
+log. Any gzip reader reads it as one stream, so it can be sent as is to HTTP clients accepting the
+``gzip`` content encoding. A seek table of the blocks, kept in a hidden sidecar file, lets readers
+start decompressing at the block holding a given line, byte offset or time.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import zlib
+from collections.abc import Generator, Iterator
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ARCHIVE_SUFFIX",
+    "LogArchive",
+    "archive_log",
+    "is_log_archive",
+    "parse_line_timestamp",
+]
+
+ARCHIVE_SUFFIX = ".gz"
+
+BLOCK_SIZE = 1024 * 1024
+"""Size of the uncompressed lines in one block of an archive."""
+
+ARCHIVE_INDEX_VERSION = 1
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_READ_SIZE = 256 * 1024
+_TIMESTAMP_RE = re.compile(rb'"timestamp":\s*"([^"]+)"')
+
+
+def parse_line_timestamp(line: bytes) -> float | None:
+    """Return the timestamp of a structured log line as epoch seconds, without decoding the whole line."""
+    match = _TIMESTAMP_RE.search(line)
+    if not match:
+        return None
+    try:
+        return datetime.fromisoformat(match.group(1).decode()).timestamp()
+    except ValueError:
+        return None
+
+
+def is_log_archive(path: str | os.PathLike[str]) -> bool:
+    """Whether a log file is an archive."""
+    return os.fspath(path).endswith(ARCHIVE_SUFFIX)
+
+
+def _sidecar_path(path: str | os.PathLike[str]) -> Path:
+    """Return the hidden index file of a log file or archive, not matched by ``<name>*`` globs."""
+    path = Path(path)
+    return path.with_name(f".{path.name}.idx")
+
+
+def _first_timestamp(block: bytes) -> float | None:
+    return parse_line_timestamp(block[: block.find(b"\n") + 1 or len(block)])
+
+
+class LogArchive:
+    """
+    Seek table of a log archive, to read it from any line, byte offset or time.
+
+    Every block of the archive has an entry ``(first line, uncompressed offset, compressed offset,
+    timestamp)``, where the timestamp is the one of the first line of the block, if it has one. Byte
+    offsets given to and returned by the methods are offsets in the uncompressed log, so they are
+    the same as in the log file before it was archived.
+
+    The table is kept in a sidecar file; without it, the archive is scanned once to rebuild it.
+
+    :param archive_path: Path of the archive.
+    """
+
+    def __init__(self, archive_path: str | os.PathLike[str]) -> None:
+        self.archive_path = Path(archive_path)
+        self.compressed_size = 0
+        """Size of the archive the table was built for."""
+        self.size = 0
+        """Size of the uncompressed log."""
+        self.lines = 0
+        """Number of lines of the log."""
+        self.blocks: list[tuple[int, int, int, float | None]] = []
+
+    @property
+    def file_size(self) -> int:
+        """Size of the uncompressed log; an archive has no partial lines to leave out."""
+        return self.size
+
+    @classmethod
+    def load(cls, archive_path: str | os.PathLike[str]) -> LogArchive:
+        """Load the seek table of an archive, rebuilding it if it is missing or out of date."""
+        archive = cls(archive_path)
+        compressed_size = os.stat(archive_path).st_size
+        try:
+            data = json.loads(_sidecar_path(archive_path).read_bytes())
+            if (
+                data.get("version") == ARCHIVE_INDEX_VERSION
+                and data.get("compressed_size") == compressed_size
+            ):
+                archive.compressed_size = compressed_size
+                archive.size = data["size"]
+                archive.lines = data["lines"]
+                archive.blocks = [tuple(b) for b in data["blocks"]]
+                return archive
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        archive._scan()
+        archive.save()
+        return archive
+
+    def _scan(self) -> None:
+        """Build the seek table by decompressing the whole archive once."""
+        self.size = self.lines = self.compressed_size = 0
+        self.blocks = []
+        with open(self.archive_path, "rb") as f:
+            for compressed_offset, block in _iter_members(f, 0):
+                self._add_block(compressed_offset, block)
+            self.compressed_size = f.tell()
+
+    def _add_block(self, compressed_offset: int, block: bytes) -> None:
+        self.blocks.append((self.lines, self.size, compressed_offset, _first_timestamp(block)))
+        self.lines += block.count(b"\n") + (not block.endswith(b"\n"))
+        self.size += len(block)
+
+    def save(self) -> None:
+        data = {
+            "version": ARCHIVE_INDEX_VERSION,
+            "compressed_size": self.compressed_size,
+            "size": self.size,
+            "lines": self.lines,
+            "blocks": self.blocks,
+        }
+        path = _sidecar_path(self.archive_path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug("Could not write log archive index %s: %s", path, e)
+
+    def _block_of_offset(self, offset: int) -> int:
+        return max(bisect.bisect_right([b[1] for b in self.blocks], offset) - 1, 0)
+
+    def offset_of_line(self, line: int) -> int:
+        """Return the uncompressed offset of a line (0-based), decompressing one block at most."""
+        if line <= 0 or not self.blocks:
+            return 0
+        if line >= self.lines:
+            return self.size
+        first_line, offset, _, _ = self.blocks[bisect.bisect_right([b[0] for b in self.blocks], line) - 1]
+        for _, block in self._read_blocks(offset):
+            position = -1
+            for _ in range(line - first_line):
+                position = block.index(b"\n", position + 1)
+            return offset + position + 1
+        return offset
+
+    def offset_of_time(self, timestamp: datetime) -> int:
+        """
+        Return the uncompressed offset of the last block starting before ``timestamp``.
+
+        Reading from there yields every line from ``timestamp`` on, preceded by at most one block.
+        """
+        target = timestamp.timestamp()
+        offset = 0
+        for _, block_offset, _, block_time in self.blocks:
+            if block_time is None:
+                continue
+            if block_time >= target:
+                break
+            offset = block_offset
+        return offset
+
+    def _read_blocks(self, start: int) -> Iterator[tuple[int, bytes]]:
+        """Yield the uncompressed offset and content of the blocks from the one holding ``start``."""
+        if not self.blocks or start >= self.size:
+            return
+        index = self._block_of_offset(start)
+        offset = self.blocks[index][1]
+        with open(self.archive_path, "rb") as f:
+            for _, block in _iter_members(f, self.blocks[index][2]):
+                yield offset, block
+                offset += len(block)
+
+    def read_chunks(self, start: int = 0) -> Generator[bytes, None, None]:
+        """Yield the uncompressed log from offset ``start``, one block at a time."""
+        for offset, block in self._read_blocks(start):
+            yield block[start - offset :] if start > offset else block
+
+    def read_lines(self, start: int = 0, end: int | None = None) -> Generator[str, None, None]:
+        """Yield the lines of the log from uncompressed offset ``start`` to ``end``."""
+        remaining = (self.size if end is None else end) - start
+        pending = b""
+        if remaining <= 0:
+            return
+        for chunk in self.read_chunks(start):
+            data = chunk[:remaining]
+            remaining -= len(data)
+            *lines, pending = (pending + data).split(b"\n")
+            for line in lines:
+                yield line.decode("utf-8", errors="replace")
+            if remaining <= 0:
+                break
+        if pending:
+            yield pending.decode("utf-8", errors="replace")
+
+
+def _iter_members(f, compressed_offset: int) -> Generator[tuple[int, bytes], None, None]:
+    """Yield the compressed offset and uncompressed content of the gzip members from an offset on."""
+    f.seek(compressed_offset)
+    decompressor = zlib.decompressobj(_GZIP_WBITS)
+    member_start = compressed_offset
+    parts: list[bytes] = []
+    data = b""
+    while True:
+        if not data:
+            data = f.read(_READ_SIZE)
+            if not data:
+                break
+        parts.append(decompressor.decompress(data))
+        if not decompressor.eof:
+            data = b""
+            continue
+        # End of a member: whatever was read past it starts the next one.
+        data = decompressor.unused_data
+        member_end = f.tell() - len(data)
+        yield member_start, b"".join(parts)
+        member_start = member_end
+        parts = []
+        decompressor = zlib.decompressobj(_GZIP_WBITS)
+    if any(parts):
+        logger.warning("Truncated block at offset %s of log archive %s", member_start, f.name)
+
+
+def _iter_blocks(f, block_size: int) -> Iterator[bytes]:
+    """
+    Split a log file into blocks of about ``block_size`` bytes ending at line ends.
+
+    A line longer than ``block_size`` ends a block of its own, so the blocks after it are not merged
+    into one.
+    """
+    pending = b""
+    while chunk := f.read(block_size):
+        pending += chunk
+        while len(pending) >= block_size:
+            end = pending.rfind(b"\n", 0, block_size + 1)
+            if end == -1:
+                end = pending.find(b"\n", block_size)
+                if end == -1:
+                    # The end of the long line has not been read yet.
+                    break
+            yield pending[: end + 1]
+            pending = pending[end + 1 :]
+    if pending:
+        yield pending
+
+
+def archive_log(log_path: str | os.PathLike[str], *, block_size: int = BLOCK_SIZE) -> Path | None:
+    """
+    Compress a log file into its archive, ``<log file>.gz``, and remove the log file.
+
+    If the archive exists already, e.g. from before the task was deferred, the log is appended to it
+    as new blocks. The archive is written to a temporary file first and then moved in place, so
+    readers see either the log file or the whole archive.
+
+    :param log_path: Path of the log file.
+    :param block_size: Size of the uncompressed lines in one block.
+    :return: The path of the archive, or None if there was no log file to archive.
+    """
+    log_path = Path(log_path)
+    archive_path = log_path.with_name(log_path.name + ARCHIVE_SUFFIX)
+    try:
+        src = open(log_path, "rb")
+    except FileNotFoundError:
+        return None
+    with src:
+        archive = LogArchive.load(archive_path) if archive_path.exists() else LogArchive(archive_path)
+        fd, tmp_path = tempfile.mkstemp(dir=log_path.parent, prefix=f".{archive_path.name}", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst:
+                if archive.compressed_size:
+                    with open(archive_path, "rb") as existing:
+                        shutil.copyfileobj(existing, dst)
+                for block in _iter_blocks(src, block_size):
+                    compressed_offset = dst.tell()
+                    compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+                    dst.write(compressor.compress(block) + compressor.flush())
+                    archive._add_block(compressed_offset, block)
+                archive.compressed_size = dst.tell()
+            shutil.copymode(log_path, tmp_path)
+            os.replace(tmp_path, archive_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    archive.save()
+    os.remove(log_path)
+    # The line index of the log file, if it was read before being archived, is of no use anymore.
+    _sidecar_path(log_path).unlink(missing_ok=True)
+    return archive_path
@@ -0,0 +1,124 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from airflow_shared.logging.archive import ARCHIVE_SUFFIX, LogArchive, archive_log, parse_line_timestamp
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _log_lines(count: int, first: int = 0) -> list[str]:
+    return [
+        json.dumps({"timestamp": (START + timedelta(seconds=i)).isoformat(), "event": f"line {i}"})
+        for i in range(first, first + count)
+    ]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "attempt=1.log"
+    path.write_text("\n".join(_log_lines(100)) + "\n")
+    return path
+
+
+def test_parse_line_timestamp():
+    assert parse_line_timestamp(b'{"timestamp": "2024-01-01T00:00:00+00:00"}') == START.timestamp()
+    assert parse_line_timestamp(b'{"timestamp": "not a time"}') is None
+    assert parse_line_timestamp(b"plain text line") is None
+
+
+class TestArchiveLog:
+    def test_archive_is_gzip_of_the_log(self, log_path):
+        content = log_path.read_bytes()
+
+        archive_path = archive_log(log_path, block_size=500)
+
+        assert archive_path == log_path.with_name(log_path.name + ARCHIVE_SUFFIX)
+        assert not log_path.exists()
+        assert gzip.decompress(archive_path.read_bytes()) == content
+        archive = LogArchive.load(archive_path)
+        assert len(archive.blocks) > 1
+        assert archive.size == len(content)
+        assert archive.lines == 100
+
+    def test_line_longer_than_block_ends_its_own_block(self, log_path):
+        lines = [*_log_lines(5), "x" * 2000, *_log_lines(20, first=5)]
+        log_path.write_text("\n".join(lines) + "\n")
+
+        archive = LogArchive.load(archive_log(log_path, block_size=500))
+
+        assert list(archive.read_lines()) == lines
+        long_line_block = next(i for i, block in enumerate(archive.blocks) if block[3] is None)
+        # The lines after the long one are split into blocks again.
+        assert len(archive.blocks) - long_line_block > 2
+        assert archive.blocks[long_line_block + 1][3] is not None
+
+    def test_missing_log(self, tmp_path):
+        assert archive_log(tmp_path / "attempt=1.log") is None
+
+    def test_appends_to_existing_archive(self, log_path):
+        first = log_path.read_bytes()
+        archive_log(log_path, block_size=500)
+        log_path.write_text("\n".join(_log_lines(10, first=100)) + "\n")
+        second = log_path.read_bytes()
+
+        archive_path = archive_log(log_path, block_size=500)
+
+        assert gzip.decompress(archive_path.read_bytes()) == first + second
+        assert LogArchive.load(archive_path).lines == 110
+
+
+class TestLogArchive:
+    @pytest.fixture
+    def archive(self, log_path):
+        self.lines = log_path.read_text().splitlines()
+        return LogArchive.load(archive_log(log_path, block_size=500))
+
+    def test_read_lines(self, archive):
+        assert list(archive.read_lines()) == self.lines
+
+    def test_offset_of_line(self, archive):
+        offset = archive.offset_of_line(42)
+        assert list(archive.read_lines(offset)) == self.lines[42:]
+        assert archive.offset_of_line(0) == 0
+        assert archive.offset_of_line(1000) == archive.size
+
+    def test_read_lines_range(self, archive):
+        start, end = archive.offset_of_line(10), archive.offset_of_line(20)
+        assert list(archive.read_lines(start, end)) == self.lines[10:20]
+
+    def test_offset_of_time(self, archive):
+        since = START + timedelta(seconds=50)
+        lines = list(archive.read_lines(archive.offset_of_time(since)))
+        assert self.lines[50] in lines
+        assert len(lines) < len(self.lines)
+
+    def test_rebuilds_missing_index(self, archive):
+        sidecar = archive.archive_path.with_name(f".{archive.archive_path.name}.idx")
+        sidecar.unlink()
+
+        rebuilt = LogArchive.load(archive.archive_path)
+
+        assert rebuilt.blocks == archive.blocks
+        assert sidecar.exists()
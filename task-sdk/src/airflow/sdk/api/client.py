@@ -18,8 +18,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import ssl
 import sys
+import threading
 import uuid
 from datetime import datetime
 from functools import cache
@@ -71,6 +73,9 @@ from airflow.sdk.api.datamodels._generated import (
     TaskStateStoreResponse,
     TerminalStateNonSuccess,
     TIAwaitingInputStatePayload,
+    TIBatchItem,
+    TIBatchRequest,
+    TIBatchResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -331,6 +336,17 @@ class TaskInstanceOperations:
         body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
         self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
 
+    def batch(self, items: list[TIBatchItem]) -> TIBatchResponse:
+        """
+        Heartbeat and update the state of several TIs in one request.
+
+        Each item carries the token of its TI, so the items can come from the clients of different
+        supervisors. The error of an item is returned in its result instead of being raised.
+        """
+        body = TIBatchRequest(items=items)
+        resp = self.client.post("task-instances/batch", content=body.model_dump_json())
+        return TIBatchResponse.model_validate_json(resp.read())
+
     def skip_downstream_tasks(self, id: uuid.UUID, msg: SkipDownstreamTasks):
         """Tell the API server to skip the downstream tasks of this TI."""
         body = TISkippedDownstreamTasksStatePayload(tasks=msg.tasks)
@@ -1144,6 +1160,8 @@ API_TIMEOUT = conf.getfloat("workers", "execution_api_timeout")
 API_CLIENT_SSL_CERT = conf.get("api", "client_ssl_cert", fallback=None)
 API_CLIENT_SSL_KEY = conf.get("api", "client_ssl_key", fallback=None)
 API_CLIENT_USE_PUBLIC_CERTS = conf.getboolean("api", "client_use_public_certs", fallback=True)
+API_HTTP2 = conf.getboolean("workers", "execution_api_http2", fallback=False)
+API_SHARED_CONNECTIONS = conf.getboolean("workers", "execution_api_shared_connections", fallback=True)
 
 
 def _should_retry_api_request(exception: BaseException) -> bool:
@@ -1154,6 +1172,57 @@ def _should_retry_api_request(exception: BaseException) -> bool:
     return isinstance(exception, httpx.RequestError)
 
 
+class _SharedTransport(httpx.HTTPTransport):
+    """Transport whose connection pool is shared by all the clients of a process to the same server."""
+
+    def close(self) -> None:
+        # Closing one of the clients must not close the connections the others are using
+        pass
+
+
+_shared_transports: dict[tuple[str, bytes, int | None], _SharedTransport] = {}
+_shared_transports_lock = threading.Lock()
+
+
+def _reset_shared_transports_after_fork() -> None:
+    # The connections of the parent process must not be used by the child too
+    global _shared_transports_lock
+    _shared_transports.clear()
+    _shared_transports_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_shared_transports_after_fork)
+
+
+@cache
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        log.warning(
+            "HTTP/2 is enabled for the Execution API client but the h2 package is not installed; "
+            "using HTTP/1.1. Install apache-airflow-task-sdk[http2] to use HTTP/2."
+        )
+        return False
+    return True
+
+
+def _shared_transport(base_url: str, **kwargs: Any) -> _SharedTransport:
+    """
+    Return the transport shared by the clients of this process to the server at ``base_url``.
+
+    The keyword arguments are the ones of :class:`httpx.HTTPTransport`. They are only used to create the
+    transport, by the first client to the server; they come from the configuration, so they are the same
+    for every client.
+    """
+    url = httpx.URL(base_url)
+    key = (url.scheme, url.raw_host, url.port)
+    with _shared_transports_lock:
+        if (transport := _shared_transports.get(key)) is None:
+            transport = _shared_transports[key] = _SharedTransport(**kwargs)
+    return transport
+
+
 class Client(httpx.Client):
     @lru_cache()
     @staticmethod
@@ -1195,6 +1264,19 @@ class Client(httpx.Client):
 
                 kwargs["cert"] = (API_CLIENT_SSL_CERT, API_CLIENT_SSL_KEY)
 
+            kwargs["http2"] = API_HTTP2 and _http2_available()
+            if API_SHARED_CONNECTIONS and "transport" not in kwargs:
+                # Supervisors of the same worker process reuse the connections to the server, and save
+                # their TLS handshakes, instead of each opening their own. Per-client connection limits do not apply
+                # to the shared pool, which uses the default limits of httpx.
+                kwargs.pop("limits", None)
+                kwargs["transport"] = _shared_transport(
+                    kwargs["base_url"],
+                    verify=kwargs["verify"],
+                    cert=kwargs.get("cert"),
+                    http2=kwargs["http2"],
+                )
+
         # Set timeout if not explicitly provided
         kwargs.setdefault("timeout", API_TIMEOUT)
 
@@ -261,6 +261,17 @@ class TIAwaitingInputStatePayload(BaseModel):
     rendered_map_index: Annotated[str | None, Field(title="Rendered Map Index")] = None
 
 
+class TIBatchItemResult(BaseModel):
+    """
+    Result of one item of a batch request.
+    """
+
+    task_instance_id: Annotated[UUID, Field(title="Task Instance Id")]
+    status_code: Annotated[int, Field(title="Status Code")]
+    detail: JsonValue | None = None
+    refreshed_token: Annotated[str | None, Field(title="Refreshed Token")] = None
+
+
 class TIDeferredStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a deferred state.
@@ -273,6 +284,7 @@ class TIDeferredStatePayload(BaseModel):
     classpath: Annotated[str, Field(title="Classpath")]
     trigger_kwargs: Annotated[dict[str, JsonValue | None] | str | None, Field(title="Trigger Kwargs")] = None
     trigger_timeout: Annotated[timedelta | None, Field(title="Trigger Timeout")] = None
+    trigger_fire_at: Annotated[AwareDatetime | None, Field(title="Trigger Fire At")] = None
     queue: Annotated[str | None, Field(title="Queue")] = None
     next_method: Annotated[str, Field(title="Next Method")]
     next_kwargs: Annotated[dict[str, JsonValue | None] | None, Field(title="Next Kwargs")] = None
@@ -713,6 +725,14 @@ class LiteralArgBinding(BaseModel):
     from_default: Annotated[bool | None, Field(title="From Default")] = False
 
 
+class TIBatchResponse(BaseModel):
+    """
+    Response schema for a batch request, with one result per item in the order of the items.
+    """
+
+    results: Annotated[list[TIBatchItemResult], Field(title="Results")]
+
+
 class TITerminalStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a terminal state except SUCCESS state.
@@ -809,10 +829,45 @@ class DagRun(BaseModel):
     team_name: Annotated[str | None, Field(title="Team Name")] = None
 
 
+class TIBatchItem(BaseModel):
+    """
+    Schema for one heartbeat or state update of a TaskInstance in a batch request.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    task_instance_id: Annotated[UUID, Field(title="Task Instance Id")]
+    token: Annotated[str, Field(title="Token")]
+    heartbeat: TIHeartbeatInfo | None = None
+    state: Annotated[
+        TITerminalStatePayload
+        | TISuccessStatePayload
+        | TITargetStatePayload
+        | TIDeferredStatePayload
+        | TIRescheduleStatePayload
+        | TIAwaitingInputStatePayload
+        | TIRetryStatePayload
+        | None,
+        Field(title="State"),
+    ] = None
+
+
 class TaskArgBinding(RootModel[XComArgBinding | LiteralArgBinding]):
     root: Annotated[XComArgBinding | LiteralArgBinding, Field(discriminator="kind", title="TaskArgBinding")]
 
 
+class TIBatchRequest(BaseModel):
+    """
+    Schema for heartbeating and updating the state of several TaskInstances in one request.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    items: Annotated[list[TIBatchItem], Field(max_length=1000, title="Items")]
+
+
 class TIRunContext(BaseModel):
     """
     Response schema for TaskInstance run context.
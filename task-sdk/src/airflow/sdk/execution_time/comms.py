@@ -1071,6 +1071,19 @@ class DeleteVariable(BaseModel):
     type: Literal["DeleteVariable"] = "DeleteVariable"
 
 
+class PrefetchRequests(BaseModel):
+    """
+    Ask the supervisor to fetch the variables and connections a task is known to use.
+
+    The supervisor answers right away and fetches them in the background, so that the task finds
+    them in the supervisor request cache when it asks for them. Ignored when that cache is disabled.
+    """
+
+    variables: list[str] = Field(default_factory=list)
+    connections: list[str] = Field(default_factory=list)
+    type: Literal["PrefetchRequests"] = "PrefetchRequests"
+
+
 class ResendLoggingFD(BaseModel):
     type: Literal["ResendLoggingFD"] = "ResendLoggingFD"
 
@@ -1285,6 +1298,7 @@ ToSupervisor = Annotated[
     | GetXComCount
     | GetXComSequenceItem
     | GetXComSequenceSlice
+    | PrefetchRequests
     | PutVariable
     | RescheduleTask
     | RetryTask
@@ -178,13 +178,17 @@ class _PythonCoordinator(BaseCoordinator):
         # supervisor, and maybe with additional refactoring to abstract out
         # process handling.
         from airflow.sdk.execution_time.supervisor import ActivitySubprocess
+        from airflow.sdk.execution_time.task_runner_pool import get_task_runner_pool
+
+        pool = get_task_runner_pool()
+        start = ActivitySubprocess.start if pool is None else pool.start_task
 
         # Keep the warm-shutdown handlers installed across both start() (which
         # transitions the TI to RUNNING) and wait() (which runs the task and
         # reports its terminal state / uploads logs) so a SIGTERM at any point
         # in this window can't kill the supervisor and tear the task down.
         with _warm_shutdown_signals():
-            process = ActivitySubprocess.start(
+            process = start(
                 dag_rel_path=dag_rel_path,
                 what=what,
                 client=client,
@@ -194,6 +198,8 @@ class _PythonCoordinator(BaseCoordinator):
                 sentry_integration=sentry_integration,
             )
             exit_code = process.wait()
+            if pool is not None:
+                pool.task_finished(process)
             return self.ExecutionResult(exit_code, process.final_state)
 
 
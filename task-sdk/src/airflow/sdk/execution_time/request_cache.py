@@ -0,0 +1,197 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Caching of the responses a task supervisor sends to the read requests of its task.
+
+Task code reading the same variables, connections or XComs over and over (in loops, or in every
+callable of an operator) would otherwise make one Execution API call per read.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import attrs
+
+from airflow.sdk.configuration import conf
+from airflow.sdk.execution_time.comms import (
+    DeleteVariable,
+    DeleteXCom,
+    GetConnection,
+    GetVariable,
+    GetXCom,
+    PrefetchRequests,
+    PutVariable,
+    SetXCom,
+)
+from airflow.sdk.execution_time.request_handlers import connection_result, variable_result, xcom_result
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from airflow.sdk.api.client import Client
+
+    Response = tuple[BaseModel | None, dict[str, bool]]
+
+# Maximum number of cached responses; expired ones, then the oldest ones, are dropped beyond it.
+_PRUNE_SIZE = 1024
+
+# Maximum number of requests fetched at the same time for a prefetch.
+_PREFETCH_WORKERS = 4
+
+# How to fetch the response to each cacheable request type from the API, and how to turn what
+# was fetched into the response to the task. Fetching only calls the client, so that it can run
+# in a prefetch thread; secrets are masked when the response is first used, in the main thread.
+_FETCHERS: dict[type[BaseModel], tuple[Callable[[Client, Any], Any], Callable[[Any], Response]]] = {
+    GetVariable: (lambda client, msg: client.variables.get(msg.key), variable_result),
+    GetConnection: (lambda client, msg: client.connections.get(msg.conn_id), connection_result),
+    GetXCom: (
+        lambda client, msg: client.xcoms.get(
+            msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.map_index, msg.include_prior_dates
+        ),
+        xcom_result,
+    ),
+}
+
+
+def _cache_key(msg: GetVariable | GetConnection | GetXCom) -> tuple:
+    if isinstance(msg, GetVariable):
+        return ("variable", msg.key)
+    if isinstance(msg, GetConnection):
+        return ("connection", msg.conn_id)
+    return ("xcom", msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.map_index, msg.include_prior_dates)
+
+
+def request_cache_ttls() -> dict[type[BaseModel], float]:
+    """Return the configured time to live of the cached responses of each request type."""
+    return {
+        GetVariable: conf.getfloat("workers", "request_cache_variable_ttl", fallback=0),
+        GetConnection: conf.getfloat("workers", "request_cache_connection_ttl", fallback=0),
+        GetXCom: conf.getfloat("workers", "request_cache_xcom_ttl", fallback=0),
+    }
+
+
+@attrs.define
+class _Entry:
+    expires_at: float
+    pending: Future | None = None
+    response: Response | None = None
+
+
+class SupervisorRequestCache:
+    """
+    Cache the responses of a supervisor to the read requests of its task.
+
+    Responses to ``GetVariable``, ``GetConnection`` and ``GetXCom`` are kept for the time to live
+    of their type, and the writes the task makes through the supervisor drop the responses they
+    make stale. Not found responses are cached too, so that a default used in a loop does not cost
+    an API call each time.
+
+    Requests can also be prefetched: they are then fetched in background threads while the task
+    starts, and a request arriving while its prefetch is in flight waits for that fetch instead of
+    making a second call.
+
+    :param ttls: Seconds to keep the responses of each request type for. Types with a time to live
+        of 0 are not cached.
+    """
+
+    def __init__(self, ttls: Mapping[type[BaseModel], float]) -> None:
+        self.ttls = {msg_type: ttl for msg_type, ttl in ttls.items() if ttl > 0 and msg_type in _FETCHERS}
+        self._entries: dict[tuple, _Entry] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def from_config(cls) -> SupervisorRequestCache:
+        return cls(request_cache_ttls())
+
+    def __bool__(self) -> bool:
+        return bool(self.ttls)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def handle(self, client: Client, msg: GetVariable | GetConnection | GetXCom) -> Response:
+        """Return the response to a request, from the cache when it has one."""
+        fetch, finish = _FETCHERS[type(msg)]
+        if (ttl := self.ttls.get(type(msg))) is None:
+            return finish(fetch(client, msg))
+        key = _cache_key(msg)
+        now = time.monotonic()
+        if (entry := self._entries.get(key)) is not None and entry.expires_at > now:
+            if entry.response is not None:
+                return entry.response
+            if entry.pending is not None:
+                try:
+                    entry.response = finish(entry.pending.result())
+                except Exception:
+                    # The prefetch failed, fetch again so that errors surface as they would without it
+                    del self._entries[key]
+                else:
+                    entry.pending = None
+                    return entry.response
+        response = finish(fetch(client, msg))
+        self._add(key, _Entry(expires_at=now + ttl, response=response), now)
+        return response
+
+    def prefetch(self, client: Client, msg: PrefetchRequests) -> None:
+        """Start fetching the requested variables and connections that are not cached yet."""
+        requests: Iterable[GetVariable | GetConnection] = [
+            *(GetVariable(key=key) for key in msg.variables),
+            *(GetConnection(conn_id=conn_id) for conn_id in msg.connections),
+        ]
+        now = time.monotonic()
+        for request in requests:
+            if (ttl := self.ttls.get(type(request))) is None:
+                continue
+            key = _cache_key(request)
+            if (entry := self._entries.get(key)) is not None and entry.expires_at > now:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_PREFETCH_WORKERS, thread_name_prefix="request-prefetch"
+                )
+            fetch, _ = _FETCHERS[type(request)]
+            pending = self._executor.submit(fetch, client, request)
+            self._add(key, _Entry(expires_at=now + ttl, pending=pending), now)
+
+    def invalidate(self, msg: PutVariable | DeleteVariable | SetXCom | DeleteXCom) -> None:
+        """Drop the cached responses a write from the task makes stale."""
+        if isinstance(msg, (PutVariable, DeleteVariable)):
+            self._entries.pop(("variable", msg.key), None)
+            return
+        stale = ("xcom", msg.dag_id, msg.run_id, msg.task_id, msg.key)
+        for key in [key for key in self._entries if key[:5] == stale]:
+            del self._entries[key]
+
+    def close(self) -> None:
+        """Drop all cached responses and stop the prefetch threads."""
+        self._entries.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _add(self, key: tuple, entry: _Entry, now: float) -> None:
+        if len(self._entries) >= _PRUNE_SIZE:
+            self._entries = {k: e for k, e in self._entries.items() if e.expires_at > now}
+            if len(self._entries) >= _PRUNE_SIZE:
+                # Nothing expired, drop the oldest entry
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = entry
@@ -84,11 +84,18 @@ if TYPE_CHECKING:
     from pydantic import BaseModel
 
     from airflow.sdk.api.client import Client
+    from airflow.sdk.execution_time.comms import ErrorResponse
 
 
 def handle_get_connection(client: Client, msg: GetConnection) -> tuple[BaseModel | None, dict[str, bool]]:
     """Fetch a connection and mask its sensitive fields."""
-    conn = client.connections.get(msg.conn_id)
+    return connection_result(client.connections.get(msg.conn_id))
+
+
+def connection_result(
+    conn: ConnectionResponse | ErrorResponse,
+) -> tuple[BaseModel | None, dict[str, bool]]:
+    """Mask the sensitive fields of a fetched connection and normalize it for supervisor response handling."""
     if isinstance(conn, ConnectionResponse):
         if conn.password:
             mask_secret(conn.password)
@@ -100,7 +107,11 @@ def handle_get_connection(client: Client, msg: GetConnection) -> tuple[BaseModel
 
 def handle_get_variable(client: Client, msg: GetVariable) -> tuple[BaseModel | None, dict[str, bool]]:
     """Fetch a variable and mask its value."""
-    var = client.variables.get(msg.key)
+    return variable_result(client.variables.get(msg.key))
+
+
+def variable_result(var: VariableResponse | ErrorResponse) -> tuple[BaseModel | None, dict[str, bool]]:
+    """Mask the value of a fetched variable and normalize it for supervisor response handling."""
     if isinstance(var, VariableResponse):
         if var.value:
             mask_secret(var.value, var.key)
@@ -275,9 +286,13 @@ def handle_get_xcom_sequence_slice(
 
 def handle_get_xcom(client: Client, msg: GetXCom) -> tuple[BaseModel | None, dict[str, bool]]:
     """Fetch an XCom and normalize it for supervisor response handling."""
-    xcom = client.xcoms.get(
-        msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.map_index, msg.include_prior_dates
+    return xcom_result(
+        client.xcoms.get(msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.map_index, msg.include_prior_dates)
     )
+
+
+def xcom_result(xcom: XComResponse) -> tuple[BaseModel | None, dict[str, bool]]:
+    """Normalize a fetched XCom for supervisor response handling."""
     if isinstance(xcom, XComResponse):
         xcom_result = XComResult.from_xcom_response(xcom)
         return xcom_result, {"exclude_unset": True}
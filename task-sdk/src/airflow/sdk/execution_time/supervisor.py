@@ -109,6 +109,7 @@ from airflow.sdk.execution_time.comms import (
     InactiveAssetsResult,
     MaskSecret,
     OKResponse,
+    PrefetchRequests,
     PutVariable,
     RescheduleTask,
     ResendLoggingFD,
@@ -133,10 +134,10 @@ from airflow.sdk.execution_time.comms import (
     _ResponseFrame,
 )
 from airflow.sdk.execution_time.coordinator import get_coordinator_manager
+from airflow.sdk.execution_time.request_cache import SupervisorRequestCache
 from airflow.sdk.execution_time.request_handlers import (
     handle_delete_variable,
     handle_delete_xcom,
-    handle_get_connection,
     handle_get_dag_run_state,
     handle_get_dr_count,
     handle_get_prev_successful_dag_run,
@@ -144,9 +145,7 @@ from airflow.sdk.execution_time.request_handlers import (
     handle_get_previous_ti,
     handle_get_task_states,
     handle_get_ti_count,
-    handle_get_variable,
     handle_get_variable_keys,
-    handle_get_xcom,
     handle_get_xcom_count,
     handle_get_xcom_sequence_item,
     handle_get_xcom_sequence_slice,
@@ -206,6 +205,15 @@ STATES_SENT_DIRECTLY: frozenset[TaskInstanceState | str] = frozenset(
     }
 )
 
+# The attempt goes on in the same log file after these states, so its log is not complete yet.
+STATES_RESUMING_ATTEMPT: frozenset[TaskInstanceState | str] = frozenset(
+    {
+        TaskInstanceState.DEFERRED,
+        TaskInstanceState.AWAITING_INPUT,
+        TaskInstanceState.UP_FOR_RESCHEDULE,
+    }
+)
+
 # Setting a fair buffer size here to handle most message sizes. Intention is to enforce a buffer size
 # that is big enough to handle small to medium messages while not enforcing hard latency issues
 BUFFER_SIZE = 4096
@@ -1158,6 +1166,12 @@ class WatchedSubprocess:
         """
         # Ensure minimum timeout to prevent CPU spike with tight loop when timeout is 0 or negative
         timeout = max(0.01, max_wait_time)
+        if not self.selector.get_map():
+            # Every socket of the subprocess is closed already, so `select` would only sleep for the whole
+            # timeout: wait for the subprocess to exit instead, to notice it as soon as it does.
+            return self._check_subprocess_exit(
+                raise_on_timeout=raise_on_timeout, expect_signal=expect_signal, timeout=timeout
+            )
         events = self.selector.select(timeout=timeout)
         for key, _ in events:
             # Retrieve the handler responsible for processing this file object (e.g., stdout, stderr)
@@ -1186,14 +1200,14 @@ class WatchedSubprocess:
         return self._check_subprocess_exit(raise_on_timeout=raise_on_timeout, expect_signal=expect_signal)
 
     def _check_subprocess_exit(
-        self, raise_on_timeout: bool = False, expect_signal: None | int = None
+        self, raise_on_timeout: bool = False, expect_signal: None | int = None, timeout: float = 0
     ) -> int | None:
-        """Check if the subprocess has exited."""
+        """Check if the subprocess has exited, waiting up to ``timeout`` seconds for it to."""
         if self._exit_code is not None:
             return self._exit_code
 
         try:
-            self._exit_code = self._process.wait(timeout=0)
+            self._exit_code = self._process.wait(timeout=timeout)
         except self._process.TimeoutExpired:
             if raise_on_timeout:
                 raise
@@ -1394,6 +1408,11 @@ class ActivitySubprocess(WatchedSubprocess):
     _task_end_time_monotonic: float | None = attrs.field(default=None, init=False)
     _rendered_map_index: str | None = attrs.field(default=None, init=False)
 
+    request_cache: SupervisorRequestCache = attrs.field(
+        factory=SupervisorRequestCache.from_config, init=False
+    )
+    """Responses to the read requests of the task, see ``[workers] request_cache_*_ttl``."""
+
     decoder: ClassVar[TypeAdapter[ToSupervisor]] = TypeAdapter(ToSupervisor)
 
     ti: RuntimeTI | None = None
@@ -1488,6 +1507,7 @@ class ActivitySubprocess(WatchedSubprocess):
             self._monitor_subprocess()
         finally:
             self.selector.close()
+            self.request_cache.close()
 
         # self._monitor_subprocess() will set the exit code when the process has finished
         # If it hasn't, assume it's failed
@@ -1771,14 +1791,12 @@ class ActivitySubprocess(WatchedSubprocess):
             self._task_end_time_monotonic = time.monotonic()
             self._rendered_map_index = msg.rendered_map_index
             self._send_terminal_state_msg(msg)
-        elif isinstance(msg, GetConnection):
-            resp, dump_opts = handle_get_connection(self.client, msg)
-        elif isinstance(msg, GetVariable):
-            resp, dump_opts = handle_get_variable(self.client, msg)
+        elif isinstance(msg, (GetConnection, GetVariable, GetXCom)):
+            resp, dump_opts = self.request_cache.handle(self.client, msg)
+        elif isinstance(msg, PrefetchRequests):
+            self.request_cache.prefetch(self.client, msg)
         elif isinstance(msg, GetVariableKeys):
             resp, dump_opts = handle_get_variable_keys(self.client, msg)
-        elif isinstance(msg, GetXCom):
-            resp, dump_opts = handle_get_xcom(self.client, msg)
         elif isinstance(msg, GetXComSequenceItem):
             resp, dump_opts = handle_get_xcom_sequence_item(self.client, msg)
         elif isinstance(msg, GetXComSequenceSlice):
@@ -1794,10 +1812,13 @@ class ActivitySubprocess(WatchedSubprocess):
         elif isinstance(msg, SkipDownstreamTasks):
             self.client.task_instances.skip_downstream_tasks(self.id, msg)
         elif isinstance(msg, SetXCom):
+            self.request_cache.invalidate(msg)
             resp, dump_opts = handle_set_xcom(self.client, msg)
         elif isinstance(msg, DeleteXCom):
+            self.request_cache.invalidate(msg)
             resp, dump_opts = handle_delete_xcom(self.client, msg)
         elif isinstance(msg, PutVariable):
+            self.request_cache.invalidate(msg)
             resp, dump_opts = handle_put_variable(self.client, msg)
         elif isinstance(msg, SetRenderedFields):
             try:
@@ -1887,6 +1908,7 @@ class ActivitySubprocess(WatchedSubprocess):
         elif isinstance(msg, GetPreviousTI):
             resp, dump_opts = handle_get_previous_ti(self.client, msg)
         elif isinstance(msg, DeleteVariable):
+            self.request_cache.invalidate(msg)
             resp, dump_opts = handle_delete_variable(self.client, msg)
         elif isinstance(msg, ValidateInletsAndOutlets):
             inactive_assets_resp = self.client.task_instances.validate_inlets_and_outlets(msg.ti_id)
@@ -2060,7 +2082,7 @@ class InProcessTestSupervisor(ActivitySubprocess):
             return super().request.__wrapped__(self, *args, **kwargs)  # type: ignore[attr-defined]
 
     def _check_subprocess_exit(
-        self, raise_on_timeout: bool = False, expect_signal: None | int = None
+        self, raise_on_timeout: bool = False, expect_signal: None | int = None, timeout: float = 0
     ) -> int | None:
         # InProcessSupervisor has no subprocess, so we don't need to poll anything. This is called from
         # _handle_socket_comms, so we need to override it
@@ -2511,6 +2533,47 @@ def _configure_logging(log_path: str, client: Client) -> tuple[FilteringBoundLog
     return logger, log_file_descriptor
 
 
+# Threads compressing task logs that have not finished yet
+_TASK_LOG_ARCHIVERS: set[threading.Thread] = set()
+
+
+def _archive_task_log(log_file: str, final_state: str) -> threading.Thread | None:
+    """
+    Compress the log file of a completed attempt, if ``[logging] compress_task_logs`` is set.
+
+    The log is compressed in a thread, so the worker can move on to its next workload. The thread is
+    not a daemon: the process waits for it before exiting rather than leave the archive half written.
+    Processes that exit with ``os._exit`` must call :func:`wait_for_task_log_archives` first.
+
+    :return: The thread compressing the log, or None if the log is kept as it is.
+    """
+    if final_state in STATES_RESUMING_ATTEMPT:
+        return None
+    if not conf.getboolean("logging", "compress_task_logs", fallback=False):
+        return None
+    thread = threading.Thread(target=_compress_task_log, args=(log_file,), name="compress-task-log")
+    _TASK_LOG_ARCHIVERS.add(thread)
+    thread.start()
+    return thread
+
+
+def _compress_task_log(log_file: str) -> None:
+    from airflow.sdk._shared.logging.archive import archive_log
+
+    try:
+        archive_log(log_file)
+    except OSError:
+        log.warning("Failed to compress the task log", path=log_file, exc_info=True)
+    finally:
+        _TASK_LOG_ARCHIVERS.discard(threading.current_thread())
+
+
+def wait_for_task_log_archives() -> None:
+    """Wait for the task logs being compressed by this process to be fully written."""
+    for thread in list(_TASK_LOG_ARCHIVERS):
+        thread.join()
+
+
 def supervise_task(
     *,
     ti: TaskInstance,
@@ -2611,6 +2674,7 @@ def supervise_task(
 
         reset_secrets_masker()
 
+        final_state: str | None = None
         try:
             result = coordinator.execute_task(
                 what=ti,
@@ -2621,6 +2685,7 @@ def supervise_task(
                 sentry_integration=sentry_integration,
                 subprocess_logs_to_stdout=subprocess_logs_to_stdout,
             )
+            final_state = result.final_state
             end = time.monotonic()
             log.info(
                 "Workload finished",
@@ -2634,6 +2699,8 @@ def supervise_task(
         finally:
             if log_path and log_file_descriptor:
                 log_file_descriptor.close()
+                if final_state is not None:
+                    _archive_task_log(log_file_descriptor.name, final_state)
             provider = trace.get_tracer_provider()
             if hasattr(provider, "force_flush"):
                 provider.force_flush(timeout_millis=5000)  # upper bound, not a fixed wait
@@ -23,6 +23,7 @@ import contextvars
 import functools
 import inspect
 import os
+import re
 import sys
 import time
 from collections.abc import Callable, Iterable, Iterator, Mapping
@@ -94,6 +95,7 @@ from airflow.sdk.execution_time.comms import (
     DeferTask,
     DRCount,
     ErrorResponse,
+    GetConnection,
     GetDag,
     GetDagRunState,
     GetDRCount,
@@ -103,7 +105,9 @@ from airflow.sdk.execution_time.comms import (
     GetTaskRescheduleStartDate,
     GetTaskStates,
     GetTICount,
+    GetVariable,
     InactiveAssetsResult,
+    PrefetchRequests,
     PreviousDagRunResult,
     PreviousTIResult,
     RescheduleTask,
@@ -158,11 +162,14 @@ if TYPE_CHECKING:
     from pendulum.datetime import DateTime
     from structlog.typing import FilteringBoundLogger as Logger
 
+    from airflow.dag_processing.dagbag import BundleDagBag
+    from airflow.sdk.api.datamodels._generated import BundleInfo
     from airflow.sdk.definitions._internal.abstractoperator import AbstractOperator
     from airflow.sdk.definitions.context import Context
     from airflow.sdk.definitions.retry_policy import RetryDecision
     from airflow.sdk.exceptions import DagRunTriggerException
     from airflow.sdk.types import OutletEventAccessorsProtocol
+    from airflow.triggers.base import BaseTrigger
 
 log = structlog.get_logger("task")
 
@@ -1012,35 +1019,87 @@ def _register_deserialization_allowed_classes(dag, log: Logger) -> None:
                     )
 
 
+# Dag files parsed by the template process this process was forked from, keyed by bundle name and
+# version, path in the bundle and Dag id. See :mod:`airflow.sdk.execution_time.task_runner_pool`.
+_PREPARSED_DAG_BAGS: dict[tuple[str, str, str, str], BundleDagBag] = {}
+
+# Bundles initialized by a template process to parse Dag files from, by bundle name and version
+_PREPARSE_BUNDLES: dict[tuple[str, str | None], BaseDagBundle] = {}
+
+
+def _get_initialized_bundle(bundle_info: BundleInfo) -> BaseDagBundle:
+    bundle_instance = DagBundlesManager().get_bundle(
+        name=bundle_info.name,
+        version=bundle_info.version,
+        version_data=bundle_info.version_data,
+    )
+    bundle_instance.initialize()
+    return bundle_instance
+
+
+def preparse_dag_file(bundle_info: BundleInfo, dag_rel_path: str, dag_id: str) -> str:
+    """
+    Parse a Dag file ahead of the task processes that will be forked from this process.
+
+    The tasks of ``dag_id`` from this file then find their Dag already parsed. The file is parsed for
+    the Dag only, not for one of its tasks, so the parsed Dag has all of its tasks.
+
+    Only Dags of a bundle version are kept. A task of an unversioned bundle refreshes the bundle
+    before it parses its Dag file, so a Dag parsed before may be stale; the file is still parsed, so
+    that the task processes find what it imports already imported.
+
+    :return: The path of the bundle.
+    """
+    from airflow.dag_processing.dagbag import BundleDagBag
+
+    bundle_key = (bundle_info.name, bundle_info.version)
+    if (bundle_instance := _PREPARSE_BUNDLES.get(bundle_key)) is None:
+        bundle_instance = _PREPARSE_BUNDLES[bundle_key] = _get_initialized_bundle(bundle_info)
+    bundle_path = os.fspath(bundle_instance.path)
+    version = bundle_info.version
+    if version is not None and (bundle_info.name, version, dag_rel_path, dag_id) in _PREPARSED_DAG_BAGS:
+        return bundle_path
+    dag_absolute_path = os.fspath(Path(bundle_instance.path, dag_rel_path))
+    with _airflow_parsing_context_manager(dag_id=dag_id):
+        bag = BundleDagBag(
+            dag_folder=dag_absolute_path,
+            safe_mode=False,
+            load_op_links=False,
+            bundle_path=bundle_instance.path,
+            bundle_name=bundle_info.name,
+        )
+    if version is not None and dag_id in bag.dags:
+        _PREPARSED_DAG_BAGS[(bundle_info.name, version, dag_rel_path, dag_id)] = bag
+    return bundle_path
+
+
 @detail_span("parse")
 def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
     # TODO: Task-SDK:
     # Using BundleDagBag here is about 98% wrong, but it'll do for now
     from airflow.dag_processing.dagbag import BundleDagBag
 
+    if TYPE_CHECKING:
+        assert what.ti.dag_id
+
     bundle_info = what.bundle_info
     bundle_prepare_start = time.monotonic()
-    bundle_instance = DagBundlesManager().get_bundle(
-        name=bundle_info.name,
-        version=bundle_info.version,
-        version_data=bundle_info.version_data,
-    )
-    bundle_instance.initialize()
+    bundle_instance = _get_initialized_bundle(bundle_info)
     _verify_bundle_access(bundle_instance, log)
     bundle_prepare_ms = int((time.monotonic() - bundle_prepare_start) * 1000)
 
     dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
     dag_file_parse_start = time.monotonic()
-    bag = BundleDagBag(
-        dag_folder=dag_absolute_path,
-        safe_mode=False,
-        load_op_links=False,
-        bundle_path=bundle_instance.path,
-        bundle_name=bundle_info.name,
-    )
+    preparsed_key = (bundle_info.name, bundle_info.version, what.dag_rel_path, what.ti.dag_id)
+    if bundle_info.version is None or (bag := _PREPARSED_DAG_BAGS.get(preparsed_key)) is None:
+        bag = BundleDagBag(
+            dag_folder=dag_absolute_path,
+            safe_mode=False,
+            load_op_links=False,
+            bundle_path=bundle_instance.path,
+            bundle_name=bundle_info.name,
+        )
     dag_file_parse_ms = int((time.monotonic() - dag_file_parse_start) * 1000)
-    if TYPE_CHECKING:
-        assert what.ti.dag_id
 
     try:
         dag = bag.dags[what.ti.dag_id]
@@ -1414,10 +1473,55 @@ def _serialize_outlet_events(events: OutletEventAccessorsProtocol) -> Iterator[d
             yield attrs.asdict(alias_event)
 
 
+_TEMPLATE_VARIABLE_RE = re.compile(r"\bvar\.(?:value|json)\.([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def _template_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            yield from _template_strings(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from _template_strings(item)
+
+
+def _requests_to_prefetch(task: BaseOperator) -> PrefetchRequests | None:
+    """
+    Find the variables and connections a task is known to use, for the supervisor to prefetch.
+
+    Connections are the ones named by the ``*conn_id`` attributes of the task, and variables the
+    ones read as ``var.value.<key>`` or ``var.json.<key>`` in its templated fields. Only the types
+    the supervisor caches are looked for.
+    """
+    from airflow.sdk.execution_time.request_cache import request_cache_ttls
+
+    ttls = request_cache_ttls()
+    variables: set[str] = set()
+    connections: set[str] = set()
+    if ttls[GetVariable] > 0:
+        for field in task.template_fields:
+            for template in _template_strings(getattr(task, field, None)):
+                variables.update(_TEMPLATE_VARIABLE_RE.findall(template))
+    if ttls[GetConnection] > 0:
+        connections.update(
+            value
+            for name, value in vars(task).items()
+            if name.endswith("conn_id") and isinstance(value, str) and value and "{{" not in value
+        )
+    if not variables and not connections:
+        return None
+    return PrefetchRequests(variables=sorted(variables), connections=sorted(connections))
+
+
 @detail_span("_prepare")
 def _prepare(ti: RuntimeTaskInstance, log: Logger, context: Context) -> ToSupervisor | None:
     ti.hostname = get_hostname()
     ti.task = ti.task.prepare_for_execution()
+    if prefetch := _requests_to_prefetch(ti.task):
+        # Let the supervisor fetch these while the templates are rendered
+        SUPERVISOR_COMMS.send(msg=prefetch)
     # Since context is now cached, and calling `ti.get_template_context` will return the same dict, we want to
     # update the value of the task that is sent from there
     context["task"] = ti.task
@@ -1472,6 +1576,24 @@ def _validate_task_inlets_and_outlets(*, ti: RuntimeTaskInstance, log: Logger) -
         )
 
 
+def _trigger_fire_at(trigger: BaseTrigger) -> datetime | None:
+    """
+    Return the moment a trigger fires, if it only waits for it and fires an event carrying it.
+
+    The scheduler can resume tasks deferred on such triggers without running them, as the event
+    it has to resume them with is known from the moment alone.
+    """
+    # Triggers from Airflow versions without timer_event() run in the triggerer as before.
+    timer_event = getattr(trigger, "timer_event", None)
+    if timer_event is None or (timer := timer_event()) is None:
+        return None
+    moment, event = timer
+    # Events ending the task rather than resuming it have to go through the triggerer.
+    if getattr(event, "task_instance_state", None) is not None or event.payload != moment:
+        return None
+    return moment
+
+
 def _defer_task(
     defer: TaskDeferred, ti: RuntimeTaskInstance, log: Logger
 ) -> tuple[ToSupervisor, TaskInstanceState]:
@@ -1498,6 +1620,7 @@ def _defer_task(
         classpath=classpath,
         trigger_kwargs=trigger_kwargs,
         trigger_timeout=defer.timeout,
+        trigger_fire_at=_trigger_fire_at(defer.trigger),
         queue=queue,
         next_method=defer.method_name,
         next_kwargs=next_kwargs,
@@ -0,0 +1,632 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Warm template processes to fork task processes from.
+
+Every task process is forked from the supervisor, and then imports the Dag file of its task and
+everything that file uses before it can run the task. For short tasks, this is most of the time
+they take. With a :class:`TaskRunnerPool`, a worker instead keeps a template process for each Dag
+bundle version it ran tasks from: the template parses the Dag files of the tasks it is asked to
+start, once, and forks the task processes, which find their Dag already parsed and its imports
+already loaded. Each task still runs in a process of its own, started from the same template state.
+
+Templates are replaced after they started a number of tasks or once their memory grew too much,
+and, for bundles without versions, as soon as one of the files they imported from the bundle
+changes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import enum
+import functools
+import gc
+import hashlib
+import json
+import os
+import select
+import signal
+import sys
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from socket import socket, socketpair
+from typing import TYPE_CHECKING, Any, NoReturn, cast
+
+import attrs
+import psutil
+import structlog
+
+from airflow.sdk.configuration import conf
+from airflow.sdk.execution_time.supervisor import (
+    ActivitySubprocess,
+    ProcessTracker,
+    _fork_main,
+    _reset_signals,
+    _resolve_child_target,
+    _should_use_exec,
+    _subprocess_main,
+)
+
+try:
+    from socket import recv_fds, send_fds
+except ImportError:
+    recv_fds = send_fds = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from structlog.typing import FilteringBoundLogger
+    from typing_extensions import Self
+
+    from airflow.sdk.api.datamodels._generated import BundleInfo, TaskInstance
+
+__all__ = ["TaskRunnerPool", "close_task_runner_pool", "get_task_runner_pool"]
+
+log: FilteringBoundLogger = structlog.get_logger(logger_name="task_runner_pool")
+
+# How long to wait for a template to report the exit of a task process it has seen exit.
+_EXIT_REPORT_TIMEOUT = 1.0
+
+# How long a template has to exit once it is told to, before it is killed.
+_STOP_TIMEOUT = 5.0
+
+# Exit codes of task processes killed by a signal, named like the ones psutil reports for children.
+_NegativeSignal = enum.IntEnum("_NegativeSignal", {sig.name: -sig.value for sig in signal.Signals})  # type: ignore[misc]
+
+
+class TemplateExited(RuntimeError):
+    """Raised when a template process exited, or cannot be used anymore, before forking a task process."""
+
+
+class TemplateStale(TemplateExited):
+    """Raised when a template process imported files from its bundle that changed since."""
+
+
+def _exit_code(status: int) -> int:
+    code = os.waitstatus_to_exitcode(status)
+    if code < 0:
+        with suppress(ValueError):
+            return _NegativeSignal(code)
+    return code
+
+
+def _has_exited(pid: int) -> bool:
+    try:
+        return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+
+
+def _fingerprint_files(paths: Iterable[str], *, unchanged_since: float | None = None) -> str | None:
+    """
+    Hash the content of the given files.
+
+    :param unchanged_since: If given, a file modified at or after this (wall clock) time makes the
+        fingerprint unreliable, and ``None`` is returned.
+    :return: The hex digest, or ``None`` if a file is missing or was modified too recently.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    for path in paths:
+        try:
+            if unchanged_since is not None and os.stat(path).st_mtime >= unchanged_since:
+                return None
+            with open(path, "rb") as f:
+                digest.update(os.fsencode(path))
+                digest.update(f.read())
+        except OSError:
+            return None
+    return digest.hexdigest()
+
+
+def _bundle_module_files(modules: Iterable[str], bundle_path: str) -> set[str]:
+    """Return the files of the given modules that are in the bundle."""
+    bundle_dir = os.path.realpath(bundle_path)
+    files = set()
+    for name in modules:
+        if not (module_file := getattr(sys.modules.get(name), "__file__", None)):
+            continue
+        module_file = os.path.realpath(module_file)
+        if os.path.isfile(module_file) and os.path.commonpath([bundle_dir, module_file]) == bundle_dir:
+            files.add(module_file)
+    return files
+
+
+class _Template:
+    """
+    The template process side of a template.
+
+    It waits for requests to start task processes on its control socket, and forks them, until the
+    socket is closed. The exit statuses of the task processes are reported back on the same socket,
+    as the template is their parent.
+    """
+
+    def __init__(self, control: socket, bundle_info: BundleInfo) -> None:
+        from airflow.sdk._shared.secrets_masker import reset_secrets_masker
+
+        self.control = control
+        self.bundle_info = bundle_info
+        # Files the template imported from an unversioned bundle, and their fingerprint once imported
+        self.watched_files: set[str] = set()
+        self.fingerprint: str | None = None
+
+        _reset_signals()
+        structlog.contextvars.clear_contextvars()
+        # Secrets of the task the supervisor was running when it forked the template are of no concern
+        # to the tasks the template forks
+        reset_secrets_masker()
+
+        # Wake up from waiting on the control socket when a task process exits
+        self.wakeup, self.wakeup_write = socketpair()
+        self.wakeup.setblocking(False)
+        self.wakeup_write.setblocking(False)
+        signal.set_wakeup_fd(self.wakeup_write.fileno())
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    def serve(self) -> None:
+        while True:
+            readable, _, _ = select.select([self.control, self.wakeup], [], [])
+            if self.wakeup in readable:
+                with suppress(BlockingIOError):
+                    self.wakeup.recv(4096)
+            self._reap()
+            if self.control in readable:
+                data, fds, _, _ = recv_fds(self.control, 65536, 4)
+                if not data:
+                    return
+                request = json.loads(data)
+                try:
+                    self._send(self._start_task(request, fds))
+                finally:
+                    for fd in fds:
+                        os.close(fd)
+
+    def _send(self, msg: dict[str, Any]) -> None:
+        self.control.sendall(json.dumps(msg).encode() + b"\n")
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            self._send({"exited": pid, "status": status})
+
+    def _start_task(self, request: dict[str, Any], fds: list[int]) -> dict[str, Any]:
+        if self._is_stale():
+            return {"stale": True}
+        target = _resolve_child_target(request["target"])
+        if target is _subprocess_main:
+            self._preparse(request["dag_rel_path"], request["dag_id"])
+        # Let the task processes share the pages of everything imported so far
+        gc.collect()
+        gc.freeze()
+        return {"pid": self._fork(target, fds)}
+
+    def _is_stale(self) -> bool:
+        if not self.watched_files:
+            return False
+        return self.fingerprint is None or _fingerprint_files(sorted(self.watched_files)) != self.fingerprint
+
+    def _preparse(self, dag_rel_path: str, dag_id: str) -> None:
+        from airflow.sdk.execution_time.task_runner import preparse_dag_file
+
+        started_at = time.time()
+        modules_before = set(sys.modules)
+        try:
+            bundle_path = preparse_dag_file(self.bundle_info, dag_rel_path, dag_id)
+        except BaseException:
+            # The task process parses the file itself, and reports what is wrong with it
+            log.warning("Failed to parse Dag file in template process", file=dag_rel_path, exc_info=True)
+            return
+        if self.bundle_info.version is not None:
+            # The files of a bundle version do not change
+            return
+        self.watched_files.add(os.path.realpath(os.path.join(bundle_path, dag_rel_path)))
+        self.watched_files |= _bundle_module_files(set(sys.modules) - modules_before, bundle_path)
+        # A file changed while it was parsed leaves no fingerprint, and the next request finds the
+        # template stale
+        self.fingerprint = _fingerprint_files(sorted(self.watched_files), unchanged_since=started_at)
+
+    def _fork(self, target: Callable[[], None], fds: list[int]) -> int:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                signal.set_wakeup_fd(-1)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                for sock in (self.control, self.wakeup, self.wakeup_write):
+                    sock.close()
+                # Put the task process in its own process group, as ActivitySubprocess.start does
+                with suppress(OSError):
+                    os.setpgid(0, 0)
+                requests, stdout, stderr = (socket(fileno=fd) for fd in fds[:3])
+                _fork_main(requests, stdout, stderr, fds[3], target)
+            finally:
+                os._exit(124)
+        with suppress(OSError):
+            os.setpgid(pid, pid)
+        return pid
+
+
+def _template_main(control: socket, bundle_info: BundleInfo) -> NoReturn:
+    """Entrypoint of a template process."""
+    exit_code = 0
+    try:
+        _Template(control, bundle_info).serve()
+    except BaseException:
+        import traceback
+
+        with suppress(BaseException):
+            print("Exception in task runner template process", file=sys.stderr)
+            traceback.print_exc()
+        exit_code = 1
+    os._exit(exit_code)
+
+
+@attrs.define(kw_only=True)
+class _TemplateProcess:
+    """The supervisor side of a template, to request task processes from it and track them."""
+
+    key: tuple[str, str | None]
+    pid: int
+    control: socket | None = attrs.field(repr=False)
+    process: psutil.Process = attrs.field(repr=False)
+
+    tasks_started: int = 0
+    baseline_rss: int | None = None
+    """Memory of the template once it started its first task, with its first Dag file parsed."""
+
+    _buffer: bytes = attrs.field(default=b"", repr=False)
+    _exit_codes: dict[int, int] = attrs.field(factory=dict, repr=False)
+
+    @classmethod
+    def start(cls, bundle_info: BundleInfo, *, close: Iterable[socket] = ()) -> Self:
+        """
+        Fork a template process for the tasks of a Dag bundle version.
+
+        :param close: Control sockets of the other templates, which the new one must not keep open.
+        """
+        control, child_control = socketpair()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                for sock in (control, *close):
+                    sock.close()
+                _template_main(child_control, bundle_info)
+            finally:
+                os._exit(124)
+        child_control.close()
+        return cls(
+            key=(bundle_info.name, bundle_info.version),
+            pid=pid,
+            control=control,
+            process=psutil.Process(pid),
+        )
+
+    def start_task(
+        self, *, target: Callable[[], None], dag_rel_path: str, dag_id: str, sockets: tuple[socket, ...]
+    ) -> int:
+        """
+        Fork a task process connected to the given sockets.
+
+        :return: The pid of the task process.
+        """
+        if self.control is None or send_fds is None:
+            raise TemplateExited(f"Template process {self.pid} exited")
+        request = {
+            "target": f"{target.__module__}:{target.__qualname__}",
+            "dag_rel_path": dag_rel_path,
+            "dag_id": dag_id,
+        }
+        try:
+            send_fds(self.control, [json.dumps(request).encode()], [sock.fileno() for sock in sockets])
+            while self.control is not None:
+                for reply in self._receive(timeout=None):
+                    if reply.get("stale"):
+                        raise TemplateStale(f"Template process {self.pid} imported files that changed")
+                    self.tasks_started += 1
+                    if self.baseline_rss is None:
+                        self.baseline_rss = self.rss()
+                    return reply["pid"]
+        except OSError as e:
+            raise TemplateExited(f"Template process {self.pid} exited") from e
+        raise TemplateExited(f"Template process {self.pid} exited")
+
+    def _receive(self, timeout: float | None) -> list[dict[str, Any]]:
+        """Read what the template sent, and return its replies; exit statuses are kept aside."""
+        if self.control is None:
+            return []
+        readable, _, _ = select.select([self.control], [], [], timeout)
+        if not readable:
+            return []
+        if not (data := self.control.recv(65536)):
+            self.control.close()
+            self.control = None
+            return []
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        replies = []
+        for msg in map(json.loads, lines):
+            if "exited" in msg:
+                self._exit_codes[msg["exited"]] = _exit_code(msg["status"])
+            else:
+                replies.append(msg)
+        return replies
+
+    def has_exited(self, pid: int) -> bool:
+        """Whether the template reported the exit of task process ``pid``."""
+        self._receive(timeout=0)
+        return pid in self._exit_codes
+
+    def wait_task(self, pid: int, timeout: float | None) -> int:
+        """Wait for the template to report the exit of task process ``pid``, and return its exit code."""
+        if timeout == 0 and pid not in self._exit_codes and _has_exited(pid):
+            # The template reaps the process as soon as it exits; wait to hear about it
+            timeout = _EXIT_REPORT_TIMEOUT
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while pid not in self._exit_codes:
+            if self.control is None:
+                # The template exited, and its task processes were reparented; we can only tell
+                # whether they are still running.
+                with suppress(psutil.NoSuchProcess):
+                    psutil.Process(pid).wait(timeout)
+                log.warning("Exit code of task process lost with its template process", pid=pid)
+                return 1
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            self._receive(remaining)
+            if pid not in self._exit_codes and remaining == 0:
+                raise psutil.TimeoutExpired(timeout, pid)
+        return self._exit_codes[pid]
+
+    def rss(self) -> int:
+        try:
+            return self.process.memory_info().rss
+        except psutil.NoSuchProcess:
+            return 0
+
+    def stop(self) -> None:
+        """Tell the template to exit, and wait for it."""
+        if self.control is not None:
+            self.control.close()
+            self.control = None
+        try:
+            self.process.wait(_STOP_TIMEOUT)
+        except psutil.TimeoutExpired:
+            log.warning("Template process did not exit in time; killing it", pid=self.pid)
+            with suppress(psutil.NoSuchProcess):
+                self.process.kill()
+                self.process.wait(_STOP_TIMEOUT)
+        except psutil.NoSuchProcess:
+            pass
+
+
+class _TemplateChildTracker(ProcessTracker):
+    """
+    Process tracker of a task process forked from a template process.
+
+    :meta private:
+    """
+
+    ProcessNotFound = ProcessLookupError
+    TimeoutExpired = psutil.TimeoutExpired
+
+    def __init__(self, template: _TemplateProcess, pid: int) -> None:
+        self._template = template
+        self._pid = pid
+
+    @property
+    def pid(self) -> int:
+        return self._pid
+
+    def send_signal(self, s: signal.Signals) -> None:
+        if self._template.has_exited(self._pid):
+            # Reaped by the template, the pid may already be someone else's
+            raise ProcessLookupError(self._pid)
+        os.kill(self._pid, s)
+
+    def wait(self, timeout: float | None) -> int:
+        return self._template.wait_task(self._pid, timeout)
+
+
+@attrs.define(kw_only=True)
+class _PooledActivitySubprocess(ActivitySubprocess):
+    """Activity subprocess forked from a template process of a :class:`TaskRunnerPool`."""
+
+    template: _TemplateProcess = attrs.field(repr=False)
+
+    @classmethod
+    def start(  # type: ignore[override]
+        cls,
+        *,
+        template: _TemplateProcess,
+        what: TaskInstance,
+        dag_rel_path: str | os.PathLike[str],
+        bundle_info,
+        target: Callable[[], None] = _subprocess_main,
+        logger: FilteringBoundLogger | None = None,
+        sentry_integration: str = "",
+        **kwargs,
+    ) -> Self:
+        child_stdout, read_stdout = socketpair()
+        child_stderr, read_stderr = socketpair()
+        child_requests, read_requests = socketpair()
+        child_logs, read_logs = socketpair()
+        try:
+            pid = template.start_task(
+                target=target,
+                dag_rel_path=os.fspath(dag_rel_path),
+                dag_id=what.dag_id,
+                sockets=(child_requests, child_stdout, child_stderr, child_logs),
+            )
+        except BaseException:
+            cls._close_unused_sockets(read_requests, read_stdout, read_stderr, read_logs)
+            raise
+        finally:
+            cls._close_unused_sockets(child_requests, child_stdout, child_stderr, child_logs)
+
+        logger = logger or cast("FilteringBoundLogger", structlog.get_logger(logger_name="task").bind())
+        proc = cls(
+            id=what.id,
+            pid=pid,
+            stdin=read_requests,
+            process=_TemplateChildTracker(template, pid),
+            process_log=logger,
+            start_time=time.monotonic(),
+            new_process_group=True,
+            template=template,
+            **kwargs,
+        )
+        proc._register_pipe_readers(read_stdout, read_stderr, read_requests, read_logs, data={})
+        proc._on_child_started(
+            ti=what,
+            dag_rel_path=dag_rel_path,
+            bundle_info=bundle_info,
+            sentry_integration=sentry_integration,
+        )
+        return proc
+
+
+class TaskRunnerPool:
+    """
+    Template processes of a worker, to fork its task processes from.
+
+    :param size: Maximum number of templates, i.e. of Dag bundle versions with a warm template. The
+        least recently used template is stopped to start one for another bundle version.
+    :param max_tasks: Number of tasks after which a template is replaced by a new one.
+    :param max_memory_growth: Bytes of memory a template may grow by, after starting its first task,
+        before it is replaced by a new one.
+    """
+
+    def __init__(self, *, size: int, max_tasks: int, max_memory_growth: int) -> None:
+        self.size = size
+        self.max_tasks = max_tasks
+        self.max_memory_growth = max_memory_growth
+        self._templates: OrderedDict[tuple[str, str | None], _TemplateProcess] = OrderedDict()
+
+    @classmethod
+    def from_config(cls) -> TaskRunnerPool | None:
+        """Create the pool configured in ``[workers]``, or return ``None`` if it is disabled."""
+        size = conf.getint("workers", "task_runner_pool_size", fallback=0)
+        if size <= 0:
+            return None
+        if _should_use_exec() or send_fds is None:
+            log.warning("Task runner pool is not supported on this platform", platform=sys.platform)
+            return None
+        return cls(
+            size=size,
+            max_tasks=conf.getint("workers", "task_runner_pool_max_tasks", fallback=100),
+            max_memory_growth=conf.getint("workers", "task_runner_pool_max_memory_growth", fallback=512)
+            * 1024
+            * 1024,
+        )
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def start_task(
+        self,
+        *,
+        what: TaskInstance,
+        dag_rel_path: str | os.PathLike[str],
+        bundle_info: BundleInfo,
+        **kwargs,
+    ) -> ActivitySubprocess:
+        """
+        Start the process of a task from the template of its Dag bundle version.
+
+        The arguments are the ones of :meth:`ActivitySubprocess.start`. When the template cannot be
+        used, the task process is forked from the supervisor as usual.
+        """
+        key = (bundle_info.name, bundle_info.version)
+        for _ in range(2):
+            template = self._template(key, bundle_info)
+            try:
+                return _PooledActivitySubprocess.start(
+                    template=template, what=what, dag_rel_path=dag_rel_path, bundle_info=bundle_info, **kwargs
+                )
+            except TemplateStale:
+                log.info("Dag bundle files changed; replacing template process", pid=template.pid)
+                self._stop(key)
+            except TemplateExited:
+                log.warning("Template process exited; starting the task process directly", pid=template.pid)
+                self._stop(key)
+                break
+        return ActivitySubprocess.start(
+            what=what, dag_rel_path=dag_rel_path, bundle_info=bundle_info, **kwargs
+        )
+
+    def task_finished(self, process: ActivitySubprocess) -> None:
+        """Replace the template a finished task was forked from if it ran enough tasks or grew too much."""
+        if not isinstance(process, _PooledActivitySubprocess):
+            return
+        template = process.template
+        if self._templates.get(template.key) is not template:
+            return
+        if template.tasks_started >= self.max_tasks:
+            log.debug("Template process started its maximum number of tasks", pid=template.pid)
+        elif template.baseline_rss is not None and (
+            template.rss() - template.baseline_rss > self.max_memory_growth
+        ):
+            log.info("Template process memory grew too much; replacing it", pid=template.pid)
+        else:
+            return
+        self._stop(template.key)
+
+    def close(self) -> None:
+        """Stop all template processes."""
+        while self._templates:
+            self._stop(next(iter(self._templates)))
+
+    def _template(self, key: tuple[str, str | None], bundle_info: BundleInfo) -> _TemplateProcess:
+        if (template := self._templates.get(key)) is not None:
+            self._templates.move_to_end(key)
+            return template
+        while len(self._templates) >= self.size:
+            self._stop(next(iter(self._templates)))
+        template = _TemplateProcess.start(
+            bundle_info,
+            close=[t.control for t in self._templates.values() if t.control is not None],
+        )
+        log.debug("Started template process", pid=template.pid, bundle=key)
+        self._templates[key] = template
+        return template
+
+    def _stop(self, key: tuple[str, str | None]) -> None:
+        if (template := self._templates.pop(key, None)) is not None:
+            template.stop()
+
+
+@functools.cache
+def get_task_runner_pool() -> TaskRunnerPool | None:
+    """
+    Return the process-wide :class:`TaskRunnerPool`, or ``None`` if it is disabled.
+
+    Its template processes are stopped when the process exits normally. Processes that leave with
+    ``os._exit``, like executor workers, should call :func:`close_task_runner_pool` themselves; a
+    template left behind still exits once its control socket is closed.
+    """
+    if (pool := TaskRunnerPool.from_config()) is not None:
+        atexit.register(pool.close)
+    return pool
+
+
+def close_task_runner_pool() -> None:
+    """Stop the template processes of the process-wide :class:`TaskRunnerPool`, if it was started."""
+    if get_task_runner_pool.cache_info().currsize and (pool := get_task_runner_pool()) is not None:
+        pool.close()
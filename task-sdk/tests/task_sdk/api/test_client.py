@@ -46,7 +46,11 @@ from airflow.sdk.api.datamodels._generated import (
     HITLDetailResponse,
     HITLUser,
     TaskStateStoreResponse,
+    TerminalStateNonSuccess,
     TerminalTIState,
+    TIBatchItem,
+    TIHeartbeatInfo,
+    TITerminalStatePayload,
     VariableResponse,
     XComResponse,
 )
@@ -126,6 +130,26 @@ class TestClient:
         make_client(httpx.MockTransport(handle_request))
         mock_default_context.return_value.load_verify_locations.assert_called_with(certifi.where())
 
+    def test_clients_share_connections_to_the_same_server(self):
+        first = Client(base_url="http://server:8080/execution/", token="")
+        second = Client(base_url="http://server:8080/execution/", token="")
+        other = Client(base_url="http://other-server:8080/execution/", token="")
+
+        assert first._transport is second._transport
+        assert other._transport is not first._transport
+
+        # Closing a client leaves the connections of the others open
+        with mock.patch.object(httpx.HTTPTransport, "close") as close:
+            first.close()
+        close.assert_not_called()
+
+    @mock.patch("airflow.sdk.api.client.API_SHARED_CONNECTIONS", False)
+    def test_clients_do_not_share_connections_when_disabled(self):
+        first = Client(base_url="http://server:8080/execution/", token="")
+        second = Client(base_url="http://server:8080/execution/", token="")
+
+        assert first._transport is not second._transport
+
     @mock.patch("airflow.sdk.api.client.API_TIMEOUT", 60.0)
     def test_timeout_configuration(self):
         def handle_request(request: httpx.Request) -> httpx.Response:
@@ -458,6 +482,52 @@ class TestTaskInstanceOperations:
         client = make_client(transport=httpx.MockTransport(handle_request))
         client.task_instances.heartbeat(ti_id, 100)
 
+    def test_task_instance_batch(self):
+        ti_id = uuid6.uuid7()
+        other_ti_id = uuid6.uuid7()
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/task-instances/batch":
+                items = json.loads(request.read())["items"]
+                assert [item["token"] for item in items] == ["token", "other-token"]
+                assert items[0]["heartbeat"] == {"hostname": "host", "pid": 100}
+                assert items[1]["state"]["state"] == "failed"
+                return httpx.Response(
+                    status_code=200,
+                    json={
+                        "results": [
+                            {"task_instance_id": str(ti_id), "status_code": 204},
+                            {
+                                "task_instance_id": str(other_ti_id),
+                                "status_code": 409,
+                                "detail": {"reason": "invalid_state"},
+                            },
+                        ]
+                    },
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.task_instances.batch(
+            [
+                TIBatchItem(
+                    task_instance_id=ti_id,
+                    token="token",
+                    heartbeat=TIHeartbeatInfo(hostname="host", pid=100),
+                ),
+                TIBatchItem(
+                    task_instance_id=other_ti_id,
+                    token="other-token",
+                    state=TITerminalStatePayload(
+                        state=TerminalStateNonSuccess.FAILED, end_date=timezone.utcnow()
+                    ),
+                ),
+            ]
+        )
+
+        assert [r.status_code for r in result.results] == [204, 409]
+        assert result.results[1].detail == {"reason": "invalid_state"}
+
     @pytest.mark.parametrize("queues_enabled", [False, True])
     def test_task_instance_defer(self, queues_enabled: bool):
         # Simulate a successful response from the server that defers a task
@@ -0,0 +1,151 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from airflow.sdk.api import client as sdk_client
+from airflow.sdk.api.datamodels._generated import ConnectionResponse, VariableResponse, XComResponse
+from airflow.sdk.exceptions import ErrorType
+from airflow.sdk.execution_time.comms import (
+    ConnectionResult,
+    ErrorResponse,
+    GetConnection,
+    GetVariable,
+    GetXCom,
+    PrefetchRequests,
+    PutVariable,
+    SetXCom,
+    VariableResult,
+)
+from airflow.sdk.execution_time.request_cache import SupervisorRequestCache
+
+from tests_common.test_utils.config import conf_vars
+
+
+@pytest.fixture
+def client():
+    return MagicMock(spec=sdk_client.Client)
+
+
+def test_disabled_cache_always_calls_the_api(client):
+    cache = SupervisorRequestCache({GetVariable: 0})
+    client.variables.get.return_value = VariableResponse(key="a", value="1")
+
+    assert not cache
+    for _ in range(2):
+        resp, dump_opts = cache.handle(client, GetVariable(key="a"))
+        assert isinstance(resp, VariableResult)
+        assert resp.value == "1"
+        assert dump_opts == {"exclude_unset": True}
+    assert client.variables.get.call_count == 2
+    assert len(cache) == 0
+
+
+def test_repeated_requests_are_served_from_cache_until_expired(client):
+    cache = SupervisorRequestCache({GetVariable: 10})
+    client.variables.get.return_value = VariableResponse(key="a", value="1")
+
+    with patch("airflow.sdk.execution_time.request_cache.time.monotonic", side_effect=[0, 5, 11]):
+        for _ in range(3):
+            resp, _ = cache.handle(client, GetVariable(key="a"))
+            assert resp.value == "1"
+
+    assert client.variables.get.call_count == 2
+
+
+def test_not_found_responses_are_cached(client):
+    cache = SupervisorRequestCache({GetVariable: 10})
+    not_found = ErrorResponse(error=ErrorType.VARIABLE_NOT_FOUND, detail={"key": "a"})
+    client.variables.get.return_value = not_found
+
+    assert cache.handle(client, GetVariable(key="a"))[0] is not_found
+    assert cache.handle(client, GetVariable(key="a"))[0] is not_found
+    client.variables.get.assert_called_once_with("a")
+
+
+def test_writes_drop_stale_responses(client):
+    cache = SupervisorRequestCache({GetVariable: 60, GetXCom: 60})
+    client.variables.get.return_value = VariableResponse(key="a", value="1")
+    client.xcoms.get.return_value = XComResponse(key="k", value=1)
+    get_xcom = GetXCom(key="k", dag_id="d", run_id="r", task_id="t", map_index=0)
+    cache.handle(client, GetVariable(key="a"))
+    cache.handle(client, get_xcom)
+
+    cache.invalidate(PutVariable(key="a", value="2", description=None))
+    cache.invalidate(SetXCom(key="k", value=2, dag_id="d", run_id="r", task_id="t"))
+    cache.handle(client, GetVariable(key="a"))
+    cache.handle(client, get_xcom)
+
+    assert client.variables.get.call_count == 2
+    assert client.xcoms.get.call_count == 2
+
+
+def test_request_waits_for_prefetch_in_flight(client):
+    cache = SupervisorRequestCache({GetConnection: 60})
+    release = threading.Event()
+
+    def get_connection(conn_id):
+        release.wait(5)
+        return ConnectionResponse(
+            conn_id=conn_id,
+            conn_type="http",
+            host=None,
+            schema=None,
+            login=None,
+            password="secret",
+            port=None,
+            extra=None,
+        )
+
+    client.connections.get.side_effect = get_connection
+    cache.prefetch(client, PrefetchRequests(connections=["c"], variables=["ignored"]))
+    release.set()
+
+    resp, _ = cache.handle(client, GetConnection(conn_id="c"))
+    cache.close()
+
+    assert isinstance(resp, ConnectionResult)
+    assert resp.conn_id == "c"
+    client.connections.get.assert_called_once_with("c")
+    client.variables.get.assert_not_called()
+
+
+def test_failed_prefetch_is_fetched_again(client):
+    cache = SupervisorRequestCache({GetVariable: 60})
+    client.variables.get.side_effect = [RuntimeError("boom"), VariableResponse(key="a", value="1")]
+    cache.prefetch(client, PrefetchRequests(variables=["a"]))
+
+    resp, _ = cache.handle(client, GetVariable(key="a"))
+    cache.close()
+
+    assert isinstance(resp, VariableResult)
+    assert resp.value == "1"
+    assert client.variables.get.call_count == 2
+
+
+@conf_vars(
+    {
+        ("workers", "request_cache_variable_ttl"): "30",
+        ("workers", "request_cache_xcom_ttl"): "5",
+    }
+)
+def test_from_config():
+    assert SupervisorRequestCache.from_config().ttls == {GetVariable: 30.0, GetXCom: 5.0}
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import gzip
 import inspect
 import json
 import logging
@@ -27,6 +28,7 @@ import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
 from contextlib import nullcontext
 from dataclasses import dataclass, field
@@ -67,6 +69,7 @@ from airflow.sdk.api.datamodels._generated import (
     PreviousTIResponse,
     TaskInstance,
     TaskInstanceState,
+    VariableResponse,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType, TaskAlreadyRunningError
 from airflow.sdk.execution_time import supervisor, task_runner
@@ -124,6 +127,7 @@ from airflow.sdk.execution_time.comms import (
     InactiveAssetsResult,
     MaskSecret,
     OKResponse,
+    PrefetchRequests,
     PreviousDagRunResult,
     PreviousTIResult,
     PrevSuccessfulDagRunResult,
@@ -160,12 +164,14 @@ from airflow.sdk.execution_time.comms import (
     _ResponseFrame,
 )
 from airflow.sdk.execution_time.supervisor import (
+    _TASK_LOG_ARCHIVERS,
     SERVER_TERMINATED,
     ActivitySubprocess,
     InProcessSupervisorComms,
     InProcessTestSupervisor,
     ProcessTracker,
     WatchedSubprocess,
+    _archive_task_log,
     _make_process_nondumpable,
     _remote_logging_conn,
     in_process_api_server,
@@ -173,6 +179,7 @@ from airflow.sdk.execution_time.supervisor import (
     process_log_messages_from_subprocess,
     set_supervisor_comms,
     supervise_task,
+    wait_for_task_log_archives,
 )
 from airflow.sdk.execution_time.task_runner import run
 
@@ -827,6 +834,7 @@ class TestWatchedSubprocess:
                     "end_from_trigger": False,
                 },
                 trigger_timeout=None,
+                trigger_fire_at=timezone.datetime(2024, 11, 7, 12, 34, 59, 0),
                 next_kwargs={},
             ),
         )
@@ -1594,6 +1602,18 @@ class TestWatchedSubprocessKill:
         # Validate that `_check_subprocess_exit` is called
         mock_process.wait.assert_called_once_with(timeout=0)
 
+    def test_service_subprocess_waits_on_process_once_sockets_are_closed(
+        self, watched_subprocess, mock_process
+    ):
+        """With every socket closed, wait on the process rather than sleep in an empty `select`."""
+        watched_subprocess.selector.get_map.return_value = {}
+        mock_process.wait.return_value = 0
+
+        assert watched_subprocess._service_subprocess(max_wait_time=5.0) == 0
+
+        watched_subprocess.selector.select.assert_not_called()
+        mock_process.wait.assert_called_once_with(timeout=5.0)
+
     def test_max_wait_time_prevents_cpu_spike(self, watched_subprocess, mock_process, monkeypatch):
         """Test that max_wait_time calculation prevents CPU spike when heartbeat timeout is reached."""
         # Mock the configuration to reproduce the CPU spike scenario
@@ -3099,6 +3119,10 @@ REQUEST_TEST_CASES = [
         expected_body={"fds": mock.ANY, "type": "SentFDs"},
         test_id="resend_logging_fd",
     ),
+    RequestTestCase(
+        message=PrefetchRequests(variables=["test_key"], connections=["test_conn"]),
+        test_id="prefetch_requests",
+    ),
     RequestTestCase(
         message=SkipDownstreamTasks(tasks=["task1", "task2"]),
         client_mock=ClientMock(
@@ -3413,6 +3437,32 @@ class TestHandleRequest:
             decoder = CommsDecoder(socket=None).body_decoder  # type: ignore[var-annotated, arg-type]
             assert decoder.validate_python(frame.body) == client_mock.response
 
+    @conf_vars({("workers", "request_cache_variable_ttl"): "60"})
+    def test_repeated_get_variable_is_served_from_request_cache(self, mocker):
+        read_end, write_end = socket.socketpair()
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=TI_ID,
+            pid=12345,
+            stdin=write_end,
+            client=mocker.Mock(),
+            process=mocker.Mock(),
+        )
+        proc.client.variables.get.return_value = VariableResponse(key="test_key", value="v")
+        generator = proc.handle_requests(log=mocker.Mock())
+        next(generator)
+
+        for req_id in (1, 2):
+            generator.send(_RequestFrame(id=req_id, body=GetVariable(key="test_key").model_dump()))
+        generator.send(
+            _RequestFrame(id=3, body=PutVariable(key="test_key", value="w", description=None).model_dump())
+        )
+        generator.send(_RequestFrame(id=4, body=GetVariable(key="test_key").model_dump()))
+
+        assert proc.client.variables.get.call_count == 2
+        read_end.close()
+        write_end.close()
+
     def test_all_to_supervisor_messages_are_covered(self):
         """Ensure all ToSupervisor message types have test coverage."""
 
@@ -4751,3 +4801,60 @@ class TestLengthPrefixedFrameReader:
                 break
 
         assert received == [_RequestFrame(id=42, body={"key": "foo"})]
+
+
+class TestArchiveTaskLog:
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        log_file = tmp_path / "attempt=1.log"
+        log_file.write_text('{"event": "hello"}\n')
+        return log_file
+
+    @conf_vars({("logging", "compress_task_logs"): "True"})
+    def test_archives_log_of_completed_attempt(self, log_file):
+        thread = _archive_task_log(str(log_file), TaskInstanceState.SUCCESS)
+        assert thread is not None
+        thread.join()
+
+        assert not log_file.exists()
+        archive = log_file.with_name("attempt=1.log.gz")
+        assert gzip.decompress(archive.read_bytes()) == b'{"event": "hello"}\n'
+
+    @conf_vars({("logging", "compress_task_logs"): "True"})
+    def test_wait_for_task_log_archives(self, log_file, mocker):
+        started = threading.Event()
+        release = threading.Event()
+
+        def archive_log(path):
+            started.set()
+            release.wait()
+            os.unlink(path)
+
+        mocker.patch("airflow.sdk._shared.logging.archive.archive_log", side_effect=archive_log)
+        thread = _archive_task_log(str(log_file), TaskInstanceState.SUCCESS)
+        assert thread is not None
+        started.wait()
+        assert thread in _TASK_LOG_ARCHIVERS
+
+        threading.Timer(0.1, release.set).start()
+        wait_for_task_log_archives()
+
+        assert not thread.is_alive()
+        assert not log_file.exists()
+        assert not _TASK_LOG_ARCHIVERS
+
+    @pytest.mark.parametrize(
+        "state",
+        [TaskInstanceState.DEFERRED, TaskInstanceState.UP_FOR_RESCHEDULE, TaskInstanceState.AWAITING_INPUT],
+    )
+    @conf_vars({("logging", "compress_task_logs"): "True"})
+    def test_keeps_log_of_resuming_attempt(self, log_file, state):
+        assert _archive_task_log(str(log_file), state) is None
+
+        assert log_file.exists()
+
+    @conf_vars({("logging", "compress_task_logs"): "False"})
+    def test_keeps_log_when_disabled(self, log_file):
+        assert _archive_task_log(str(log_file), TaskInstanceState.SUCCESS) is None
+
+        assert log_file.exists()
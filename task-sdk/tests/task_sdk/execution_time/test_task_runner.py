@@ -136,6 +136,7 @@ from airflow.sdk.execution_time.comms import (
     InactiveAssetsResult,
     MaskSecret,
     OKResponse,
+    PrefetchRequests,
     PreviousDagRunResult,
     PreviousTIResult,
     PrevSuccessfulDagRunResult,
@@ -177,8 +178,10 @@ from airflow.sdk.execution_time.task_runner import (
     _make_task_span,
     _push_xcom_if_needed,
     _register_deserialization_allowed_classes,
+    _requests_to_prefetch,
     _run_execute_callable,
     _serialize_outlet_events,
+    _trigger_fire_at,
     _xcom_push,
     detail_span,
     finalize,
@@ -926,6 +929,7 @@ def test_run_deferred_basic(time_machine, create_runtime_ti, mock_supervisor_com
                 "end_from_trigger": False,
             },
             trigger_timeout=None,
+            trigger_fire_at=instant + timedelta(seconds=3),
             queue=deferred_queue,
             next_method="execute_complete",
             next_kwargs={},
@@ -943,6 +947,41 @@ def test_run_deferred_basic(time_machine, create_runtime_ti, mock_supervisor_com
         mock_supervisor_comms.send.assert_any_call(expected_defer_task)
 
 
+def test_trigger_fire_at_only_for_triggers_resumable_from_their_moment():
+    """Only triggers whose event carries their moment can be resumed by the scheduler."""
+    from airflow.providers.standard.triggers.temporal import DateTimeTrigger
+
+    moment = timezone.datetime(2024, 11, 22)
+
+    assert _trigger_fire_at(DateTimeTrigger(moment)) == moment
+    assert _trigger_fire_at(DateTimeTrigger(moment, end_from_trigger=True)) is None
+    assert _trigger_fire_at(SuccessTrigger()) is None
+
+
+def test_requests_to_prefetch_lists_variables_and_connections_of_task():
+    """Variables read in templated fields and connections named by conn_id attributes are prefetched."""
+    from airflow.providers.standard.operators.bash import BashOperator
+
+    task = BashOperator(
+        task_id="templated_task",
+        bash_command="echo {{ var.value.foo }} {{ var.json.bar.nested }} {{ var.value.foo }}",
+        env={"CONN": "{{ conn.my_conn.host }}", "BAZ": "{{ var.value.baz }}"},
+    )
+    task.ssh_conn_id = "my_ssh"
+    task.http_conn_id = "{{ params.conn_id }}"
+
+    with conf_vars(
+        {
+            ("workers", "request_cache_variable_ttl"): "60",
+            ("workers", "request_cache_connection_ttl"): "60",
+        }
+    ):
+        prefetch = _requests_to_prefetch(task)
+
+    assert prefetch == PrefetchRequests(variables=["bar", "baz", "foo"], connections=["my_ssh"])
+    assert _requests_to_prefetch(task) is None
+
+
 class FakeEventTrigger(BaseEventTrigger):
     """Fake event trigger class for testing"""
 
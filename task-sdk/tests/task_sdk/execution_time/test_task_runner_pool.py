@@ -0,0 +1,203 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import signal
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from task_sdk import FAKE_BUNDLE
+from uuid6 import uuid7
+
+from airflow.executors.workloads import BundleInfo
+from airflow.sdk.api import client as sdk_client
+from airflow.sdk.api.datamodels._generated import TaskInstance
+from airflow.sdk.execution_time import task_runner
+from airflow.sdk.execution_time.comms import CommsDecoder
+from airflow.sdk.execution_time.supervisor import ActivitySubprocess
+from airflow.sdk.execution_time.task_runner_pool import (
+    TaskRunnerPool,
+    close_task_runner_pool,
+    get_task_runner_pool,
+)
+
+from tests_common.test_utils.config import conf_vars
+
+pytestmark = pytest.mark.skipif(sys.platform == "darwin", reason="Task processes are not forked on macOS")
+
+
+def exit_with_code_three():
+    CommsDecoder()._get_response()
+    sys.exit(3)
+
+
+def kill_itself():
+    CommsDecoder()._get_response()
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def _ti(dag_id: str = "super_basic", task_id: str = "a") -> TaskInstance:
+    return TaskInstance(
+        id=uuid7(),
+        task_id=task_id,
+        dag_id=dag_id,
+        run_id="d",
+        try_number=1,
+        dag_version_id=uuid7(),
+        queue="default",
+    )
+
+
+@pytest.fixture
+def pool(mocker, make_ti_context):
+    mocker.patch.object(sdk_client.TaskInstanceOperations, "start", return_value=make_ti_context())
+    pool = TaskRunnerPool(size=1, max_tasks=10, max_memory_growth=1024 * 1024 * 1024)
+    yield pool
+    pool.close()
+
+
+def _start(pool: TaskRunnerPool, bundle_info: BundleInfo = FAKE_BUNDLE, **kwargs):
+    kwargs.setdefault("dag_rel_path", os.devnull)
+    kwargs.setdefault("what", _ti())
+    return pool.start_task(
+        bundle_info=bundle_info,
+        client=sdk_client.Client(base_url="", dry_run=True, token=""),
+        **kwargs,
+    )
+
+
+def test_tasks_are_forked_from_the_template_of_their_bundle(pool):
+    first = _start(pool, target=exit_with_code_three)
+    assert first.wait() == 3
+    pool.task_finished(first)
+    second = _start(pool, target=exit_with_code_three)
+    assert second.wait() == 3
+    pool.task_finished(second)
+
+    assert first.pid != second.pid
+    assert first.template is second.template
+    assert first.template.tasks_started == 2
+    assert len(pool) == 1
+
+    other = _start(pool, bundle_info=BundleInfo(name="other", version="1"), target=exit_with_code_three)
+    assert other.wait() == 3
+    assert other.template is not first.template
+    # Only one template is kept; the least recently used one was stopped
+    assert len(pool) == 1
+    assert not first.template.process.is_running()
+
+
+def test_task_killed_by_signal(pool):
+    proc = _start(pool, target=kill_itself)
+
+    assert proc.wait() == -signal.SIGKILL
+    assert proc.final_state == "failed"
+
+
+def test_template_is_replaced_after_max_tasks(pool):
+    pool.max_tasks = 1
+    first = _start(pool, target=exit_with_code_three)
+    first.wait()
+    pool.task_finished(first)
+    second = _start(pool, target=exit_with_code_three)
+    second.wait()
+
+    assert second.template is not first.template
+    assert not first.template.process.is_running()
+
+
+def test_task_is_forked_from_supervisor_when_template_exited(pool, mocker):
+    first = _start(pool, target=exit_with_code_three)
+    first.wait()
+    first.template.process.kill()
+    first.template.process.wait()
+    start = mocker.patch.object(ActivitySubprocess, "start")
+
+    assert _start(pool, target=exit_with_code_three) is start.return_value
+    assert len(pool) == 0
+
+
+def test_task_runner_runs_preparsed_dag(pool, test_dags_dir: Path):
+    bundle_config = [
+        {
+            "name": "my-bundle",
+            "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+            "kwargs": {"path": str(test_dags_dir), "refresh_interval": 1},
+        }
+    ]
+    bundle_info = BundleInfo(name="my-bundle", version=None)
+    with mock.patch.dict(
+        os.environ, {"AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(bundle_config)}
+    ):
+        procs = [_start(pool, bundle_info=bundle_info, dag_rel_path="super_basic.py") for _ in range(2)]
+        assert [proc.wait() for proc in procs] == [0, 0]
+
+    assert procs[0].template is procs[1].template
+
+
+@pytest.mark.parametrize(("version", "kept"), [pytest.param("1", True), pytest.param(None, False)])
+def test_preparsed_dag_is_only_kept_for_bundle_versions(test_dags_dir: Path, monkeypatch, version, kept):
+    monkeypatch.setattr(task_runner, "_PREPARSED_DAG_BAGS", {})
+    monkeypatch.setattr(task_runner, "_PREPARSE_BUNDLES", {})
+    bundle = mock.Mock(path=test_dags_dir, version=version)
+    bundle.name = "my-bundle"
+    monkeypatch.setattr(task_runner, "_get_initialized_bundle", lambda bundle_info: bundle)
+
+    bundle_path = task_runner.preparse_dag_file(
+        BundleInfo(name="my-bundle", version=version), "super_basic.py", "super_basic"
+    )
+
+    assert bundle_path == str(test_dags_dir)
+
+    # An unversioned bundle is refreshed by the task process before it parses, so its Dag may change
+    assert (
+        ("my-bundle", version, "super_basic.py", "super_basic") in task_runner._PREPARSED_DAG_BAGS
+    ) is kept
+
+
+def test_close_task_runner_pool(mocker):
+    get_task_runner_pool.cache_clear()
+    close = mocker.patch.object(TaskRunnerPool, "close")
+    # Nothing to stop before the pool is first used
+    close_task_runner_pool()
+
+    with conf_vars({("workers", "task_runner_pool_size"): "1"}):
+        assert get_task_runner_pool() is not None
+    close_task_runner_pool()
+    get_task_runner_pool.cache_clear()
+
+    close.assert_called_once_with()
+
+
+def test_from_config():
+    assert TaskRunnerPool.from_config() is None
+    with conf_vars(
+        {
+            ("workers", "task_runner_pool_size"): "2",
+            ("workers", "task_runner_pool_max_tasks"): "5",
+            ("workers", "task_runner_pool_max_memory_growth"): "64",
+        }
+    ):
+        pool = TaskRunnerPool.from_config()
+
+    assert pool is not None
+    assert (pool.size, pool.max_tasks, pool.max_memory_growth) == (2, 5, 64 * 1024 * 1024)